@@ -367,6 +367,55 @@ the fourth:
 >>> sw.sim_score('TGTTACGG', 'GGTTGACTA')
 4.0
 
+To compute many measures of the same pairs of strings, e.g. as features for
+record linkage, :py:class:`.TokenFeatureExtractor` tokenizes each pair once
+for all token-based measures that tokenize alike, sharing the cardinalities of
+their token sets:
+
+>>> fe = TokenFeatureExtractor([Jaccard(), Dice(), KulczynskiII(), Cosine()])
+>>> fe.features('orange', 'strange')
+array([0.5       , 0.66666667, 0.66964286, 0.6681531 ])
+
+To find all the pairs of similar records in a collection, without comparing
+every pair, :py:func:`.similarity_join` joins the collection to itself by
+prefix filtering, for Jaccard, Dice, Cosine, and Overlap similarities (and
+Tversky indices with equal weights):
+
+>>> records = ['Niall', 'Neil', 'Nigel', 'Niall', 'Neal', 'Nils', 'Neill']
+>>> sorted(similarity_join(records, Jaccard(), 0.4))
+[(0, 3, 1.0), (1, 4, 0.42857142857142855), (1, 6, 0.8333333333333334)]
+
+To find the few strings most similar to a query among many,
+:py:func:`.best_matches` scores them with the measure's batch methods,
+skipping those whose similarity, bounded cheaply from their lengths, cannot
+reach the best found so far:
+
+>>> best_matches('Nial', records, Levenshtein(), 3)
+[('Niall', 0.8), ('Niall', 0.8), ('Neal', 0.75)]
+
+A string compared to many others can be wrapped as a
+:py:class:`.PreparedString`, a str that caches the representations measures
+derive from it (its tokens, its characters' bit-vectors, its q-grams for
+Jaro-Winkler, and its phonetic transforms), so that they are derived once,
+rather than once per comparison:
+
+>>> query = PreparedString('Nial')
+>>> [round(Jaccard().sim(query, record), 4) for record in records[:3]]
+[0.8333, 0.25, 0.375]
+
+To compare the same pairs of strings repeatedly, e.g. over several passes of
+record linkage, a measure can be wrapped by :py:class:`.CachedDistance`,
+which memoizes its results for each pair in a least-recently-used cache,
+optionally backed by a persistent store such as a :py:mod:`shelve` shelf:
+
+>>> cmp = CachedDistance(Levenshtein(), maxsize=10000)
+>>> cmp.dist('Niall', 'Neil')
+0.6
+>>> cmp.dist('Neil', 'Niall')
+0.6
+>>> cmp.cache_info()
+CacheInfo(hits=1, store_hits=0, misses=1, maxsize=10000, currsize=1)
+
 ----
 
 """
@@ -378,6 +427,7 @@ from ._andres_marzo_delta import AndresMarzoDelta
 from ._average_linkage import AverageLinkage
 from ._azzoo import AZZOO
 from ._bag import Bag
+from ._best_matches import best_matches
 from ._baroni_urbani_buser_i import BaroniUrbaniBuserI
 from ._baroni_urbani_buser_ii import BaroniUrbaniBuserII
 from ._batagelj_bren import BatageljBren
@@ -406,6 +456,7 @@ from ._bleu import BLEU
 from ._block_levenshtein import BlockLevenshtein
 from ._brainerd_robinson import BrainerdRobinson
 from ._braun_blanquet import BraunBlanquet
+from ._cached_distance import CachedDistance
 from ._canberra import Canberra
 from ._cao import Cao
 from ._chao_dice import ChaoDice
@@ -562,6 +613,7 @@ from ._positional_q_gram_dice import PositionalQGramDice
 from ._positional_q_gram_jaccard import PositionalQGramJaccard
 from ._positional_q_gram_overlap import PositionalQGramOverlap
 from ._prefix import Prefix
+from ._prepared_string import PreparedString
 from ._q_gram import QGram
 from ._quantitative_cosine import QuantitativeCosine
 from ._quantitative_dice import QuantitativeDice
@@ -585,6 +637,7 @@ from ._shapira_storer_i import ShapiraStorerI
 from ._sift4 import Sift4
 from ._sift4_extended import Sift4Extended
 from ._sift4_simplest import Sift4Simplest
+from ._similarity_join import similarity_join
 from ._single_linkage import SingleLinkage
 from ._size import Size
 from ._smith_waterman import SmithWaterman
@@ -610,6 +663,7 @@ from ._tetrachoric import Tetrachoric
 from ._tf_idf import TFIDF
 from ._tichy import Tichy
 from ._token_distance import _TokenDistance
+from ._token_feature_extractor import TokenFeatureExtractor
 from ._tulloss_r import TullossR
 from ._tulloss_s import TullossS
 from ._tulloss_t import TullossT
@@ -649,6 +703,11 @@ from ._yule_y import YuleY
 __all__ = [
     '_Distance',
     '_TokenDistance',
+    'TokenFeatureExtractor',
+    'similarity_join',
+    'best_matches',
+    'PreparedString',
+    'CachedDistance',
     'Levenshtein',
     'DamerauLevenshtein',
     'ShapiraStorerI',
@@ -0,0 +1,692 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._affine_gap_aligner.
+
+Global alignment with affine gap costs, in linear space
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+__all__ = []  # type: List[str]
+
+# The states of an alignment path: the last move was diagonal (a match or
+# mismatch), vertical (a src character against a gap), or horizontal (a tar
+# character against a gap).
+_D, _P, _Q = 0, 1, 2
+
+_Rows = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class _AffineGapAligner:
+    """Global alignment with affine gap costs.
+
+    This finds the maximum-scoring global alignment of two strings, where
+    aligned characters score according to a similarity function, and a run
+    of k gaps costs the gap opening cost plus k-1 times the gap extension
+    cost :cite:`Gotoh:1982`. It covers Needleman-Wunsch (equal opening and
+    extension costs), Gotoh, and (with negated costs) Levenshtein distance.
+
+    Each row of the dynamic programming matrices is computed with vectorized
+    operations. Alignments are found either from full matrices of back
+    pointers or, to use memory linear in the length of the strings, by
+    divide-and-conquer :cite:`Hirschberg:1975`, extended to affine gap costs
+    by tracking the state in which the path crosses the middle row
+    :cite:`Myers:1988`. Scores alone are computed keeping only one row per
+    state, over the shorter of the two strings.
+
+    With local set, scores are those of the best local alignment ending at
+    the last cell, where any cell may start a new alignment with a score of
+    0, as in the Smith-Waterman recurrence :cite:`Smith:1981`. Only score
+    supports local scoring.
+
+    .. versionadded:: 0.6.0
+    """
+
+    # Matrices with more cells than this are aligned in linear space when
+    # linear_space is None: at about 30 bytes per cell, 2**22 cells take about
+    # 120 MiB.
+    linear_space_threshold = 1 << 22
+
+    # Subproblems with at most this many cells are solved with full matrices
+    # during divide-and-conquer.
+    _base_cells = 1 << 12
+
+    def __init__(
+        self,
+        sim_func: Callable[[str, str], float],
+        del_open: float,
+        del_ext: float,
+        ins_open: float,
+        ins_ext: float,
+        gap_switch: bool = True,
+        local: bool = False,
+    ) -> None:
+        """Initialize _AffineGapAligner instance.
+
+        Parameters
+        ----------
+        sim_func : function
+            A function that returns the score of aligning two characters
+        del_open : float
+            The cost of the first gap in a run of src characters aligned to
+            gaps
+        del_ext : float
+            The cost of each subsequent gap in such a run
+        ins_open : float
+            The cost of the first gap in a run of tar characters aligned to
+            gaps
+        ins_ext : float
+            The cost of each subsequent gap in such a run
+        gap_switch : bool
+            If False, a run of gaps in one string may not be immediately
+            followed by a run of gaps in the other
+        local : bool
+            If True, score local rather than global alignments
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._sim_func = sim_func
+        self._del_open = del_open
+        self._del_ext = del_ext
+        self._ins_open = ins_open
+        self._ins_ext = ins_ext
+        self._gap_switch = gap_switch
+        self._local = local
+
+        self._table = {}  # type: Dict[str, np.ndarray]
+        self._codes = np.zeros(0, dtype=np.intp)
+
+    def _prepare(self, src: str, tar: str) -> None:
+        """Tabulate the character similarities needed to align src & tar.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tar_alphabet = {}  # type: Dict[str, int]
+        for char in tar:
+            tar_alphabet.setdefault(char, len(tar_alphabet))
+        self._codes = np.fromiter(
+            (tar_alphabet[char] for char in tar), dtype=np.intp, count=len(tar)
+        )
+        self._table = {
+            char: np.array(
+                [self._sim_func(char, tar_char) for tar_char in tar_alphabet],
+                dtype=np.float_,
+            )
+            for char in set(src)
+        }
+
+    @staticmethod
+    def _gap_scan(
+        values: np.ndarray,
+        first: float,
+        gap_open: float,
+        gap_ext: float,
+        exact: bool = False,
+    ) -> np.ndarray:
+        """Return the scores of runs of gaps along a row.
+
+        The running maximum of the scores, offset by each cell's extension
+        costs, is found in one pass, and the offsets then removed, which may
+        introduce rounding error. If exact is True, the best start of the run
+        ending at each cell is found instead, and its score less the
+        extensions (or, if opening a run costs the same as extending it,
+        the run's length times that cost) computed directly, as the full
+        matrices do for the runs of gaps along the first row & column.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            The scores from which a run of gaps may be opened
+        first : float
+            The score of the first cell
+        gap_open : float
+            The cost of opening a run of gaps
+        gap_ext : float
+            The cost of extending a run of gaps
+        exact : bool
+            If True, compute each score from the start of its run
+
+        Returns
+        -------
+        numpy.ndarray
+            Scores where out[0] = first and
+            out[j] = max(values[j-1] - gap_open, out[j-1] - gap_ext)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        positions = np.arange(len(values))
+        steps = positions * gap_ext
+        cands = np.empty(len(values), dtype=np.float_)
+        cands[0] = first
+        cands[1:] = values[:-1] - gap_open
+        keys = cands + steps
+        best = np.maximum.accumulate(keys)
+        if not exact:
+            return best - steps
+        starts = np.where(keys == best, positions, 0)
+        np.maximum.accumulate(starts, out=starts)
+        runs = positions - starts
+        scores = cands[starts] - runs * gap_ext
+        if gap_open == gap_ext:
+            # A run of n gaps of a single cost costs n times that cost
+            opened = starts > 0
+            scores[opened] = (
+                values[starts[opened] - 1] - (runs[opened] + 1) * gap_ext
+            )
+        return scores
+
+    def _first_row(self, width: int, start: int) -> _Rows:
+        """Return the scores of the first row, starting in a given state.
+
+        Parameters
+        ----------
+        width : int
+            The number of cells in the row
+        start : int
+            The state of the path at the first cell
+
+        Returns
+        -------
+        tuple
+            The diagonal, vertical, and horizontal state scores
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        d_row = np.full(width, 0.0 if self._local else -np.inf)
+        p_row = np.full(width, -np.inf)
+        d_row[0] = 0.0 if start == _D else -np.inf
+        p_row[0] = 0.0 if start == _P else -np.inf
+        opener = np.maximum(d_row, p_row) if self._gap_switch else d_row
+        q_row = self._gap_scan(
+            opener,
+            0.0 if start == _Q else -np.inf,
+            self._ins_open,
+            self._ins_ext,
+            exact=True,
+        )
+        return d_row, p_row, q_row
+
+    def _first_column(self, rows: _Rows, height: int) -> np.ndarray:
+        """Return the vertical state scores of the first column.
+
+        Parameters
+        ----------
+        rows : tuple
+            The state scores of the first row
+        height : int
+            The number of cells in the column
+
+        Returns
+        -------
+        numpy.ndarray
+            The vertical state score of each cell of the first column
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        d_col = np.full(height, 0.0 if self._local else -np.inf)
+        d_col[0] = rows[_D][0]
+        if self._gap_switch:
+            q_col = np.full(height, -np.inf)
+            q_col[0] = rows[_Q][0]
+            d_col = np.maximum(d_col, q_col)
+        return self._gap_scan(
+            d_col, rows[_P][0], self._del_open, self._del_ext, exact=True
+        )
+
+    def _next_row(
+        self, rows: _Rows, scores: np.ndarray, p_first: float
+    ) -> _Rows:
+        """Return the scores of the row after the given one.
+
+        Parameters
+        ----------
+        rows : tuple
+            The diagonal, vertical, and horizontal state scores of a row
+        scores : numpy.ndarray
+            The scores of aligning the next src character with each tar
+            character
+        p_first : float
+            The vertical state score of the next row's first cell, from
+            :py:meth:`_first_column`
+
+        Returns
+        -------
+        tuple
+            The diagonal, vertical, and horizontal state scores of the next
+            row
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        d_prev, p_prev, q_prev = rows
+        d_row = np.full(len(d_prev), -np.inf)
+        d_row[1:] = (
+            np.maximum(np.maximum(d_prev[:-1], p_prev[:-1]), q_prev[:-1])
+            + scores
+        )
+        if self._local:
+            np.maximum(d_row, 0.0, out=d_row)
+        p_row = np.maximum(d_prev - self._del_open, p_prev - self._del_ext)
+        if self._gap_switch:
+            p_row = np.maximum(p_row, q_prev - self._del_open)
+        p_row[0] = p_first
+        if self._gap_switch:
+            opener = np.maximum(d_row, p_row)
+        else:
+            opener = d_row
+        q_row = self._gap_scan(opener, -np.inf, self._ins_open, self._ins_ext)
+        return d_row, p_row, q_row
+
+    def _pointers(self, prev: Optional[_Rows], rows: _Rows) -> np.ndarray:
+        """Return the back pointers of a row.
+
+        Parameters
+        ----------
+        prev : tuple or None
+            The state scores of the previous row, or None for the first row
+        rows : tuple
+            The state scores of the row
+
+        Returns
+        -------
+        numpy.ndarray
+            For each state (axis 0) and cell (axis 1), the state of the path
+            at the previous cell
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        d_row, p_row, q_row = rows
+        width = len(d_row)
+        pointers = np.zeros((3, width), dtype=np.int8)
+        switch_pen = 0.0 if self._gap_switch else -np.inf
+        if prev is not None:
+            d_prev, p_prev, q_prev = prev
+            pointers[_D, 1:] = np.argmax(
+                np.stack((d_prev[:-1], p_prev[:-1], q_prev[:-1])), axis=0
+            )
+            pointers[_P] = np.argmax(
+                np.stack(
+                    (
+                        d_prev - self._del_open,
+                        p_prev - self._del_ext,
+                        q_prev - self._del_open + switch_pen,
+                    )
+                ),
+                axis=0,
+            )
+        pointers[_Q, 1:] = np.argmax(
+            np.stack(
+                (
+                    d_row[:-1] - self._ins_open,
+                    p_row[:-1] - self._ins_open + switch_pen,
+                    q_row[:-1] - self._ins_ext,
+                )
+            ),
+            axis=0,
+        )
+        return pointers
+
+    def _forward(self, src: str, codes: np.ndarray, start: int) -> _Rows:
+        """Return the state scores of the last row.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        codes : numpy.ndarray
+            The codes of the target string's characters
+        start : int
+            The state of the path at the first cell
+
+        Returns
+        -------
+        tuple
+            The diagonal, vertical, and horizontal state scores of the last
+            row
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        rows = self._first_row(len(codes) + 1, start)
+        column = self._first_column(rows, len(src) + 1)
+        for i, char in enumerate(src, 1):
+            rows = self._next_row(rows, self._table[char][codes], column[i])
+        return rows
+
+    def _backward(
+        self, src: str, codes: np.ndarray, end: Optional[int]
+    ) -> _Rows:
+        """Return the scores of completing the alignment from the first row.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        codes : numpy.ndarray
+            The codes of the target string's characters
+        end : int or None
+            The required state of the path at the last cell, if any
+
+        Returns
+        -------
+        tuple
+            For each state, the best score of a path from each cell of the
+            first row to the last cell, given that the path arrived at the
+            cell in that state
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        width = len(codes) + 1
+        init = [
+            0.0 if end is None or end == state else -np.inf
+            for state in (_D, _P, _Q)
+        ]
+
+        opener = np.full(width, -np.inf)
+        opener[-1] = init[_Q]
+        q_row = self._rev_gap_scan(opener)
+        h_open = np.full(width, -np.inf)
+        h_open[:-1] = q_row[1:] - self._ins_open
+        d_row = h_open.copy()
+        d_row[-1] = init[_D]
+        p_row = h_open.copy() if self._gap_switch else np.full(width, -np.inf)
+        p_row[-1] = init[_P]
+
+        for char in reversed(src):
+            diag = np.full(width, -np.inf)
+            diag[:-1] = self._table[char][codes] + d_row[1:]
+            v_open = p_row - self._del_open
+            v_ext = p_row - self._del_ext
+            q_row = self._rev_gap_scan(
+                np.maximum(diag, v_open) if self._gap_switch else diag
+            )
+            h_open = np.full(width, -np.inf)
+            h_open[:-1] = q_row[1:] - self._ins_open
+            d_row = np.maximum(np.maximum(diag, v_open), h_open)
+            p_row = np.maximum(diag, v_ext)
+            if self._gap_switch:
+                p_row = np.maximum(p_row, h_open)
+        return d_row, p_row, q_row
+
+    def _rev_gap_scan(self, values: np.ndarray) -> np.ndarray:
+        """Return the scores of runs of gaps along a row, right to left.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            The scores of leaving each cell other than horizontally
+
+        Returns
+        -------
+        numpy.ndarray
+            Scores where out[-1] = values[-1] and
+            out[j] = max(values[j], out[j+1] - ins_ext)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        steps = np.arange(len(values)) * self._ins_ext
+        return (np.maximum.accumulate(values[::-1] + steps) - steps)[::-1]
+
+    def _base(
+        self, src: str, codes: np.ndarray, start: int, end: Optional[int]
+    ) -> List[int]:
+        """Return the moves of an optimal alignment, using full matrices.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        codes : numpy.ndarray
+            The codes of the target string's characters
+        start : int
+            The state of the path at the first cell
+        end : int or None
+            The required state of the path at the last cell, if any
+
+        Returns
+        -------
+        list of int
+            The states entered by each move of the alignment path
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        rows = self._first_row(len(codes) + 1, start)
+        column = self._first_column(rows, len(src) + 1)
+        pointers = [self._pointers(None, rows)]
+        for i, char in enumerate(src, 1):
+            prev, rows = (
+                rows,
+                self._next_row(rows, self._table[char][codes], column[i]),
+            )
+            pointers.append(self._pointers(prev, rows))
+
+        if end is None:
+            state = int(np.argmax([row[-1] for row in rows]))
+        else:
+            state = end
+
+        moves = []
+        i, j = len(src), len(codes)
+        while i or j:
+            moves.append(state)
+            prev_state = int(pointers[i][state, j])
+            if state == _D:
+                i -= 1
+                j -= 1
+            elif state == _P:
+                i -= 1
+            else:
+                j -= 1
+            state = prev_state
+        moves.reverse()
+        return moves
+
+    def _solve(
+        self, src: str, codes: np.ndarray, start: int, end: Optional[int]
+    ) -> List[int]:
+        """Return the moves of an optimal alignment, in linear space.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        codes : numpy.ndarray
+            The codes of the target string's characters
+        start : int
+            The state of the path at the first cell
+        end : int or None
+            The required state of the path at the last cell, if any
+
+        Returns
+        -------
+        list of int
+            The states entered by each move of the alignment path
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if (
+            len(src) <= 1
+            or (len(src) + 1) * (len(codes) + 1) <= self._base_cells
+        ):
+            return self._base(src, codes, start, end)
+
+        mid = len(src) // 2
+        forward = self._forward(src[:mid], codes, start)
+        backward = self._backward(src[mid:], codes, end)
+        totals = np.stack(forward) + np.stack(backward)
+        state, j = np.unravel_index(int(np.argmax(totals)), totals.shape)
+        state, j = int(state), int(j)
+
+        return self._solve(src[:mid], codes[:j], start, state) + self._solve(
+            src[mid:], codes[j:], state, end
+        )
+
+    def _transposed(self) -> '_AffineGapAligner':
+        """Return an aligner of the target string against the source string.
+
+        Returns
+        -------
+        _AffineGapAligner
+            An aligner with the roles of the two strings exchanged
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        sim_func = self._sim_func
+        return _AffineGapAligner(
+            lambda tar_char, src_char: sim_func(src_char, tar_char),
+            self._ins_open,
+            self._ins_ext,
+            self._del_open,
+            self._del_ext,
+            self._gap_switch,
+            self._local,
+        )
+
+    def score(self, src: str, tar: str) -> float:
+        """Return the optimal alignment score, in linear space.
+
+        Only one row per state is kept, with a cell per character of the
+        shorter string.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float
+            The score of an optimal alignment
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if len(tar) > len(src):
+            return self._transposed().score(tar, src)
+
+        self._prepare(src, tar)
+        rows = self._forward(src, self._codes, _D)
+        self._table = {}
+        self._codes = np.zeros(0, dtype=np.intp)
+        return float(max(row[-1] for row in rows))
+
+    def align(
+        self, src: str, tar: str, linear_space: Optional[bool] = None
+    ) -> Tuple[float, str, str]:
+        """Return an optimal alignment of two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        linear_space : bool or None
+            If True, use divide-and-conquer to align in linear space; if
+            False, use full matrices of back pointers; if None, use linear
+            space only when the matrices would have more than
+            linear_space_threshold cells
+
+        Returns
+        -------
+        tuple
+            The score of the alignment and the two strings, aligned, with gaps
+            marked by '-'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._prepare(src, tar)
+        if linear_space is None:
+            linear_space = (len(src) + 1) * (
+                len(tar) + 1
+            ) > self.linear_space_threshold
+        if linear_space:
+            moves = self._solve(src, self._codes, _D, None)
+        else:
+            moves = self._base(src, self._codes, _D, None)
+        self._table = {}
+        self._codes = np.zeros(0, dtype=np.intp)
+
+        score = 0.0
+        src_aligned = []
+        tar_aligned = []
+        i = j = 0
+        prev = _D
+        for move in moves:
+            if move == _D:
+                score += self._sim_func(src[i], tar[j])
+                src_aligned.append(src[i])
+                tar_aligned.append(tar[j])
+                i += 1
+                j += 1
+            elif move == _P:
+                score -= self._del_ext if prev == _P else self._del_open
+                src_aligned.append(src[i])
+                tar_aligned.append('-')
+                i += 1
+            else:
+                score -= self._ins_ext if prev == _Q else self._ins_open
+                src_aligned.append('-')
+                tar_aligned.append(tar[j])
+                j += 1
+            prev = move
+
+        return score, ''.join(src_aligned), ''.join(tar_aligned)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
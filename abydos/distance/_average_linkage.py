@@ -42,6 +42,8 @@ class AverageLinkage(_TokenDistance):
     .. versionadded:: 0.4.0
     """
 
+    _compares_strings = True
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
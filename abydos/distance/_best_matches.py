@@ -0,0 +1,328 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._best_matches.
+
+Top-k best matches, with upper-bound pruning
+"""
+
+from collections.abc import Iterable
+from heapq import heappush, heapreplace
+from typing import Iterable as TIterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._damerau_levenshtein import DamerauLevenshtein
+from ._distance import _Distance
+from ._jaro_winkler import JaroWinkler
+from ._levenshtein import Levenshtein
+from ._token_distance import _TokenDistance
+from ..tokenizer import QGrams
+
+__all__ = ['best_matches']
+
+
+# A tolerance for rounding error in the bounds, which are raised by it so
+# that no match is lost
+_EPSILON = 1e-9
+
+# The number of choices scored at once, by the measure's batch methods
+_BLOCK_SIZE = 256
+
+
+def _edit_bounds(
+    query: str, lengths: np.ndarray, measure: _Distance
+) -> Optional[np.ndarray]:
+    """Return upper bounds of normalized edit similarities, by length.
+
+    At least the difference of the lengths of two strings must be inserted or
+    deleted, so the edit distance is no less than the cost of those edits.
+
+    .. versionadded:: 0.6.0
+
+    """
+    if getattr(measure, '_taper_enabled', False):
+        return None
+    ins_cost, del_cost = measure._cost[:2]  # type: ignore # noqa: SF01
+    normalizer = measure._normalizer  # type: ignore # noqa: SF01
+    query_len = len(query)
+
+    least = np.where(
+        lengths < query_len,
+        (query_len - lengths) * del_cost,
+        (lengths - query_len) * ins_cost,
+    )
+    src_term = query_len * del_cost
+    tar_terms = lengths * ins_cost
+    if normalizer is max:
+        norms = np.maximum(tar_terms, src_term)
+    elif normalizer is sum:
+        norms = tar_terms + src_term
+    else:
+        norms = np.fromiter(
+            (normalizer([src_term, term]) for term in tar_terms.tolist()),
+            dtype=np.float_,
+            count=len(tar_terms),
+        )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(norms > 0, 1.0 - least / norms, 1.0)
+
+
+def _jaro_winkler_bounds(
+    query: str, choices: Sequence[str], measure: JaroWinkler
+) -> Optional[np.ndarray]:
+    """Return upper bounds of Jaro-Winkler similarities, by length.
+
+    At most as many characters as the shorter string has can match, and the
+    Winkler boosts are greatest for a matching prefix of 4 characters.
+
+    .. versionadded:: 0.6.0
+
+    """
+    if measure._qval != 1:  # noqa: SF01
+        return None
+    # The strings are stripped before they are compared
+    query_len = len(query.strip())
+    lengths = np.fromiter(
+        (len(choice.strip()) for choice in choices),
+        dtype=np.float_,
+        count=len(choices),
+    )
+    shorter = np.minimum(lengths, query_len)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bounds = (shorter / query_len + shorter / lengths + 1) / 3
+        if measure._mode == 'winkler':  # noqa: SF01
+            prefix = np.minimum(shorter, 4)
+            bounds += (
+                prefix * measure._scaling_factor * (1 - bounds)  # noqa: SF01
+            )
+            if measure._long_strings:  # noqa: SF01
+                bounds += (
+                    (1 - bounds)
+                    * np.maximum(shorter - 1, 0)
+                    / (query_len + lengths + 2)
+                )
+    # Blank strings are similar only if they are identical
+    return np.where(
+        shorter > 0, bounds, np.where(lengths == query_len, 1.0, 0.0)
+    )
+
+
+def _token_bounds(
+    query: str, lengths: np.ndarray, measure: _TokenDistance
+) -> Optional[np.ndarray]:
+    """Return upper bounds of token similarities, by token count.
+
+    The number of q-grams of a string follows from its length, and the
+    intersection of two strings' tokens is no larger than the smaller of
+    them, so the measure's similarity formula, evaluated with that
+    intersection, bounds the similarity.
+
+    .. versionadded:: 0.6.0
+
+    """
+    tokenizer = measure.params['tokenizer']
+    if (
+        not measure._has_sim_formula()  # noqa: SF01
+        or type(tokenizer) is not QGrams
+        or tokenizer._scaler is not None  # noqa: SF01
+    ):
+        return None
+    qvals = (
+        tokenizer.qval
+        if isinstance(tokenizer.qval, Iterable)
+        else (tokenizer.qval,)
+    )
+    skips = (
+        tokenizer.skip
+        if isinstance(tokenizer.skip, Iterable)
+        else (tokenizer.skip,)
+    )
+
+    def _count(lens: np.ndarray) -> np.ndarray:
+        counts = np.zeros(len(lens), dtype=np.float_)
+        for qval in qvals:
+            if qval < 1:
+                continue
+            padded = lens + 2 * (qval - 1) if tokenizer.start_stop else lens
+            grams = np.where(
+                (lens > 0) & ((padded >= qval) | (qval == 1)),
+                padded - (qval - 1),
+                0,
+            )
+            counts += grams * len(skips)
+        return counts
+
+    tar_card = _count(lengths)
+    src_card = _count(np.array([len(query)]))
+    bounds = measure._sim_formula(  # noqa: SF01
+        np.minimum(tar_card, src_card), src_card, tar_card
+    )
+    # Identical strings are similar, whatever their tokens
+    return np.where(np.isnan(bounds) | (tar_card == src_card), 1.0, bounds)
+
+
+def _upper_bounds(
+    query: str, choices: Sequence[str], measure: _Distance
+) -> Optional[np.ndarray]:
+    """Return upper bounds of the similarity of the query to each choice.
+
+    Parameters
+    ----------
+    query : str
+        The string to match
+    choices : sequence of str
+        The strings to match it to
+    measure : _Distance
+        The measure of similarity
+
+    Returns
+    -------
+    numpy.ndarray or None
+        An upper bound of the similarity of the query to each choice, or None
+        if the measure has no cheap bound
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    measure_type = type(measure)
+    if isinstance(measure, JaroWinkler):
+        if measure_type.sim is JaroWinkler.sim:
+            return _jaro_winkler_bounds(query, choices, measure)
+        return None
+
+    lengths = np.fromiter(
+        (len(choice) for choice in choices),
+        dtype=np.float_,
+        count=len(choices),
+    )
+    for edit_type in (Levenshtein, DamerauLevenshtein):
+        if (
+            isinstance(measure, edit_type)
+            and measure_type.sim is _Distance.sim
+            and measure_type.dist is edit_type.dist
+            and measure_type.dist_abs is edit_type.dist_abs
+        ):
+            return _edit_bounds(query, lengths, measure)
+    if isinstance(measure, _TokenDistance):
+        return _token_bounds(query, lengths, measure)
+    return None
+
+
+def best_matches(
+    query: str,
+    choices: TIterable[str],
+    measure: _Distance,
+    k: int,
+    min_sim: Optional[float] = None,
+) -> List[Tuple[str, float]]:
+    """Return the k choices most similar to a query.
+
+    The choices are scored in blocks by the measure's batch methods
+    (:py:meth:`sim_cross`, which uses a vectorized form of the similarity
+    where the measure has one), and the best k kept in a heap. For
+    :py:class:`Levenshtein` and :py:class:`DamerauLevenshtein` (by length),
+    :py:class:`JaroWinkler` (by length, for qval=1), and token measures with
+    a vectorized similarity and a :py:class:`abydos.tokenizer.QGrams`
+    tokenizer (by the number of q-grams, which follows from length), an upper
+    bound of each choice's similarity is computed cheaply first. The choices
+    are then scored in decreasing order of their bounds, and scoring stops as
+    soon as no remaining choice can reach the kth best similarity found (or
+    min_sim).
+
+    Parameters
+    ----------
+    query : str
+        The string to match
+    choices : iterable of str
+        The strings to match it to
+    measure : _Distance
+        The measure of similarity, by its sim method
+    k : int
+        The number of matches to return
+    min_sim : float
+        The least similarity of the matches to return, if any
+
+    Returns
+    -------
+    list of tuples of str & float
+        The k choices (or fewer, if there are fewer with at least min_sim)
+        most similar to the query, and their similarities, in decreasing
+        order of similarity (and, for choices equally similar, in the order
+        of the choices)
+
+    Examples
+    --------
+    >>> from abydos.distance import JaroWinkler, Levenshtein, Jaccard
+    >>> choices = ['Niall', 'Neil', 'Nigel', 'Neal', 'Nils', 'Neill']
+    >>> best_matches('Nial', choices, Levenshtein(), 3)
+    [('Niall', 0.8), ('Neal', 0.75), ('Nigel', 0.6)]
+    >>> best_matches('Nial', choices, JaroWinkler(), 2)
+    [('Niall', 0.96), ('Nils', 0.8666666666666667)]
+    >>> best_matches('Nial', choices, Jaccard(), 5, min_sim=0.4)
+    [('Niall', 0.8333333333333334), ('Neal', 0.42857142857142855)]
+
+    .. versionadded:: 0.6.0
+
+    """
+    if not isinstance(choices, Sequence):
+        choices = list(choices)
+    if k < 1 or not choices:
+        return []
+    least = -np.inf if min_sim is None else min_sim
+
+    bounds = _upper_bounds(query, choices, measure)
+    if bounds is None:
+        order = np.arange(len(choices))
+    else:
+        bounds = bounds + _EPSILON
+        order = np.flatnonzero(bounds >= least)
+        # Score the choices that can be most similar first
+        order = order[np.argsort(-bounds[order], kind='stable')]
+
+    # The best matches, as a min-heap of their similarities & negated indices
+    best = []  # type: List[Tuple[float, int]]
+    for start in range(0, len(order), _BLOCK_SIZE):
+        block = order[start : start + _BLOCK_SIZE]
+        if bounds is not None:
+            threshold = least
+            if len(best) == k:
+                threshold = max(threshold, best[0][0])
+            if bounds[block[0]] < threshold:
+                break
+            block = block[bounds[block] >= threshold]
+        indices = block.tolist()
+        sims = measure.sim_cross([query], [choices[i] for i in indices])[0]
+        for index, sim in zip(indices, sims.tolist()):
+            if sim < least:
+                continue
+            if len(best) < k:
+                heappush(best, (sim, -index))
+            elif (sim, -index) > best[0]:
+                heapreplace(best, (sim, -index))
+
+    return [
+        (choices[-neg_index], sim)
+        for sim, neg_index in sorted(best, reverse=True)
+    ]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,426 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._cached_distance.
+
+Cached distance, a measure that memoizes the comparisons of another
+"""
+
+from collections import OrderedDict, namedtuple
+from typing import Any, MutableMapping, Optional, Tuple
+
+from ._cosine import Cosine
+from ._damerau_levenshtein import DamerauLevenshtein
+from ._dice import Dice
+from ._distance import _Distance
+from ._hamming import Hamming
+from ._indel import Indel
+from ._jaccard import Jaccard
+from ._levenshtein import Levenshtein
+from ._overlap import Overlap
+
+__all__ = ['CachedDistance']
+
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'store_hits', 'misses', 'maxsize', 'currsize']
+)
+
+
+def _known_symmetric(measure: _Distance) -> bool:
+    """Return whether a measure is known to be symmetric.
+
+    A measure is symmetric if comparing (src, tar) always gives the same
+    result as comparing (tar, src). The measures known to be symmetric, by
+    their sim, dist, and dist_abs methods, are:
+
+        - :py:class:`Levenshtein` and :py:class:`DamerauLevenshtein`, with
+          equal insert & delete costs, a normalizer of max or sum, and no
+          tapering, and :py:class:`Indel`
+        - :py:class:`Hamming`
+        - :py:class:`Jaccard`, :py:class:`Dice`, :py:class:`Cosine`, and
+          :py:class:`Overlap`, with crisp intersections
+
+    Subclasses that redefine those methods are not known to be symmetric.
+
+    Parameters
+    ----------
+    measure : _Distance
+        The measure to check
+
+    Returns
+    -------
+    bool
+        True if the measure is known to be symmetric
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    measure_type = type(measure)
+    for edit_type, dist in (
+        (Levenshtein, Levenshtein.dist),
+        (Levenshtein, Indel.dist),
+        (DamerauLevenshtein, DamerauLevenshtein.dist),
+    ):
+        if (
+            isinstance(measure, edit_type)
+            and measure_type.sim is _Distance.sim
+            and measure_type.dist is dist
+            and measure_type.dist_abs is edit_type.dist_abs
+        ):
+            if dist is Indel.dist:
+                return True
+            ins_cost, del_cost = measure._cost[:2]  # type: ignore # noqa: SF01
+            normalizer = measure._normalizer  # type: ignore # noqa: SF01
+            return (
+                ins_cost == del_cost
+                and normalizer in (max, sum)
+                and not getattr(measure, '_taper_enabled', False)
+            )
+    if measure_type is Hamming:
+        return True
+    if measure_type in {Jaccard, Dice, Cosine, Overlap}:
+        return bool(measure.params['intersection_type'] == 'crisp')
+    return False
+
+
+class CachedDistance(_Distance):
+    """Cached distance.
+
+    A cached distance wraps another measure, memoizing the results of its
+    sim, dist, and dist_abs methods for each pair of strings in a bounded,
+    least-recently-used cache, so that pairs compared repeatedly, e.g. over
+    several passes of record linkage, are compared by the measure only
+    once. The batch methods (sim_many, sim_cross, etc.) compare each pair
+    by the cache, too.
+
+    For a measure known to be symmetric (see the symmetric parameter), the
+    result for (src, tar) is also that for (tar, src), so both pairs share a
+    single entry.
+
+    Results can also be kept in a backing store, a mapping from str keys to
+    results, such as a :py:mod:`shelve` shelf (or any other
+    :py:class:`~collections.abc.MutableMapping`, e.g. one backed by a
+    :py:mod:`dbm` or SQLite database), which persists them across runs. Each
+    result computed is written to the store, and results missing from the
+    cache are sought there before they are computed. Since the store's keys
+    identify only the method and the pair of strings, a store should hold
+    the results of a single measure, in a single configuration.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        measure: _Distance,
+        maxsize: int = 1024,
+        symmetric: Optional[bool] = None,
+        store: Optional[MutableMapping[str, float]] = None,
+        **kwargs: Any
+    ) -> None:
+        """Initialize CachedDistance instance.
+
+        Parameters
+        ----------
+        measure : _Distance
+            The measure whose results to cache
+        maxsize : int
+            The maximum number of results to retain in memory
+        symmetric : bool
+            Whether the measure is symmetric, i.e. whether comparing (src,
+            tar) always gives the same result as comparing (tar, src). By
+            default, this is derived from the measure: only Levenshtein,
+            DamerauLevenshtein, & Indel distances with equal insert & delete
+            costs, Hamming distance, and Jaccard, Dice, Cosine, & Overlap
+            similarities with crisp intersections are treated as symmetric.
+            Set it to True to treat another measure as symmetric.
+        store : MutableMapping
+            A backing store for the results, such as a shelf opened by
+            :py:func:`shelve.open`, which the caller should close once done
+        **kwargs
+            Arbitrary keyword arguments
+
+        Raises
+        ------
+        ValueError
+            maxsize must be a positive integer
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(CachedDistance, self).__init__(**kwargs)
+        self.measure = measure
+        self.symmetric = (
+            _known_symmetric(measure) if symmetric is None else symmetric
+        )
+        self.store = store
+
+        self._maxsize = 0
+        self._entries = (
+            OrderedDict()
+        )  # type: OrderedDict[Tuple[str, str, str], float]
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum number of results retained in memory.
+
+        Returns
+        -------
+        int
+            The maximum size of the cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        """Set the maximum number of results retained in memory.
+
+        If the cache holds more than maxsize entries, the least recently used
+        are discarded.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum size of the cache
+
+        Raises
+        ------
+        ValueError
+            maxsize must be a positive integer
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError('maxsize must be a positive integer.')
+        self._maxsize = maxsize
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of results in the cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._entries)
+
+    def sim(self, src: str, tar: str) -> float:
+        """Return the measure's similarity of two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float
+            The measure's similarity
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = CachedDistance(Levenshtein())
+        >>> cmp.sim('cat', 'hat')
+        0.6666666666666667
+        >>> cmp.sim('hat', 'cat')
+        0.6666666666666667
+        >>> cmp.cache_info()
+        CacheInfo(hits=1, store_hits=0, misses=1, maxsize=1024, currsize=1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._lookup('sim', src, tar)
+
+    def dist(self, src: str, tar: str) -> float:
+        """Return the measure's distance of two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        float
+            The measure's distance
+
+        Examples
+        --------
+        >>> from abydos.distance import Tversky
+        >>> cmp = CachedDistance(Tversky(alpha=1, beta=0))
+        >>> cmp.dist('cat', 'cats')
+        0.25
+        >>> cmp.dist('cats', 'cat')
+        0.4
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._lookup('dist', src, tar)
+
+    def dist_abs(self, src: str, tar: str) -> float:
+        """Return the measure's absolute distance of two strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        int or float
+            The measure's absolute distance
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = CachedDistance(Levenshtein())
+        >>> cmp.dist_abs('Niall', 'Neil')
+        3
+        >>> cmp.dist_abs('Niall', 'Neil')
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._lookup('dist_abs', src, tar)
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of the hits (results found in the cache),
+            store_hits (results found in the backing store), and misses
+            (results computed by the measure), and the maxsize and current
+            size of the cache
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> cmp = CachedDistance(Jaccard(), maxsize=2)
+        >>> for pair in (('a', 'b'), ('c', 'd'), ('b', 'a'), ('e', 'f')):
+        ...     _ = cmp.sim(*pair)
+        >>> _ = cmp.sim('c', 'd')
+        >>> cmp.cache_info()
+        CacheInfo(hits=1, store_hits=0, misses=4, maxsize=2, currsize=2)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return CacheInfo(
+            self.hits,
+            self.store_hits,
+            self.misses,
+            self._maxsize,
+            len(self._entries),
+        )
+
+    def clear(self) -> None:
+        """Empty the cache and reset its statistics.
+
+        The backing store, if any, is not emptied.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def _lookup(self, method: str, src: str, tar: str) -> float:
+        """Return a result of the measure, from the cache if possible.
+
+        Parameters
+        ----------
+        method : str
+            The name of the measure's method: sim, dist, or dist_abs
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        int or float
+            The result of the method
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.symmetric and tar < src:
+            src, tar = tar, src
+        key = (method, src, tar)
+        try:
+            value = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+        store_key = ''
+        stored = None  # type: Optional[float]
+        if self.store is not None:
+            store_key = repr((method, str(src), str(tar)))
+            stored = self.store.get(store_key)
+        if stored is not None:
+            self.store_hits += 1
+            value = stored
+        else:
+            self.misses += 1
+            value = getattr(self.measure, method)(src, tar)
+            if self.store is not None:
+                self.store[store_key] = value
+
+        self._entries[key] = value
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -45,6 +45,8 @@ class ChaoJaccard(_TokenDistance):
     .. versionadded:: 0.4.1
     """
 
+    _compares_strings = True
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize ChaoJaccard instance.
 
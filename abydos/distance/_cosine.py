@@ -22,6 +22,8 @@ Cosine similarity & distance
 from math import sqrt
 from typing import Any, Optional
 
+import numpy as np
+
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
 
@@ -143,6 +145,39 @@ class Cosine(_TokenDistance):
             return num / sqrt(self._src_card() * self._tar_card())
         return 0.0
 
+    def _sim_formula(
+        self,
+        intersection: np.ndarray,
+        src_card: np.ndarray,
+        tar_card: np.ndarray,
+    ) -> np.ndarray:
+        """Return the cosine similarities of many pairs from cardinalities.
+
+        Parameters
+        ----------
+        intersection : numpy.ndarray
+            The cardinality of the intersection of each pair
+        src_card : numpy.ndarray
+            The cardinality of each source's tokens, as a column
+        tar_card : numpy.ndarray
+            The cardinality of each target's tokens, as a row
+
+        Returns
+        -------
+        numpy.ndarray
+            Cosine similarity of each pair
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.divide(
+            intersection,
+            np.sqrt(src_card * tar_card),
+            out=np.zeros(intersection.shape, dtype=np.float_),
+            where=intersection != 0,
+        )
+
 
 if __name__ == '__main__':
     import doctest
@@ -0,0 +1,347 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._csr_matrix.
+
+Compressed sparse row matrices of token counts
+"""
+
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+
+from ..tokenizer import TokenArrays
+
+try:
+    from scipy import sparse
+except ImportError:  # pragma: no cover
+    # If the system lacks the SciPy library, that's fine, but intersections
+    # will be computed by NumPy alone.
+    sparse = None  # type: ignore
+
+__all__ = ['_CSRMatrix']
+
+
+class _CSRMatrix:
+    """Compressed sparse row matrix.
+
+    A matrix of the token counts of several strings, with a row per string
+    and a column per token ID, stored in compressed sparse row form: the
+    column indices & values of the non-zero cells of row i are
+    ``indices[indptr[i]:indptr[i+1]]`` & ``data[indptr[i]:indptr[i+1]]``.
+
+    .. versionadded:: 0.6.0
+    """
+
+    # The maximum number of pairs of cells expanded at once by min_product
+    _block_cells = 1 << 22
+
+    # The maximum count for which min_product uses SciPy, with a sparse
+    # product per count
+    _scipy_max_count = 8
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        indices: np.ndarray,
+        indptr: np.ndarray,
+        shape: Tuple[int, int],
+    ) -> None:
+        """Initialize _CSRMatrix.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The values of the non-zero cells, row by row
+        indices : numpy.ndarray
+            The column index of each non-zero cell
+        indptr : numpy.ndarray
+            The offset of each row's cells in data & indices, followed by the
+            number of non-zero cells
+        shape : tuple of ints
+            The number of rows & columns
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = shape
+
+    @classmethod
+    def from_token_arrays(
+        cls, rows: Sequence[TokenArrays], n_cols: int
+    ) -> '_CSRMatrix':
+        """Return the matrix of several strings' token arrays.
+
+        Parameters
+        ----------
+        rows : sequence of TokenArrays
+            The token arrays of each row, encoded by a single vocabulary
+        n_cols : int
+            The number of columns, i.e. the size of the vocabulary
+
+        Returns
+        -------
+        _CSRMatrix
+            The matrix of token counts
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import Vocabulary
+        >>> vocab = Vocabulary()
+        >>> mat = _CSRMatrix.from_token_arrays(
+        ...     [vocab.encode({'ab': 2, 'bc': 1}), vocab.encode({'cd': 1})],
+        ...     len(vocab)
+        ... )
+        >>> mat.indptr
+        array([0, 2, 3])
+        >>> mat.toarray()
+        array([[2, 1, 0],
+               [0, 0, 1]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        indptr = np.zeros(len(rows) + 1, dtype=np.intp)
+        np.cumsum([len(row.ids) for row in rows], out=indptr[1:])
+        if rows:
+            indices = np.concatenate([row.ids for row in rows])
+            data = np.concatenate([row.counts for row in rows])
+        else:
+            indices = np.zeros(0, dtype=np.int32)
+            data = np.zeros(0, dtype=np.int64)
+        return cls(data, indices, indptr, (len(rows), n_cols))
+
+    def toarray(self) -> np.ndarray:
+        """Return the matrix as a dense array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The dense matrix
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        dense[self._row_of_cells(), self.indices] = self.data
+        return dense
+
+    def row_sums(self) -> np.ndarray:
+        """Return the sum of the absolute values of each row.
+
+        Returns
+        -------
+        numpy.ndarray
+            The cardinality of the tokens of each row, as floats
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.bincount(
+            self._row_of_cells(),
+            weights=np.abs(self.data),
+            minlength=self.shape[0],
+        )
+
+    def transpose(self) -> '_CSRMatrix':
+        """Return the transpose of the matrix.
+
+        Returns
+        -------
+        _CSRMatrix
+            The transposed matrix, with a row per column of this one
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        order = np.argsort(self.indices, kind='stable')
+        indptr = np.zeros(self.shape[1] + 1, dtype=np.intp)
+        np.cumsum(
+            np.bincount(self.indices, minlength=self.shape[1]), out=indptr[1:],
+        )
+        return _CSRMatrix(
+            self.data[order],
+            self._row_of_cells()[order],
+            indptr,
+            (self.shape[1], self.shape[0]),
+        )
+
+    def min_product(self, other: '_CSRMatrix') -> np.ndarray:
+        """Return the sums of the minima of each pair of rows.
+
+        Cell (i, j) of the result is the sum, over the columns, of the
+        minimum of row i of this matrix and row j of other. For matrices of
+        token counts, this is the cardinality of the crisp intersection of
+        the tokens of each pair of strings. Only pairs of cells that are both
+        non-zero contribute, so the counts must be non-negative.
+
+        Parameters
+        ----------
+        other : _CSRMatrix
+            A matrix with the same number of columns
+
+        Returns
+        -------
+        numpy.ndarray
+            A dense matrix of floats, with a row per row of this matrix and a
+            column per row of other
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import Vocabulary
+        >>> vocab = Vocabulary()
+        >>> src = [vocab.encode({'ab': 2, 'bc': 1}), vocab.encode({'cd': 1})]
+        >>> tar = [vocab.encode({'ab': 1, 'cd': 3}), vocab.encode({'ab': 3})]
+        >>> _CSRMatrix.from_token_arrays(src, len(vocab)).min_product(
+        ...     _CSRMatrix.from_token_arrays(tar, len(vocab))
+        ... )
+        array([[1., 2.],
+               [1., 0.]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        n_rows, n_other = self.shape[0], other.shape[0]
+        if (
+            sparse is not None
+            and self.data.dtype.kind in 'iu'
+            and other.data.dtype.kind in 'iu'
+            and max(self._max_count(), other._max_count())
+            <= self._scipy_max_count
+        ):  # pragma: no cover
+            return self._scipy_min_product(other)
+
+        # Pair each cell of this matrix with the cells of the same column of
+        # other, found in the rows of its transpose
+        columns = other.transpose()
+        cell_rows = self._row_of_cells()
+        starts = columns.indptr[self.indices]
+        lengths = columns.indptr[self.indices + 1] - starts
+
+        product = np.zeros(n_rows * n_other, dtype=np.float_)
+        # Expand the pairs in blocks of rows, to bound the memory used
+        row_bounds = np.concatenate(([0], np.cumsum(lengths)))[self.indptr]
+        row = 0
+        while row < n_rows:
+            end = int(
+                np.searchsorted(
+                    row_bounds,
+                    row_bounds[row] + self._block_cells,
+                    side='right',
+                )
+            )
+            end = min(max(end - 1, row + 1), n_rows)
+            cells = slice(self.indptr[row], self.indptr[end])
+            block_lengths = lengths[cells]
+            n_pairs = int(block_lengths.sum())
+            if n_pairs:
+                offsets = np.repeat(
+                    starts[cells] - (np.cumsum(block_lengths) - block_lengths),
+                    block_lengths,
+                )
+                pairs = offsets + np.arange(n_pairs)
+                product += np.bincount(
+                    np.repeat(cell_rows[cells], block_lengths) * n_other
+                    + columns.indices[pairs],
+                    weights=np.minimum(
+                        np.repeat(self.data[cells], block_lengths),
+                        columns.data[pairs],
+                    ),
+                    minlength=n_rows * n_other,
+                )
+            row = end
+        return product.reshape(n_rows, n_other)
+
+    def _scipy_min_product(
+        self, other: '_CSRMatrix'
+    ) -> np.ndarray:  # pragma: no cover
+        """Return the sums of the minima of each pair of rows, by SciPy.
+
+        For non-negative integers, :math:`min(x, y)` is the number of counts
+        :math:`k \\geq 1` for which both :math:`x \\geq k` and
+        :math:`y \\geq k`, so the result is the sum, over the counts, of the
+        sparse products of the matrices' indicators of counts of at least k.
+
+        Parameters
+        ----------
+        other : _CSRMatrix
+            A matrix with the same number of columns
+
+        Returns
+        -------
+        numpy.ndarray
+            A dense matrix of floats
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        product = np.zeros((self.shape[0], other.shape[0]), dtype=np.float_)
+        for count in range(1, max(self._max_count(), other._max_count()) + 1):
+            product += (
+                self._scipy_indicator(count)
+                .dot(other._scipy_indicator(count).T)
+                .toarray()
+            )
+        return product
+
+    def _scipy_indicator(self, count: int) -> Any:  # pragma: no cover
+        """Return a SciPy matrix of which cells are at least count.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return sparse.csr_matrix(
+            (
+                (self.data >= count).astype(np.float_),
+                self.indices,
+                self.indptr,
+            ),
+            shape=self.shape,
+        )
+
+    def _max_count(self) -> int:
+        """Return the greatest value of the matrix, or 0 if it is empty.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return int(self.data.max()) if len(self.data) else 0
+
+    def _row_of_cells(self) -> np.ndarray:
+        """Return the row index of each non-zero cell.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.repeat(
+            np.arange(self.shape[0], dtype=np.intp), np.diff(self.indptr)
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -20,7 +20,7 @@ Damerau-Levenshtein distance
 """
 
 from sys import maxsize
-from typing import Any, Callable, List, Tuple, cast
+from typing import Any, Callable, Dict, List, Tuple, cast
 
 from numpy import int_ as np_int
 from numpy import zeros as np_zeros
@@ -188,6 +188,200 @@ class DamerauLevenshtein(_Distance):
 
         return cast(float, d_mat[len(src) - 1, len(tar) - 1])
 
+    def dist_abs_bounded(
+        self, src: str, tar: str, max_distance: float
+    ) -> float:
+        """Return the Damerau-Levenshtein distance, if at most max_distance.
+
+        Only the diagonal band of the distance matrix that can contain a path
+        of cost max_distance or less is computed :cite:`Ukkonen:1985`. Since a
+        transposition may skip over rows of the matrix, but pays for each
+        skipped row with a delete, the computation stops once enough
+        consecutive rows exceed max_distance that no such skip could fall
+        back within max_distance.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : int or float
+            The greatest distance of interest
+
+        Returns
+        -------
+        int (may return a float if cost has float values)
+            The Damerau-Levenshtein distance between src & tar, if it is no
+            greater than max_distance; otherwise max_distance + 1
+
+        Raises
+        ------
+        ValueError
+            Unsupported cost assignment; the cost of two transpositions must
+            not be less than the cost of an insert plus a delete.
+
+        Examples
+        --------
+        >>> cmp = DamerauLevenshtein()
+        >>> cmp.dist_abs_bounded('Niall', 'Neil', 3)
+        3
+        >>> cmp.dist_abs_bounded('aluminum', 'Catalan', 4)
+        5
+        >>> cmp.dist_abs_bounded('ATCG', 'TAGC', 2)
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+
+        src_len = len(src)
+        tar_len = len(tar)
+
+        if src == tar:
+            return 0
+        if not src or not tar:
+            distance = self.dist_abs(src, tar)
+            return distance if distance <= max_distance else max_distance + 1
+
+        if 2 * trans_cost < ins_cost + del_cost:
+            raise ValueError(
+                'Unsupported cost assignment; the cost of two transpositions '
+                + 'must not be less than the cost of an insert plus a delete.'
+            )
+
+        diff = tar_len - src_len
+
+        def _lower_bound(offset: int) -> float:
+            # indels needed to reach the diagonal, then to leave it for the
+            # final cell
+            reach = offset * ins_cost if offset > 0 else -offset * del_cost
+            rest = diff - offset
+            return reach + (rest * ins_cost if rest > 0 else -rest * del_cost)
+
+        # The pre-swap cell is clamped to the first row & column, which lets
+        # a path reuse one character, so the bound may be short one indel.
+        slack = max_distance + max(ins_cost, del_cost)
+        if _lower_bound(0) > slack:
+            return max_distance + 1
+        offsets = [
+            offset
+            for offset in range(-src_len, tar_len + 1)
+            if _lower_bound(offset) <= slack
+        ]
+        band_lo, band_hi = offsets[0], offsets[-1]
+
+        # Each row is stored as the column of its first banded cell and the
+        # banded cells themselves; cells outside the band are never on a path
+        # of cost max_distance or less and read as maxsize.
+        starts = []  # type: List[int]
+        rows = []  # type: List[List[float]]
+
+        def _cell(i: int, j: int) -> float:
+            start = starts[i]
+            if start <= j < start + len(rows[i]):
+                return rows[i][j - start]
+            return maxsize
+
+        # A transposition spanning skip rows costs at least (skip - 1) deletes
+        window = int(max_distance // del_cost) + 2 if del_cost else 0
+        rows_over = 0
+
+        src_index_by_character = {}  # type: Dict[str, int]
+        for i in range(src_len):
+            lo = max(0, i + band_lo)
+            hi = min(tar_len - 1, i + band_hi)
+            row = []  # type: List[float]
+            starts.append(lo)
+            rows.append(row)
+
+            if i == 0:
+                for j in range(lo, hi + 1):
+                    if j == 0:
+                        row.append(
+                            0
+                            if src[0] == tar[0]
+                            else int(min(sub_cost, ins_cost + del_cost))
+                        )
+                        continue
+                    del_distance = (j + 1) * ins_cost + del_cost
+                    ins_distance = _cell(0, j - 1) + ins_cost
+                    match_distance = j * ins_cost + (
+                        0 if src[0] == tar[j] else sub_cost
+                    )
+                    row.append(
+                        int(min(del_distance, ins_distance, match_distance))
+                    )
+            else:
+                if lo == 0:
+                    del_distance = _cell(i - 1, 0) + del_cost
+                    ins_distance = (i + 1) * del_cost + ins_cost
+                    match_distance = i * del_cost + (
+                        0 if src[i] == tar[0] else sub_cost
+                    )
+                    row.append(
+                        int(min(del_distance, ins_distance, match_distance))
+                    )
+                    lo = 1
+
+                max_src_letter_match_index = tar.rfind(src[i], 0, lo)
+                for j in range(lo, hi + 1):
+                    candidate_swap_index = src_index_by_character.get(
+                        tar[j], -1
+                    )
+                    j_swap = max_src_letter_match_index
+                    del_distance = _cell(i - 1, j) + del_cost
+                    ins_distance = (
+                        row[-1] if len(row) else maxsize
+                    ) + ins_cost
+                    match_distance = _cell(i - 1, j - 1)
+                    if src[i] != tar[j]:
+                        match_distance += sub_cost
+                    else:
+                        max_src_letter_match_index = j
+
+                    if candidate_swap_index != -1 and j_swap != -1:
+                        i_swap = candidate_swap_index
+
+                        if i_swap == 0 and j_swap == 0:
+                            pre_swap_cost = 0
+                        else:
+                            pre_swap_cost = _cell(
+                                max(0, i_swap - 1), max(0, j_swap - 1)
+                            )
+                        swap_distance = (
+                            pre_swap_cost
+                            + (i - i_swap - 1) * del_cost
+                            + (j - j_swap - 1) * ins_cost
+                            + trans_cost
+                        )
+                    else:
+                        swap_distance = maxsize
+
+                    row.append(
+                        int(
+                            min(
+                                del_distance,
+                                ins_distance,
+                                match_distance,
+                                swap_distance,
+                            )
+                        )
+                    )
+            src_index_by_character[src[i]] = i
+
+            if not row or min(row) > max_distance:
+                rows_over += 1
+                if window and rows_over >= window:
+                    return max_distance + 1
+            else:
+                rows_over = 0
+
+        distance = _cell(src_len - 1, tar_len - 1)
+        return distance if distance <= max_distance else max_distance + 1
+
     def dist(self, src: str, tar: str) -> float:
         """Return the Damerau-Levenshtein similarity of two strings.
 
@@ -117,10 +117,8 @@ class DiscountedLevenshtein(Levenshtein):
     def _exp_discount(discounts: float) -> float:
         return 1 / (discounts + 1) ** 0.2
 
-    def _alignment_matrix(
-        self, src: str, tar: str, backtrace: bool = True
-    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
-        """Return the Levenshtein alignment matrix.
+    def _discount_from_positions(self, src: str, tar: str) -> List[int]:
+        """Return the positions in src & tar from which to discount edits.
 
         Parameters
         ----------
@@ -128,21 +126,16 @@ class DiscountedLevenshtein(Levenshtein):
             Source string for comparison
         tar : str
             Target string for comparison
-        backtrace : bool
-            Return the backtrace matrix as well
 
         Returns
         -------
-        numpy.ndarray or tuple(numpy.ndarray, numpy.ndarray)
-            The alignment matrix and (optionally) the backtrace matrix
+        list
+            The first discounted positions of src & tar, respectively
 
 
-        .. versionadded:: 0.4.1
+        .. versionadded:: 0.6.0
 
         """
-        src_len = len(src)
-        tar_len = len(tar)
-
         if self._discount_from == 'coda':
             discount_from = [0, 0]
 
@@ -175,6 +168,35 @@ class DiscountedLevenshtein(Levenshtein):
         else:
             discount_from = [1, 1]
 
+        return discount_from
+
+    def _alignment_matrix(
+        self, src: str, tar: str, backtrace: bool = True
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Return the Levenshtein alignment matrix.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        backtrace : bool
+            Return the backtrace matrix as well
+
+        Returns
+        -------
+        numpy.ndarray or tuple(numpy.ndarray, numpy.ndarray)
+            The alignment matrix and (optionally) the backtrace matrix
+
+
+        .. versionadded:: 0.4.1
+
+        """
+        src_len = len(src)
+        tar_len = len(tar)
+        discount_from = self._discount_from_positions(src, tar)
+
         d_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.float_)
         if backtrace:
             trace_mat = np.zeros((src_len + 1, tar_len + 1), dtype=np.int8)
@@ -292,6 +314,103 @@ class DiscountedLevenshtein(Levenshtein):
         else:
             return cast(float, d_mat[src_len, tar_len])
 
+    def dist_abs_bounded(
+        self, src: str, tar: str, max_distance: float
+    ) -> float:
+        """Return the discounted distance, if it is at most max_distance.
+
+        The discounted edit costs may fall arbitrarily close to zero, so the
+        full width of each row of the alignment matrix is computed, but the
+        computation stops as soon as every cell of a row (or, in ``osa`` mode,
+        of two consecutive rows) exceeds max_distance.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : int or float
+            The greatest distance of interest
+
+        Returns
+        -------
+        float
+            The discounted Levenshtein distance between src & tar, if it is no
+            greater than max_distance; otherwise max_distance + 1
+
+        Examples
+        --------
+        >>> cmp = DiscountedLevenshtein()
+        >>> cmp.dist_abs_bounded('Niall', 'Neil', 3)
+        2.526064024369237
+        >>> cmp.dist_abs_bounded('aluminum', 'Catalan', 2)
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_len = len(src)
+        tar_len = len(tar)
+
+        if src == tar:
+            return 0.0
+        if not src or not tar:
+            distance = self.dist_abs(src, tar)
+            return distance if distance <= max_distance else max_distance + 1
+
+        discount_from = self._discount_from_positions(src, tar)
+        osa = self._mode == 'osa'
+
+        prev_row = [0.0] * (tar_len + 1)
+        for j in range(1, tar_len + 1):
+            prev_row[j] = prev_row[j - 1] + self._discount_func(
+                max(0, j - discount_from[1])
+            )
+        prev_prev_row = prev_row
+        prev_min = 0.0
+        tar_discounts = [
+            self._discount_func(max(0, j - discount_from[1]))
+            for j in range(tar_len)
+        ]
+
+        for i in range(src_len):
+            i_extend = self._discount_func(max(0, i - discount_from[0]))
+            row = [
+                prev_row[0]
+                + self._discount_func(max(0, i + 1 - discount_from[0]))
+            ] + [0.0] * tar_len
+            for j in range(tar_len):
+                cost = min(i_extend, tar_discounts[j])
+                cell = min(
+                    row[j] + cost,  # ins
+                    prev_row[j + 1] + cost,  # del
+                    prev_row[j] + (cost if src[i] != tar[j] else 0),  # sub/==
+                )
+                if (
+                    osa
+                    and i
+                    and j
+                    and src[i] == tar[j - 1]
+                    and src[i - 1] == tar[j]
+                ):
+                    # transposition
+                    cell = min(cell, prev_prev_row[j - 1] + cost)
+                row[j + 1] = cell
+
+            row_min = min(row)
+            if row_min > max_distance and (not osa or prev_min > max_distance):
+                return max_distance + 1
+            prev_prev_row, prev_row, prev_min = prev_row, row, row_min
+
+        distance = prev_row[tar_len]
+        if distance > max_distance:
+            return max_distance + 1
+        if int(distance) == distance:
+            return int(distance)
+        return distance
+
     def dist(self, src: str, tar: str) -> float:
         """Return the normalized Levenshtein distance between two strings.
 
@@ -18,7 +18,9 @@
 
 The distance._distance module implements abstract class _Distance.
 """
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
+
+import numpy as np
 
 __all__ = ['_Distance']
 
@@ -122,6 +124,133 @@ class _Distance:
         """
         return self.dist(src, tar)
 
+    def sim_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the similarities of a string to each of several strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of src to each of the targets
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.fromiter(
+            (self.sim(src, tar) for tar in targets), dtype=np.float_
+        )
+
+    def dist_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the distances of a string to each of several strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of src to each of the targets
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.fromiter(
+            (self.dist(src, tar) for tar in targets), dtype=np.float_
+        )
+
+    def dist_abs_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the absolute distances of a string to several strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The absolute distance of src to each of the targets
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.fromiter(
+            (self.dist_abs(src, tar) for tar in targets), dtype=np.float_
+        )
+
+    def sim_cross(
+        self, srcs: Iterable[str], targets: Iterable[str]
+    ) -> np.ndarray:
+        """Return the similarities of each of several strings to several more.
+
+        Parameters
+        ----------
+        srcs : iterable of str
+            Source strings for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-dimensional array of the similarity of each of the srcs (by
+            row) to each of the targets (by column)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        targets = list(targets)
+        srcs = list(srcs)
+        sims = np.empty((len(srcs), len(targets)), dtype=np.float_)
+        for i, src in enumerate(srcs):
+            sims[i] = self.sim_many(src, targets)
+        return sims
+
+    def dist_cross(
+        self, srcs: Iterable[str], targets: Iterable[str]
+    ) -> np.ndarray:
+        """Return the distances of each of several strings to several more.
+
+        Parameters
+        ----------
+        srcs : iterable of str
+            Source strings for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-dimensional array of the distance of each of the srcs (by
+            row) to each of the targets (by column)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        targets = list(targets)
+        srcs = list(srcs)
+        dists = np.empty((len(srcs), len(targets)), dtype=np.float_)
+        for i, src in enumerate(srcs):
+            dists[i] = self.dist_many(src, targets)
+        return dists
+
 
 if __name__ == '__main__':
     import doctest
@@ -38,6 +38,8 @@ class FellegiSunter(_TokenDistance):
     .. versionadded:: 0.4.0
     """
 
+    _compares_strings = True
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -39,6 +39,8 @@ class FuzzyWuzzyTokenSet(_TokenDistance):
     .. versionadded:: 0.4.0
     """
 
+    _compares_strings = True
+
     def __init__(
         self, tokenizer: Optional[_Tokenizer] = None, **kwargs: Any
     ) -> None:
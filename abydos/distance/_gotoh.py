@@ -18,11 +18,9 @@
 
 Gotoh score
 """
-from typing import Any, Callable, Optional, cast
-
-from numpy import float_ as np_float
-from numpy import zeros as np_zeros
+from typing import Any, Callable, Optional, Tuple, cast
 
+from ._affine_gap_aligner import _AffineGapAligner
 from ._needleman_wunsch import NeedlemanWunsch
 
 __all__ = ['Gotoh']
@@ -101,49 +99,69 @@ class Gotoh(NeedlemanWunsch):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Computed in linear space, a row at a time
+
+        """
+        return self._aligner().score(src, tar)
+
+    def _aligner(self) -> _AffineGapAligner:
+        """Return an aligner with this measure's scores & gap costs.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _AffineGapAligner(
+            self._sim_func,
+            self._gap_open,
+            self._gap_ext,
+            self._gap_open,
+            self._gap_ext,
+            gap_switch=False,
+        )
+
+    def alignment(
+        self, src: str, tar: str, linear_space: Optional[bool] = None
+    ) -> Tuple[float, str, str]:
+        """Return the Gotoh alignment of two strings.
+
+        An optimal alignment can be found either from full matrices of back
+        pointers, or in linear space by divide-and-conquer
+        :cite:`Hirschberg:1975,Myers:1988`, which returns the same score,
+        though possibly a different alignment of equal score.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        linear_space : bool or None
+            If True, align in linear space; if False, build full matrices; if
+            None (default), align in linear space when the matrices would have
+            more than 2**22 cells
+
+        Returns
+        -------
+        tuple
+            A tuple containing the Gotoh score and the two strings, aligned,
+            with gaps marked by '-'
+
+        Examples
+        --------
+        >>> cmp = Gotoh()
+        >>> cmp.alignment('cat', 'hat')
+        (2.0, 'cat', 'hat')
+        >>> cmp.alignment('Niall', 'Neil')
+        (1.0, 'Niall', 'N-eil')
+        >>> cmp.alignment('aluminum', 'Catalan')
+        (-0.4, '-aluminum', 'Catalan--')
+
+
+        .. versionadded:: 0.6.0
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-        p_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-        q_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-
-        d_mat[0, 0] = 0
-        p_mat[0, 0] = float('-inf')
-        q_mat[0, 0] = float('-inf')
-        for i in range(1, len(src) + 1):
-            d_mat[i, 0] = float('-inf')
-            p_mat[i, 0] = -self._gap_open - self._gap_ext * (i - 1)
-            q_mat[i, 0] = float('-inf')
-            if len(tar) > 1:
-                q_mat[i, 1] = -self._gap_open
-        for j in range(1, len(tar) + 1):
-            d_mat[0, j] = float('-inf')
-            p_mat[0, j] = float('-inf')
-            if len(src) > 1:
-                p_mat[1, j] = -self._gap_open
-            q_mat[0, j] = -self._gap_open - self._gap_ext * (j - 1)
-
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                sim_val = self._sim_func(src[i - 1], tar[j - 1])
-                d_mat[i, j] = max(
-                    d_mat[i - 1, j - 1] + sim_val,
-                    p_mat[i - 1, j - 1] + sim_val,
-                    q_mat[i - 1, j - 1] + sim_val,
-                )
-
-                p_mat[i, j] = max(
-                    d_mat[i - 1, j] - self._gap_open,
-                    p_mat[i - 1, j] - self._gap_ext,
-                )
-
-                q_mat[i, j] = max(
-                    d_mat[i, j - 1] - self._gap_open,
-                    q_mat[i, j - 1] - self._gap_ext,
-                )
-
-        i, j = (n - 1 for n in d_mat.shape)
-        return cast(float, max(d_mat[i, j], p_mat[i, j], q_mat[i, j]))
+        return self._aligner().align(src, tar, linear_space)
 
     def sim(self, src: str, tar: str) -> float:
         """Return the normalized Gotoh score of two strings.
@@ -178,8 +196,14 @@ class Gotoh(NeedlemanWunsch):
         """
         if src == tar:
             return 1.0
+        src_score = self.sim_score(src, src)
+        tar_score = self.sim_score(tar, tar)
+        # A string that scores nothing against itself, such as the empty
+        # string, is not similar to any other
+        if src_score <= 0.0 or tar_score <= 0.0:
+            return 0.0
         return max(0.0, self.sim_score(src, tar)) / (
-            self.sim_score(src, src) ** 0.5 * self.sim_score(tar, tar) ** 0.5
+            src_score ** 0.5 * tar_score ** 0.5
         )
 
 
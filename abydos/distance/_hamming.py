@@ -19,7 +19,10 @@
 Hamming distance
 """
 
-from typing import Any
+from collections import defaultdict
+from typing import Any, DefaultDict, Iterable, List
+
+import numpy as np
 
 from ._distance import _Distance
 
@@ -158,6 +161,154 @@ class Hamming(_Distance):
             return 0.0
         return self.dist_abs(src, tar) / max(len(src), len(tar))
 
+    @staticmethod
+    def _code_points(strings: List[str], length: int) -> np.ndarray:
+        """Return the code points of equal-length strings as a 2-D array.
+
+        Parameters
+        ----------
+        strings : list of str
+            Strings, all of the same length
+        length : int
+            The length of each of the strings
+
+        Returns
+        -------
+        numpy.ndarray
+            An array with one row of code points per string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.frombuffer(
+            ''.join(strings).encode('utf-32-le', 'surrogatepass'),
+            dtype=np.uint32,
+        ).reshape(len(strings), length)
+
+    def dist_abs_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the Hamming distances of a string to several strings.
+
+        Targets are grouped by length, and each group is compared with src
+        as a single array operation.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The Hamming distance of src to each of the targets
+
+        Raises
+        ------
+        ValueError
+            Undefined for sequences of unequal length; set diff_lens to True
+            for Hamming distance between strings of unequal lengths.
+
+        Examples
+        --------
+        >>> cmp = Hamming()
+        >>> cmp.dist_abs_many('cat', ['hat', 'cats', 'tac', ''])
+        array([1., 1., 2., 3.])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        targets = list(targets)
+        src_len = len(src)
+        src_codes = self._code_points([src], src_len)[0]
+
+        by_len = defaultdict(list)  # type: DefaultDict[int, List[int]]
+        for idx, tar in enumerate(targets):
+            by_len[len(tar)].append(idx)
+
+        hdists = np.zeros(len(targets), dtype=np.float_)
+        for tar_len, idxs in by_len.items():
+            if not self._diff_lens and tar_len != src_len:
+                raise ValueError(
+                    'Undefined for sequences of unequal length; set '
+                    + 'diff_lens to True for Hamming distance between strings '
+                    + 'of unequal lengths.'
+                )
+            overlap = min(src_len, tar_len)
+            tar_codes = self._code_points(
+                [targets[idx] for idx in idxs], tar_len
+            )
+            hdists[idxs] = np.count_nonzero(
+                tar_codes[:, :overlap] != src_codes[:overlap], axis=1
+            )
+            if self._diff_lens:
+                hdists[idxs] += abs(src_len - tar_len)
+
+        return hdists
+
+    def dist_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the normalized Hamming distances to several strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Hamming distance of src to each of the targets
+
+        Examples
+        --------
+        >>> cmp = Hamming()
+        >>> cmp.dist_many('cat', ['hat', 'cats', 'tac', ''])
+        array([0.33333333, 0.25      , 0.66666667, 1.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        targets = list(targets)
+        hdists = self.dist_abs_many(src, targets)
+        lens = np.fromiter(
+            (max(len(src), len(tar)) for tar in targets), dtype=np.float_
+        )
+        return np.divide(
+            hdists, lens, out=np.zeros_like(hdists), where=lens > 0
+        )
+
+    def sim_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the normalized Hamming similarities to several strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Hamming similarity of src to each of the targets
+
+        Examples
+        --------
+        >>> cmp = Hamming()
+        >>> cmp.sim_many('cat', ['hat', 'cats', 'tac', ''])
+        array([0.66666667, 0.75      , 0.33333333, 0.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.dist_many(src, targets)
+
 
 if __name__ == '__main__':
     import doctest
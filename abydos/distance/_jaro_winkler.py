@@ -23,9 +23,12 @@ The distance._JaroWinkler module implements distance metrics based on
     - Jaro-Winkler distance
 """
 
-from typing import Any
+from typing import Any, Iterable, List, cast
+
+import numpy as np
 
 from ._distance import _Distance
+from ._prepared_string import PreparedString
 from ..tokenizer import QGrams
 
 __all__ = ['JaroWinkler']
@@ -144,6 +147,63 @@ class JaroWinkler(_Distance):
         .. versionchanged:: 0.3.6
             Encapsulated in class
 
+        """
+        self._check_params()
+
+        if src == tar:
+            return 1.0
+
+        tokenizer = QGrams(self._qval)
+        return self._sim_lists(
+            self._qgrams(src, tokenizer), self._qgrams(tar, tokenizer)
+        )
+
+    def _qgrams(self, string: str, tokenizer: QGrams) -> List[str]:
+        """Return the q-grams of a string, once stripped, as a list.
+
+        The q-grams of a :py:class:`PreparedString` are cached.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+        tokenizer : QGrams
+            A q-gram tokenizer, of the measure's qval
+
+        Returns
+        -------
+        list of str
+            The q-grams of string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(string, PreparedString):
+            return cast(
+                List[str],
+                string.derived(
+                    ('jaro_qgrams', self._qval),
+                    lambda plain: tokenizer.tokenize(plain.strip()).get_list(),
+                ),
+            )
+        return tokenizer.tokenize(string.strip()).get_list()
+
+    def _check_params(self) -> None:
+        """Raise a ValueError if the Winkler parameters are out of range.
+
+        Raises
+        ------
+        ValueError
+            Unsupported boost_threshold assignment; boost_threshold must be
+            between 0 and 1.
+        ValueError
+            Unsupported scaling_factor assignment; scaling_factor must be
+            between 0 and 0.25.'
+
+
+        .. versionadded:: 0.6.0
+
         """
         if self._mode == 'winkler':
             if self._boost_threshold > 1 or self._boost_threshold < 0:
@@ -157,15 +217,25 @@ class JaroWinkler(_Distance):
                     + 'scaling_factor must be between 0 and 0.25.'
                 )
 
-        if src == tar:
-            return 1.0
+    def _sim_lists(self, src_list: List[str], tar_list: List[str]) -> float:
+        """Return the Jaro or Jaro-Winkler similarity of two q-gram lists.
 
-        tokenizer = QGrams(self._qval)
-        tokenizer.tokenize(src.strip())
-        src_list = tokenizer.get_list()
-        tokenizer.tokenize(tar.strip())
-        tar_list = tokenizer.get_list()
+        Parameters
+        ----------
+        src_list : list of str
+            The q-grams of the source string
+        tar_list : list of str
+            The q-grams of the target string
+
+        Returns
+        -------
+        float
+            Jaro or Jaro-Winkler similarity
 
+
+        .. versionadded:: 0.6.0
+
+        """
         lens = len(src_list)
         lent = len(tar_list)
 
@@ -249,6 +319,82 @@ class JaroWinkler(_Distance):
 
         return weight
 
+    def sim_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the Jaro or Jaro-Winkler similarities to several strings.
+
+        The q-grams of src are computed once and reused for each of the
+        targets.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The Jaro or Jaro-Winkler similarity of src to each of the targets
+
+        Raises
+        ------
+        ValueError
+            Unsupported boost_threshold assignment; boost_threshold must be
+            between 0 and 1.
+        ValueError
+            Unsupported scaling_factor assignment; scaling_factor must be
+            between 0 and 0.25.'
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> cmp.sim_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.805     , 0.78666667, 1.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_params()
+
+        tokenizer = QGrams(self._qval)
+        src_list = self._qgrams(src, tokenizer)
+
+        def _sim(tar: str) -> float:
+            if src == tar:
+                return 1.0
+            return self._sim_lists(src_list, self._qgrams(tar, tokenizer))
+
+        return np.fromiter((_sim(tar) for tar in targets), dtype=np.float_)
+
+    def dist_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the Jaro or Jaro-Winkler distances to several strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The Jaro or Jaro-Winkler distance of src to each of the targets
+
+        Examples
+        --------
+        >>> cmp = JaroWinkler()
+        >>> cmp.dist_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.195     , 0.21333333, 0.        ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.sim_many(src, targets)
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,7 +19,7 @@
 Longest common subsequence
 """
 
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List
 
 from numpy import int_ as np_int
 from numpy import zeros as np_zeros
@@ -127,6 +127,63 @@ class LCSseq(_Distance):
                 j -= 1
         return result
 
+    def lcsseq_len(self, src: str, tar: str) -> int:
+        """Return the length of the longest common subsequence of two strings.
+
+        This uses the bit-parallel algorithm of :cite:`Allison:1986`, in the
+        formulation of :cite:`Hyyro:2004`, with a Python int as the bit-vector
+        over the characters of the shorter string. No matrix or subsequence is
+        built, so it is much faster than taking the length of
+        :py:meth:`lcsseq`.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        int
+            The length of the longest common subsequence
+
+        Examples
+        --------
+        >>> sseq = LCSseq()
+        >>> sseq.lcsseq_len('cat', 'hat')
+        2
+        >>> sseq.lcsseq_len('Niall', 'Neil')
+        3
+        >>> sseq.lcsseq_len('aluminum', 'Catalan')
+        3
+        >>> sseq.lcsseq_len('ATCG', 'TAGC')
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if len(tar) < len(src):
+            src, tar = tar, src
+        if not src:
+            return 0
+
+        # Bit i of matches[char] is set iff src[i] == char
+        matches = {}  # type: Dict[str, int]
+        for i, char in enumerate(src):
+            matches[char] = matches.get(char, 0) | (1 << i)
+
+        mask = (1 << len(src)) - 1
+        vec = mask
+        for char in tar:
+            if char in matches:
+                match_vec = vec & matches[char]
+                vec = ((vec + match_vec) | (vec - match_vec)) & mask
+
+        # Each unset bit of vec marks a character of the LCS
+        return len(src) - bin(vec).count('1')
+
     def sim(self, src: str, tar: str) -> float:
         r"""Return the longest common subsequence similarity of two strings.
 
@@ -164,13 +221,15 @@ class LCSseq(_Distance):
             Encapsulated in class
         .. versionchanged:: 0.4.0
             Added normalization option
+        .. versionchanged:: 0.6.0
+            Computed with the bit-parallel :py:meth:`lcsseq_len`
 
         """
         if src == tar:
             return 1.0
         elif not src or not tar:
             return 0.0
-        return len(self.lcsseq(src, tar)) / self._normalizer(
+        return self.lcsseq_len(src, tar) / self._normalizer(
             [len(src), len(tar)]
         )
 
@@ -21,10 +21,8 @@ Longest common substring
 
 from typing import Any, Callable, List
 
-from numpy import int_ as np_int
-from numpy import zeros as np_zeros
-
 from ._distance import _Distance
+from ._suffix_automaton import _SuffixAutomaton
 
 __all__ = ['LCSstr']
 
@@ -71,6 +69,9 @@ class LCSstr(_Distance):
         Modifications include:
 
             - conversion to a numpy array in place of a list of lists
+            - replacement of the dynamic programming matrix by a suffix
+              automaton of tar :cite:`Blumer:1985`, which finds the same
+              substring in linear time
 
         Parameters
         ----------
@@ -100,20 +101,12 @@ class LCSstr(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Found in linear time with a suffix automaton
 
         """
-        lengths = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
-        longest, i_longest = 0, 0
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                if src[i - 1] == tar[j - 1]:
-                    lengths[i, j] = lengths[i - 1, j - 1] + 1
-                    if lengths[i, j] > longest:
-                        longest = lengths[i, j]
-                        i_longest = i
-                else:
-                    lengths[i, j] = 0
-        return src[i_longest - longest : i_longest]
+        start, _, length = _SuffixAutomaton(tar).longest_common_substring(src)
+        return src[start : start + length]
 
     def sim(self, src: str, tar: str) -> float:
         r"""Return the longest common substring similarity of two strings.
@@ -23,12 +23,25 @@ based on Levenshtein distance, including:
     - Optimal String Alignment distance
 """
 
+from math import inf
 from sys import float_info
-from typing import Any, Callable, List, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 
+from ._affine_gap_aligner import _AffineGapAligner
 from ._distance import _Distance
+from ._prepared_string import PreparedString
 
 __all__ = ['Levenshtein']
 
@@ -49,6 +62,11 @@ class Levenshtein(_Distance):
     Levenshtein edit distance ordinarily has unit insertion, deletion, and
     substitution costs.
 
+    When all costs are 1 and tapering is disabled, :py:meth:`dist_abs` uses
+    the bit-parallel algorithm of Myers :cite:`Myers:1999`, as formulated by
+    Hyyrö :cite:`Hyyro:2003`, which also supports the Optimal String Alignment
+    distance.
+
     .. versionadded:: 0.3.6
     .. versionchanged:: 0.4.0
         Added taper option
@@ -109,6 +127,132 @@ class Levenshtein(_Distance):
             else 1
         )
 
+    def _bitparallel_applies(self) -> bool:
+        """Return True if the bit-parallel algorithm computes the distance.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            not self._taper_enabled
+            and self._cost == (1, 1, 1, 1)
+            and self._mode in {'lev', 'osa'}
+        )
+
+    @staticmethod
+    def _char_masks(pattern: str) -> Dict[str, int]:
+        """Return the match bit-vector of each character in pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            The string to encode
+
+        Returns
+        -------
+        dict
+            A dict mapping each character of pattern to an int whose set bits
+            mark the positions at which that character occurs. The masks of
+            a :py:class:`PreparedString` are cached.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(pattern, PreparedString):
+            return cast(
+                Dict[str, int],
+                pattern.derived('char_masks', Levenshtein._char_masks),
+            )
+        masks = {}  # type: Dict[str, int]
+        bit = 1
+        for char in pattern:
+            masks[char] = masks.get(char, 0) | bit
+            bit <<= 1
+        return masks
+
+    def _bitparallel_dist_abs(
+        self,
+        masks: Dict[str, int],
+        pat_len: int,
+        text: str,
+        max_distance: Optional[int] = None,
+    ) -> int:
+        """Return the unit-cost distance by the bit-parallel algorithm.
+
+        Python ints are arbitrary-precision, so a single bit-vector spans the
+        whole pattern and the carries between machine words that a blocked
+        implementation would handle explicitly are propagated natively.
+
+        Parameters
+        ----------
+        masks : dict
+            The character masks of the pattern, as returned by _char_masks
+        pat_len : int
+            The length of the pattern
+        text : str
+            The string compared against the pattern
+        max_distance : int
+            If supplied, the computation stops as soon as the distance is
+            certain to exceed this value, in which case max_distance + 1 is
+            returned
+
+        Returns
+        -------
+        int
+            The Levenshtein (or OSA) distance between pattern & text
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        text_len = len(text)
+        if max_distance is None:
+            max_distance = pat_len + text_len
+        if not pat_len:
+            return min(text_len, max_distance + 1)
+        # Each remaining character of text can lower the distance by at most
+        # one, so the distance after pos characters exceeds max_distance for
+        # certain once it exceeds max_distance + text_len - pos.
+        limit = max_distance + text_len
+        full = (1 << pat_len) - 1
+        last = 1 << (pat_len - 1)
+        osa = self._mode == 'osa'
+
+        v_pos = full
+        v_neg = 0
+        diag = 0
+        prev_eq = 0
+        dist = pat_len
+
+        for pos, char in enumerate(text, 1):
+            eq = masks.get(char, 0)
+            if osa:
+                trans = (((~diag) & eq) << 1) & prev_eq
+                prev_eq = eq
+                diag = (
+                    (((eq & v_pos) + v_pos) ^ v_pos) | eq | v_neg | trans
+                ) & full
+            else:
+                diag = ((((eq & v_pos) + v_pos) ^ v_pos) | eq | v_neg) & full
+            h_pos = (v_neg | ~(diag | v_pos)) & full
+            h_neg = v_pos & diag
+
+            if h_pos & last:
+                dist += 1
+            elif h_neg & last:
+                dist -= 1
+
+            h_pos = ((h_pos << 1) | 1) & full
+            h_neg = (h_neg << 1) & full
+            v_pos = (h_neg | ~(diag | h_pos)) & full
+            v_neg = h_pos & diag
+
+            if dist + pos > limit:
+                return max_distance + 1
+
+        return dist
+
     def _alignment_matrix(
         self, src: str, tar: str, backtrace: bool = True
     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
@@ -188,15 +332,61 @@ class Levenshtein(_Distance):
             return d_mat, trace_mat
         return d_mat
 
-    def alignment(self, src: str, tar: str) -> Tuple[float, str, str]:
+    def _linear_space_applies(self) -> bool:
+        """Return True if alignments can be found in linear space.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            not self._taper_enabled
+            and self._mode == 'lev'
+            and type(self)._alignment_matrix is Levenshtein._alignment_matrix
+        )
+
+    def _aligner(self) -> _AffineGapAligner:
+        """Return an aligner scoring alignments by negated edit costs.
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, _ = self._cost
+
+        def _neg_sub_cost(src_char: str, tar_char: str) -> float:
+            return 0.0 if src_char == tar_char else -float(sub_cost)
+
+        return _AffineGapAligner(
+            _neg_sub_cost, del_cost, del_cost, ins_cost, ins_cost
+        )
+
+    def alignment(
+        self, src: str, tar: str, linear_space: Optional[bool] = None
+    ) -> Tuple[float, str, str]:
         """Return the Levenshtein alignment of two strings.
 
+        By default, an alignment matrix and a backtrace matrix, each with
+        (len(src)+1)*(len(tar)+1) cells, are built. For long strings, an
+        optimal alignment can instead be found in linear space by
+        divide-and-conquer :cite:`Hirschberg:1975`. This returns the same
+        distance, though possibly a different alignment of equal cost. It is
+        available in 'lev' mode without tapering.
+
         Parameters
         ----------
         src : str
             Source string for comparison
         tar : str
             Target string for comparison
+        linear_space : bool or None
+            If True, align in linear space; if False, build the full matrices;
+            if None (default), align in linear space when the matrices would
+            have more than 2**22 cells and linear space alignment is available
+
+        Raises
+        ------
+        ValueError
+            Linear space alignment is unavailable in osa mode or with
+            tapering
 
         Returns
         -------
@@ -222,10 +412,33 @@ class Levenshtein(_Distance):
         >>> cmp.alignment('ACTG', 'TAGC')
         (4.0, 'ACT-G-', '--TAGC')
 
+        >>> cmp = Levenshtein()
+        >>> cmp.alignment('aluminum', 'Catalan', linear_space=True)
+        (7.0, '-aluminum', 'Catalan--')
+
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added linear_space parameter
 
         """
+        if linear_space is None:
+            linear_space = (
+                self._linear_space_applies()
+                and (len(src) + 1) * (len(tar) + 1)
+                > _AffineGapAligner.linear_space_threshold
+            )
+        if linear_space:
+            if not self._linear_space_applies():
+                raise ValueError(
+                    'Linear space alignment is unavailable in osa mode or '
+                    'with tapering'
+                )
+            score, src_aligned, tar_aligned = self._aligner().align(
+                src, tar, linear_space=True
+            )
+            return -score, src_aligned, tar_aligned
+
         d_mat, trace_mat = self._alignment_matrix(src, tar, backtrace=True)
 
         src_aligned = []
@@ -302,8 +515,21 @@ class Levenshtein(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Unit-cost, untapered distances use a bit-parallel algorithm
 
         """
+        if self._bitparallel_applies():
+            if src == tar:
+                return 0
+            # The distance is symmetric, so the longer string becomes the
+            # pattern, minimizing the number of iterations over the text.
+            if len(src) < len(tar):
+                src, tar = tar, src
+            return self._bitparallel_dist_abs(
+                self._char_masks(src), len(src), tar
+            )
+
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
 
         src_len = len(src)
@@ -330,6 +556,169 @@ class Levenshtein(_Distance):
         else:
             return cast(float, d_mat[src_len, tar_len])
 
+    def _band(
+        self, src_len: int, tar_len: int, max_distance: float
+    ) -> Tuple[int, int]:
+        """Return the range of diagonals that can lie on a bounded path.
+
+        Parameters
+        ----------
+        src_len : int
+            The length of the source string
+        tar_len : int
+            The length of the target string
+        max_distance : float
+            The maximum distance of interest
+
+        Returns
+        -------
+        tuple
+            The lowest & highest offsets (tar position minus src position)
+            of cells whose cheapest path cost cannot exceed max_distance
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost = self._cost[:2]
+        diff = tar_len - src_len
+
+        def _lower_bound(offset: int) -> float:
+            # indels needed to reach the diagonal, then to leave it for the
+            # final cell
+            reach = offset * ins_cost if offset > 0 else -offset * del_cost
+            rest = diff - offset
+            return reach + (rest * ins_cost if rest > 0 else -rest * del_cost)
+
+        offsets = [
+            offset
+            for offset in range(-src_len, tar_len + 1)
+            if _lower_bound(offset) <= max_distance
+        ]
+        return offsets[0], offsets[-1]
+
+    def dist_abs_bounded(
+        self, src: str, tar: str, max_distance: float
+    ) -> float:
+        """Return the Levenshtein distance, if it is at most max_distance.
+
+        Only the diagonal band of the alignment matrix that can contain a path
+        of cost max_distance or less is computed :cite:`Ukkonen:1985`, and the
+        computation stops as soon as every cell of a row (or, in ``osa`` mode,
+        of two consecutive rows) exceeds max_distance. Unit-cost, untapered
+        distances are computed by the bit-parallel algorithm, which stops once
+        the distance can no longer fall to max_distance. Subclasses that
+        redefine dist_abs compute their own distance in full.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : int or float
+            The greatest distance of interest
+
+        Returns
+        -------
+        int or float
+            The Levenshtein distance between src & tar, if it is no greater
+            than max_distance; otherwise max_distance + 1
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_abs_bounded('Niall', 'Neil', 3)
+        3
+        >>> cmp.dist_abs_bounded('Niall', 'Neil', 2)
+        3
+        >>> cmp.dist_abs_bounded('aluminum', 'Catalan', 2)
+        3
+
+        >>> cmp = Levenshtein(cost=(1, 1, 2, 2))
+        >>> cmp.dist_abs_bounded('ATCG', 'TAGC', 6)
+        4
+        >>> cmp.dist_abs_bounded('ATCG', 'TAGC', 3)
+        4
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if type(self).dist_abs is not Levenshtein.dist_abs:
+            distance = self.dist_abs(src, tar)
+            return distance if distance <= max_distance else max_distance + 1
+
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+
+        src_len = len(src)
+        tar_len = len(tar)
+
+        if src == tar:
+            return 0
+        if not src or not tar:
+            distance = self.dist_abs(src, tar)
+            return distance if distance <= max_distance else max_distance + 1
+        if src_len > tar_len:
+            length_bound = (src_len - tar_len) * del_cost
+        else:
+            length_bound = (tar_len - src_len) * ins_cost
+        if length_bound > max_distance:
+            return max_distance + 1
+
+        if self._bitparallel_applies():
+            if src_len < tar_len:
+                src, tar = tar, src
+            distance = self._bitparallel_dist_abs(
+                self._char_masks(src), len(src), tar, int(max_distance)
+            )
+            return distance if distance <= max_distance else max_distance + 1
+
+        max_len = max(src_len, tar_len)
+        osa = self._mode == 'osa'
+        band_lo, band_hi = self._band(src_len, tar_len, max_distance)
+
+        prev_row = [inf] * (tar_len + 1)
+        for j in range(max(0, band_lo), min(tar_len, band_hi) + 1):
+            prev_row[j] = j * self._taper(j, max_len) * ins_cost
+        prev_prev_row = prev_row
+        prev_min = min(prev_row)
+
+        for i in range(src_len):
+            row = [inf] * (tar_len + 1)
+            if band_lo <= -(i + 1):
+                row[0] = (i + 1) * self._taper(i + 1, max_len) * del_cost
+            for j in range(max(0, i + band_lo), min(tar_len, i + band_hi + 1)):
+                taper = self._taper(1 + max(i, j), max_len)
+                cell = min(
+                    row[j] + ins_cost * taper,  # ins
+                    prev_row[j + 1] + del_cost * taper,  # del
+                    prev_row[j]
+                    + (sub_cost * taper if src[i] != tar[j] else 0),  # sub/==
+                )
+                if (
+                    osa
+                    and i
+                    and j
+                    and src[i] == tar[j - 1]
+                    and src[i - 1] == tar[j]
+                ):
+                    # transposition
+                    cell = min(cell, prev_prev_row[j - 1] + trans_cost * taper)
+                row[j + 1] = cell
+
+            row_min = min(row)
+            if row_min > max_distance and (not osa or prev_min > max_distance):
+                return max_distance + 1
+            prev_prev_row, prev_row, prev_min = prev_row, row, row_min
+
+        distance = prev_row[tar_len]
+        if distance > max_distance:
+            return max_distance + 1
+        if int(distance) == distance:
+            return int(distance)
+        return distance
+
     def dist(self, src: str, tar: str) -> float:
         """Return the normalized Levenshtein distance between two strings.
 
@@ -397,6 +786,132 @@ class Levenshtein(_Distance):
 
         return self.dist_abs(src, tar) / normalize_term
 
+    def _batch_applies(self) -> bool:
+        """Return True if the batch methods may use the bit-parallel engine.
+
+        Subclasses that redefine the distance fall back to scoring each pair.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            type(self).dist_abs is Levenshtein.dist_abs
+            and type(self).dist is Levenshtein.dist
+            and self._bitparallel_applies()
+        )
+
+    def dist_abs_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the Levenshtein distances of a string to several strings.
+
+        For unit-cost, untapered distances, the character masks of src are
+        computed once and reused for each of the targets.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The Levenshtein distance of src to each of the targets
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_abs_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([3., 2., 0.])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._batch_applies():
+            return super(Levenshtein, self).dist_abs_many(src, targets)
+
+        masks = self._char_masks(src)
+        src_len = len(src)
+        return np.fromiter(
+            (
+                self._bitparallel_dist_abs(masks, src_len, tar)
+                for tar in targets
+            ),
+            dtype=np.float_,
+        )
+
+    def dist_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the normalized Levenshtein distances to several strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Levenshtein distance of src to each of the targets
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.6, 0.4, 0. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._batch_applies():
+            return super(Levenshtein, self).dist_many(src, targets)
+
+        masks = self._char_masks(src)
+        src_len = len(src)
+        ins_cost, del_cost = self._cost[:2]
+
+        def _dist(tar: str) -> float:
+            if src == tar:
+                return 0.0
+            return self._bitparallel_dist_abs(
+                masks, src_len, tar
+            ) / self._normalizer([src_len * del_cost, len(tar) * ins_cost])
+
+        return np.fromiter((_dist(tar) for tar in targets), dtype=np.float_)
+
+    def sim_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the normalized Levenshtein similarities to several strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Levenshtein similarity of src to each of the
+            targets
+
+        Examples
+        --------
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_many('Niall', ['Neil', 'Nigel', 'Niall'])
+        array([0.4, 0.6, 1. ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._batch_applies():
+            return super(Levenshtein, self).sim_many(src, targets)
+        return 1.0 - self.dist_many(src, targets)
+
 
 if __name__ == '__main__':
     import doctest
@@ -0,0 +1,188 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._linear_assignment.
+
+Linear assignment, by shortest augmenting paths
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+__all__ = ['_linear_assignment', '_sparse_linear_assignment']
+
+
+def _linear_assignment(cost: np.ndarray) -> List[Tuple[int, int]]:
+    """Return a minimum cost assignment of the rows & columns of a matrix.
+
+    This is the shortest augmenting path method of Jonker & Volgenant
+    :cite:`Jonker:1987`, without their initialization heuristics: each row is
+    assigned in turn, by a Dijkstra search over the columns with reduced
+    costs maintained by dual potentials. Each search is vectorized over the
+    columns, so the assignment takes :math:`O(n^2 m)` time at most, for an
+    :math:`n \\times m` matrix.
+
+    Parameters
+    ----------
+    cost : numpy.ndarray
+        A 2-dimensional matrix of costs
+
+    Returns
+    -------
+    list of tuples of ints
+        The (row, column) pairs of the assignment, in order of row. If the
+        matrix has more rows than columns, some rows are unassigned, and
+        vice versa.
+
+    Examples
+    --------
+    >>> _linear_assignment(np.array([[4, 1, 3], [2, 0, 5], [3, 2, 2]]))
+    [(0, 1), (1, 0), (2, 2)]
+    >>> _linear_assignment(np.array([[1.0, 0.5], [0.2, 0.3], [0.0, 0.9]]))
+    [(1, 1), (2, 0)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    cost = np.asarray(cost, dtype=np.float_)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n_rows, n_cols = cost.shape
+
+    # Column 0 is a sentinel; row_of[col] is the row (numbered from 1)
+    # assigned to col, or 0
+    row_pot = np.zeros(n_rows + 1)
+    col_pot = np.zeros(n_cols + 1)
+    row_of = np.zeros(n_cols + 1, dtype=np.intp)
+    prev_col = np.zeros(n_cols + 1, dtype=np.intp)
+    reduced = np.full(n_cols + 1, np.inf)
+
+    for row in range(1, n_rows + 1):
+        row_of[0] = row
+        col = 0
+        min_red = np.full(n_cols + 1, np.inf)
+        used = np.zeros(n_cols + 1, dtype=np.bool_)
+        while True:
+            used[col] = True
+            free = ~used
+            free[0] = False
+            reduced[1:] = cost[row_of[col] - 1]
+            reduced[1:] -= row_pot[row_of[col]]
+            reduced[1:] -= col_pot[1:]
+            closer = free & (reduced < min_red)
+            min_red[closer] = reduced[closer]
+            prev_col[closer] = col
+
+            candidates = np.where(free, min_red, np.inf)
+            next_col = int(np.argmin(candidates))
+            delta = candidates[next_col]
+            row_pot[row_of[used]] += delta
+            col_pot[used] -= delta
+            min_red[free] -= delta
+
+            col = next_col
+            if not row_of[col]:
+                break
+
+        # Augment along the path of columns to the free column found
+        while col:
+            row_of[col] = row_of[prev_col[col]]
+            col = prev_col[col]
+
+    pairs = [
+        (int(row_of[col]) - 1, col - 1)
+        for col in range(1, n_cols + 1)
+        if row_of[col]
+    ]
+    if transposed:
+        pairs = [(col, row) for row, col in pairs]
+    return sorted(pairs)
+
+
+def _sparse_linear_assignment(
+    weights: np.ndarray, mask: np.ndarray
+) -> List[Tuple[int, int]]:
+    """Return a maximum weight matching among the masked cells of a matrix.
+
+    Only the cells of weights where mask is True are eligible to be matched.
+    The rows & columns are split into the connected components of the
+    bipartite graph of eligible cells, and each component is assigned
+    separately, by :py:func:`_linear_assignment`. Rows & columns without
+    eligible cells are left unmatched.
+
+    Parameters
+    ----------
+    weights : numpy.ndarray
+        A 2-dimensional matrix of non-negative weights
+    mask : numpy.ndarray
+        A boolean matrix of the same shape, marking the eligible cells
+
+    Returns
+    -------
+    list of tuples of ints
+        The (row, column) pairs of the matching, in order of row
+
+    Examples
+    --------
+    >>> weights = np.array([[0.9, 0.8, 0.0], [0.85, 0.1, 0.0], [0.0, 0.0, 0.7]])
+    >>> _sparse_linear_assignment(weights, weights >= 0.5)
+    [(0, 1), (1, 0), (2, 2)]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    n_rows, n_cols = mask.shape
+    # Label the components by union-find over rows (0..n_rows-1) & columns
+    # (n_rows..n_rows+n_cols-1)
+    parent = list(range(n_rows + n_cols))
+
+    def _find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    edge_rows, edge_cols = mask.nonzero()
+    for row, col in zip(edge_rows.tolist(), edge_cols.tolist()):
+        root_row, root_col = _find(row), _find(n_rows + col)
+        if root_row != root_col:
+            parent[root_col] = root_row
+
+    components = {}  # type: dict
+    for row in sorted(set(edge_rows.tolist())):
+        components.setdefault(_find(row), ([], []))[0].append(row)
+    for col in sorted(set(edge_cols.tolist())):
+        components[_find(n_rows + col)][1].append(col)
+
+    pairs = []  # type: List[Tuple[int, int]]
+    for rows, cols in components.values():
+        sub_mask = mask[np.ix_(rows, cols)]
+        # Ineligible cells cost nothing, as do unmatched rows & columns
+        cost = np.where(sub_mask, -weights[np.ix_(rows, cols)], 0.0)
+        for row, col in _linear_assignment(cost):
+            if sub_mask[row, col]:
+                pairs.append((rows[row], cols[col]))
+    return sorted(pairs)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
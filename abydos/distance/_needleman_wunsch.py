@@ -21,9 +21,7 @@ Needleman-Wunsch score
 
 from typing import Any, Callable, Dict, Optional, Tuple, cast
 
-from numpy import float_ as np_float
-from numpy import zeros as np_zeros
-
+from ._affine_gap_aligner import _AffineGapAligner
 from ._distance import _Distance
 
 __all__ = ['NeedlemanWunsch']
@@ -184,23 +182,70 @@ class NeedlemanWunsch(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Computed in linear space, a row at a time
+
+        """
+        return self._aligner().score(src, tar)
+
+    def _aligner(self) -> _AffineGapAligner:
+        """Return an aligner with this measure's scores & gap costs.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _AffineGapAligner(
+            self._sim_func,
+            self._gap_cost,
+            self._gap_cost,
+            self._gap_cost,
+            self._gap_cost,
+        )
+
+    def alignment(
+        self, src: str, tar: str, linear_space: Optional[bool] = None
+    ) -> Tuple[float, str, str]:
+        """Return the Needleman-Wunsch alignment of two strings.
+
+        An optimal alignment can be found either from full matrices of back
+        pointers, or in linear space by divide-and-conquer
+        :cite:`Hirschberg:1975`, which returns the same score, though possibly
+        a different alignment of equal score.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        linear_space : bool or None
+            If True, align in linear space; if False, build full matrices; if
+            None (default), align in linear space when the matrices would have
+            more than 2**22 cells
+
+        Returns
+        -------
+        tuple
+            A tuple containing the Needleman-Wunsch score and the two strings,
+            aligned, with gaps marked by '-'
+
+        Examples
+        --------
+        >>> cmp = NeedlemanWunsch()
+        >>> cmp.alignment('cat', 'hat')
+        (2.0, 'cat', 'hat')
+        >>> cmp.alignment('Niall', 'Neil')
+        (1.0, 'Niall', 'N-eil')
+        >>> cmp.alignment('aluminum', 'Catalan')
+        (-1.0, 'aluminum', '-Catalan')
+        >>> cmp.alignment('ATCG', 'TAGC', linear_space=True)
+        (0.0, 'ATCG', 'TAGC')
+
+
+        .. versionadded:: 0.6.0
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-
-        for i in range(len(src) + 1):
-            d_mat[i, 0] = -(i * self._gap_cost)
-        for j in range(len(tar) + 1):
-            d_mat[0, j] = -(j * self._gap_cost)
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                match = d_mat[i - 1, j - 1] + self._sim_func(
-                    src[i - 1], tar[j - 1]
-                )
-                delete = d_mat[i - 1, j] - self._gap_cost
-                insert = d_mat[i, j - 1] - self._gap_cost
-                d_mat[i, j] = max(match, delete, insert)
-        return cast(float, d_mat[d_mat.shape[0] - 1, d_mat.shape[1] - 1])
+        return self._aligner().align(src, tar, linear_space)
 
     def sim(self, src: str, tar: str) -> float:
         """Return the normalized Needleman-Wunsch score of two strings.
@@ -235,8 +280,14 @@ class NeedlemanWunsch(_Distance):
         """
         if src == tar:
             return 1.0
+        src_score = self.sim_score(src, src)
+        tar_score = self.sim_score(tar, tar)
+        # A string that scores nothing against itself, such as the empty
+        # string, is not similar to any other
+        if src_score <= 0.0 or tar_score <= 0.0:
+            return 0.0
         return max(0.0, self.sim_score(src, tar)) / (
-            self.sim_score(src, src) ** 0.5 * self.sim_score(tar, tar) ** 0.5
+            src_score ** 0.5 * tar_score ** 0.5
         )
 
 
@@ -21,6 +21,8 @@ Overlap similarity & distance
 
 from typing import Any, Optional
 
+import numpy as np
+
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
 
@@ -134,6 +136,40 @@ class Overlap(_TokenDistance):
             self._src_card(), self._tar_card()
         )
 
+    def _sim_formula(
+        self,
+        intersection: np.ndarray,
+        src_card: np.ndarray,
+        tar_card: np.ndarray,
+    ) -> np.ndarray:
+        """Return the overlap similarities of many pairs from cardinalities.
+
+        Parameters
+        ----------
+        intersection : numpy.ndarray
+            The cardinality of the intersection of each pair
+        src_card : numpy.ndarray
+            The cardinality of each source's tokens, as a column
+        tar_card : numpy.ndarray
+            The cardinality of each target's tokens, as a row
+
+        Returns
+        -------
+        numpy.ndarray
+            Overlap similarity of each pair
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        min_card = np.minimum(src_card, tar_card)
+        return np.divide(
+            intersection,
+            min_card,
+            out=np.zeros(intersection.shape, dtype=np.float_),
+            where=min_card != 0,
+        )
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,9 +19,19 @@
 Phonetic distance.
 """
 
-from typing import Any, Callable, List, Optional, Sequence, Type, Union
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    cast,
+)
 
 from ._distance import _Distance
+from ._prepared_string import PreparedString
 from ..fingerprint import _Fingerprint
 from ..phonetic import _Phonetic
 from ..stemmer import _Stemmer
@@ -189,9 +199,8 @@ class PhoneticDistance(_Distance):
         .. versionadded:: 0.4.1
 
         """
-        for trans in self.transforms:
-            src = trans(src)
-            tar = trans(tar)
+        src = self._transform(src)
+        tar = self._transform(tar)
         if self.metric:
             return self.metric.dist_abs(src, tar)
         else:
@@ -240,14 +249,46 @@ class PhoneticDistance(_Distance):
         .. versionadded:: 0.4.1
 
         """
-        for trans in self.transforms:
-            src = trans(src)
-            tar = trans(tar)
+        src = self._transform(src)
+        tar = self._transform(tar)
         if self.metric:
             return self.metric.dist(src, tar)
         else:
             return float(src != tar)
 
+    def _transform(self, string: str) -> str:
+        """Return a string, transformed by each of the transforms in turn.
+
+        The transform of a :py:class:`PreparedString` is cached, and is
+        itself a prepared string, so that the metric can cache its own
+        representations of it.
+
+        Parameters
+        ----------
+        string : str
+            The string to transform
+
+        Returns
+        -------
+        str
+            The transformed string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(string, PreparedString):
+            return cast(
+                str,
+                string.derived(
+                    ('transforms', tuple(self.transforms)),
+                    lambda plain: PreparedString(self._transform(plain)),
+                ),
+            )
+        for trans in self.transforms:
+            string = trans(string)
+        return string
+
 
 if __name__ == '__main__':
     import doctest
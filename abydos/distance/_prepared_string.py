@@ -0,0 +1,152 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._prepared_string.
+
+Prepared string, a string that caches its derived representations
+"""
+
+from typing import Any, Callable, Dict, Hashable
+
+__all__ = ['PreparedString']
+
+
+class PreparedString(str):
+    """Prepared string.
+
+    A prepared string is a str, and so may be passed to any measure in place
+    of one, with the same results. In addition, it caches the
+    representations that measures derive from it (its tokens, character
+    bit-vectors, phonetic codes, etc.), so that a string compared to many
+    others is prepared only once, rather than once per comparison.
+
+    The representations are derived lazily, by the first comparison that
+    needs each of them, and are keyed by the configuration of the measure (or
+    tokenizer, phonetic algorithm, etc.) that derived them, so a prepared
+    string may be compared by any number of measures. The measures that
+    currently use the cache are:
+
+        - the token-based measures, which cache the tokens of the string by
+          the configuration of their tokenizer
+        - :py:class:`Levenshtein`, which caches the bit-vectors of the
+          string's characters, used by its bit-parallel algorithm
+        - :py:class:`JaroWinkler`, which caches the string's q-grams
+        - :py:class:`PhoneticDistance`, which caches the string's transforms
+          (as prepared strings, for its metric to compare)
+
+    Other measures compare a prepared string just as they do a str.
+    Measures, tokenizers, and transforms should not be reconfigured once
+    they have been used with a prepared string, since representations cached
+    for their old configuration might be reused.
+
+    Operations on a prepared string, such as slicing or concatenation,
+    return a str, without the cached representations.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __new__(cls, string: str) -> 'PreparedString':
+        """Create a PreparedString.
+
+        Parameters
+        ----------
+        string : str
+            The string to prepare
+
+        Returns
+        -------
+        PreparedString
+            The prepared string, with no representations cached
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        prepared = super(PreparedString, cls).__new__(cls, string)
+        # the representations derived so far, by key
+        prepared._derived = {}  # type: Dict[Hashable, Any]
+        return prepared
+
+    def __getnewargs__(self) -> Any:
+        """Return the arguments with which to recreate the string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (str(self),)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the string for pickling.
+
+        The cached representations are dropped, since their keys may refer to
+        measures that are not pickled with the string.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {}
+
+    def derived(self, key: Hashable, derive: Callable[[str], Any]) -> Any:
+        """Return a representation of the string, deriving it if need be.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the representation, which should identify both the
+            kind of representation and the configuration of whatever derives
+            it
+        derive : callable
+            A function from a str to the representation, called (with the
+            string, as a str) only if the representation is not yet cached
+
+        Returns
+        -------
+        Any
+            The representation, which is shared by every caller, so must not
+            be modified
+
+        Examples
+        --------
+        >>> prep = PreparedString('Niall')
+        >>> prep.derived('upper', str.upper)
+        'NIALL'
+        >>> prep.derived('upper', str.lower)
+        'NIALL'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = derive(str(self))
+            self._derived[key] = value
+            return value
+
+    def clear(self) -> None:
+        """Discard the cached representations.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._derived.clear()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
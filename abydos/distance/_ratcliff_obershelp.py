@@ -21,10 +21,8 @@ Ratcliff-Obershelp similarity
 
 from typing import Tuple
 
-from numpy import int_ as np_int
-from numpy import zeros as np_zeros
-
 from ._distance import _Distance
+from ._suffix_automaton import _SuffixAutomaton
 
 __all__ = ['RatcliffObershelp']
 
@@ -101,21 +99,11 @@ class RatcliffObershelp(_Distance):
                 strings src and tar.
 
             .. versionadded:: 0.1.0
+            .. versionchanged:: 0.6.0
+                Found in linear time with a suffix automaton of tar
 
             """
-            lengths = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
-            longest, src_longest, tar_longest = 0, 0, 0
-            for i in range(1, len(src) + 1):
-                for j in range(1, len(tar) + 1):
-                    if src[i - 1] == tar[j - 1]:
-                        lengths[i, j] = lengths[i - 1, j - 1] + 1
-                        if lengths[i, j] > longest:
-                            longest = lengths[i, j]
-                            src_longest = i
-                            tar_longest = j
-                    else:
-                        lengths[i, j] = 0
-            return src_longest - longest, tar_longest - longest, longest
+            return _SuffixAutomaton(tar).longest_common_substring(src)
 
         def _sstr_matches(src: str, tar: str) -> int:
             """Return the sum of substring match lengths.
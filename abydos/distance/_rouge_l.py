@@ -82,6 +82,8 @@ class RougeL(_Distance):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Computed with the bit-parallel :py:meth:`LCSseq.lcsseq_len`
 
         """
         if src == tar:
@@ -89,7 +91,7 @@ class RougeL(_Distance):
         if not src or not tar:
             return 0.0
 
-        lcs_len = len(self._lcs.lcsseq(src, tar))
+        lcs_len = self._lcs.lcsseq_len(src, tar)
         r_lcs = lcs_len / len(src)
         p_lcs = lcs_len / len(tar)
         beta_sq = beta * beta
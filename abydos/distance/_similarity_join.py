@@ -0,0 +1,318 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._similarity_join.
+
+Similarity join, by prefix filtering
+"""
+
+from collections import Counter, deque
+from math import ceil, sqrt
+from typing import (
+    Callable,
+    Counter as TCounter,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from ._cosine import Cosine
+from ._overlap import Overlap
+from ._token_distance import _TokenDistance
+from ._tversky import Tversky
+
+__all__ = ['similarity_join']
+
+
+# A tolerance for rounding error in the bounds, which are lowered by it so
+# that no pair is lost
+_EPSILON = 1e-9
+
+
+def _join_bounds(
+    measure: _TokenDistance, threshold: float
+) -> Tuple[Callable[[int, int], int], Callable[[int], float]]:
+    """Return the bounds on the overlap & size of similar token sets.
+
+    Parameters
+    ----------
+    measure : _TokenDistance
+        A Tversky index with equal alpha & beta (such as
+        :py:class:`Jaccard` or :py:class:`Dice`), :py:class:`Cosine`, or
+        :py:class:`Overlap` measure
+    threshold : float
+        The minimum similarity
+
+    Returns
+    -------
+    tuple of functions
+        A function of the sizes of two token sets, the second no larger than
+        the first, returning the least overlap for which their similarity
+        can meet the threshold; and a function of the size of a token set,
+        returning the least size of a set whose similarity to it can meet
+        the threshold
+
+    Raises
+    ------
+    ValueError
+        The measure is not supported
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(measure, Tversky):
+        weight = measure.params['alpha']
+        if (
+            measure.params['beta'] != weight
+            or weight <= 0
+            or measure.params['bias'] is not None
+        ):
+            raise ValueError(
+                'Only Tversky indices with equal, positive alpha & beta and '
+                + 'no bias are supported.'
+            )
+        # sim >= threshold iff overlap * (1 - t + 2tw) >= tw(|x| + |y|)
+        scale = threshold * weight / (1 - threshold + 2 * threshold * weight)
+
+        def _min_overlap(size: int, other: int) -> int:
+            return max(int(ceil(scale * (size + other) - _EPSILON)), 1)
+
+        def _min_size(size: int) -> float:
+            return (
+                threshold
+                * weight
+                * size
+                / (1 - threshold + threshold * weight)
+            )
+
+    elif isinstance(measure, Cosine):
+
+        def _min_overlap(size: int, other: int) -> int:
+            return max(int(ceil(threshold * sqrt(size * other) - _EPSILON)), 1)
+
+        def _min_size(size: int) -> float:
+            return threshold * threshold * size
+
+    elif isinstance(measure, Overlap):
+
+        def _min_overlap(size: int, other: int) -> int:
+            return max(int(ceil(threshold * other - _EPSILON)), 1)
+
+        # A record may be contained in one of any size, so there is no
+        # bound on size by which to release records
+        def _min_size(size: int) -> float:
+            return 1.0
+
+    else:
+        raise ValueError(
+            '{} is not supported; the measure must be a Tversky index, '.format(
+                type(measure).__name__
+            )
+            + 'Cosine, or Overlap.'
+        )
+    return _min_overlap, _min_size
+
+
+def similarity_join(
+    records: Sequence[str], measure: _TokenDistance, threshold: float
+) -> Iterator[Tuple[int, int, float]]:
+    """Yield the pairs of records whose similarity meets a threshold.
+
+    This is the PPJoin similarity self-join of :cite:`Xiao:2008`, which
+    builds on the prefix filtering of AllPairs :cite:`Bayardo:2007`. The
+    tokens of each record (by the measure's tokenizer) are ordered from
+    rarest to most common, and records are processed in increasing order of
+    their number of tokens. Two records can only be similar enough if they
+    share a token among the first few of each (the prefix filter), if their
+    sizes are close enough (the length filter), and if the tokens following
+    each shared token can still supply the overlap required (the positional
+    filter). The overlap of each pair that passes these filters is then
+    counted, and the pairs with enough overlap are verified by the measure's
+    sim method.
+
+    The records are tokenized twice: once to count the tokens and their
+    sizes, and again as they are processed in order of size. The records
+    must therefore be a sequence, which is indexed in that order, rather
+    than an iterator. The rank of every distinct token and the size of
+    every record are kept throughout the join. Beyond those, only the
+    records whose sizes can still match those being processed are retained.
+    For Tversky indices and Cosine, the memory they take is bounded by the
+    records of similar sizes. For Overlap, a record can be contained in
+    one of any greater size, so no record is ever released, and that memory
+    grows with the collection.
+
+    Tokens are counted as multisets, as by the measure, so a token that
+    occurs twice in a record must occur twice in another to contribute 2 to
+    their overlap.
+
+    Parameters
+    ----------
+    records : sequence of str
+        The records to join
+    measure : _TokenDistance
+        A Tversky index with equal alpha & beta (such as
+        :py:class:`Jaccard` or :py:class:`Dice`), :py:class:`Cosine`, or
+        :py:class:`Overlap` measure, with the crisp intersection type and no
+        normalizer
+    threshold : float
+        The minimum similarity of the pairs to yield, in (0, 1]
+
+    Yields
+    ------
+    tuple of int, int, & float
+        The indices of each pair of similar records, the lesser first, and
+        their similarity
+
+    Raises
+    ------
+    ValueError
+        The measure is not supported
+    ValueError
+        The threshold must be in (0, 1]
+    ValueError
+        Token counts must be non-negative integers
+
+    Examples
+    --------
+    >>> from abydos.distance import Cosine, Jaccard
+    >>> records = ['Niall', 'Neil', 'Nigel', 'Niall', 'Neal', 'Nils', 'Neill']
+    >>> sorted(similarity_join(records, Jaccard(), 0.4))
+    [(0, 3, 1.0), (1, 4, 0.42857142857142855), (1, 6, 0.8333333333333334)]
+    >>> sorted(similarity_join(records, Cosine(), 0.55))
+    [(0, 3, 1.0), (1, 4, 0.6), (1, 6, 0.9128709291752769)]
+
+    .. versionadded:: 0.6.0
+
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError('threshold must be in (0, 1].')
+    min_overlap, min_size = _join_bounds(measure, threshold)
+    if (
+        measure.params['intersection_type'] != 'crisp'
+        or measure.params.get('normalizer') in measure._norm_dict  # noqa: SF01
+    ):
+        raise ValueError(
+            'The measure must use the crisp intersection and no normalizer.'
+        )
+
+    def _elements(tokens: TCounter[str]) -> Iterator[Tuple[str, int]]:
+        # A multiset as a set: the nth occurrence of each token is distinct
+        for token, count in tokens.items():
+            if not isinstance(count, int) or count < 0:
+                raise ValueError('Token counts must be non-negative integers.')
+            for occurrence in range(count):
+                yield token, occurrence
+
+    # Count the records containing each element, and the size of each record
+    frequencies = Counter()  # type: TCounter[Tuple[str, int]]
+    sizes = []  # type: List[int]
+    for record in records:
+        tokens = measure._get_counter(record)  # noqa: SF01
+        frequencies.update(_elements(tokens))
+        sizes.append(sum(tokens.values()))
+
+    # Rank the elements from rarest to most common
+    ranks = {
+        element: rank
+        for rank, (element, _) in enumerate(
+            sorted(frequencies.items(), key=lambda item: item[1])
+        )
+    }
+    del frequencies
+
+    # The records without tokens are similar only to identical records
+    empty = {}  # type: Dict[str, List[int]]
+
+    # The postings (record & position) of the element ranks in the prefixes
+    # of the records retained, and the tokens, prefix, & elements of each
+    # record retained, in order of size
+    index = {}  # type: Dict[int, Deque[Tuple[int, int]]]
+    retained = (
+        {}
+    )  # type: Dict[int, Tuple[TCounter[str], List[int], FrozenSet[int]]]
+    window = deque()  # type: Deque[int]
+
+    for x in sorted(range(len(sizes)), key=sizes.__getitem__):
+        record = records[x]
+        size = sizes[x]
+        if not size:
+            identical = empty.setdefault(record, [])
+            for y in identical:
+                sim = measure.sim(records[y], record)
+                if sim >= threshold:
+                    yield min(x, y), max(x, y), sim
+            identical.append(x)
+            continue
+
+        tokens = measure._get_counter(record)  # noqa: SF01
+        elements = sorted(ranks[element] for element in _elements(tokens))
+
+        # Release the records too small to be similar to this or later ones.
+        # Each is the first posting of its prefix's elements, since records
+        # are indexed & released in the same order.
+        least_size = min_size(size) - _EPSILON
+        while window and sizes[window[0]] < least_size:
+            for element in retained.pop(window.popleft())[1]:
+                postings = index[element]
+                postings.popleft()
+                if not postings:
+                    del index[element]
+
+        # Probe the index with the prefix of the record, counting the overlap
+        # of each candidate's prefix; a count of -1 marks a pruned candidate
+        overlaps = {}  # type: Dict[int, int]
+        probe_len = size - min_overlap(size, max(int(ceil(least_size)), 1))
+        for i, element in enumerate(elements[: probe_len + 1]):
+            for y, j in index.get(element, ()):
+                overlap = overlaps.get(y, 0)
+                if overlap < 0:
+                    continue
+                if overlap + 1 + min(size - i - 1, sizes[y] - j - 1) >= (
+                    min_overlap(size, sizes[y])
+                ):
+                    overlaps[y] = overlap + 1
+                else:
+                    overlaps[y] = -1
+
+        # Verify the candidates, by their overlap and then by the measure
+        element_set = frozenset(elements)
+        for y, overlap in overlaps.items():
+            if overlap > 0:
+                y_tokens, _, y_elements = retained[y]
+                if len(element_set & y_elements) < min_overlap(size, sizes[y]):
+                    continue
+                sim = measure.sim(y_tokens, tokens)
+                if sim >= threshold:
+                    yield min(x, y), max(x, y), sim
+
+        # Index the prefix of the record, which suffices to find the records
+        # similar to it among those of its size or larger
+        prefix = elements[: size - min_overlap(size, size) + 1]
+        for j, element in enumerate(prefix):
+            index.setdefault(element, deque()).append((x, j))
+        retained[x] = tokens, prefix, element_set
+        window.append(x)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
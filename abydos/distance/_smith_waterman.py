@@ -19,11 +19,9 @@
 Smith-Waterman score
 """
 
-from typing import Any, Callable, Optional, cast
-
-from numpy import float_ as np_float
-from numpy import zeros as np_zeros
+from typing import Any, Callable, NoReturn, Optional, cast
 
+from ._affine_gap_aligner import _AffineGapAligner
 from ._needleman_wunsch import NeedlemanWunsch
 
 __all__ = ['SmithWaterman']
@@ -99,19 +97,47 @@ class SmithWaterman(NeedlemanWunsch):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Computed in linear space, a row at a time
+
+        """
+        return self._aligner().score(src, tar)
+
+    def _aligner(self) -> _AffineGapAligner:
+        """Return a local aligner with this measure's scores & gap costs.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _AffineGapAligner(
+            self._sim_func,
+            self._gap_cost,
+            self._gap_cost,
+            self._gap_cost,
+            self._gap_cost,
+            local=True,
+        )
+
+    def alignment(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Raise exception when called.
+
+        Parameters
+        ----------
+        *args
+            Variable length argument list
+        **kwargs
+            Arbitrary keyword arguments
+
+        Raises
+        ------
+        NotImplementedError
+            Method disabled for Smith-Waterman score
+
+
+        .. versionadded:: 0.6.0
 
         """
-        d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float)
-
-        for i in range(1, len(src) + 1):
-            for j in range(1, len(tar) + 1):
-                match = d_mat[i - 1, j - 1] + self._sim_func(
-                    src[i - 1], tar[j - 1]
-                )
-                delete = d_mat[i - 1, j] - self._gap_cost
-                insert = d_mat[i, j - 1] - self._gap_cost
-                d_mat[i, j] = max(0, match, delete, insert)
-        return cast(float, d_mat[d_mat.shape[0] - 1, d_mat.shape[1] - 1])
+        raise NotImplementedError('Method disabled for Smith-Waterman score.')
 
     def sim(self, src: str, tar: str) -> float:
         """Return the normalized Smith-Waterman score of two strings.
@@ -146,8 +172,14 @@ class SmithWaterman(NeedlemanWunsch):
         """
         if src == tar:
             return 1.0
+        src_score = self.sim_score(src, src)
+        tar_score = self.sim_score(tar, tar)
+        # A string that scores nothing against itself, such as the empty
+        # string, is not similar to any other
+        if src_score <= 0.0 or tar_score <= 0.0:
+            return 0.0
         return max(0.0, self.sim_score(src, tar)) / (
-            self.sim_score(src, src) ** 0.5 * self.sim_score(tar, tar) ** 0.5
+            src_score ** 0.5 * tar_score ** 0.5
         )
 
 
@@ -64,6 +64,8 @@ class SoftTFIDF(_TokenDistance):
 
     """
 
+    _compares_strings = True
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
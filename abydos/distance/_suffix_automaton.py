@@ -0,0 +1,162 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._suffix_automaton.
+
+Suffix automaton, for finding longest common substrings in linear time
+"""
+
+from typing import Dict, List, Tuple
+
+__all__ = []  # type: List[str]
+
+
+class _SuffixAutomaton:
+    """Suffix automaton.
+
+    The suffix automaton (or DAWG) of a text is the smallest deterministic
+    automaton accepting all of its substrings :cite:`Blumer:1985`. It is built
+    online in time & space linear in the length of the text, after which the
+    longest substring of the text occurring in another string can be found in
+    time linear in the length of that string.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, text: str) -> None:
+        """Initialize _SuffixAutomaton instance.
+
+        Parameters
+        ----------
+        text : str
+            The text whose substrings the automaton accepts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # For each state: its transitions, suffix link, the length of the
+        # longest substring it accepts, and the end position of the first
+        # occurrence of its substrings in the text
+        self._next = [{}]  # type: List[Dict[str, int]]
+        self._link = [-1]
+        self._length = [0]
+        self._first_end = [-1]
+
+        last = 0
+        for pos, char in enumerate(text):
+            cur = self._add_state(self._length[last] + 1, -1, pos, {})
+            state = last
+            while state != -1 and char not in self._next[state]:
+                self._next[state][char] = cur
+                state = self._link[state]
+            if state == -1:
+                self._link[cur] = 0
+            else:
+                target = self._next[state][char]
+                if self._length[state] + 1 == self._length[target]:
+                    self._link[cur] = target
+                else:
+                    clone = self._add_state(
+                        self._length[state] + 1,
+                        self._link[target],
+                        self._first_end[target],
+                        dict(self._next[target]),
+                    )
+                    while (
+                        state != -1 and self._next[state].get(char) == target
+                    ):
+                        self._next[state][char] = clone
+                        state = self._link[state]
+                    self._link[target] = clone
+                    self._link[cur] = clone
+            last = cur
+
+    def _add_state(
+        self, length: int, link: int, first_end: int, trans: Dict[str, int]
+    ) -> int:
+        """Add a state to the automaton.
+
+        Parameters
+        ----------
+        length : int
+            The length of the longest substring the state accepts
+        link : int
+            The state's suffix link
+        first_end : int
+            The end position of the first occurrence of the state's substrings
+        trans : dict
+            The state's transitions
+
+        Returns
+        -------
+        int
+            The new state
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._next.append(trans)
+        self._link.append(link)
+        self._length.append(length)
+        self._first_end.append(first_end)
+        return len(self._length) - 1
+
+    def longest_common_substring(self, other: str) -> Tuple[int, int, int]:
+        """Return the longest substring shared by the text and another string.
+
+        Ties are broken as by the usual dynamic programming algorithm, which
+        scans other in order: the substring ending earliest in other is
+        returned, located at its first occurrence in the text.
+
+        Parameters
+        ----------
+        other : str
+            The string to compare against the text
+
+        Returns
+        -------
+        tuple
+            The start position of the substring in other, its start position
+            in the text, and its length
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        trans = self._next
+        link = self._link
+        state = length = 0
+        longest, other_end, text_end = 0, 0, 0
+        for pos, char in enumerate(other):
+            while state and char not in trans[state]:
+                state = link[state]
+                length = self._length[state]
+            if char in trans[state]:
+                state = trans[state][char]
+                length += 1
+            if length > longest:
+                longest = length
+                other_end = pos + 1
+                text_end = self._first_end[state] + 1
+        return other_end - longest, text_end - longest, longest
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -53,6 +53,8 @@ class TFIDF(_TokenDistance):
 
     """
 
+    _compares_strings = True
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -20,13 +20,17 @@ The distance._token_distance._TokenDistance module implements abstract class
 _TokenDistance.
 """
 
-from collections import Counter, OrderedDict
-from itertools import product
+from collections import Counter, defaultdict
+from heapq import heapify, heappop
 from math import exp, log1p
 from typing import (
     Any,
     Callable,
     Counter as TCounter,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -35,12 +39,23 @@ from typing import (
 
 import numpy as np
 
+from ._csr_matrix import _CSRMatrix
 from ._damerau_levenshtein import DamerauLevenshtein
 from ._distance import _Distance
 from ._lcprefix import LCPrefix
 from ._levenshtein import Levenshtein
+from ._linear_assignment import _linear_assignment, _sparse_linear_assignment
+from ._prepared_string import PreparedString
 from ..stats import ConfusionTable
-from ..tokenizer import QGrams, QSkipgrams, WhitespaceTokenizer, _Tokenizer
+from ..tokenizer import (
+    QGrams,
+    QSkipgrams,
+    TokenArrays,
+    TokenCache,
+    Vocabulary,
+    WhitespaceTokenizer,
+    _Tokenizer,
+)
 
 __all__ = ['_TokenDistance']
 
@@ -76,6 +91,28 @@ class _TokenDistance(_Distance):
     .. versionadded:: 0.3.6
     """
 
+    # The maximum numbers of pairs of tokens whose similarities are cached for
+    # the fuzzy intersection, and whose alignments are cached for the soft
+    # intersection
+    _fuzzy_sims_size = 65536
+    _soft_alignments_size = 4096
+
+    # Whether the measure reads the strings compared themselves, e.g. to
+    # normalize by their lengths or to re-tokenize them, so that it cannot
+    # compare token arrays
+    _compares_strings = False
+
+    # The cardinalities computed together by _merge_cards
+    _merged_cards = frozenset(
+        (
+            'intersection',
+            'src_only',
+            'tar_only',
+            'union',
+            'symmetric_difference',
+        )
+    )
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -162,14 +199,59 @@ class _TokenDistance(_Distance):
                 - ``laplace`` : :math:`x+1`
                 - ``inverse`` : :math:`\frac{1}{x}`
                 - ``complement`` : :math:`n-x`, where n is the total population
+        assignment : str
+            The method of solving the assignment problem of the ``linkage``
+            variant: ``munkres`` (the default) for the Hungarian algorithm,
+            ``jv`` for the Jonker-Volgenant algorithm, or ``sparse`` for the
+            same on only the pairs of tokens whose similarity meets the
+            threshold.
+        token_cache : TokenCache
+            A :py:class:`abydos.tokenizer.TokenCache`, in which the tokens of
+            the strings compared are cached. By default, no cache is used and
+            each string is tokenized anew.
+        vocabulary : Vocabulary
+            A :py:class:`abydos.tokenizer.Vocabulary`, by which the tokens of
+            strings are encoded as :py:class:`abydos.tokenizer.TokenArrays`.
+            With a vocabulary, token arrays encoded by it may be compared in
+            place of strings, and the crisp intersection & the population of
+            two token arrays are computed by merging their sorted arrays.
+            Measures that read the strings compared, and not only their
+            tokens, do not take a vocabulary.
+
+        Raises
+        ------
+        ValueError
+            Unknown assignment method
+        ValueError
+            The measure compares strings and cannot take a vocabulary
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added token_cache & vocabulary parameters
 
         """
         super(_TokenDistance, self).__init__(
             intersection_type=intersection_type, **kwargs
         )
 
+        assignment = self.params.get('assignment', 'munkres')
+        if assignment not in {'munkres', 'jv', 'sparse'}:
+            raise ValueError(
+                'Unknown assignment method {}: '.format(assignment)
+                + 'it must be munkres, jv, or sparse.'
+            )
+
+        if (
+            self._compares_strings
+            and self.params.get('vocabulary') is not None
+        ):
+            raise ValueError(
+                '{} compares strings, not only their tokens, '.format(
+                    type(self).__name__
+                )
+                + 'so it cannot take a vocabulary.'
+            )
+
         qval = 2 if 'qval' not in self.params else self.params['qval']
         self.params['tokenizer'] = (
             tokenizer
@@ -235,10 +317,30 @@ class _TokenDistance(_Distance):
         else:
             self._intersection = self._crisp_intersection  # type: ignore
 
-        self._src_tokens = Counter()  # type: TCounter[str]
-        self._tar_tokens = Counter()  # type: TCounter[str]
+        # the tokens of the current comparison, as Counters and/or (when
+        # comparing token arrays) as TokenArrays; Counters of token arrays
+        # are decoded as needed by _src_tokens & _tar_tokens
+        self._src_counter = Counter()  # type: Optional[TCounter[str]]
+        self._tar_counter = Counter()  # type: Optional[TCounter[str]]
+        self._src_arrays = None  # type: Optional[TokenArrays]
+        self._tar_arrays = None  # type: Optional[TokenArrays]
         self._population_card_value = 0  # type: float
 
+        # the cardinalities of the current comparison's token sets, before
+        # normalization, by name
+        self._card_cache = {}  # type: Dict[str, float]
+
+        # the src & tar whose tokens were shared by another measure, which
+        # _tokenize need not tokenize again
+        self._shared_pair = None  # type: Optional[Tuple[Any, Any]]
+
+        # the source string & its tokens, while scoring a batch of targets
+        self._src_memo = None  # type: Optional[Tuple[str, TCounter[str]]]
+
+        # the tokenizer & its configuration key, by which the tokens of
+        # prepared strings are cached
+        self._tokenizer_memo = None  # type: Optional[Tuple[_Tokenizer, Any]]
+
         # initialize normalizer
         self.normalizer = (
             self._norm_none
@@ -258,6 +360,101 @@ class _TokenDistance(_Distance):
         self._soft_src_only = Counter()  # type: TCounter[str]
         self._soft_tar_only = Counter()  # type: TCounter[str]
 
+        # the similarities of pairs of tokens in fuzzy intersections
+        self._fuzzy_sims = {}  # type: Dict[Tuple[str, str], float]
+
+        # the aligned tokens of pairs of tokens in soft intersections
+        self._soft_alignments = (
+            {}
+        )  # type: Dict[Tuple[str, str], Tuple[str, float, str, float, str, float]]  # noqa: E501
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the measure for pickling.
+
+        The tokens and intermediate values of the most recent comparison are
+        not part of the measure's configuration, so they are dropped. This
+        keeps pickled measures (and their bound sim/dist methods) small when
+        they are sent to worker processes, e.g. by
+        :py:func:`abydos.stats.mean_pairwise_similarity` with n_jobs > 1.
+
+        Returns
+        -------
+        dict
+            The instance's attributes, without per-comparison state
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        for attr in (
+            '_src_counter',
+            '_tar_counter',
+            '_soft_intersection_precalc',
+            '_soft_src_only',
+            '_soft_tar_only',
+        ):
+            state[attr] = Counter()
+        state['_src_arrays'] = None
+        state['_tar_arrays'] = None
+        state['_population_card_value'] = 0
+        state['_card_cache'] = {}
+        state['_shared_pair'] = None
+        state['_src_memo'] = None
+        state['_fuzzy_sims'] = {}
+        state['_soft_alignments'] = {}
+        state.pop('_src_orig', None)
+        state.pop('_tar_orig', None)
+        return state
+
+    @property
+    def _src_tokens(self) -> TCounter[str]:
+        """Return the src tokens as a Counter."""
+        if self._src_counter is None:
+            self._src_counter = self._decode(
+                cast(TokenArrays, self._src_arrays)
+            )
+        return self._src_counter
+
+    @_src_tokens.setter
+    def _src_tokens(self, tokens: TCounter[str]) -> None:
+        """Set the src tokens to a Counter."""
+        self._src_counter = tokens
+        self._src_arrays = None
+
+    @property
+    def _tar_tokens(self) -> TCounter[str]:
+        """Return the tar tokens as a Counter."""
+        if self._tar_counter is None:
+            self._tar_counter = self._decode(
+                cast(TokenArrays, self._tar_arrays)
+            )
+        return self._tar_counter
+
+    @_tar_tokens.setter
+    def _tar_tokens(self, tokens: TCounter[str]) -> None:
+        """Set the tar tokens to a Counter."""
+        self._tar_counter = tokens
+        self._tar_arrays = None
+
+    def _decode(self, arrays: TokenArrays) -> TCounter[str]:
+        """Return the Counter of tokens of token arrays.
+
+        Parameters
+        ----------
+        arrays : TokenArrays
+            Token arrays encoded by the measure's vocabulary
+
+        Returns
+        -------
+        Counter
+            The tokens & their counts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return cast(Vocabulary, self.params['vocabulary']).decode(arrays)
+
     @staticmethod
     def _norm_none(x: float, _squares: int, _pop: float) -> float:
         return x
@@ -287,16 +484,20 @@ class _TokenDistance(_Distance):
         return pop - x
 
     def _tokenize(
-        self, src: Union[str, TCounter[str]], tar: Union[str, TCounter[str]]
+        self,
+        src: Union[str, TCounter[str], TokenArrays],
+        tar: Union[str, TCounter[str], TokenArrays],
     ) -> '_TokenDistance':
         """Return the Q-Grams in src & tar.
 
         Parameters
         ----------
         src : str
-            Source string (or QGrams/Counter objects) for comparison
+            Source string (or QGrams/Counter/TokenArrays objects) for
+            comparison
         tar : str
-            Target string (or QGrams/Counter objects) for comparison
+            Target string (or QGrams/Counter/TokenArrays objects) for
+            comparison
 
         Returns
         -------
@@ -314,27 +515,92 @@ class _TokenDistance(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added support for TokenArrays
 
         """
+        if self._shared_pair is not None:
+            if src is self._shared_pair[0] and tar is self._shared_pair[1]:
+                return self
+            self._shared_pair = None
+
         self._src_orig = src
         self._tar_orig = tar
 
-        if isinstance(src, Counter):
-            self._src_tokens = src
+        if isinstance(src, TokenArrays) or isinstance(tar, TokenArrays):
+            self._tokenize_arrays(src, tar)
         else:
-            self._src_tokens = (
-                self.params['tokenizer'].tokenize(src).get_counter()
-            )
-        if isinstance(tar, Counter):
-            self._tar_tokens = tar
-        else:
-            self._tar_tokens = (
-                self.params['tokenizer'].tokenize(tar).get_counter()
-            )
+            if isinstance(src, Counter):
+                self._src_tokens = src
+            else:
+                self._src_tokens = self._get_counter(src)
+            if isinstance(tar, Counter):
+                self._tar_tokens = tar
+            else:
+                self._tar_tokens = self._get_counter(tar)
 
+        self._card_cache = {}
         self._population_card_value = self._calc_population_card()
+        self._set_normalizer()
 
-        # Set up the normalizer, a function of two variables:
+        # clear values for soft intersection
+        self._soft_intersection_precalc = Counter()
+        self._soft_src_only = Counter()
+        self._soft_tar_only = Counter()
+
+        return self
+
+    def _tokenize_arrays(
+        self,
+        src: Union[str, TCounter[str], TokenArrays],
+        tar: Union[str, TCounter[str], TokenArrays],
+    ) -> None:
+        """Store the tokens of src & tar as token arrays.
+
+        Strings and Counters compared to token arrays are encoded by the
+        measure's vocabulary.
+
+        Parameters
+        ----------
+        src : str, Counter, or TokenArrays
+            Source string (or Counter/TokenArrays objects) for comparison
+        tar : str, Counter, or TokenArrays
+            Target string (or Counter/TokenArrays objects) for comparison
+
+        Raises
+        ------
+        ValueError
+            A vocabulary is required to compare token arrays
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        vocabulary = self.params.get('vocabulary')
+        if vocabulary is None:
+            raise ValueError(
+                'A vocabulary is required to compare token arrays.'
+            )
+
+        def _encode(
+            tokens: Union[str, TCounter[str], TokenArrays]
+        ) -> Tuple[Optional[TCounter[str]], TokenArrays]:
+            if isinstance(tokens, TokenArrays):
+                return None, tokens
+            if not isinstance(tokens, Counter):
+                tokens = self._get_counter(tokens)
+            return tokens, vocabulary.encode(tokens)
+
+        self._src_counter, self._src_arrays = _encode(src)
+        self._tar_counter, self._tar_arrays = _encode(tar)
+
+    def _set_normalizer(self) -> None:
+        """Set up the normalizer from the params.
+
+        .. versionadded:: 0.6.0
+
+        """
+        # The normalizer is a function of two variables:
         # x is the value in the contingency table square(s)
         # n is the number of squares that x represents
         if (
@@ -343,34 +609,704 @@ class _TokenDistance(_Distance):
         ):
             self.normalizer = self._norm_dict[self.params['normalizer']]
 
-        # clear values for soft intersection
-        self._soft_intersection_precalc = Counter()
-        self._soft_src_only = Counter()
-        self._soft_tar_only = Counter()
+    def _share_tokens(self, other: '_TokenDistance') -> None:
+        """Adopt the tokens & cardinalities of another measure's comparison.
 
-        return self
+        Until this measure is given a different pair of strings, _tokenize
+        leaves the adopted tokens in place, and cardinalities computed by
+        either measure are shared. The measures must tokenize alike and have
+        the same intersection type (see :py:meth:`_shares_tokens_with`).
+
+        Parameters
+        ----------
+        other : _TokenDistance
+            A measure that has tokenized a pair of strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._src_orig = other._src_orig
+        self._tar_orig = other._tar_orig
+        self._src_counter = other._src_counter
+        self._tar_counter = other._tar_counter
+        self._src_arrays = other._src_arrays
+        self._tar_arrays = other._tar_arrays
+        self._population_card_value = other._population_card_value
+        self._card_cache = other._card_cache
+        self._soft_intersection_precalc = other._soft_intersection_precalc
+        self._soft_src_only = other._soft_src_only
+        self._soft_tar_only = other._soft_tar_only
+        self._set_normalizer()
+        self._shared_pair = (other._src_orig, other._tar_orig)
+
+    def _shares_tokens_with(self, other: '_TokenDistance') -> bool:
+        """Return whether two measures tokenize & intersect alike.
+
+        Parameters
+        ----------
+        other : _TokenDistance
+            Another token measure
+
+        Returns
+        -------
+        bool
+            True if the measures derive the same tokens, intersections, and
+            population from any pair of strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if (
+            self.params['tokenizer']._config_key()  # noqa: SF01
+            != other.params['tokenizer']._config_key()  # noqa: SF01
+            or self.params['intersection_type']
+            != other.params['intersection_type']
+            or self.params['alphabet'] != other.params['alphabet']
+            or self.params.get('vocabulary')
+            is not other.params.get('vocabulary')
+        ):
+            return False
+        if self.params['intersection_type'] == 'crisp':
+            return True
+        metric = self.params['metric']
+        other_metric = other.params['metric']
+        return (
+            type(metric) is type(other_metric)
+            and vars(metric) == vars(other_metric)
+            and self.params.get('threshold') == other.params.get('threshold')
+        )
+
+    def _get_counter(self, string: str) -> TCounter[str]:
+        """Return the tokens of a string as a Counter.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter
+            The tokens of string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._src_memo is not None and string == self._src_memo[0]:
+            return Counter(self._src_memo[1])
+        if isinstance(string, PreparedString):
+            tokenizer = self.params['tokenizer']
+            return Counter(
+                string.derived(
+                    ('tokens', self._tokenizer_key()),
+                    lambda plain: tokenizer.tokenize(plain).get_counter(),
+                )
+            )
+        if self.params.get('token_cache') is not None:
+            return cast(TokenCache, self.params['token_cache']).get_counter(
+                self.params['tokenizer'], string
+            )
+        return cast(
+            TCounter[str],
+            self.params['tokenizer'].tokenize(string).get_counter(),
+        )
+
+    def _tokenizer_key(self) -> Any:
+        """Return the configuration key of the measure's tokenizer.
+
+        The key is computed once for each tokenizer the measure is given.
+
+        Returns
+        -------
+        tuple
+            The tokenizer's configuration key
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokenizer = self.params['tokenizer']
+        if (
+            self._tokenizer_memo is None
+            or self._tokenizer_memo[0] is not tokenizer
+        ):
+            self._tokenizer_memo = (
+                tokenizer,
+                tokenizer._config_key(),  # noqa: SF01
+            )
+        return self._tokenizer_memo[1]
+
+    def _memoize_src(self, src: str) -> None:
+        """Tokenize the source string of a batch once, for reuse.
+
+        Parameters
+        ----------
+        src : str
+            The source string of a batch
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._src_memo = None
+        if isinstance(src, str):
+            self._src_memo = (src, self._get_counter(src))
+
+    def sim_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the similarities of a string to each of several strings.
+
+        The source string is tokenized once and its tokens are reused for
+        each of the targets.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of src to each of the targets
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._memoize_src(src)
+        try:
+            return super(_TokenDistance, self).sim_many(src, targets)
+        finally:
+            self._src_memo = None
+
+    def dist_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the distances of a string to each of several strings.
+
+        The source string is tokenized once and its tokens are reused for
+        each of the targets.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of src to each of the targets
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._memoize_src(src)
+        try:
+            return super(_TokenDistance, self).dist_many(src, targets)
+        finally:
+            self._src_memo = None
+
+    def dist_abs_many(self, src: str, targets: Iterable[str]) -> np.ndarray:
+        """Return the absolute distances of a string to several strings.
+
+        The source string is tokenized once and its tokens are reused for
+        each of the targets.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        targets : iterable of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The absolute distance of src to each of the targets
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._memoize_src(src)
+        try:
+            return super(_TokenDistance, self).dist_abs_many(src, targets)
+        finally:
+            self._src_memo = None
+
+    def sim_cross(
+        self,
+        srcs: Iterable[Union[str, TCounter[str], TokenArrays]],
+        targets: Iterable[Union[str, TCounter[str], TokenArrays]],
+    ) -> np.ndarray:
+        """Return the similarities of each of several strings to several more.
+
+        For measures that declare a vectorized formula of their similarity
+        (such as :py:class:`Jaccard`, :py:class:`Dice`, :py:class:`Tversky`,
+        :py:class:`Cosine`, and :py:class:`Overlap`), using the crisp
+        intersection and no normalizer, the tokens of the strings are stored
+        as sparse matrices of token counts, from which the cardinalities of
+        the intersections of all pairs are computed in bulk. The formula is
+        then evaluated for all pairs at once. Other measures compare each
+        pair in turn.
+
+        Parameters
+        ----------
+        srcs : iterable of str
+            Source strings (or Counter/TokenArrays objects) for comparison
+        targets : iterable of str
+            Target strings (or Counter/TokenArrays objects) for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-dimensional array of the similarity of each of the srcs (by
+            row) to each of the targets (by column)
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> cmp = Jaccard()
+        >>> cmp.sim_cross(['cat', 'Niall'], ['hat', 'Neil', 'cat'])
+        array([[0.33333333, 0.        , 1.        ],
+               [0.        , 0.22222222, 0.        ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        targets = list(targets)
+        srcs = list(srcs)
+        if not self._has_sim_formula():
+            return super(_TokenDistance, self).sim_cross(srcs, targets)
+
+        vocabulary = self.params.get('vocabulary')
+        if vocabulary is None:
+            if any(isinstance(tar, TokenArrays) for tar in srcs + targets):
+                raise ValueError(
+                    'A vocabulary is required to compare token arrays.'
+                )
+            vocabulary = Vocabulary()
+        src_arrays = self._token_arrays(srcs, vocabulary)
+        tar_arrays = self._token_arrays(targets, vocabulary)
+        src_matrix = _CSRMatrix.from_token_arrays(src_arrays, len(vocabulary))
+        tar_matrix = _CSRMatrix.from_token_arrays(tar_arrays, len(vocabulary))
+        if (src_matrix.data < 0).any() or (tar_matrix.data < 0).any():
+            return super(_TokenDistance, self).sim_cross(srcs, targets)
+
+        sims = self._sim_formula(
+            src_matrix.min_product(tar_matrix),
+            src_matrix.row_sums()[:, np.newaxis],
+            tar_matrix.row_sums()[np.newaxis, :],
+        )
+
+        # Identical strings are similar, whatever their tokens
+        tar_cols = defaultdict(list)  # type: DefaultDict[Any, List[int]]
+        for j, tar in enumerate(targets):
+            tar_cols[self._equality_key(tar)].append(j)
+        for i, src in enumerate(srcs):
+            cols = tar_cols.get(self._equality_key(src))
+            if cols:
+                sims[i, cols] = 1.0
+        return sims
+
+    def dist_cross(
+        self,
+        srcs: Iterable[Union[str, TCounter[str], TokenArrays]],
+        targets: Iterable[Union[str, TCounter[str], TokenArrays]],
+    ) -> np.ndarray:
+        """Return the distances of each of several strings to several more.
+
+        For measures that declare a vectorized formula of their similarity,
+        the distances are computed in bulk, as by :py:meth:`sim_cross`.
+
+        Parameters
+        ----------
+        srcs : iterable of str
+            Source strings (or Counter/TokenArrays objects) for comparison
+        targets : iterable of str
+            Target strings (or Counter/TokenArrays objects) for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-dimensional array of the distance of each of the srcs (by
+            row) to each of the targets (by column)
+
+        Examples
+        --------
+        >>> from abydos.distance import Dice
+        >>> cmp = Dice()
+        >>> cmp.dist_cross(['cat', 'Niall'], ['hat', 'Neil'])
+        array([[0.5       , 1.        ],
+               [1.        , 0.63636364]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._has_sim_formula() and type(self).dist is _Distance.dist:
+            return 1.0 - self.sim_cross(srcs, targets)
+        return super(_TokenDistance, self).dist_cross(srcs, targets)
+
+    def _has_sim_formula(self) -> bool:
+        """Return whether the similarity can be computed by _sim_formula.
+
+        Returns
+        -------
+        bool
+            True if the measure declares a vectorized formula of its
+            similarity, and its intersection type & normalizer are those the
+            formula assumes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            type(self)._sim_formula is not _TokenDistance._sim_formula
+            and self.params['intersection_type'] == 'crisp'
+            and self.params.get('normalizer') not in self._norm_dict
+        )
+
+    def _sim_formula(
+        self,
+        intersection: np.ndarray,
+        src_card: np.ndarray,
+        tar_card: np.ndarray,
+    ) -> np.ndarray:
+        """Return the similarities of many pairs from their cardinalities.
+
+        Measures whose similarity is a closed-form function of the
+        cardinalities of the crisp intersection and of the source & target
+        token sets may override this with a vectorized form of that function,
+        for use by :py:meth:`sim_cross`. Similarities of identical strings
+        are set to 1.0 afterwards, so the formula need not handle them.
+
+        Parameters
+        ----------
+        intersection : numpy.ndarray
+            The cardinality of the intersection of each pair, with a row per
+            source & a column per target
+        src_card : numpy.ndarray
+            The cardinality of each source's tokens, as a column
+        tar_card : numpy.ndarray
+            The cardinality of each target's tokens, as a row
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity of each pair
+
+        Raises
+        ------
+        NotImplementedError
+            The measure declares no vectorized formula
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        raise NotImplementedError(
+            '{} declares no vectorized formula.'.format(type(self).__name__)
+        )
+
+    def _token_arrays(
+        self,
+        strings: List[Union[str, TCounter[str], TokenArrays]],
+        vocabulary: Vocabulary,
+    ) -> List[TokenArrays]:
+        """Return the token arrays of several strings.
+
+        Parameters
+        ----------
+        strings : list of str
+            Strings (or Counter/TokenArrays objects)
+        vocabulary : Vocabulary
+            The vocabulary by which to encode the tokens
+
+        Returns
+        -------
+        list of TokenArrays
+            The token arrays of each string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        arrays = []  # type: List[TokenArrays]
+        for string in strings:
+            if isinstance(string, TokenArrays):
+                arrays.append(string)
+            elif isinstance(string, Counter):
+                arrays.append(vocabulary.encode(string))
+            else:
+                arrays.append(vocabulary.encode(self._get_counter(string)))
+        return arrays
+
+    @staticmethod
+    def _equality_key(string: Union[str, TCounter[str], TokenArrays]) -> Any:
+        """Return a key that is equal for strings that are equal.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(string, Counter):
+            return Counter, frozenset(string.items())
+        return type(string) is TokenArrays, string
 
     def _get_tokens(self) -> Tuple[TCounter[str], TCounter[str]]:
         """Return the src and tar tokens as a tuple."""
         return self._src_tokens, self._tar_tokens
 
+    def _raw_card(
+        self, name: str, tokens: Callable[[], TCounter[str]]
+    ) -> float:
+        """Return the cardinality of a set of tokens, before normalization.
+
+        Cardinalities are cached by name until the next _tokenize. Except for
+        the soft intersection, all the cardinalities of the contingency table
+        are computed together, by :py:meth:`_merge_cards`.
+
+        Parameters
+        ----------
+        name : str
+            The name of the set of tokens
+        tokens : function
+            A function returning the set of tokens
+
+        Returns
+        -------
+        float
+            The sum of the absolute values of the tokens' counts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if name not in self._card_cache:
+            if (
+                name in self._merged_cards
+                and self.params['intersection_type'] != 'soft'
+            ):
+                self._merge_cards()
+            else:
+                self._card_cache[name] = sum(
+                    abs(val) for val in tokens().values()
+                )
+        return self._card_cache[name]
+
+    def _merge_cards(self) -> None:
+        """Compute the cardinalities of the token sets in a single pass.
+
+        This merges the src & tar tokens and the intersection once, adding
+        each token's contribution to each set's cardinality, rather than
+        building each set as a Counter. Each set's count for a token follows
+        the Counter operation that the set's method uses (so only positive
+        counts are kept), and tokens are visited in the order in which those
+        Counters would hold them, so the sums are identical.
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_tokens = self._src_tokens
+        tar_tokens = self._tar_tokens
+        if self.params['intersection_type'] == 'crisp':
+            self._merge_crisp_cards()
+            return
+
+        inter = self._intersection()
+        inter_card = sum(abs(val) for val in inter.values())
+
+        def _counts(tok: str, src: float, tar: float) -> Tuple[float, ...]:
+            tok_int = inter.get(tok, 0)
+            extra = max(tok_int - max(min(src, tar), 0), 0)
+            return (
+                max(max(src - tok_int, 0) - extra, 0),
+                max(max(tar - tok_int, 0) - extra, 0),
+                max(max(max(src + tar, 0) - tok_int, 0) - extra, 0),
+            )
+
+        # Counters drop non-positive counts, which contribute nothing
+        src_only_card = tar_only_card = 0  # type: float
+        union_card = sym_diff_card = 0  # type: float
+
+        for tok, src in src_tokens.items():
+            src_only, tar_only, union = _counts(
+                tok, src, tar_tokens.get(tok, 0)
+            )
+            if src_only > 0:
+                src_only_card += src_only
+                sym_diff_card += src_only + tar_only
+            if union > 0:
+                union_card += union
+        for tok, tar in tar_tokens.items():
+            src_only, tar_only, union = _counts(
+                tok, src_tokens.get(tok, 0), tar
+            )
+            if tar_only > 0:
+                tar_only_card += tar_only
+                if src_only <= 0:
+                    sym_diff_card += tar_only
+            if tok not in src_tokens and union > 0:
+                union_card += union
+        for tok in inter:
+            if tok not in src_tokens and tok not in tar_tokens:
+                src_only, tar_only, union = _counts(tok, 0, 0)
+                if src_only > 0:
+                    src_only_card += src_only
+                if tar_only > 0:
+                    tar_only_card += tar_only
+                if union > 0:
+                    union_card += union
+                if src_only + tar_only > 0:
+                    sym_diff_card += src_only + tar_only
+
+        self._card_cache.update(
+            (
+                ('intersection', inter_card),
+                ('src_only', src_only_card),
+                ('tar_only', tar_only_card),
+                ('union', union_card),
+                ('symmetric_difference', sym_diff_card),
+            )
+        )
+
+    def _merge_crisp_cards(self) -> None:
+        """Compute the cardinalities of crisp token sets in a single pass.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._src_arrays is not None and self._tar_arrays is not None:
+            self._merge_arrays()
+            return
+
+        tar_tokens = self._tar_tokens
+        tar_get = tar_tokens.get
+        inter_card = src_only_card = tar_only_card = 0  # type: float
+        union_card = 0  # type: float
+
+        for tok, src in self._src_tokens.items():
+            tar = tar_get(tok, 0)
+            tok_int = src if src < tar else tar
+            if tok_int > 0:
+                inter_card += tok_int
+            else:
+                tok_int = 0
+            if src > tok_int:
+                src_only_card += src - tok_int
+            if src + tar > tok_int:
+                union_card += src + tar - tok_int
+        # At most one of src_only & tar_only holds each token, so their sum
+        # continues from src_only
+        sym_diff_card = src_only_card
+        # Tokens only in tar have no intersection
+        src_get = self._src_tokens.get
+        for tok, tar in tar_tokens.items():
+            src = src_get(tok)
+            if src is None:
+                if tar > 0:
+                    tar_only_card += tar
+                    sym_diff_card += tar
+                    union_card += tar
+            else:
+                tok_int = src if src < tar else tar
+                if tok_int < 0:
+                    tok_int = 0
+                if tar > tok_int:
+                    tar_only_card += tar - tok_int
+                    sym_diff_card += tar - tok_int
+
+        self._card_cache.update(
+            (
+                ('intersection', inter_card),
+                ('src_only', src_only_card),
+                ('tar_only', tar_only_card),
+                ('union', union_card),
+                ('symmetric_difference', sym_diff_card),
+            )
+        )
+
+    def _merge_arrays(self) -> None:
+        """Compute the cardinalities of two token arrays' crisp sets.
+
+        The sorted token IDs of src & tar are merged, aligning the counts of
+        the tokens they share, from which the cardinalities of the crisp
+        intersection, of the other sets of the contingency table, and of the
+        total are computed.
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_ids, src_counts = cast(TokenArrays, self._src_arrays)
+        tar_ids, tar_counts = cast(TokenArrays, self._tar_arrays)
+        # Find the shared tokens by each src token's position among the tar
+        # tokens
+        if len(tar_ids):
+            tar_pos = np.searchsorted(tar_ids, src_ids)
+            np.minimum(tar_pos, len(tar_ids) - 1, out=tar_pos)
+            src_idx = np.flatnonzero(tar_ids[tar_pos] == src_ids)
+            tar_idx = tar_pos[src_idx]
+        else:
+            src_idx = tar_idx = np.zeros(0, dtype=np.intp)
+
+        dtype = np.result_type(src_counts, tar_counts)
+        tar_at_src = np.zeros(len(src_ids), dtype=dtype)
+        tar_at_src[src_idx] = tar_counts[tar_idx]
+        src_at_tar = np.zeros(len(tar_ids), dtype=dtype)
+        src_at_tar[tar_idx] = src_counts[src_idx]
+        tar_only_tokens = np.ones(len(tar_ids), dtype=np.bool_)
+        tar_only_tokens[tar_idx] = False
+
+        # As with Counters, only positive counts are kept
+        src_int = np.maximum(np.minimum(src_counts, tar_at_src), 0)
+        tar_int = np.maximum(np.minimum(src_at_tar, tar_counts), 0)
+        src_only_card = np.maximum(src_counts - src_int, 0).sum().item()
+        tar_only_card = np.maximum(tar_counts - tar_int, 0).sum().item()
+        total = np.concatenate(
+            (src_counts + tar_at_src, tar_counts[tar_only_tokens])
+        )
+        total = total[total > 0]
+        src_union = np.maximum(src_counts + tar_at_src - src_int, 0)
+
+        self._card_cache.update(
+            (
+                ('intersection', src_int.sum().item()),
+                ('src_only', src_only_card),
+                ('tar_only', tar_only_card),
+                (
+                    'union',
+                    src_union.sum().item()
+                    + np.maximum(tar_counts[tar_only_tokens], 0).sum().item(),
+                ),
+                ('symmetric_difference', src_only_card + tar_only_card),
+                ('total', total.sum().item()),
+                ('total_size', len(total)),
+            )
+        )
+
     def _src_card(self) -> float:
         r"""Return the cardinality of the tokens in the source set."""
         if self.params['intersection_type'] == 'soft':
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             return self.normalizer(
-                sum(
-                    abs(val)
-                    for val in (
-                        self._soft_intersection_precalc + self._soft_src_only
-                    ).values()
+                self._raw_card(
+                    'src',
+                    lambda: self._soft_intersection_precalc
+                    + self._soft_src_only,
                 ),
                 2,
                 self._population_card_value,
             )
         return self.normalizer(
-            sum(abs(val) for val in self._src_tokens.values()),
+            self._raw_card('src', lambda: self._src_tokens),
             2,
             self._population_card_value,
         )
@@ -392,7 +1328,7 @@ class _TokenDistance(_Distance):
     def _src_only_card(self) -> float:
         """Return the cardinality of the tokens only in the source set."""
         return self.normalizer(
-            sum(abs(val) for val in self._src_only().values()),
+            self._raw_card('src_only', self._src_only),
             1,
             self._population_card_value,
         )
@@ -403,17 +1339,16 @@ class _TokenDistance(_Distance):
             if not len(self._soft_intersection_precalc):
                 self._intersection()
             return self.normalizer(
-                sum(
-                    abs(val)
-                    for val in (
-                        self._soft_intersection_precalc + self._soft_tar_only
-                    ).values()
+                self._raw_card(
+                    'tar',
+                    lambda: self._soft_intersection_precalc
+                    + self._soft_tar_only,
                 ),
                 2,
                 self._population_card_value,
             )
         return self.normalizer(
-            sum(abs(val) for val in self._tar_tokens.values()),
+            self._raw_card('tar', lambda: self._tar_tokens),
             2,
             self._population_card_value,
         )
@@ -435,7 +1370,7 @@ class _TokenDistance(_Distance):
     def _tar_only_card(self) -> float:
         """Return the cardinality of the tokens only in the target set."""
         return self.normalizer(
-            sum(abs(val) for val in self._tar_only().values()),
+            self._raw_card('tar_only', self._tar_only),
             1,
             self._population_card_value,
         )
@@ -450,7 +1385,7 @@ class _TokenDistance(_Distance):
     def _symmetric_difference_card(self) -> float:
         """Return the cardinality of the symmetric difference."""
         return self.normalizer(
-            sum(abs(val) for val in self._symmetric_difference().values()),
+            self._raw_card('symmetric_difference', self._symmetric_difference),
             2,
             self._population_card_value,
         )
@@ -477,45 +1412,86 @@ class _TokenDistance(_Distance):
     def _total_card(self) -> float:
         """Return the cardinality of the complement of the total."""
         return self.normalizer(
-            sum(abs(val) for val in self._total().values()),
+            self._raw_card('total', self._total),
             3,
             self._population_card_value,
         )
 
     def _total_complement_card(self) -> float:
         """Return the cardinality of the complement of the total."""
-        if self.params['alphabet'] is None:
-            return self.normalizer(0, 1, self._population_card_value)
-        elif isinstance(self.params['alphabet'], Counter):
-            return self.normalizer(
-                max(
-                    0,
-                    sum(
-                        abs(val)
-                        for val in (
-                            self.params['alphabet'] - self._total()
-                        ).values()
-                    ),
-                ),
-                1,
-                self._population_card_value,
+        if 'total_complement' not in self._card_cache:
+            self._card_cache['total_complement'] = self._complement_size(
+                self._total()
             )
         return self.normalizer(
-            max(0, self.params['alphabet'] - len(self._total().values())),
+            self._card_cache['total_complement'],
             1,
             self._population_card_value,
         )
 
+    def _complement_size(self, total: TCounter[str]) -> float:
+        """Return the cardinality of the alphabet less a total.
+
+        Parameters
+        ----------
+        total : Counter
+            The total of the tokens of a comparison
+
+        Returns
+        -------
+        float
+            The cardinality of the complement of the total
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.params['alphabet'] is None:
+            return 0
+        elif isinstance(self.params['alphabet'], Counter):
+            return max(
+                0,
+                sum(
+                    abs(val)
+                    for val in (self.params['alphabet'] - total).values()
+                ),
+            )
+        return max(0, self.params['alphabet'] - len(total.values()))
+
     def _calc_population_card(self) -> float:
         """Return the cardinality of the population."""
-        save_normalizer = self.normalizer
-        self.normalizer = self._norm_none
-        save_intersection = self.params['intersection_type']
-        self.params['intersection_type'] = 'crisp'
-        pop = self._total_card() + self._total_complement_card()
-        self.normalizer = save_normalizer
-        self.params['intersection_type'] = save_intersection
-        return pop
+        # The population is that of crisp sets, without normalization
+        if (
+            self._src_arrays is not None
+            and self._tar_arrays is not None
+            and not isinstance(self.params['alphabet'], Counter)
+        ):
+            self._merge_arrays()
+            total_card = self._card_cache['total']
+            complement_card = (
+                0
+                if self.params['alphabet'] is None
+                else max(
+                    0, self.params['alphabet'] - self._card_cache['total_size']
+                )
+            )
+            if self.params['intersection_type'] == 'soft':
+                del self._card_cache['total']
+            else:
+                self._card_cache['total_complement'] = complement_card
+            if self.params['intersection_type'] != 'crisp':
+                for name in self._merged_cards:
+                    del self._card_cache[name]
+            return total_card + complement_card
+
+        total = self._src_tokens + self._tar_tokens
+        total_card = sum(abs(val) for val in total.values())
+        complement_card = self._complement_size(total)
+        if self.params['intersection_type'] != 'soft':
+            # Only the soft intersection changes the total
+            self._card_cache['total'] = total_card
+            self._card_cache['total_complement'] = complement_card
+        return total_card + complement_card
 
     def _population_card(self) -> float:
         """Return the cardinality of the population."""
@@ -552,7 +1528,7 @@ class _TokenDistance(_Distance):
     def _union_card(self) -> float:
         """Return the cardinality of the union."""
         return self.normalizer(
-            sum(abs(val) for val in self._union().values()),
+            self._raw_card('union', self._union),
             3,
             self._population_card_value,
         )
@@ -581,6 +1557,14 @@ class _TokenDistance(_Distance):
 
         This implements the soft intersection defined by :cite:`Russ:2014` in
         a way that can reproduce the results in the paper.
+
+        Pairs of tokens are taken greedily, in order of decreasing membership
+        (and in sorted order among pairs of equal membership), from a heap.
+        The aligned tokens of each pair taken are cached by the measure, for
+        reuse in later comparisons.
+
+        .. versionchanged:: 0.6.0
+            Pairs taken from a heap, and aligned tokens cached
         """
         if not hasattr(self.params['metric'], 'alignment'):
             raise TypeError(
@@ -595,16 +1579,21 @@ member function, such as Levenshtein."
         src_new = Counter()  # type: TCounter[str]
         tar_new = Counter()  # type: TCounter[str]
 
-        def _membership(src: str, tar: str) -> float:
-            greater_length = max(len(src), len(tar))
-            return cast(
-                float,
-                max(
-                    greater_length - self.params['metric'].dist_abs(src, tar),
-                    self._lcprefix.dist_abs(src, tar),
-                )
-                / greater_length,
-            )
+        metric = self.params['metric']
+        tar_toks = sorted(tar_only)
+
+        def _memberships(src: str) -> Iterable[float]:
+            if hasattr(metric, 'dist_abs_many'):
+                dists = metric.dist_abs_many(
+                    src, tar_toks
+                ).tolist()  # type: Iterable[float]
+            else:
+                dists = (metric.dist_abs(src, tar) for tar in tar_toks)
+            for tar, dist in zip(tar_toks, dists):
+                greater_length = max(len(src), len(tar))
+                yield max(
+                    greater_length - dist, self._lcprefix.dist_abs(src, tar),
+                ) / greater_length
 
         def _token_src_tar_int(
             src: str, tar: str
@@ -651,18 +1640,25 @@ member function, such as Levenshtein."
                 int_val,
             )
 
-        # Dictionary ordering is important for reproducibility, so insertion
-        # order needs to be controlled and retained.
-        memberships = OrderedDict(
-            ((src, tar), _membership(src, tar))
-            for src, tar in sorted(product(src_only, tar_only))
-        )
-
-        while memberships:
-            src_tok, tar_tok = max(memberships, key=memberships.get)
-            if memberships[src_tok, tar_tok] > 0.0:
-                pairings = min(src_only[src_tok], tar_only[tar_tok])
-                if pairings:
+        # The pairs are ordered by decreasing membership, then by the tokens
+        # themselves, for reproducibility. Pairs of non-positive membership
+        # are never taken.
+        heap = [
+            (-membership, src, tar)
+            for src in sorted(src_only)
+            for tar, membership in zip(tar_toks, _memberships(src))
+            if membership > 0.0
+        ]
+        heapify(heap)
+
+        src_left = len(src_only)
+        tar_left = len(tar_only)
+        alignments = self._soft_alignments
+        while heap and src_left and tar_left:
+            _, src_tok, tar_tok = heappop(heap)
+            pairings = min(src_only[src_tok], tar_only[tar_tok])
+            if pairings:
+                try:
                     (
                         src_ntok,
                         src_val,
@@ -670,17 +1666,30 @@ member function, such as Levenshtein."
                         tar_val,
                         int_ntok,
                         int_val,
+                    ) = alignments[src_tok, tar_tok]
+                except KeyError:
+                    if len(alignments) >= self._soft_alignments_size:
+                        alignments.clear()
+                    alignments[src_tok, tar_tok] = (
+                        src_ntok,
+                        src_val,
+                        tar_ntok,
+                        tar_val,
+                        int_ntok,
+                        int_val,
                     ) = _token_src_tar_int(src_tok, tar_tok)
 
-                    src_new[src_ntok] += src_val * pairings  # type: ignore
-                    tar_new[tar_ntok] += tar_val * pairings  # type: ignore
-                    intersection[int_ntok] += int_val * pairings  # type: ignore
+                src_new[src_ntok] += src_val * pairings  # type: ignore
+                tar_new[tar_ntok] += tar_val * pairings  # type: ignore
+                intersection[int_ntok] += int_val * pairings  # type: ignore
 
-                    # Remove pairings from src_only/tar_only
-                    src_only[src_tok] -= pairings
-                    tar_only[tar_tok] -= pairings
-
-            del memberships[src_tok, tar_tok]
+                # Remove pairings from src_only/tar_only
+                src_only[src_tok] -= pairings
+                tar_only[tar_tok] -= pairings
+                if not src_only[src_tok]:
+                    src_left -= 1
+                if not tar_only[tar_tok]:
+                    tar_left -= 1
 
         # Add src_new/tar_new back into src_only/tar_only
         src_only += src_new
@@ -708,19 +1717,94 @@ member function, such as Levenshtein."
         :math:`\delta = 0.8`, must match exactly to be included in the
         intersection.
 
+        When the metric is Levenshtein or Damerau-Levenshtein distance with
+        unit costs, normalized by the length of the longer token, pairs of
+        tokens that cannot be this similar are skipped without computing their
+        similarity: the distance between two different tokens is at least 1,
+        and at least the number of characters of the longer token not matched
+        by the characters of the shorter (and so at least the difference in
+        their lengths). The similarities of other pairs are cached by the
+        measure, for reuse in later comparisons.
+
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Skip pairs beyond the bounds of Levenshtein distance, and cache
+            similarities
 
         """
         intersection = self._crisp_intersection()
         src_only = self._src_tokens - self._tar_tokens
         tar_only = self._tar_tokens - self._src_tokens
 
+        metric = self.params['metric']
+        threshold = self.params['threshold']
+        sims = self._fuzzy_sims
+        bounded = self._fuzzy_bounded()
+        tar_toks = sorted(tar_only)
+        if bounded:
+            tar_chars = {tar_tok: Counter(tar_tok) for tar_tok in tar_toks}
+            tar_lengths = defaultdict(
+                list
+            )  # type: DefaultDict[int, List[str]]
+            for tar_tok in tar_toks:
+                tar_lengths[len(tar_tok)].append(tar_tok)
+
         pair = {}
         for src_tok in sorted(src_only):
-            for tar_tok in sorted(tar_only):
-                sim = self.params['metric'].sim(src_tok, tar_tok)
-                if sim >= self.params['threshold']:
+            if bounded:
+                # The tokens differ, so their distance is at least 1, and at
+                # least the difference in their lengths
+                src_len = len(src_tok)
+                src_chars = Counter(src_tok)
+                tars = [
+                    tar_tok
+                    for tar_len, toks in tar_lengths.items()
+                    if 1
+                    - max(abs(src_len - tar_len), 1) / max(src_len, tar_len)
+                    >= threshold
+                    for tar_tok in toks
+                ]  # type: List[str]
+            else:
+                tars = tar_toks
+
+            candidates = []
+            for tar_tok in tars:
+                try:
+                    sim = sims[src_tok, tar_tok]
+                except KeyError:
+                    if bounded:
+                        # The distance is at least the number of characters
+                        # of the longer token unmatched in the shorter
+                        longer = max(src_len, len(tar_tok))
+                        chars = tar_chars[tar_tok]
+                        common = sum(
+                            [
+                                min(count, chars[char])
+                                for char, count in src_chars.items()
+                                if char in chars
+                            ]
+                        )
+                        if 1 - max(longer - common, 1) / longer < threshold:
+                            continue
+                    candidates.append(tar_tok)
+                    continue
+                if sim >= threshold:
+                    pair[(src_tok, tar_tok)] = sim
+
+            if not candidates:
+                continue
+            if hasattr(metric, 'sim_many'):
+                cand_sims = metric.sim_many(
+                    src_tok, candidates
+                ).tolist()  # type: Iterable[float]
+            else:
+                cand_sims = (metric.sim(src_tok, tar) for tar in candidates)
+            if len(sims) + len(candidates) > self._fuzzy_sims_size:
+                sims.clear()
+            for tar_tok, sim in zip(candidates, cand_sims):
+                sims[src_tok, tar_tok] = sim
+                if sim >= threshold:
                     pair[(src_tok, tar_tok)] = sim
 
         ordered_keys = [(pair[_], _[0], _[1]) for _ in pair]
@@ -766,6 +1850,27 @@ member function, such as Levenshtein."
 
         return intersection
 
+    def _fuzzy_bounded(self) -> bool:
+        """Return whether the fuzzy intersection's metric may be bounded.
+
+        Returns
+        -------
+        bool
+            True if the metric is Levenshtein or Damerau-Levenshtein distance
+            with unit costs, normalized by the length of the longer string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        metric = self.params['metric']
+        return (
+            type(metric) in {Levenshtein, DamerauLevenshtein}
+            and tuple(metric._cost) == (1, 1, 1, 1)  # noqa: SF01
+            and metric._normalizer is max  # noqa: SF01
+            and not getattr(metric, '_taper_enabled', False)
+        )
+
     def _group_linkage_intersection(self) -> TCounter[str]:
         r"""Return the group linkage intersection of the tokens in src and tar.
 
@@ -777,10 +1882,23 @@ member function, such as Levenshtein."
         below in Python & Numpy is used to solve the assignment problem since
         it is roughly twice as fast as SciPy's implementation.
 
+        With the `assignment` parameter set to ``jv``, the assignment problem
+        is instead solved by the shortest augmenting path method of Jonker &
+        Volgenant :cite:`Jonker:1987`, which takes :math:`O(n^3)` time at
+        most, and so is much faster for large sets of tokens. With
+        ``sparse``, only the pairs of tokens whose similarity meets the
+        threshold are matched, by solving the assignment problem of each
+        connected group of such pairs separately. (Where several assignments
+        are optimal, the methods may choose different ones.) In each case,
+        the matrix of token distances is filled by the metric's dist_many
+        method.
+
         .. versionadded:: 0.4.0
         .. versionchanged:: 0.4.1
             Corrected the Hungarian algorithm & optimized it so that SciPy's
             version is no longer needed.
+        .. versionchanged:: 0.6.0
+            Added the Jonker-Volgenant & sparse assignment methods
 
         """
         intersection = self._crisp_intersection()
@@ -789,17 +1907,50 @@ member function, such as Levenshtein."
         src_only = self._src_tokens - self._tar_tokens
         tar_only = self._tar_tokens - self._src_tokens
 
+        # The matrix of distances, with a row for each tar token & a column
+        # for each src token
+        metric = self.params['metric']
+        arr = np.zeros((len(tar_only_tok), len(src_only_tok)), dtype=float)
+        for col, src_tok in enumerate(src_only_tok):
+            if hasattr(metric, 'dist_many'):
+                arr[:, col] = metric.dist_many(src_tok, tar_only_tok)
+            else:
+                arr[:, col] = [
+                    metric.dist(src_tok, tar) for tar in tar_only_tok
+                ]
+
+        assignment = self.params.get('assignment', 'munkres')
+        if assignment != 'munkres':
+            if assignment == 'sparse':
+                sims = 1 - arr
+                pairs = _sparse_linear_assignment(
+                    sims, sims >= self.params['threshold']
+                )
+            else:
+                pairs = _linear_assignment(arr)
+            for row, col in pairs:
+                sim = 1 - arr[row, col]
+                if sim >= self.params['threshold']:
+                    score = float(
+                        (sim / 2)
+                        * min(
+                            src_only[src_only_tok[col]],
+                            tar_only[tar_only_tok[row]],
+                        )
+                    )
+                    intersection[src_only_tok[col]] += score  # type: ignore
+                    intersection[tar_only_tok[row]] += score  # type: ignore
+            return intersection
+
         # Quoted text below is from Munkres (1957), cited above.
 
         # Pre-preliminaries: create square the matrix of scores
         n = max(len(src_only_tok), len(tar_only_tok))
-        arr = np.zeros((n, n), dtype=float)
-
-        for col in range(len(src_only_tok)):
-            for row in range(len(tar_only_tok)):
-                arr[row, col] = self.params['metric'].dist(
-                    src_only_tok[col], tar_only_tok[row]
-                )
+        arr = np.pad(
+            arr,
+            ((0, n - len(tar_only_tok)), (0, n - len(src_only_tok))),
+            'constant',
+        )
 
         src_only_tok += [''] * (n - len(src_only_tok))
         tar_only_tok += [''] * (n - len(tar_only_tok))
@@ -967,7 +2118,7 @@ member function, such as Levenshtein."
     def _intersection_card(self) -> float:
         """Return the cardinality of the intersection."""
         return self.normalizer(
-            sum(abs(val) for val in self._intersection().values()),
+            self._raw_card('intersection', self._intersection),
             1,
             self._population_card_value,
         )
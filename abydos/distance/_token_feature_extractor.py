@@ -0,0 +1,199 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._token_feature_extractor.
+
+Token feature extractor, evaluating many measures of each pair of strings
+"""
+
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from ._distance import _Distance
+from ._token_distance import _TokenDistance
+
+__all__ = ['TokenFeatureExtractor']
+
+
+class TokenFeatureExtractor:
+    """Token feature extractor.
+
+    This evaluates a list of measures on pairs of strings, returning a row of
+    values per pair, as features for e.g. record linkage classifiers.
+
+    Token measures that tokenize alike (i.e. with tokenizers of the same
+    configuration, and with the same intersection type and alphabet) are
+    grouped, and each pair of strings is tokenized once per group. The
+    cardinalities of the contingency table (a, b, c, d, and n) and of the
+    other token sets are then computed once per pair and shared by all
+    measures in the group. Other measures are evaluated as usual.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, measures: Sequence[_Distance], method: str = 'sim'
+    ) -> None:
+        """Initialize TokenFeatureExtractor instance.
+
+        Parameters
+        ----------
+        measures : sequence of _Distance
+            The measures to evaluate
+        method : str
+            The name of the method of each measure to evaluate, such as
+            ``sim`` (the default), ``dist``, ``sim_score``, or ``dist_abs``
+
+        Raises
+        ------
+        ValueError
+            No measures supplied
+        ValueError
+            A measure lacks the method
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not measures:
+            raise ValueError('At least one measure is required.')
+        for measure in measures:
+            if not callable(getattr(measure, method, None)):
+                raise ValueError(
+                    '{} has no {} method.'.format(
+                        type(measure).__name__, method
+                    )
+                )
+
+        self._measures = list(measures)
+        self._method = method
+
+        # Group the token measures by the measure (the first of each group)
+        # that tokenizes each pair for the group
+        self._groups = []  # type: List[Tuple[_TokenDistance, List[int]]]
+        for i, measure in enumerate(self._measures):
+            if not isinstance(measure, _TokenDistance):
+                continue
+            for template, members in self._groups:
+                if template._shares_tokens_with(measure):  # noqa: SF01
+                    members.append(i)
+                    break
+            else:
+                self._groups.append((measure, [i]))
+
+        grouped = {i for _, members in self._groups for i in members}
+        self._ungrouped = [
+            i for i in range(len(self._measures)) if i not in grouped
+        ]
+
+    @property
+    def feature_names(self) -> List[str]:
+        """Return the names of the features.
+
+        Returns
+        -------
+        list of str
+            The class name of each measure
+
+        Examples
+        --------
+        >>> from abydos.distance import Dice, Jaccard, Levenshtein
+        >>> fe = TokenFeatureExtractor([Jaccard(), Dice(), Levenshtein()])
+        >>> fe.feature_names
+        ['Jaccard', 'Dice', 'Levenshtein']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [type(measure).__name__ for measure in self._measures]
+
+    def features(self, src: str, tar: str) -> np.ndarray:
+        """Return the value of each measure for a pair of strings.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The value of each measure, in order
+
+        Examples
+        --------
+        >>> from abydos.distance import Dice, Jaccard, Levenshtein
+        >>> fe = TokenFeatureExtractor([Jaccard(), Dice(), Levenshtein()])
+        >>> fe.features('cat', 'hat')
+        array([0.33333333, 0.5       , 0.66666667])
+        >>> fe.features('Niall', 'Neil')
+        array([0.22222222, 0.36363636, 0.4       ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        row = np.empty(len(self._measures), dtype=np.float_)
+        for template, members in self._groups:
+            template._tokenize(src, tar)  # noqa: SF01
+            for i in members:
+                measure = self._measures[i]
+                measure._share_tokens(template)  # noqa: SF01
+                row[i] = getattr(measure, self._method)(src, tar)
+        for i in self._ungrouped:
+            row[i] = getattr(self._measures[i], self._method)(src, tar)
+        return row
+
+    def transform(self, pairs: Iterable[Tuple[str, str]]) -> np.ndarray:
+        """Return the value of each measure for each of several pairs.
+
+        Parameters
+        ----------
+        pairs : iterable of tuples of str
+            The (src, tar) pairs for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            A 2-dimensional array with a row for each pair and a column for
+            each measure
+
+        Examples
+        --------
+        >>> from abydos.distance import Dice, Jaccard, Levenshtein
+        >>> fe = TokenFeatureExtractor([Jaccard(), Dice(), Levenshtein()])
+        >>> fe.transform([('cat', 'hat'), ('Niall', 'Neil')])
+        array([[0.33333333, 0.5       , 0.66666667],
+               [0.22222222, 0.36363636, 0.4       ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        rows = [self.features(src, tar) for src, tar in pairs]
+        if not rows:
+            return np.zeros((0, len(self._measures)), dtype=np.float_)
+        return np.vstack(rows)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
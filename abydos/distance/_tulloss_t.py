@@ -103,9 +103,10 @@ class TullossT(_TokenDistance):
         super(TullossT, self).__init__(
             tokenizer=tokenizer, intersection_type=intersection_type, **kwargs
         )
-        self._r = TullossR()
-        self._s = TullossS()
-        self._u = TullossU()
+        vocabulary = self.params.get('vocabulary')
+        self._r = TullossR(vocabulary=vocabulary)
+        self._s = TullossS(vocabulary=vocabulary)
+        self._u = TullossU(vocabulary=vocabulary)
 
     def sim(self, src: str, tar: str) -> float:
         """Return Tulloss' T similarity of two strings.
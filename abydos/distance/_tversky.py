@@ -21,6 +21,8 @@ Tversky index
 
 from typing import Any, Optional, cast
 
+import numpy as np
+
 from ._token_distance import _TokenDistance
 from ..tokenizer import _Tokenizer
 
@@ -200,6 +202,68 @@ class Tversky(_TokenDistance):
             ),
         )
 
+    def _sim_formula(
+        self,
+        intersection: np.ndarray,
+        src_card: np.ndarray,
+        tar_card: np.ndarray,
+    ) -> np.ndarray:
+        """Return the Tversky indices of many pairs from their cardinalities.
+
+        Parameters
+        ----------
+        intersection : numpy.ndarray
+            The cardinality of the intersection of each pair
+        src_card : numpy.ndarray
+            The cardinality of each source's tokens, as a column
+        tar_card : numpy.ndarray
+            The cardinality of each target's tokens, as a row
+
+        Returns
+        -------
+        numpy.ndarray
+            Tversky similarity of each pair
+
+        Raises
+        ------
+        ValueError
+            Unsupported weight assignment; alpha and beta must be greater than
+            or equal to 0.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.params['alpha'] < 0 or self.params['beta'] < 0:
+            raise ValueError(
+                'Unsupported weight assignment; alpha and beta '
+                + 'must be greater than or equal to 0.'
+            )
+
+        q_src_mag = src_card - intersection
+        q_tar_mag = tar_card - intersection
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.params['bias'] is None:
+                sims = intersection / (
+                    intersection
+                    + self.params['alpha'] * q_src_mag
+                    + self.params['beta'] * q_tar_mag
+                )
+            else:
+                a_val = np.minimum(q_src_mag, q_tar_mag)
+                b_val = np.maximum(q_src_mag, q_tar_mag)
+                c_val = intersection + self.params['bias']
+                sims = c_val / (
+                    self.params['beta']
+                    * (
+                        self.params['alpha'] * a_val
+                        + (1 - self.params['alpha']) * b_val
+                    )
+                    + c_val
+                )
+        return np.where((src_card == 0) | (tar_card == 0), 0.0, sims)
+
 
 if __name__ == '__main__':
     import doctest
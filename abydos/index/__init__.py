@@ -0,0 +1,68 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+r"""abydos.index.
+
+The index package implements indices of strings, which find the strings near
+a query string without comparing the query to each of them:
+
+- :py:class:`QGramIndex`, a q-gram inverted index, for Levenshtein &
+  Damerau-Levenshtein distance search
+- :py:class:`BKTree`, a Burkhard-Keller tree, for search by a metric with
+  integer distances
+- :py:class:`VPTree`, a vantage-point tree, for search by a metric with
+  real-valued distances
+- :py:class:`Trie`, a trie, which is walked with a
+  :py:class:`LevenshteinAutomaton` for Levenshtein & optimal string alignment
+  distance search
+
+The metric trees accept only measures known to be metrics: Levenshtein (in
+``lev`` mode), Indel, Damerau-Levenshtein, and Hamming distance. Besides
+searches for the strings within a distance of a query, they find the k
+strings nearest to it.
+
+
+As a quick example of :py:class:`.QGramIndex`:
+
+>>> index = QGramIndex(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'])
+>>> index.add('Neill')
+5
+>>> index.search('Nial', 1)
+[('Niall', 1), ('Neal', 1)]
+
+And of :py:class:`.BKTree`:
+
+>>> tree = BKTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils', 'Neill'])
+>>> tree.nearest('Nial', 3)
+[('Niall', 1), ('Neal', 1), ('Nigel', 2)]
+
+----
+
+"""
+
+from ._bk_tree import BKTree
+from ._levenshtein_automaton import LevenshteinAutomaton
+from ._qgram_index import QGramIndex
+from ._trie import Trie
+from ._vp_tree import VPTree
+
+__all__ = ['QGramIndex', 'BKTree', 'VPTree', 'Trie', 'LevenshteinAutomaton']
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,244 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._bk_tree.
+
+Burkhard-Keller tree, for search by an integer metric
+"""
+
+from heapq import heappop, heappush, heapreplace
+from math import inf
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._metric_tree import _MetricTree
+from ..distance._distance import _Distance
+
+__all__ = ['BKTree']
+
+
+class BKTree(_MetricTree):
+    """Burkhard-Keller tree.
+
+    A BK-tree :cite:`Burkhard:1973` holds a dictionary of strings under a
+    metric with integer distances. Each string added becomes a child of a
+    string already in the tree, found by descending from the root: at each
+    node, the new string follows the branch labelled with its distance to the
+    node's string, until there is no such branch.
+
+    Every string below the branch labelled k of a node is at distance k from
+    the node's string, so, by the triangle inequality, a string within d of a
+    query can only be found below branches labelled within d of the query's
+    distance to the node. Searches descend only those branches, comparing
+    the query to a small part of the tree, and the comparisons are bounded
+    (by dist_abs_bounded, where the metric has it) by the greatest distance
+    that can lead to a match.
+
+    Strings can be added at any time, and the tree can be saved to and
+    loaded from a file.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        strings: Optional[Iterable[str]] = None,
+        metric: Optional[_Distance] = None,
+    ) -> None:
+        """Initialize BKTree.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            Strings to add to the tree initially
+        metric : _Distance
+            The metric by which strings are compared (by default
+            :py:class:`abydos.distance.Levenshtein()`). It must be known to be
+            a metric, with integer distances: Levenshtein (in ``lev`` mode),
+            Indel, DamerauLevenshtein, or Hamming, with positive, symmetric,
+            integer costs.
+
+        Raises
+        ------
+        ValueError
+            The measure is not known to be a metric
+        ValueError
+            The metric's distances are not integers
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(BKTree, self).__init__(metric)
+        if not self._integral:
+            raise ValueError(
+                'The costs of the metric must be integers; use VPTree for '
+                + 'real-valued metrics.'
+            )
+        # The ID of the child of each node along the branch labelled with
+        # each distance
+        self._children = []  # type: List[Dict[int, int]]
+
+        if strings is not None:
+            self.update(strings)
+
+    def _insert(self, string: str, string_id: int) -> None:
+        """Place a new string in the tree.
+
+        The string becomes a child of the first string, found by descending
+        from the root, with no branch labelled with its distance to it.
+
+        Parameters
+        ----------
+        string : str
+            The string added
+        string_id : int
+            The ID it will be given
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if string_id:
+            node = 0
+            while True:
+                dist = int(self._metric.dist_abs(string, self._strings[node]))
+                child = self._children[node].get(dist)
+                if child is None:
+                    self._children[node][dist] = string_id
+                    break
+                node = child
+        self._children.append({})
+
+    def search(
+        self, query: str, max_distance: float
+    ) -> List[Tuple[str, float]]:
+        """Return the strings within a distance of a query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        max_distance : int or float
+            The greatest distance of the strings to return
+
+        Returns
+        -------
+        list of tuples of str & float
+            Each string within max_distance of the query, and its distance,
+            in increasing order of distance (and, for strings at the same
+            distance, in the order in which they were added)
+
+        Examples
+        --------
+        >>> tree = BKTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'])
+        >>> tree.search('Neill', 1)
+        [('Neil', 1)]
+        >>> tree.search('Neill', 2)
+        [('Neil', 1), ('Niall', 2), ('Neal', 2), ('Nils', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if max_distance < 0 or not self._strings:
+            return []
+        found = []  # type: List[Tuple[float, int]]
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            children = self._children[node]
+            # Beyond max_distance plus the longest branch, neither the node
+            # nor any branch can match, so the exact distance is not needed
+            reach = max(children) if children else 0
+            dist = self._distance(query, node, max_distance + reach)
+            if dist <= max_distance:
+                found.append((dist, node))
+            for label, child in children.items():
+                if abs(dist - label) <= max_distance:
+                    stack.append(child)
+        found.sort()
+        return [(self._strings[node], dist) for dist, node in found]
+
+    def nearest(self, query: str, k: int = 1) -> List[Tuple[str, float]]:
+        """Return the k strings nearest to a query.
+
+        The branches are searched best-first, by the least distance to the
+        query of any string below them, and the search stops once no branch
+        can hold a string nearer than the kth nearest found, so strings
+        only as near as the kth are not sought.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        k : int
+            The number of strings to return
+
+        Returns
+        -------
+        list of tuples of str & float
+            The k strings nearest the query (or every string, if there are
+            fewer than k), and their distances, in increasing order of
+            distance (and, for strings at the same distance, in the order in
+            which they were added). Of several strings as near as the kth,
+            those returned depend on the shape of the tree.
+
+        Examples
+        --------
+        >>> tree = BKTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'])
+        >>> tree.nearest('Neill')
+        [('Neil', 1)]
+        >>> tree.nearest('Neill', 3)
+        [('Neil', 1), ('Niall', 2), ('Neal', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if k < 1 or not self._strings:
+            return []
+        # The k nearest strings found, as a max-heap of their negated
+        # distances & IDs, and a min-heap of the branches to search, by a
+        # lower bound of the distance of their strings to the query
+        best = []  # type: List[Tuple[float, int]]
+        branches = [(0.0, 0)]  # type: List[Tuple[float, int]]
+        radius = inf
+        while branches:
+            bound, node = heappop(branches)
+            if bound >= radius:
+                break
+            children = self._children[node]
+            reach = max(children) if children else 0
+            dist = self._distance(query, node, radius + reach)
+            if len(best) < k:
+                heappush(best, (-dist, -node))
+            elif dist < -best[0][0]:
+                heapreplace(best, (-dist, -node))
+            if len(best) == k:
+                radius = -best[0][0]
+            for label, child in children.items():
+                lower = max(bound, abs(dist - label))
+                if lower < radius:
+                    heappush(branches, (lower, child))
+        return [
+            (self._strings[-node], -dist) for dist, node in sorted(best)[::-1]
+        ]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,214 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._index.
+
+The _Index class, the base of the string indices
+"""
+
+import pickle  # noqa: S403
+from typing import Dict, Iterable, List, Tuple
+
+__all__ = ['_Index']
+
+
+class _Index:
+    """Abstract string index.
+
+    An index holds a dictionary of strings, each with an ID in the order in
+    which strings were added, and finds the strings near a query string.
+    Subclasses record each new string in their own structure by _insert.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self) -> None:
+        """Initialize _Index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        # The strings and their IDs, by ID
+        self._strings = []  # type: List[str]
+        self._ids = {}  # type: Dict[str, int]
+
+    def __len__(self) -> int:
+        """Return the number of strings in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._strings)
+
+    def __contains__(self, string: str) -> bool:
+        """Return whether a string is in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return string in self._ids
+
+    def add(self, string: str) -> int:
+        """Add a string to the index.
+
+        Parameters
+        ----------
+        string : str
+            The string to add
+
+        Returns
+        -------
+        int
+            The ID of the string, in the order in which strings were added. A
+            string already in the index keeps its ID.
+
+        Examples
+        --------
+        >>> from abydos.index import QGramIndex
+        >>> index = QGramIndex()
+        >>> index.add('Niall')
+        0
+        >>> index.add('Neil')
+        1
+        >>> index.add('Niall')
+        0
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if string in self._ids:
+            return self._ids[string]
+        string_id = len(self._strings)
+        self._insert(string, string_id)
+        self._strings.append(string)
+        self._ids[string] = string_id
+        return string_id
+
+    def update(self, strings: Iterable[str]) -> None:
+        """Add several strings to the index.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings to add
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for string in strings:
+            self.add(string)
+
+    def search(
+        self, query: str, max_distance: float
+    ) -> List[Tuple[str, float]]:
+        """Return the strings within a distance of a query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        max_distance : int or float
+            The greatest distance of the strings to return
+
+        Returns
+        -------
+        list of tuples of str & float
+            Each string within max_distance of the query, and its distance,
+            in increasing order of distance (and, for strings at the same
+            distance, in the order in which they were added)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        raise NotImplementedError
+
+    def save(self, filename: str) -> None:
+        """Save the index to a file.
+
+        This employs pickle to save the index, including its metric.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the index to
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, mode='wb') as pkl:
+            pickle.dump(self, pkl, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, filename: str) -> '_Index':
+        """Load an index from a file.
+
+        This employs pickle to load the index, so only files from trusted
+        sources should be loaded.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to load the index from
+
+        Returns
+        -------
+        _Index
+            The index saved to the file, of the class load is called on
+
+        Raises
+        ------
+        TypeError
+            The file does not hold an index of this class
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, mode='rb') as pkl:
+            index = pickle.load(pkl)  # noqa: S301
+        if not isinstance(index, cls):
+            raise TypeError(
+                '{} does not hold a {}.'.format(filename, cls.__name__)
+            )
+        return index
+
+    def _insert(self, string: str, string_id: int) -> None:
+        """Record a new string in the structure of the index.
+
+        This is called by add before the string is given its ID.
+
+        Parameters
+        ----------
+        string : str
+            The string added
+        string_id : int
+            The ID it will be given
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        raise NotImplementedError
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
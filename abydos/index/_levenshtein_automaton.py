@@ -0,0 +1,280 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._levenshtein_automaton.
+
+Levenshtein automaton, for matching strings within an edit distance
+"""
+
+from typing import List, Optional, Tuple
+
+from ..distance import Levenshtein
+
+__all__ = ['LevenshteinAutomaton']
+
+# A state of the automaton: the column of the alignment matrix for the
+# characters read, the column before it (in osa mode), and the last
+# character read
+_State = Tuple[List[float], Optional[List[float]], str]
+
+
+class LevenshteinAutomaton:
+    """Levenshtein automaton.
+
+    A Levenshtein automaton of degree k :cite:`Schulz:2002` accepts the
+    strings within edit distance k of a query string. It reads a candidate
+    string a character at a time, and after each character it can tell
+    whether the characters read so far are within k of the query, and
+    whether any string beginning with them can be. So it can be walked over
+    the branches of a dictionary (such as a :py:class:`Trie`), abandoning
+    each branch as soon as no word below it can match.
+
+    The automaton is simulated, rather than compiled: each state is the
+    column of the Levenshtein alignment matrix for the characters read (and,
+    in ``osa`` mode, the column before it), so its distances are those of
+    the metric's dist_abs method, for any costs.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        query: str,
+        max_distance: float,
+        metric: Optional[Levenshtein] = None,
+    ) -> None:
+        """Initialize LevenshteinAutomaton.
+
+        Parameters
+        ----------
+        query : str
+            The string to match
+        max_distance : int or float
+            The degree of the automaton: the greatest distance of the strings
+            it accepts
+        metric : Levenshtein
+            The edit distance by which strings are compared (by default
+            :py:class:`abydos.distance.Levenshtein()`), in ``lev`` or ``osa``
+            mode, without tapering, and with non-negative costs. Distances
+            are those from the query to the strings read.
+
+        Raises
+        ------
+        ValueError
+            The metric is not supported
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if metric is None:
+            metric = Levenshtein()
+        if (
+            not isinstance(metric, Levenshtein)
+            or type(metric).dist_abs is not Levenshtein.dist_abs
+            or metric._mode not in {'lev', 'osa'}  # noqa: SF01
+            or metric._taper_enabled  # noqa: SF01
+        ):
+            raise ValueError(
+                'The metric must be Levenshtein, in lev or osa mode, without '
+                + 'tapering.'
+            )
+        if min(metric._cost) < 0:  # noqa: SF01
+            raise ValueError('The costs of the metric must be non-negative.')
+
+        self.query = query
+        self.max_distance = max_distance
+        self._transpositions = metric._mode == 'osa'  # noqa: SF01
+        (
+            self._ins_cost,
+            self._del_cost,
+            self._sub_cost,
+            self._trans_cost,
+        ) = metric._cost  # noqa: SF01
+
+    def start(self) -> _State:
+        """Return the initial state, before any characters are read.
+
+        Returns
+        -------
+        tuple
+            The initial state
+
+        Examples
+        --------
+        >>> lev = LevenshteinAutomaton('Niall', 2)
+        >>> lev.distance(lev.start())
+        5
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            [i * self._del_cost for i in range(len(self.query) + 1)],
+            None,
+            '',
+        )
+
+    def step(self, state: _State, char: str) -> _State:
+        """Return the state after reading a character.
+
+        Parameters
+        ----------
+        state : tuple
+            The state before reading the character
+        char : str
+            The character read
+
+        Returns
+        -------
+        tuple
+            The state after reading the character
+
+        Examples
+        --------
+        >>> lev = LevenshteinAutomaton('Niall', 2)
+        >>> state = lev.start()
+        >>> for char in 'Neil':
+        ...     state = lev.step(state, char)
+        >>> lev.distance(state)
+        3
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        column, previous, last = state
+        query = self.query
+        new = [column[0] + self._ins_cost]
+        for i, query_char in enumerate(query):
+            dist = min(
+                column[i + 1] + self._ins_cost,
+                new[i] + self._del_cost,
+                column[i] + (self._sub_cost if query_char != char else 0),
+            )
+            if (
+                previous is not None
+                and i
+                and query_char == last
+                and query[i - 1] == char
+            ):
+                dist = min(dist, previous[i - 1] + self._trans_cost)
+            new.append(dist)
+        return new, column if self._transpositions else None, char
+
+    def is_match(self, state: _State) -> bool:
+        """Return whether the characters read are within the degree.
+
+        Parameters
+        ----------
+        state : tuple
+            A state of the automaton
+
+        Returns
+        -------
+        bool
+            True if the distance of the query to the characters read is at
+            most max_distance
+
+        Examples
+        --------
+        >>> lev = LevenshteinAutomaton('Niall', 1)
+        >>> state = lev.start()
+        >>> for char in 'Nial':
+        ...     state = lev.step(state, char)
+        >>> lev.is_match(state)
+        True
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return state[0][-1] <= self.max_distance
+
+    def can_match(self, state: _State) -> bool:
+        """Return whether any string beginning with those read can match.
+
+        Parameters
+        ----------
+        state : tuple
+            A state of the automaton
+
+        Returns
+        -------
+        bool
+            False if no string beginning with the characters read is within
+            max_distance of the query
+
+        Examples
+        --------
+        >>> lev = LevenshteinAutomaton('Niall', 1)
+        >>> state = lev.start()
+        >>> for char in 'Ne':
+        ...     state = lev.step(state, char)
+        >>> lev.can_match(state)
+        True
+        >>> lev.can_match(lev.step(state, 'e'))
+        False
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        column, previous, _ = state
+        # Every alignment passes through the current column, except that a
+        # transposition may pass over it from the previous one
+        return min(column) <= self.max_distance or (
+            previous is not None
+            and min(previous) + self._trans_cost <= self.max_distance
+        )
+
+    def distance(self, state: _State) -> float:
+        """Return the distance of the query to the characters read.
+
+        Parameters
+        ----------
+        state : tuple
+            A state of the automaton
+
+        Returns
+        -------
+        int or float
+            The edit distance of the query to the characters read
+
+        Examples
+        --------
+        >>> lev = LevenshteinAutomaton('Niall', 1, Levenshtein(mode='osa'))
+        >>> state = lev.start()
+        >>> for char in 'Nilal':
+        ...     state = lev.step(state, char)
+        >>> lev.distance(state)
+        1
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        dist = state[0][-1]
+        if int(dist) == dist:
+            return int(dist)
+        return dist
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
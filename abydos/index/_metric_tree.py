@@ -0,0 +1,184 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._metric_tree.
+
+The _MetricTree class, the base of the metric tree indices
+"""
+
+from math import inf
+from typing import List, Optional, Tuple
+
+from ._index import _Index
+from ..distance import DamerauLevenshtein, Hamming, Levenshtein
+from ..distance._distance import _Distance
+
+__all__ = ['_MetricTree']
+
+
+def _metric_costs(metric: _Distance) -> Tuple[float, ...]:
+    """Return the edit costs of a metric, if it is known to be a metric.
+
+    A metric tree prunes its search by the triangle inequality, so its
+    distance must be a true metric: non-negative, zero only between identical
+    strings, symmetric, and satisfying the triangle inequality. The measures
+    known to be metrics, by their dist_abs methods, are:
+
+        - :py:class:`abydos.distance.Levenshtein` (and so
+          :py:class:`abydos.distance.Indel`) in ``lev`` mode, untapered, with
+          positive costs and equal insert & delete costs. The ``osa`` mode
+          does not satisfy the triangle inequality.
+        - :py:class:`abydos.distance.DamerauLevenshtein`, with positive
+          costs, equal insert & delete costs, and a transposition cost at
+          least half the sum of the insert & delete costs
+        - :py:class:`abydos.distance.Hamming`
+
+    Subclasses that redefine dist_abs are not known to be metrics.
+
+    Parameters
+    ----------
+    metric : _Distance
+        The measure to check
+
+    Returns
+    -------
+    tuple of floats
+        The costs of the edits by which the metric's distances are summed
+
+    Raises
+    ------
+    ValueError
+        The measure is not known to be a metric
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    costs = None  # type: Optional[Tuple[float, ...]]
+    if (
+        isinstance(metric, Levenshtein)
+        and type(metric).dist_abs is Levenshtein.dist_abs
+    ):
+        if metric._mode == 'lev' and not metric._taper_enabled:  # noqa: SF01
+            costs = tuple(metric._cost[:3])  # noqa: SF01
+    elif (
+        isinstance(metric, DamerauLevenshtein)
+        and type(metric).dist_abs is DamerauLevenshtein.dist_abs
+    ):
+        costs = tuple(metric._cost)  # noqa: SF01
+        if 2 * costs[3] < costs[0] + costs[1]:
+            costs = None
+    elif (
+        isinstance(metric, Hamming)
+        and type(metric).dist_abs is Hamming.dist_abs
+    ):
+        costs = (1, 1)
+
+    if costs is None or costs[0] != costs[1] or min(costs) <= 0:
+        raise ValueError(
+            '{} is not known to be a metric; supported metrics are '.format(
+                type(metric).__name__
+            )
+            + 'Levenshtein (in lev mode), Indel, DamerauLevenshtein, and '
+            + 'Hamming, with positive, symmetric costs.'
+        )
+    return costs
+
+
+class _MetricTree(_Index):
+    """Abstract metric tree.
+
+    A metric tree holds a dictionary of strings, organized by their distances
+    under a metric so that the triangle inequality can exclude most of them
+    from a search, without comparing them to the query.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, metric: Optional[_Distance] = None) -> None:
+        """Initialize _MetricTree.
+
+        Parameters
+        ----------
+        metric : _Distance
+            The metric by which strings are compared (by default
+            :py:class:`abydos.distance.Levenshtein()`)
+
+        Raises
+        ------
+        ValueError
+            The measure is not known to be a metric
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if metric is None:
+            metric = Levenshtein()
+        costs = _metric_costs(metric)
+
+        super(_MetricTree, self).__init__()
+        self._metric = metric
+        # Whether each distance is an integer
+        self._integral = all(
+            cost == inf or float(cost).is_integer() for cost in costs
+        )
+
+    def nearest(self, query: str, k: int = 1) -> List[Tuple[str, float]]:
+        """Return the k strings nearest to a query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        k : int
+            The number of strings to return
+
+        Returns
+        -------
+        list of tuples of str & float
+            The k strings nearest the query (or every string, if there are
+            fewer than k), and their distances, in increasing order of
+            distance (and, for strings at the same distance, in the order in
+            which they were added). Of several strings as near as the kth,
+            those returned depend on the shape of the tree.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        raise NotImplementedError
+
+    def _distance(self, query: str, string_id: int, bound: float) -> float:
+        """Return the distance of the query to a string, up to a bound.
+
+        If the distance exceeds bound, some greater value may be returned
+        instead.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if bound < inf and hasattr(self._metric, 'dist_abs_bounded'):
+            return self._metric.dist_abs_bounded(  # type: ignore
+                query, self._strings[string_id], bound
+            )
+        return self._metric.dist_abs(query, self._strings[string_id])
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
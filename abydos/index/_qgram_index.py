@@ -0,0 +1,260 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._qgram_index.
+
+Q-gram inverted index, for edit distance search
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ._index import _Index
+from ..distance import DamerauLevenshtein, Levenshtein
+from ..tokenizer import QGrams
+
+__all__ = ['QGramIndex']
+
+
+class QGramIndex(_Index):
+    """Q-gram inverted index.
+
+    A q-gram index holds a dictionary of strings, and finds those within an
+    edit distance of a query string without comparing the query to each of
+    them :cite:`Ukkonen:1992,Gravano:2001`. Each string's q-grams (with
+    start & stop symbols, from :py:class:`abydos.tokenizer.QGrams`) are
+    recorded, with their positions, in an inverted index.
+
+    A string within k edits of the query shares most of its q-grams with it,
+    since each edit changes at most q of them (or q+1, for a transposition).
+    So, for each candidate length within k of the query's length (the length
+    filter), only strings sharing enough q-grams (the count filter), at
+    positions within k of the query's (the position filter), are candidates.
+    The candidates are verified by the metric's bounded edit distance, which
+    stops as soon as the distance is certain to exceed k.
+
+    Strings can be added at any time, and the index can be saved to and
+    loaded from a file.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        strings: Optional[Iterable[str]] = None,
+        qval: int = 2,
+        metric: Optional[Union[Levenshtein, DamerauLevenshtein]] = None,
+    ) -> None:
+        """Initialize QGramIndex.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            Strings to add to the index initially
+        qval : int
+            The length of each q-gram
+        metric : Levenshtein or DamerauLevenshtein
+            The edit distance by which strings are compared (by default
+            :py:class:`abydos.distance.Levenshtein()`). Its costs must each
+            be at least 1, so that a distance of k entails at most k edits.
+            Subclasses that redefine dist_abs (e.g.
+            :py:class:`abydos.distance.BlockLevenshtein`) are not supported.
+
+        Raises
+        ------
+        ValueError
+            qval must be a positive integer
+        ValueError
+            The metric is not supported
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(qval, int) or qval < 1:
+            raise ValueError('qval must be a positive integer.')
+        if metric is None:
+            metric = Levenshtein()
+        # Subclasses that redefine dist_abs may not count their edits
+        if (
+            isinstance(metric, DamerauLevenshtein)
+            and type(metric).dist_abs is DamerauLevenshtein.dist_abs
+        ):
+            transpositions = True
+            costs = metric._cost  # noqa: SF01
+        elif (
+            isinstance(metric, Levenshtein)
+            and type(metric).dist_abs is Levenshtein.dist_abs
+        ):
+            transpositions = metric._mode == 'osa'  # noqa: SF01
+            costs = metric._cost[: 4 if transpositions else 3]  # noqa: SF01
+        else:
+            raise ValueError(
+                'The metric must be Levenshtein (or Indel) or '
+                + 'DamerauLevenshtein, without a redefined dist_abs.'
+            )
+        if min(costs) < 1:
+            raise ValueError('The costs of the metric must be at least 1.')
+
+        super(QGramIndex, self).__init__()
+        self._qval = qval
+        self._metric = metric
+        # The most q-grams changed by a single edit
+        self._grams_per_edit = qval + 1 if transpositions else qval
+        self._tokenizer = QGrams(qval=qval, start_stop='$#', skip=0)
+
+        # The lengths of the strings, by ID
+        self._lengths = array('i')
+        # The IDs of the strings of each length
+        self._by_length = {}  # type: Dict[int, array]
+        # The IDs of the strings containing each q-gram, and the q-gram's
+        # position in each
+        self._postings = {}  # type: Dict[str, Tuple[array, array]]
+
+        if strings is not None:
+            self.update(strings)
+
+    def _insert(self, string: str, string_id: int) -> None:
+        """Record the length & q-grams of a new string.
+
+        Parameters
+        ----------
+        string : str
+            The string added
+        string_id : int
+            The ID it will be given
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._lengths.append(len(string))
+        self._by_length.setdefault(len(string), array('i')).append(string_id)
+        for pos, gram in enumerate(self._grams(string)):
+            if gram not in self._postings:
+                self._postings[gram] = array('i'), array('i')
+            ids, positions = self._postings[gram]
+            ids.append(string_id)
+            positions.append(pos)
+
+    def search(
+        self, query: str, max_distance: float
+    ) -> List[Tuple[str, float]]:
+        """Return the strings within an edit distance of a query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        max_distance : int or float
+            The greatest edit distance of the strings to return
+
+        Returns
+        -------
+        list of tuples of str & float
+            Each string within max_distance of the query, and its distance,
+            in increasing order of distance (and, for strings at the same
+            distance, in the order in which they were added)
+
+        Examples
+        --------
+        >>> index = QGramIndex(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'])
+        >>> index.search('Neill', 1)
+        [('Neil', 1)]
+        >>> index.search('Neill', 2)
+        [('Neil', 1), ('Niall', 2), ('Neal', 2), ('Nils', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if max_distance < 0 or not self._strings:
+            return []
+        # Each edit costs at least 1, so at most max_distance edits separate
+        # the query from any string returned
+        edits = int(max_distance)
+        query_len = len(query)
+        query_grams = self._grams(query)
+        lengths = np.frombuffer(self._lengths, dtype=np.int32)
+
+        # Count, for each string of a similar length, the query's q-grams
+        # that it shares at a similar position
+        shared = []  # type: List[np.ndarray]
+        for pos, gram in enumerate(query_grams):
+            postings = self._postings.get(gram)
+            if postings is None:
+                continue
+            ids = np.frombuffer(postings[0], dtype=np.int32)
+            positions = np.frombuffer(postings[1], dtype=np.int32)
+            near = (np.abs(positions - pos) <= edits) & (
+                np.abs(lengths[ids] - query_len) <= edits
+            )
+            # Count each of the query's q-grams once per string
+            shared.append(np.unique(ids[near]))
+        if shared:
+            candidates, counts = np.unique(
+                np.concatenate(shared), return_counts=True
+            )
+        else:
+            candidates = counts = np.zeros(0, dtype=np.int32)
+
+        # The least number of q-grams a string within max_distance shares
+        # with the query, by the number of its q-grams
+        cand_lengths = lengths[candidates]
+        cand_grams = np.where(
+            cand_lengths > 0, cand_lengths + self._qval - 1, 0
+        )
+        least_shared = (
+            np.maximum(cand_grams, len(query_grams))
+            - edits * self._grams_per_edit
+        )
+        candidate_ids = candidates[counts >= least_shared].tolist()
+
+        # Strings so short that they need share no q-grams are candidates
+        # without counting
+        for length in range(max(query_len - edits, 0), query_len + edits + 1):
+            grams = length + self._qval - 1 if length else 0
+            if (
+                length in self._by_length
+                and max(grams, len(query_grams)) - edits * self._grams_per_edit
+                <= 0
+            ):
+                candidate_ids.extend(self._by_length[length])
+
+        found = []  # type: List[Tuple[float, int]]
+        bounded = self._metric.dist_abs_bounded
+        for string_id in sorted(set(candidate_ids)):
+            distance = bounded(query, self._strings[string_id], max_distance)
+            if distance <= max_distance:
+                found.append((distance, string_id))
+        found.sort()
+        return [(self._strings[string_id], dist) for dist, string_id in found]
+
+    def _grams(self, string: str) -> List[str]:
+        """Return the q-grams of a string, in order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return list(self._tokenizer.tokenize(string).get_list())
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,203 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._trie.
+
+Trie, for edit distance search by a Levenshtein automaton
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ._index import _Index
+from ._levenshtein_automaton import LevenshteinAutomaton
+from ..distance import Levenshtein
+
+__all__ = ['Trie']
+
+
+class Trie(_Index):
+    """Trie.
+
+    A trie holds a dictionary of strings as a tree of characters, in which
+    the strings sharing a prefix share the branch that spells it. Walking the
+    trie together with a :py:class:`LevenshteinAutomaton`
+    :cite:`Schulz:2002`, which is advanced by each character of a branch,
+    finds the strings within an edit distance of a query without comparing
+    the query to each of them: a branch is abandoned as soon as the automaton
+    finds that no string beginning with its prefix can match, and each prefix
+    is read only once, however many strings share it.
+
+    Strings can be added at any time, and the trie can be saved to and
+    loaded from a file.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        strings: Optional[Iterable[str]] = None,
+        metric: Optional[Levenshtein] = None,
+    ) -> None:
+        """Initialize Trie.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            Strings to add to the trie initially
+        metric : Levenshtein
+            The edit distance by which strings are compared (by default
+            :py:class:`abydos.distance.Levenshtein()`), in ``lev`` or ``osa``
+            mode, without tapering, and with non-negative costs
+
+        Raises
+        ------
+        ValueError
+            The metric is not supported
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if metric is None:
+            metric = Levenshtein()
+        # Check the metric, by building an automaton of it
+        LevenshteinAutomaton('', 0, metric)
+
+        super(Trie, self).__init__()
+        self._metric = metric
+        # The child of each node by each character, and the ID of the string
+        # that ends at each node (or -1); node 0 is the root
+        self._children = [{}]  # type: List[Dict[str, int]]
+        self._ends = array('i', [-1])
+
+        if strings is not None:
+            self.update(strings)
+
+    def _insert(self, string: str, string_id: int) -> None:
+        """Spell a new string along a branch of the trie.
+
+        Parameters
+        ----------
+        string : str
+            The string added
+        string_id : int
+            The ID it will be given
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        node = 0
+        for char in string:
+            child = self._children[node].get(char)
+            if child is None:
+                child = len(self._children)
+                self._children[node][char] = child
+                self._children.append({})
+                self._ends.append(-1)
+            node = child
+        self._ends[node] = string_id
+
+    def walk(
+        self, automaton: LevenshteinAutomaton
+    ) -> Iterator[Tuple[str, float]]:
+        """Yield the strings accepted by a Levenshtein automaton.
+
+        Parameters
+        ----------
+        automaton : LevenshteinAutomaton
+            The automaton to walk the trie with
+
+        Yields
+        ------
+        tuple of str & float
+            Each string of the trie that the automaton accepts, and its
+            distance from the automaton's query, in the order of a
+            depth-first walk of the trie
+
+        Examples
+        --------
+        >>> trie = Trie(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'])
+        >>> sorted(trie.walk(LevenshteinAutomaton('Neill', 2)))
+        [('Neal', 2), ('Neil', 1), ('Niall', 2), ('Nils', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        stack = [(0, automaton.start())]
+        while stack:
+            node, state = stack.pop()
+            string_id = self._ends[node]
+            if string_id >= 0 and automaton.is_match(state):
+                yield self._strings[string_id], automaton.distance(state)
+            for char, child in self._children[node].items():
+                child_state = automaton.step(state, char)
+                if automaton.can_match(child_state):
+                    stack.append((child, child_state))
+
+    def search(
+        self, query: str, max_distance: float
+    ) -> List[Tuple[str, float]]:
+        """Return the strings within an edit distance of a query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        max_distance : int or float
+            The greatest edit distance of the strings to return
+
+        Returns
+        -------
+        list of tuples of str & float
+            Each string within max_distance of the query, and its distance,
+            in increasing order of distance (and, for strings at the same
+            distance, in the order in which they were added)
+
+        Examples
+        --------
+        >>> trie = Trie(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'])
+        >>> trie.search('Neill', 1)
+        [('Neil', 1)]
+        >>> trie.search('Neill', 2)
+        [('Neil', 1), ('Niall', 2), ('Neal', 2), ('Nils', 2)]
+
+        >>> from abydos.distance import Levenshtein
+        >>> trie = Trie(['Niall', 'Nials', 'Nilas'], Levenshtein(mode='osa'))
+        >>> trie.search('Nilal', 1)
+        [('Niall', 1), ('Nilas', 1)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if max_distance < 0:
+            return []
+        found = sorted(
+            (dist, self._ids[string])
+            for string, dist in self.walk(
+                LevenshteinAutomaton(query, max_distance, self._metric)
+            )
+        )
+        return [(self._strings[string_id], dist) for dist, string_id in found]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
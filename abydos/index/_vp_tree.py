@@ -0,0 +1,308 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._vp_tree.
+
+Vantage-point tree, for search by a real-valued metric
+"""
+
+from array import array
+from heapq import heappop, heappush, heapreplace
+from math import inf
+from random import Random
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ._metric_tree import _MetricTree
+from ..distance._distance import _Distance
+
+__all__ = ['VPTree']
+
+
+class VPTree(_MetricTree):
+    """Vantage-point tree.
+
+    A VP-tree :cite:`Yianilos:1993` holds a dictionary of strings under a
+    metric, which may have real-valued distances. Each node of the tree has a
+    vantage point, one of its strings chosen at random, and divides the rest
+    by their distance to it: the nearer half below its inner branch, within
+    the node's radius of the vantage point, and the farther half below its
+    outer branch, at least the radius from it.
+
+    By the triangle inequality, a string within d of a query can only be
+    below the inner branch if the query is within the radius plus d of the
+    vantage point, and only below the outer branch if the query is at least
+    the radius minus d from it. Searches descend only those branches,
+    comparing the query to about a logarithmic number of the strings for
+    small d, and the comparisons are bounded (by dist_abs_bounded, where the
+    metric has it) by the greatest distance that can lead to a match.
+
+    The tree is balanced, and is built when it is first searched, with the
+    distances of each vantage point to the strings below it computed by the
+    metric's dist_abs_many method. Strings added after that are held until
+    the next search, which rebuilds the tree. The tree can be saved to and
+    loaded from a file.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        strings: Optional[Iterable[str]] = None,
+        metric: Optional[_Distance] = None,
+    ) -> None:
+        """Initialize VPTree.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            Strings to add to the tree initially
+        metric : _Distance
+            The metric by which strings are compared (by default
+            :py:class:`abydos.distance.Levenshtein()`). It must be known to be
+            a metric: Levenshtein (in ``lev`` mode), Indel,
+            DamerauLevenshtein, or Hamming, with positive, symmetric costs.
+
+        Raises
+        ------
+        ValueError
+            The measure is not known to be a metric
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        super(VPTree, self).__init__(metric)
+        # The vantage point (a string ID) & radius of each node, and the node
+        # below its inner & outer branches (or -1, if there is none); node 0
+        # is the root
+        self._vantages = array('i')
+        self._radii = array('d')
+        self._inner = array('i')
+        self._outer = array('i')
+
+        if strings is not None:
+            self.update(strings)
+
+    def _insert(self, string: str, string_id: int) -> None:
+        """Hold a new string until the tree is next built, at the next search.
+
+        Parameters
+        ----------
+        string : str
+            The string added
+        string_id : int
+            The ID it will be given
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+    def search(
+        self, query: str, max_distance: float
+    ) -> List[Tuple[str, float]]:
+        """Return the strings within a distance of a query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        max_distance : int or float
+            The greatest distance of the strings to return
+
+        Returns
+        -------
+        list of tuples of str & float
+            Each string within max_distance of the query, and its distance,
+            in increasing order of distance (and, for strings at the same
+            distance, in the order in which they were added)
+
+        Examples
+        --------
+        >>> tree = VPTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'])
+        >>> tree.search('Neill', 1)
+        [('Neil', 1)]
+        >>> tree.search('Neill', 2)
+        [('Neil', 1), ('Niall', 2), ('Neal', 2), ('Nils', 2)]
+
+        >>> from abydos.distance import Levenshtein
+        >>> tree = VPTree(
+        ...     ['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'],
+        ...     metric=Levenshtein(cost=(1, 1, 1.5, 1))
+        ... )
+        >>> tree.search('Neill', 2.5)
+        [('Neil', 1), ('Niall', 2), ('Neal', 2.5), ('Nils', 2.5)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if max_distance < 0 or not self._strings:
+            return []
+        self._build()
+        found = []  # type: List[Tuple[float, int]]
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            vantage = self._vantages[node]
+            radius = self._radii[node]
+            # Beyond the radius plus max_distance, neither the vantage point
+            # nor the inner branch can match, and the outer branch must be
+            # searched, so the exact distance is not needed
+            dist = self._distance(query, vantage, radius + max_distance)
+            if dist <= max_distance:
+                found.append((dist, vantage))
+            if self._inner[node] >= 0 and dist - max_distance <= radius:
+                stack.append(self._inner[node])
+            if self._outer[node] >= 0 and dist + max_distance >= radius:
+                stack.append(self._outer[node])
+        found.sort()
+        return [(self._strings[string_id], dist) for dist, string_id in found]
+
+    def nearest(self, query: str, k: int = 1) -> List[Tuple[str, float]]:
+        """Return the k strings nearest to a query.
+
+        The branches are searched best-first, by the least distance to the
+        query of any string below them, and the search stops once no branch
+        can hold a string nearer than the kth nearest found, so strings
+        only as near as the kth are not sought.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for
+        k : int
+            The number of strings to return
+
+        Returns
+        -------
+        list of tuples of str & float
+            The k strings nearest the query (or every string, if there are
+            fewer than k), and their distances, in increasing order of
+            distance (and, for strings at the same distance, in the order in
+            which they were added). Of several strings as near as the kth,
+            those returned depend on the shape of the tree.
+
+        Examples
+        --------
+        >>> tree = VPTree(['Niall', 'Neil', 'Nigel', 'Neal', 'Nils'])
+        >>> tree.nearest('Neill')
+        [('Neil', 1)]
+        >>> tree.nearest('Neill', 3)
+        [('Neil', 1), ('Niall', 2), ('Nils', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if k < 1 or not self._strings:
+            return []
+        self._build()
+        # The k nearest strings found, as a max-heap of their negated
+        # distances & IDs, and a min-heap of the nodes to search, by a lower
+        # bound of the distance of their strings to the query
+        best = []  # type: List[Tuple[float, int]]
+        nodes = [(0.0, 0)]  # type: List[Tuple[float, int]]
+        limit = inf
+        while nodes:
+            bound, node = heappop(nodes)
+            if bound >= limit:
+                break
+            vantage = self._vantages[node]
+            radius = self._radii[node]
+            dist = self._distance(query, vantage, radius + limit)
+            if len(best) < k:
+                heappush(best, (-dist, -vantage))
+            elif dist < -best[0][0]:
+                heapreplace(best, (-dist, -vantage))
+            if len(best) == k:
+                limit = -best[0][0]
+            for child, lower in (
+                (self._inner[node], dist - radius),
+                (self._outer[node], radius - dist),
+            ):
+                lower = max(bound, lower)
+                if child >= 0 and lower < limit:
+                    heappush(nodes, (lower, child))
+        return [
+            (self._strings[-string_id], -dist)
+            for dist, string_id in sorted(best)[::-1]
+        ]
+
+    def _build(self) -> None:
+        """Build the tree, if strings have been added since it was built.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if len(self._vantages) == len(self._strings):
+            return
+        self._vantages = array('i')
+        self._radii = array('d')
+        self._inner = array('i')
+        self._outer = array('i')
+
+        # The vantage points are chosen at random, but the same tree is built
+        # from the same strings
+        rng = Random(len(self._strings))
+        # The strings of each node to build, its parent, and the branch of
+        # the parent that leads to it
+        pending = [
+            (list(range(len(self._strings))), -1, self._inner)
+        ]  # type: List[Tuple[List[int], int, array]]
+        while pending:
+            ids, parent, branch = pending.pop()
+            node = len(self._vantages)
+            if parent >= 0:
+                branch[parent] = node
+
+            pick = rng.randrange(len(ids))
+            ids[pick], ids[-1] = ids[-1], ids[pick]
+            vantage = ids.pop()
+            radius = 0.0
+            if ids:
+                dists = np.asarray(
+                    self._metric.dist_abs_many(
+                        self._strings[vantage],
+                        [self._strings[string_id] for string_id in ids],
+                    ),
+                    dtype=np.float_,
+                )
+                order = np.argsort(dists, kind='stable')
+                # The inner half, within the radius, is the larger, if the
+                # strings are odd in number
+                half = (len(ids) + 1) // 2
+                radius = float(dists[order[half - 1]])
+                if half < len(ids):
+                    pending.append(
+                        ([ids[i] for i in order[half:]], node, self._outer)
+                    )
+                pending.append(
+                    ([ids[i] for i in order[:half]], node, self._inner)
+                )
+
+            self._vantages.append(vantage)
+            self._radii.append(radius)
+            self._inner.append(-1)
+            self._outer.append(-1)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -60,7 +60,7 @@ Some examples of the basic functions:
 
 
 
-Two pairwise functions are provided:
+Four pairwise functions are provided:
 
     - mean pairwise similarity (:py:func:`.mean_pairwise_similarity`), which
       returns the mean similarity (using a supplied similarity function) among
@@ -69,6 +69,23 @@ Two pairwise functions are provided:
       (:py:func:`.pairwise_similarity_statistics`), which returns the max, min,
       mean, and standard deviation of pairwise similarities between two
       collections
+    - pairwise matrix (:py:func:`.pairwise_matrix`), which returns the square
+      matrix (or condensed upper triangle) of values among each item in a
+      collection
+    - cross matrix (:py:func:`.cross_matrix`), which returns the matrix of
+      values between each item in one collection and each item in another
+
+The streaming statistics class (:py:class:`.StreamingStatistics`)
+accumulates the count, minimum, maximum, variance, and most of the means above
+over a stream of numbers, in constant memory. Pairwise similarity statistics
+use it when called with ``streaming=True``.
+
+>>> stats = StreamingStatistics()
+>>> stats.update(nums)
+>>> stats.amean()
+41.25
+>>> stats.std()
+22.876935255113754
 
 The confusion table class (:py:class:`.ConfusionTable`) can be constructed in
 a number of ways:
@@ -189,7 +206,13 @@ from ._mean import (
     std,
     var,
 )
-from ._pairwise import mean_pairwise_similarity, pairwise_similarity_statistics
+from ._pairwise import (
+    cross_matrix,
+    mean_pairwise_similarity,
+    pairwise_matrix,
+    pairwise_similarity_statistics,
+)
+from ._streaming_statistics import StreamingStatistics
 
 __all__ = [
     'ConfusionTable',
@@ -214,6 +237,9 @@ __all__ = [
     'var',
     'mean_pairwise_similarity',
     'pairwise_similarity_statistics',
+    'pairwise_matrix',
+    'cross_matrix',
+    'StreamingStatistics',
 ]
 
 
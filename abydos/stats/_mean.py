@@ -579,8 +579,29 @@ def agmean(nums: Sequence[float], prec: int = 12) -> float:
     .. versionadded:: 0.1.0
 
     """
-    m_a = amean(nums)
-    m_g = gmean(nums)
+    return _agm(amean(nums), gmean(nums), prec)
+
+
+def _agm(m_a: float, m_g: float, prec: int) -> float:
+    """Return the arithmetic-geometric mean of an arithmetic & geometric mean.
+
+    Parameters
+    ----------
+    m_a : float
+        The arithmetic mean of a series
+    m_g : float
+        The geometric mean of the series
+    prec : int
+        Digits of precision when testing convergeance
+
+    Returns
+    -------
+    float
+        The arithmetic-geometric mean of the series
+
+    .. versionadded:: 0.6.0
+
+    """
     if math.isnan(m_a) or math.isnan(m_g):
         return float('nan')
     while round(m_a, prec) != round(m_g, prec):
@@ -625,8 +646,29 @@ def ghmean(nums: Sequence[float], prec: int = 12) -> float:
     .. versionadded:: 0.1.0
 
     """
-    m_g = gmean(nums)
-    m_h = hmean(nums)
+    return _ghm(gmean(nums), hmean(nums), prec)
+
+
+def _ghm(m_g: float, m_h: float, prec: int) -> float:
+    """Return the geometric-harmonic mean of a geometric & harmonic mean.
+
+    Parameters
+    ----------
+    m_g : float
+        The geometric mean of a series
+    m_h : float
+        The harmonic mean of the series
+    prec : int
+        Digits of precision when testing convergeance
+
+    Returns
+    -------
+    float
+        The geometric-harmonic mean of the series
+
+    .. versionadded:: 0.6.0
+
+    """
     if math.isnan(m_g) or math.isnan(m_h):
         return float('nan')
     while round(m_h, prec) != round(m_g, prec):
@@ -665,9 +707,31 @@ def aghmean(nums: Sequence[float], prec: int = 12) -> float:
     .. versionadded:: 0.1.0
 
     """
-    m_a = amean(nums)
-    m_g = gmean(nums)
-    m_h = hmean(nums)
+    return _aghm(amean(nums), gmean(nums), hmean(nums), prec)
+
+
+def _aghm(m_a: float, m_g: float, m_h: float, prec: int) -> float:
+    """Return the arithmetic-geometric-harmonic mean of three means.
+
+    Parameters
+    ----------
+    m_a : float
+        The arithmetic mean of a series
+    m_g : float
+        The geometric mean of the series
+    m_h : float
+        The harmonic mean of the series
+    prec : int
+        Digits of precision when testing convergeance
+
+    Returns
+    -------
+    float
+        The arithmetic-geometric-harmonic mean of the series
+
+    .. versionadded:: 0.6.0
+
+    """
     if math.isnan(m_a) or math.isnan(m_g) or math.isnan(m_h):
         return float('nan')
     while round(m_a, prec) != round(m_g, prec) and round(m_g, prec) != round(
@@ -19,12 +19,285 @@
 The stats._pairwise module implements pairwise statistical algorithms.
 """
 
-from typing import Callable, Optional, Sequence, Set, Tuple, Union, cast
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 
 from ._mean import amean, hmean, std
+from ._streaming_statistics import StreamingStatistics, _STREAMING_MEANS
+from ..distance._distance import _Distance
 from ..distance._levenshtein import Levenshtein
 
-__all__ = ['mean_pairwise_similarity', 'pairwise_similarity_statistics']
+__all__ = [
+    'cross_matrix',
+    'mean_pairwise_similarity',
+    'pairwise_matrix',
+    'pairwise_similarity_statistics',
+]
+
+
+def _n_workers(n_jobs: Optional[int]) -> int:
+    """Return the number of workers requested by n_jobs.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        The number of jobs: None means 1, and negative values count back from
+        the number of processors, so -1 means all processors
+
+    Returns
+    -------
+    int
+        The number of workers
+
+    Raises
+    ------
+    ValueError
+        n_jobs must not be 0
+
+    .. versionadded:: 0.6.0
+
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError('n_jobs must not be 0')
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _row_blocks(
+    weights: Sequence[int], n_blocks: int
+) -> List[Tuple[int, int]]:
+    """Split a range of rows into contiguous blocks of similar total weight.
+
+    Parameters
+    ----------
+    weights : list of int
+        The number of pairs in each row
+    n_blocks : int
+        The maximum number of blocks
+
+    Returns
+    -------
+    list of tuple
+        The start and stop row of each non-empty block, in order
+
+    .. versionadded:: 0.6.0
+
+    """
+    total = sum(weights)
+    blocks = []  # type: List[Tuple[int, int]]
+    start = 0
+    cumulative = 0
+    for row, weight in enumerate(weights):
+        cumulative += weight
+        if weight and cumulative * n_blocks >= total * (len(blocks) + 1):
+            blocks.append((start, row + 1))
+            start = row + 1
+    if blocks and start < len(weights):
+        # Trailing rows without pairs join the last block.
+        blocks[-1] = (blocks[-1][0], len(weights))
+    return blocks
+
+
+def _mps_block(
+    metric: Callable[[str, str], float],
+    collection: List[str],
+    rows: int,
+    symmetric: bool,
+    streaming: bool,
+) -> Union[List[float], StreamingStatistics]:
+    """Return the pairwise values for the first rows of a collection.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity metric function
+    collection : list
+        The members of the collection from the first row of the block onward
+    rows : int
+        The number of rows in the block
+    symmetric : bool
+        Set to True if all pairwise similarities should be calculated in both
+        directions
+    streaming : bool
+        Set to True to accumulate the values' statistics rather than a list
+
+    Returns
+    -------
+    list of float or StreamingStatistics
+        The pairwise values, in the order the serial loop produces them, or
+        their statistics
+
+    .. versionadded:: 0.6.0
+
+    """
+    pairwise_values = StreamingStatistics() if streaming else []
+    add = _adder(pairwise_values)
+    for i in range(rows):
+        for j in range(i + 1, len(collection)):
+            add(metric(collection[i], collection[j]))
+            if symmetric:
+                add(metric(collection[j], collection[i]))
+    return pairwise_values
+
+
+def _pss_block(
+    metric: Callable[[str, str], float],
+    src_collection: List[str],
+    tar_collection: List[str],
+    symmetric: bool,
+    streaming: bool,
+) -> Union[List[float], StreamingStatistics]:
+    """Return the pairwise values between a block of sources and all targets.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity metric function
+    src_collection : list
+        The members of the source collection in the block
+    tar_collection : list
+        The members of the target collection
+    symmetric : bool
+        Set to True if all pairwise similarities should be calculated in both
+        directions
+    streaming : bool
+        Set to True to accumulate the values' statistics rather than a list
+
+    Returns
+    -------
+    list of float or StreamingStatistics
+        The pairwise values, in the order the serial loop produces them, or
+        their statistics
+
+    .. versionadded:: 0.6.0
+
+    """
+    pairwise_values = StreamingStatistics() if streaming else []
+    add = _adder(pairwise_values)
+    for src in src_collection:
+        for tar in tar_collection:
+            add(metric(src, tar))
+            if symmetric:
+                add(metric(tar, src))
+    return pairwise_values
+
+
+def _adder(
+    pairwise_values: Union[List[float], StreamingStatistics]
+) -> Callable[[float], None]:
+    """Return the method that adds a value to a list or statistics object.
+
+    Parameters
+    ----------
+    pairwise_values : list or StreamingStatistics
+        The collected values
+
+    Returns
+    -------
+    function
+        The method that adds a value
+
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(pairwise_values, StreamingStatistics):
+        return pairwise_values.add
+    return pairwise_values.append
+
+
+def _merge_blocks(
+    func: Callable[..., Union[List[float], StreamingStatistics]],
+    block_args: List[Tuple[Any, ...]],
+    n_jobs: int,
+    executor: Optional[Executor],
+    streaming: bool,
+) -> Union[List[float], StreamingStatistics]:
+    """Apply a block function to each block and merge the results in order.
+
+    Parameters
+    ----------
+    func : function
+        The block function
+    block_args : list of tuple
+        The arguments for each block
+    n_jobs : int
+        The number of worker processes to start if executor is None
+    executor : concurrent.futures.Executor or None
+        An executor on which to run the blocks
+    streaming : bool
+        Set to True if the blocks return statistics rather than lists
+
+    Returns
+    -------
+    list of float or StreamingStatistics
+        The merged values or statistics of all blocks
+
+    .. versionadded:: 0.6.0
+
+    """
+    if streaming:
+        statistics = StreamingStatistics()
+        for block_statistics in _map_blocks(
+            func, block_args, n_jobs, executor
+        ):
+            statistics.merge(cast(StreamingStatistics, block_statistics))
+        return statistics
+    pairwise_values = []  # type: List[float]
+    for values in _map_blocks(func, block_args, n_jobs, executor):
+        pairwise_values.extend(cast(List[float], values))
+    return pairwise_values
+
+
+def _map_blocks(
+    func: Callable[..., Union[List[float], StreamingStatistics]],
+    block_args: List[Tuple[Any, ...]],
+    n_jobs: int,
+    executor: Optional[Executor],
+) -> List[Union[List[float], StreamingStatistics]]:
+    """Apply a block function to each block, in parallel if requested.
+
+    Parameters
+    ----------
+    func : function
+        The block function
+    block_args : list of tuple
+        The arguments for each block
+    n_jobs : int
+        The number of worker processes to start if executor is None
+    executor : concurrent.futures.Executor or None
+        An executor on which to run the blocks
+
+    Returns
+    -------
+    list
+        The results of each block, in block order
+
+    .. versionadded:: 0.6.0
+
+    """
+    if executor is None and (n_jobs == 1 or len(block_args) < 2):
+        return [func(*args) for args in block_args]
+    columns = list(zip(*block_args))
+    if executor is not None:
+        return list(executor.map(func, *columns))
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        return list(pool.map(func, *columns))
 
 
 def mean_pairwise_similarity(
@@ -32,6 +305,9 @@ def mean_pairwise_similarity(
     metric: Optional[Callable[[str, str], float]] = None,
     mean_func: Callable[[Sequence[float]], float] = hmean,
     symmetric: bool = False,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    streaming: bool = False,
 ) -> float:
     """Calculate the mean pairwise similarity of a collection of strings.
 
@@ -39,6 +315,17 @@ def mean_pairwise_similarity(
     collection, optionally in both directions (for asymmetric similarity
     metrics.
 
+    The pairs can be scored in parallel by setting n_jobs or supplying an
+    executor. The pairs are then split into blocks of rows, which are scored
+    by worker processes, and the blocks' values (or, if streaming, their
+    statistics) are combined in their original order, so the result is
+    deterministic. Without streaming, it is the same as that of a serial run.
+    Workers receive metric by pickling, so it must be picklable: pass the
+    bound method of a configured measure instance, such as
+    ``Levenshtein(cost=(1, 1, 2, 1)).sim``, rather than a lambda or a local
+    function. A bound method pickles as its instance's parameters and the
+    method name, and it is sent once per block.
+
     Parameters
     ----------
     collection : list
@@ -50,6 +337,22 @@ def mean_pairwise_similarity(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    n_jobs : int
+        The number of worker processes to use; -1 means one per processor.
+        If None (default), pairs are scored in this process, unless executor
+        is supplied.
+    executor : concurrent.futures.Executor
+        An executor (e.g. a :py:class:`concurrent.futures.ProcessPoolExecutor`)
+        on which to score blocks of pairs. If supplied, n_jobs only sets how
+        many workers the pairs are balanced across (by default, one per
+        processor).
+    streaming : bool
+        If True, accumulate statistics of the similarities in constant memory
+        (see :py:class:`StreamingStatistics`) rather than keeping a list of
+        them. mean_func must then be one of amean, gmean, hmean, qmean,
+        cmean, heronian_mean, hoelder_mean, lehmer_mean, agmean, ghmean,
+        aghmean, or midrange, and the result matches that of a non-streaming
+        run within floating point tolerance.
 
     Returns
     -------
@@ -66,6 +369,10 @@ def mean_pairwise_similarity(
         collection is neither a string nor iterable type
     ValueError
         collection has fewer than two members
+    ValueError
+        n_jobs must not be 0
+    ValueError
+        mean_func has no streaming counterpart
 
     Examples
     --------
@@ -84,6 +391,8 @@ def mean_pairwise_similarity(
         raise ValueError('mean_func must be a function')
     if not callable(metric):
         raise ValueError('metric must be a function')
+    if streaming and mean_func not in _STREAMING_MEANS:
+        raise ValueError('mean_func has no streaming counterpart')
 
     if hasattr(collection, 'split'):
         collection = cast(str, collection).split()
@@ -94,14 +403,27 @@ def mean_pairwise_similarity(
 
     collection = list(collection)
 
-    pairwise_values = []
-
-    for i in range(len(collection)):
-        for j in range(i + 1, len(collection)):
-            pairwise_values.append(metric(collection[i], collection[j]))
-            if symmetric:
-                pairwise_values.append(metric(collection[j], collection[i]))
+    workers = _n_workers(n_jobs)
+    if executor is not None and n_jobs is None:
+        workers = _n_workers(-1)
+    # Several blocks per worker balance the load as rows finish unevenly.
+    blocks = _row_blocks(
+        [len(collection) - i - 1 for i in range(len(collection))],
+        workers * 4 if workers > 1 else 1,
+    )
+    pairwise_values = _merge_blocks(
+        _mps_block,
+        [
+            (metric, collection[start:], stop - start, symmetric, streaming)
+            for start, stop in blocks
+        ],
+        workers,
+        executor,
+        streaming,
+    )
 
+    if isinstance(pairwise_values, StreamingStatistics):
+        return pairwise_values.mean(mean_func)
     return mean_func(pairwise_values)
 
 
@@ -111,6 +433,9 @@ def pairwise_similarity_statistics(
     metric: Optional[Callable[[str, str], float]] = None,
     mean_func: Callable[[Sequence[float]], float] = amean,
     symmetric: bool = False,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    streaming: bool = False,
 ) -> Tuple[float, float, float, float]:
     """Calculate the pairwise similarity statistics a collection of strings.
 
@@ -119,6 +444,9 @@ def pairwise_similarity_statistics(
     arithmetic mean, by default), and (population) standard deviation
     of those similarities.
 
+    The pairs can be scored in parallel by setting n_jobs or supplying an
+    executor, as described for :py:func:`mean_pairwise_similarity`.
+
     Parameters
     ----------
     src_collection : list
@@ -132,6 +460,22 @@ def pairwise_similarity_statistics(
     symmetric : bool
         Set to True if all pairwise similarities should be calculated in both
         directions
+    n_jobs : int
+        The number of worker processes to use; -1 means one per processor.
+        If None (default), pairs are scored in this process, unless executor
+        is supplied.
+    executor : concurrent.futures.Executor
+        An executor (e.g. a :py:class:`concurrent.futures.ProcessPoolExecutor`)
+        on which to score blocks of pairs. If supplied, n_jobs only sets how
+        many workers the pairs are balanced across (by default, one per
+        processor).
+    streaming : bool
+        If True, accumulate statistics of the similarities in constant memory
+        (see :py:class:`StreamingStatistics`) rather than keeping a list of
+        them. mean_func must then be one of amean, gmean, hmean, qmean,
+        cmean, heronian_mean, hoelder_mean, lehmer_mean, agmean, ghmean,
+        aghmean, or midrange, and the result matches that of a non-streaming
+        run within floating point tolerance.
 
     Returns
     -------
@@ -148,6 +492,10 @@ def pairwise_similarity_statistics(
         src_collection is neither a string nor iterable
     ValueError
         tar_collection is neither a string nor iterable
+    ValueError
+        n_jobs must not be 0
+    ValueError
+        mean_func has no streaming counterpart
 
     Example
     -------
@@ -164,6 +512,8 @@ def pairwise_similarity_statistics(
         raise ValueError('mean_func must be a function')
     if not callable(metric):
         raise ValueError('metric must be a function')
+    if streaming and mean_func not in _STREAMING_MEANS:
+        raise ValueError('mean_func has no streaming counterpart')
 
     if hasattr(src_collection, 'split'):
         src_collection = cast(str, src_collection).split()
@@ -178,13 +528,38 @@ def pairwise_similarity_statistics(
     src_collection = list(src_collection)
     tar_collection = list(tar_collection)
 
-    pairwise_values = []
+    workers = _n_workers(n_jobs)
+    if executor is not None and n_jobs is None:
+        workers = _n_workers(-1)
+    blocks = _row_blocks(
+        [len(tar_collection)] * len(src_collection),
+        workers * 4 if workers > 1 else 1,
+    )
+    pairwise_values = _merge_blocks(
+        _pss_block,
+        [
+            (
+                metric,
+                src_collection[start:stop],
+                tar_collection,
+                symmetric,
+                streaming,
+            )
+            for start, stop in blocks
+        ],
+        workers,
+        executor,
+        streaming,
+    )
 
-    for src in src_collection:
-        for tar in tar_collection:
-            pairwise_values.append(metric(src, tar))
-            if symmetric:
-                pairwise_values.append(metric(tar, src))
+    if isinstance(pairwise_values, StreamingStatistics):
+        mean = pairwise_values.mean(mean_func)
+        return (
+            pairwise_values.max(),
+            pairwise_values.min(),
+            mean,
+            pairwise_values.std(mean),
+        )
 
     return (
         max(pairwise_values),
@@ -194,6 +569,327 @@ def pairwise_similarity_statistics(
     )
 
 
+def _row_function(
+    metric: Callable[[str, str], float]
+) -> Callable[[str, List[str]], np.ndarray]:
+    """Return a function comparing one string against a list of strings.
+
+    If metric is the sim, dist, or dist_abs method of a distance measure, the
+    measure's corresponding batch method (sim_many, dist_many, or
+    dist_abs_many) is used. Otherwise, metric is called once per pair.
+
+    Parameters
+    ----------
+    metric : function
+        A similarity or distance metric function
+
+    Returns
+    -------
+    function
+        A function taking a source string and a list of target strings and
+        returning an array of values
+
+    .. versionadded:: 0.6.0
+
+    """
+    measure = getattr(metric, '__self__', None)
+    name = getattr(metric, '__name__', None)
+    if isinstance(measure, _Distance) and name in {'sim', 'dist', 'dist_abs'}:
+        return cast(
+            Callable[[str, List[str]], np.ndarray],
+            getattr(measure, name + '_many'),
+        )
+
+    def _row(src: str, tars: List[str]) -> np.ndarray:
+        return np.fromiter(
+            (metric(src, tar) for tar in tars),
+            dtype=np.float_,
+            count=len(tars),
+        )
+
+    return _row
+
+
+def _split_collection(
+    collection: Union[str, Sequence[str], Set[str]], name: str
+) -> List[str]:
+    """Return a collection of strings as a list.
+
+    Parameters
+    ----------
+    collection : list
+        A collection of terms or a string that can be split
+    name : str
+        The name of the collection, for use in error messages
+
+    Returns
+    -------
+    list
+        The members of the collection
+
+    Raises
+    ------
+    ValueError
+        collection is neither a string nor iterable
+
+    .. versionadded:: 0.6.0
+
+    """
+    if hasattr(collection, 'split'):
+        collection = cast(str, collection).split()
+    if not hasattr(collection, '__iter__'):
+        raise ValueError(
+            '{} is neither a string nor iterable type'.format(name)
+        )
+    return list(collection)
+
+
+def _output_array(
+    out: Optional[Union[np.ndarray, str]], shape: Tuple[int, ...]
+) -> np.ndarray:
+    """Return an array of the given shape into which to write values.
+
+    Parameters
+    ----------
+    out : numpy.ndarray, str, or None
+        A caller-supplied array, the path of a .npy file to create as a
+        memory-mapped array, or None to allocate a new array in memory
+    shape : tuple
+        The required shape of the array
+
+    Returns
+    -------
+    numpy.ndarray
+        The output array
+
+    Raises
+    ------
+    ValueError
+        out has the wrong shape
+
+    .. versionadded:: 0.6.0
+
+    """
+    if out is None:
+        return np.zeros(shape, dtype=np.float_)
+    if isinstance(out, str):
+        return np.lib.format.open_memmap(
+            out, mode='w+', dtype=np.float_, shape=shape
+        )
+    if out.shape != shape:
+        raise ValueError(
+            'out has shape {}, but shape {} is required'.format(
+                out.shape, shape
+            )
+        )
+    return out
+
+
+def pairwise_matrix(
+    collection: Union[str, Sequence[str], Set[str]],
+    metric: Optional[Callable[[str, str], float]] = None,
+    symmetric: bool = True,
+    condensed: bool = False,
+    out: Optional[Union[np.ndarray, str]] = None,
+    chunk_size: Optional[int] = None,
+) -> np.ndarray:
+    """Calculate the matrix of pairwise values among a collection of strings.
+
+    For a collection of n strings, this returns the n by n matrix whose
+    (i, j) entry is metric(collection[i], collection[j]), or, if condensed
+    is True, the upper triangle of that matrix (excluding the diagonal) as a
+    vector of length n(n-1)/2, in the same order as SciPy's pdist.
+
+    When metric is the sim, dist, or dist_abs method of a distance measure,
+    each row is computed by the measure's batch method (e.g. sim_many).
+
+    Parameters
+    ----------
+    collection : list
+        A collection of terms or a string that can be split
+    metric : function
+        A similarity or distance metric function (Levenshtein().dist by
+        default)
+    symmetric : bool
+        If True (default), metric is assumed to be symmetric and each pair is
+        computed only once. Set to False for asymmetric metrics, in which
+        case both directions are computed.
+    condensed : bool
+        If True, return the condensed upper triangle rather than the square
+        matrix
+    out : numpy.ndarray or str
+        An array into which to write the result, or the path of a .npy file
+        to create as a memory-mapped array and write the result into. If
+        None, a new array is allocated in memory.
+    chunk_size : int
+        If set, values are computed for this many rows at a time and each
+        chunk is written to out (and flushed, if out is memory-mapped) before
+        the next chunk is computed. If None, all rows form a single chunk.
+
+    Returns
+    -------
+    numpy.ndarray
+        The pairwise matrix or condensed vector
+
+    Raises
+    ------
+    ValueError
+        metric must be a function
+    ValueError
+        collection is neither a string nor iterable type
+    ValueError
+        condensed output requires a symmetric metric
+    ValueError
+        chunk_size must be a positive integer
+    ValueError
+        out has the wrong shape
+
+    Examples
+    --------
+    >>> pairwise_matrix(['Niall', 'Neal', 'Neil'])
+    array([[0.  , 0.4 , 0.6 ],
+           [0.4 , 0.  , 0.25],
+           [0.6 , 0.25, 0.  ]])
+    >>> pairwise_matrix(['Niall', 'Neal', 'Neil'], condensed=True)
+    array([0.4 , 0.6 , 0.25])
+
+    .. versionadded:: 0.6.0
+
+    """
+    if metric is None:
+        metric = Levenshtein().dist
+    if not callable(metric):
+        raise ValueError('metric must be a function')
+    if condensed and not symmetric:
+        raise ValueError('condensed output requires a symmetric metric')
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer')
+
+    collection = _split_collection(collection, 'collection')
+    row_func = _row_function(metric)
+
+    size = len(collection)
+    if condensed:
+        matrix = _output_array(out, (size * (size - 1) // 2,))
+    else:
+        matrix = _output_array(out, (size, size))
+    if chunk_size is None:
+        chunk_size = max(size, 1)
+
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+        if condensed:
+            # The rows of the upper triangle from start to stop occupy a
+            # contiguous segment of the condensed vector.
+            offset = start * size - start * (start + 1) // 2
+            chunk = [
+                row_func(collection[i], collection[i + 1 :])
+                for i in range(start, stop)
+            ]
+            if chunk:
+                values = np.concatenate(chunk)
+                matrix[offset : offset + len(values)] = values
+        elif symmetric:
+            for i in range(start, stop):
+                row = row_func(collection[i], collection[i:])
+                matrix[i, i:] = row
+                matrix[i + 1 :, i] = row[1:]
+        else:
+            matrix[start:stop] = [
+                row_func(collection[i], collection) for i in range(start, stop)
+            ]
+        if hasattr(matrix, 'flush'):
+            matrix.flush()
+
+    return matrix
+
+
+def cross_matrix(
+    src_collection: Union[str, Sequence[str], Set[str]],
+    tar_collection: Union[str, Sequence[str], Set[str]],
+    metric: Optional[Callable[[str, str], float]] = None,
+    out: Optional[Union[np.ndarray, str]] = None,
+    chunk_size: Optional[int] = None,
+) -> np.ndarray:
+    """Calculate the matrix of values between two collections of strings.
+
+    This returns the matrix whose (i, j) entry is
+    metric(src_collection[i], tar_collection[j]).
+
+    When metric is the sim, dist, or dist_abs method of a distance measure,
+    each row is computed by the measure's batch method (e.g. sim_many).
+
+    Parameters
+    ----------
+    src_collection : list
+        A collection of terms or a string that can be split
+    tar_collection : list
+        A collection of terms or a string that can be split
+    metric : function
+        A similarity or distance metric function (Levenshtein().dist by
+        default)
+    out : numpy.ndarray or str
+        An array into which to write the result, or the path of a .npy file
+        to create as a memory-mapped array and write the result into. If
+        None, a new array is allocated in memory.
+    chunk_size : int
+        If set, values are computed for this many rows at a time and each
+        chunk is written to out (and flushed, if out is memory-mapped) before
+        the next chunk is computed. If None, all rows form a single chunk.
+
+    Returns
+    -------
+    numpy.ndarray
+        The matrix of values
+
+    Raises
+    ------
+    ValueError
+        metric must be a function
+    ValueError
+        src_collection is neither a string nor iterable type
+    ValueError
+        tar_collection is neither a string nor iterable type
+    ValueError
+        chunk_size must be a positive integer
+    ValueError
+        out has the wrong shape
+
+    Examples
+    --------
+    >>> cross_matrix(['Niall', 'Neil'], ['Neal', 'Nigel', 'Njall'])
+    array([[0.4 , 0.4 , 0.2 ],
+           [0.25, 0.6 , 0.6 ]])
+
+    .. versionadded:: 0.6.0
+
+    """
+    if metric is None:
+        metric = Levenshtein().dist
+    if not callable(metric):
+        raise ValueError('metric must be a function')
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer')
+
+    src_collection = _split_collection(src_collection, 'src_collection')
+    tar_collection = _split_collection(tar_collection, 'tar_collection')
+    row_func = _row_function(metric)
+
+    matrix = _output_array(out, (len(src_collection), len(tar_collection)))
+    if chunk_size is None:
+        chunk_size = max(len(src_collection), 1)
+
+    for start in range(0, len(src_collection), chunk_size):
+        stop = min(start + chunk_size, len(src_collection))
+        matrix[start:stop] = [
+            row_func(src, tar_collection) for src in src_collection[start:stop]
+        ]
+        if hasattr(matrix, 'flush'):
+            matrix.flush()
+
+    return matrix
+
+
 if __name__ == '__main__':
     import doctest
 
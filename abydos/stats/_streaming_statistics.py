@@ -0,0 +1,786 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.stats._streaming_statistics.
+
+The stats._streaming_statistics module implements an accumulator of
+single-pass statistics over a stream of numbers.
+"""
+
+import math
+from typing import Callable, Dict, Iterable, Optional, Sequence, cast
+
+from ._mean import (
+    _aghm,
+    _agm,
+    _ghm,
+    aghmean,
+    agmean,
+    amean,
+    cmean,
+    ghmean,
+    gmean,
+    heronian_mean,
+    hmean,
+    hoelder_mean,
+    lehmer_mean,
+    midrange,
+    qmean,
+)
+
+__all__ = ['StreamingStatistics']
+
+
+class StreamingStatistics:
+    """StreamingStatistics object.
+
+    A StreamingStatistics object accumulates statistics over a stream of
+    numbers in constant memory. It keeps the count, minimum, maximum, the
+    running mean & sum of squared deviations (following
+    :cite:`Welford:1962`), and the sums needed to calculate the means in
+    :py:mod:`abydos.stats` that do not require the whole series: the
+    arithmetic, geometric, harmonic, quadratic, contraharmonic, Heronian,
+    Hölder, Lehmer, arithmetic-geometric, geometric-harmonic, and
+    arithmetic-geometric-harmonic means, and the midrange.
+
+    The results match those of the corresponding functions applied to the
+    list of all values, within floating point tolerance. The geometric mean
+    is calculated from a sum of logarithms, so it does not underflow to 0 for
+    long series of small values, as the product of the values would.
+
+    Two StreamingStatistics objects can be combined with :py:meth:`merge`,
+    following :cite:`Chan:1982`, so partial statistics can be accumulated
+    separately (e.g. by different processes) and then combined.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        values: Optional[Iterable[float]] = None,
+        powers: Iterable[float] = (2.0,),
+    ) -> None:
+        """Initialize StreamingStatistics.
+
+        Parameters
+        ----------
+        values : iterable
+            An initial series of numbers to add
+        powers : iterable
+            The exponents for which to keep sums of powers of the values,
+            which the Hölder and Lehmer means require (in addition to 1, for
+            which the sum is always kept). The quadratic and contraharmonic
+            means require 2.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+        self._mean = 0.0
+        self._sq_dev = 0.0
+
+        self._sum = 0.0
+        self._sqrt_sum = 0.0
+        self._log_sum = 0.0
+        self._recip_sum = 0.0
+        self._zeros = 0
+        self._negatives = 0
+        self._power_sums = {
+            float(exp): 0.0 for exp in powers if exp != 1
+        }  # type: Dict[float, float]
+
+        if values is not None:
+            self.update(values)
+
+    def add(self, value: float) -> None:
+        """Add a value to the statistics.
+
+        Parameters
+        ----------
+        value : float
+            A number
+
+        Examples
+        --------
+        >>> stats = StreamingStatistics()
+        >>> stats.add(2)
+        >>> stats.add(4)
+        >>> stats.amean()
+        3.0
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._count += 1
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._sq_dev += delta * (value - self._mean)
+
+        self._sum += value
+        if value == 0:
+            self._zeros += 1
+        else:
+            if value < 0:
+                self._negatives += 1
+            else:
+                self._sqrt_sum += value ** 0.5
+            self._log_sum += math.log(abs(value))
+            self._recip_sum += 1.0 / value
+        for exp in self._power_sums:
+            self._power_sums[exp] += value ** exp
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add a series of values to the statistics.
+
+        Parameters
+        ----------
+        values : iterable
+            A series of numbers
+
+        Examples
+        --------
+        >>> stats = StreamingStatistics()
+        >>> stats.update([1, 2, 3, 4])
+        >>> stats.count()
+        4
+
+        .. versionadded:: 0.6.0
+
+        """
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: 'StreamingStatistics') -> None:
+        """Add the statistics of another StreamingStatistics object.
+
+        Parameters
+        ----------
+        other : StreamingStatistics
+            Statistics of another series of numbers, accumulated with the
+            same powers
+
+        Raises
+        ------
+        ValueError
+            Both objects must keep sums of the same powers
+
+        Examples
+        --------
+        >>> stats = StreamingStatistics([1, 2])
+        >>> stats.merge(StreamingStatistics([3, 4]))
+        >>> stats.amean()
+        2.5
+        >>> stats.var()
+        1.25
+
+        .. versionadded:: 0.6.0
+
+        """
+        if set(self._power_sums) != set(other._power_sums):
+            raise ValueError('Both objects must keep sums of the same powers')
+        if not other._count:
+            return
+
+        count = self._count + other._count
+        delta = other._mean - self._mean
+        self._mean += delta * other._count / count
+        self._sq_dev += (
+            other._sq_dev + delta * delta * self._count * other._count / count
+        )
+        self._count = count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+        self._sum += other._sum
+        self._sqrt_sum += other._sqrt_sum
+        self._log_sum += other._log_sum
+        self._recip_sum += other._recip_sum
+        self._zeros += other._zeros
+        self._negatives += other._negatives
+        for exp in self._power_sums:
+            self._power_sums[exp] += other._power_sums[exp]
+
+    def _check_count(self) -> None:
+        if not self._count:
+            raise ValueError('No values have been added')
+
+    def _power_sum(self, exp: float) -> float:
+        if exp == 1:
+            return self._sum
+        if exp not in self._power_sums:
+            raise ValueError(
+                'The sum of values to the power {} is not kept; '.format(exp)
+                + 'include it in powers when constructing the object'
+            )
+        return self._power_sums[exp]
+
+    def count(self) -> int:
+        """Return the number of values added.
+
+        Returns
+        -------
+        int
+            The number of values
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).count()
+        4
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._count
+
+    def min(self) -> float:
+        """Return the minimum of the values added.
+
+        Returns
+        -------
+        float
+            The minimum
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).min()
+        1
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        return self._min
+
+    def max(self) -> float:
+        """Return the maximum of the values added.
+
+        Returns
+        -------
+        float
+            The maximum
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).max()
+        4
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        return self._max
+
+    def amean(self) -> float:
+        """Return the arithmetic mean of the values added.
+
+        Returns
+        -------
+        float
+            The arithmetic mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).amean()
+        2.5
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        return self._sum / self._count
+
+    def gmean(self) -> float:
+        """Return the geometric mean of the values added.
+
+        Returns
+        -------
+        float
+            The geometric mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> round(StreamingStatistics([1, 2, 3, 4]).gmean(), 12)
+        2.213363839401
+        >>> StreamingStatistics([0, 5, 1000]).gmean()
+        0.0
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        if self._zeros:
+            return 0.0
+        magnitude = math.exp(self._log_sum / self._count)
+        if self._negatives % 2:
+            # The product is negative, so its root is complex.
+            return (-1) ** (1 / self._count) * magnitude  # type: ignore
+        return magnitude
+
+    def hmean(self) -> float:
+        """Return the harmonic mean of the values added.
+
+        As with :py:func:`abydos.stats.hmean`, if one of the values is 0, this
+        returns 0, and if more than one value is 0, this returns NaN.
+
+        Returns
+        -------
+        float
+            The harmonic mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).hmean()
+        1.9200000000000004
+        >>> StreamingStatistics([0, 5, 1000]).hmean()
+        0
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        if self._min == self._max:
+            return self._min
+        if self._zeros:
+            if self._zeros > 1:
+                return float('nan')
+            return 0
+        return self._count / self._recip_sum
+
+    def qmean(self) -> float:
+        """Return the quadratic mean of the values added.
+
+        Returns
+        -------
+        float
+            The quadratic mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+        ValueError
+            The sum of squares is not kept
+
+        Examples
+        --------
+        >>> round(StreamingStatistics([1, 2, 3, 4]).qmean(), 12)
+        2.738612787526
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.hoelder_mean(2.0)
+
+    def cmean(self) -> float:
+        """Return the contraharmonic mean of the values added.
+
+        Returns
+        -------
+        float
+            The contraharmonic mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+        ValueError
+            The sum of squares is not kept
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).cmean()
+        3.0
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.lehmer_mean(2.0)
+
+    def heronian_mean(self) -> float:
+        r"""Return the Heronian mean of the values added.
+
+        This uses the identity
+
+            .. math::
+
+                \sum\limits_{i \le j}\sqrt{x_i \cdot x_j} =
+                \frac{(\sum\limits_{i}\sqrt{x_i})^2 + \sum\limits_{i}x_i}{2}
+
+        which holds for non-negative values.
+
+        Returns
+        -------
+        float
+            The Heronian mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> round(StreamingStatistics([1, 2, 3, 4]).heronian_mean(), 12)
+        2.388828285261
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        return (self._sqrt_sum ** 2 + self._sum) / (
+            self._count * (self._count + 1)
+        )
+
+    def hoelder_mean(self, exp: float = 2.0) -> float:
+        """Return the Hölder (power/generalized) mean of the values added.
+
+        Parameters
+        ----------
+        exp : float
+            The exponent of the Hölder mean, for which the sum of powers must
+            be kept (unless it is 0 or 1)
+
+        Returns
+        -------
+        float
+            The Hölder mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+        ValueError
+            The sum of powers is not kept
+
+        Examples
+        --------
+        >>> round(StreamingStatistics([1, 2, 3, 4]).hoelder_mean(), 12)
+        2.738612787526
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        if exp == 0:
+            return self.gmean()
+        return (self._power_sum(exp) / self._count) ** (1 / exp)
+
+    def lehmer_mean(self, exp: float = 2.0) -> float:
+        """Return the Lehmer mean of the values added.
+
+        Parameters
+        ----------
+        exp : float
+            The exponent of the Lehmer mean, for which the sums of powers exp
+            and exp-1 must be kept (unless they are 1)
+
+        Returns
+        -------
+        float
+            The Lehmer mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+        ValueError
+            The sum of powers is not kept
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).lehmer_mean()
+        3.0
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        if exp - 1 == 0:
+            denominator = float(self._count)
+        else:
+            denominator = self._power_sum(exp - 1)
+        return self._power_sum(exp) / denominator
+
+    def agmean(self, prec: int = 12) -> float:
+        """Return the arithmetic-geometric mean of the values added.
+
+        Parameters
+        ----------
+        prec : int
+            Digits of precision when testing convergeance
+
+        Returns
+        -------
+        float
+            The arithmetic-geometric mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> round(StreamingStatistics([1, 2, 3, 4]).agmean(), 12)
+        2.354500477775
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _agm(self.amean(), self.gmean(), prec)
+
+    def ghmean(self, prec: int = 12) -> float:
+        """Return the geometric-harmonic mean of the values added.
+
+        Parameters
+        ----------
+        prec : int
+            Digits of precision when testing convergeance
+
+        Returns
+        -------
+        float
+            The geometric-harmonic mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> round(StreamingStatistics([1, 2, 3, 4]).ghmean(), 12)
+        2.058868154613
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _ghm(self.gmean(), self.hmean(), prec)
+
+    def aghmean(self, prec: int = 12) -> float:
+        """Return the arithmetic-geometric-harmonic mean of the values added.
+
+        Parameters
+        ----------
+        prec : int
+            Digits of precision when testing convergeance
+
+        Returns
+        -------
+        float
+            The arithmetic-geometric-harmonic mean
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> round(StreamingStatistics([1, 2, 3, 4]).aghmean(), 12)
+        2.1983271599
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _aghm(self.amean(), self.gmean(), self.hmean(), prec)
+
+    def midrange(self) -> float:
+        """Return the midrange of the values added.
+
+        Returns
+        -------
+        float
+            The midrange
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).midrange()
+        2.5
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        return 0.5 * (self._max + self._min)
+
+    def mean(self, mean_func: Callable[[Sequence[float]], float]) -> float:
+        """Return the mean of the values added, according to a mean function.
+
+        Parameters
+        ----------
+        mean_func : function
+            A mean function from :py:mod:`abydos.stats` with a streaming
+            counterpart: amean, gmean, hmean, qmean, cmean, heronian_mean,
+            hoelder_mean, lehmer_mean, agmean, ghmean, aghmean, or midrange
+
+        Returns
+        -------
+        float
+            The mean
+
+        Raises
+        ------
+        ValueError
+            mean_func has no streaming counterpart
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 2, 3, 4]).mean(amean)
+        2.5
+
+        .. versionadded:: 0.6.0
+
+        """
+        if mean_func not in _STREAMING_MEANS:
+            raise ValueError(
+                '{} has no streaming counterpart'.format(
+                    getattr(mean_func, '__name__', mean_func)
+                )
+            )
+        return cast(float, getattr(self, _STREAMING_MEANS[mean_func])())
+
+    def var(self, center: Optional[float] = None, ddof: int = 0) -> float:
+        """Return the variance of the values added.
+
+        Parameters
+        ----------
+        center : float
+            The value from which deviations are measured (the arithmetic mean
+            by default), as the mean calculated by mean_func is in
+            :py:func:`abydos.stats.var`
+        ddof : int
+            The degrees of freedom (0 by default)
+
+        Returns
+        -------
+        float
+            The variance
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 1, 1, 1]).var()
+        0.0
+        >>> StreamingStatistics([1, 2, 3, 4]).var()
+        1.25
+        >>> round(StreamingStatistics([1, 2, 3, 4]).var(ddof=1), 12)
+        1.666666666667
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_count()
+        sq_dev = self._sq_dev
+        if center is not None:
+            sq_dev += self._count * (self._mean - center) ** 2
+        return sq_dev / (self._count - ddof)
+
+    def std(self, center: Optional[float] = None, ddof: int = 0) -> float:
+        """Return the standard deviation of the values added.
+
+        Parameters
+        ----------
+        center : float
+            The value from which deviations are measured (the arithmetic mean
+            by default)
+        ddof : int
+            The degrees of freedom (0 by default)
+
+        Returns
+        -------
+        float
+            The standard deviation
+
+        Raises
+        ------
+        ValueError
+            No values have been added
+
+        Examples
+        --------
+        >>> StreamingStatistics([1, 1, 1, 1]).std()
+        0.0
+        >>> round(StreamingStatistics([1, 2, 3, 4]).std(), 12)
+        1.11803398875
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.var(center, ddof) ** 0.5
+
+
+_STREAMING_MEANS = {
+    amean: 'amean',
+    gmean: 'gmean',
+    hmean: 'hmean',
+    qmean: 'qmean',
+    cmean: 'cmean',
+    heronian_mean: 'heronian_mean',
+    hoelder_mean: 'hoelder_mean',
+    lehmer_mean: 'lehmer_mean',
+    agmean: 'agmean',
+    ghmean: 'ghmean',
+    aghmean: 'aghmean',
+    midrange: 'midrange',
+}  # type: Dict[Callable[[Sequence[float]], float], str]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -83,6 +83,23 @@ Finally, an NLTK tokenizer is provided:
     - :py:class:`.NLTKTokenizer` does tokenization using an instantiated NLTK
       tokenizer. Accordingly, NLTK_ needs to be installed.
 
+Tokenizing the same strings repeatedly, e.g. when comparing each of a set of
+query strings to many candidates, can be avoided with a
+:py:class:`.TokenCache`, a bounded least-recently-used cache of the tokens of
+strings, keyed by each string and the configuration of the tokenizer. It can
+be passed to token-based distance measures with their ``token_cache``
+parameter, and reports its hits and misses with its ``cache_info`` method.
+
+A :py:class:`.Vocabulary` interns tokens, assigning each an integer ID, so
+that the tokens of a string can be stored compactly as a
+:py:class:`.TokenArrays` of sorted token IDs & counts, returned by each
+tokenizer's ``get_arrays`` method. Token-based distance measures given the
+same vocabulary with their ``vocabulary`` parameter can compare token arrays
+in place of strings, computing crisp intersections by merging the sorted
+arrays. Measures that read the strings themselves, such as
+:py:class:`abydos.distance.FellegiSunter` or
+:py:class:`abydos.distance.TFIDF`, do not take a vocabulary.
+
 .. _SyllabiPy: https://pypi.org/project/syllabipy/
 .. _NLTK: https://www.nltk.org/
 
@@ -101,8 +118,10 @@ from ._q_skipgrams import QSkipgrams
 from ._regexp import RegexpTokenizer
 from ._saps import SAPSTokenizer
 from ._sonoripy import SonoriPyTokenizer
+from ._token_cache import TokenCache
 from ._tokenizer import _Tokenizer
 from ._vc_cluster import VCClusterTokenizer
+from ._vocabulary import TokenArrays, Vocabulary
 from ._whitespace import WhitespaceTokenizer
 from ._wordpunct import WordpunctTokenizer
 
@@ -121,6 +140,9 @@ __all__ = [
     'SonoriPyTokenizer',
     'LegaliPyTokenizer',
     'NLTKTokenizer',
+    'TokenCache',
+    'Vocabulary',
+    'TokenArrays',
 ]
 
 
@@ -38,6 +38,8 @@ class QGrams(_Tokenizer):
     .. versionadded:: 0.1.0
     """
 
+    _tuple_attrs = ('qval', 'skip')
+
     def __init__(
         self,
         qval: Union[int, TIterable[int]] = 2,
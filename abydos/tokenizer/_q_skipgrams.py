@@ -39,6 +39,8 @@ class QSkipgrams(_Tokenizer):
     .. versionadded:: 0.4.0
     """
 
+    _tuple_attrs = ('qval',)
+
     def __init__(
         self,
         qval: Union[int, TIterable[int]] = 2,
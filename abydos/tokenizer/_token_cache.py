@@ -0,0 +1,260 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._token_cache.
+
+Token cache, a bounded LRU cache of the tokens of strings
+"""
+
+from collections import Counter, OrderedDict, namedtuple
+from typing import Any, Counter as TCounter, Dict, Tuple
+from weakref import WeakKeyDictionary
+
+from ._tokenizer import _Tokenizer
+
+__all__ = ['TokenCache']
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class TokenCache:
+    """Token cache.
+
+    A bounded, least-recently-used cache of the token Counters of strings,
+    keyed by each string and the configuration of the tokenizer that
+    tokenized it. A single cache may be shared by any number of tokenizers
+    and token measures: tokenizers of the same configuration share entries,
+    while those of different configurations do not.
+
+    The configuration of each tokenizer is read the first time the tokenizer
+    is used with the cache, so tokenizers should not be reconfigured once in
+    use.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize TokenCache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of token Counters to retain
+
+        Raises
+        ------
+        ValueError
+            maxsize must be a positive integer
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._maxsize = 0
+        self._entries = (
+            OrderedDict()
+        )  # type: OrderedDict[Tuple[Any, str], TCounter[str]]
+        # the configuration key of each tokenizer in use, held weakly, so that
+        # tokenizers that are no longer used are dropped
+        self._config_keys = (
+            WeakKeyDictionary()
+        )  # type: WeakKeyDictionary[_Tokenizer, Any]
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum number of token Counters retained.
+
+        Returns
+        -------
+        int
+            The maximum size of the cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        """Set the maximum number of token Counters retained.
+
+        If the cache holds more than maxsize entries, the least recently used
+        are discarded.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum size of the cache
+
+        Raises
+        ------
+        ValueError
+            maxsize must be a positive integer
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError('maxsize must be a positive integer.')
+        self._maxsize = maxsize
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the cache for pickling.
+
+        The configuration keys of the tokenizers in use are held by weak
+        references, which cannot be pickled, so they are dropped; they are
+        read again from each tokenizer used after unpickling.
+
+        Returns
+        -------
+        dict
+            The instance's attributes, without the tokenizers' keys
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_config_keys']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state of the cache after unpickling.
+
+        Parameters
+        ----------
+        state : dict
+            The instance's attributes, without the tokenizers' keys
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._config_keys = WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        """Return the number of token Counters in the cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._entries)
+
+    def get_counter(self, tokenizer: _Tokenizer, string: str) -> TCounter[str]:
+        """Return the tokens of a string as a Counter.
+
+        The tokens are retrieved from the cache if the string has been
+        tokenized by a tokenizer of the same configuration. Otherwise, the
+        string is tokenized by tokenizer and its tokens are cached.
+
+        Parameters
+        ----------
+        tokenizer : _Tokenizer
+            A tokenizer instance from the :py:mod:`abydos.tokenizer` package
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter
+            The tokens of string (a copy, which the caller may modify)
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import QGrams
+        >>> cache = TokenCache(maxsize=100)
+        >>> cache.get_counter(QGrams(), 'cat')
+        Counter({'$c': 1, 'ca': 1, 'at': 1, 't#': 1})
+        >>> cache.get_counter(QGrams(), 'cat')
+        Counter({'$c': 1, 'ca': 1, 'at': 1, 't#': 1})
+        >>> cache.get_counter(QGrams(qval=3), 'cat')
+        Counter({'$$c': 1, '$ca': 1, 'cat': 1, 'at#': 1, 't##': 1})
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=2, maxsize=100, currsize=2)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            config_key = self._config_keys[tokenizer]
+        except KeyError:
+            config_key = tokenizer._config_key()  # noqa: SF01
+            self._config_keys[tokenizer] = config_key
+        key = (config_key, string)
+        try:
+            counter = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            counter = tokenizer.tokenize(string).get_counter()
+            self._entries[key] = counter
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return Counter(counter)
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of the hits, misses, maxsize, and current size of
+            the cache
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import WhitespaceTokenizer
+        >>> cache = TokenCache(maxsize=2)
+        >>> tok = WhitespaceTokenizer()
+        >>> for string in ('a b', 'c d', 'a b', 'e f', 'c d'):
+        ...     _ = cache.get_counter(tok, string)
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=4, maxsize=2, currsize=2)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return CacheInfo(
+            self.hits, self.misses, self._maxsize, len(self._entries)
+        )
+
+    def clear(self) -> None:
+        """Empty the cache and reset its statistics.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._entries.clear()
+        self._config_keys.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
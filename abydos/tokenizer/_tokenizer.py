@@ -20,6 +20,7 @@ _Tokenizer base class
 """
 
 from collections import Counter, defaultdict
+from collections.abc import Iterable
 from math import exp, log1p, log2
 from typing import (
     Any,
@@ -29,10 +30,13 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
 
+from ._vocabulary import TokenArrays, Vocabulary
+
 __all__ = ['_Tokenizer']
 
 
@@ -42,6 +46,22 @@ class _Tokenizer:
     .. versionadded:: 0.4.0
     """
 
+    # Attributes holding the most recently tokenized string & its tokens,
+    # rather than the tokenizer's configuration
+    _state_attrs = frozenset(
+        (
+            '_tokens',
+            '_string',
+            '_string_ss',
+            '_ordered_tokens',
+            '_ordered_weights',
+        )
+    )
+
+    # Attributes that may be given as a single value, but which are converted
+    # to a tuple by tokenize
+    _tuple_attrs = ()  # type: Tuple[str, ...]
+
     def __init__(
         self,
         scaler: Optional[Union[str, Callable[[float], float]]] = None,
@@ -253,6 +273,72 @@ class _Tokenizer:
         """
         return self._ordered_tokens
 
+    def get_arrays(self, vocabulary: Vocabulary) -> TokenArrays:
+        """Return the tokens as sorted arrays of token IDs & counts.
+
+        Parameters
+        ----------
+        vocabulary : Vocabulary
+            The vocabulary assigning each token its ID, to which new tokens are
+            added
+
+        Returns
+        -------
+        TokenArrays
+            The sorted token IDs & the count of each token
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import Vocabulary
+        >>> vocab = Vocabulary(['term'])
+        >>> tok = _Tokenizer().tokenize('term')
+        >>> tok.get_arrays(vocab)
+        TokenArrays(ids=array([0], dtype=int32), counts=array([1]))
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return vocabulary.encode(self.get_counter())
+
+    def _config_key(self) -> Tuple[Any, ...]:
+        """Return a hashable key identifying the tokenizer's configuration.
+
+        Two tokenizers with equal keys produce the same tokens from any
+        string.
+
+        Returns
+        -------
+        tuple
+            The tokenizer's class and its configuration attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+
+        def _freeze(value: Any) -> Any:
+            if isinstance(value, (str, bytes)):
+                return value
+            if isinstance(value, dict):
+                return tuple(
+                    (key, _freeze(val)) for key, val in sorted(value.items())
+                )
+            if isinstance(value, (set, frozenset)):
+                return tuple(sorted(_freeze(val) for val in value))
+            if isinstance(value, (list, tuple, range)):
+                return tuple(_freeze(val) for val in value)
+            return value
+
+        key = [type(self)]  # type: List[Any]
+        for name, value in sorted(vars(self).items()):
+            if name in self._state_attrs:
+                continue
+            if name in self._tuple_attrs and not isinstance(value, Iterable):
+                value = (value,)
+            key.append((name, _freeze(value)))
+        return tuple(key)
+
     def __repr__(self) -> str:
         """Return representation of tokens object.
 
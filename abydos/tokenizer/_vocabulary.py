@@ -0,0 +1,308 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tokenizer._vocabulary.
+
+Vocabulary, interning tokens as integer IDs, and token arrays
+"""
+
+from collections import Counter, namedtuple
+from typing import (
+    Any,
+    Counter as TCounter,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+)
+
+import numpy as np
+
+__all__ = ['TokenArrays', 'Vocabulary']
+
+
+class TokenArrays(namedtuple('TokenArrays', ['ids', 'counts'])):
+    """Token arrays.
+
+    The tokens of a string, as a pair of NumPy arrays: the token IDs assigned
+    by a :py:class:`Vocabulary`, sorted in ascending order, and the count of
+    each token.
+
+    Token arrays are equal if their IDs and counts are equal, and are false
+    if they hold no tokens, so they can be compared by token measures in
+    place of strings.
+
+    .. versionadded:: 0.6.0
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        """Return whether two token arrays hold the same tokens & counts.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(other, TokenArrays):
+            return False
+        return bool(
+            np.array_equal(self.ids, other.ids)
+            and np.array_equal(self.counts, other.counts)
+        )
+
+    def __ne__(self, other: Any) -> bool:
+        """Return whether two token arrays differ.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return not self == other
+
+    def __hash__(self) -> int:
+        """Return the hash of the token arrays.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return hash((self.ids.tobytes(), self.counts.tobytes()))
+
+    def __bool__(self) -> bool:
+        """Return whether the token arrays hold any tokens.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return bool(len(self.ids))
+
+
+class Vocabulary:
+    """Vocabulary.
+
+    A vocabulary interns tokens, assigning each distinct token an integer ID
+    (in the order in which tokens are first seen), so that the tokens of
+    strings can be stored as compact NumPy arrays of int32 IDs & counts. A
+    single vocabulary should be shared by all the strings to be compared.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, tokens: Optional[Iterable[str]] = None) -> None:
+        """Initialize Vocabulary.
+
+        Parameters
+        ----------
+        tokens : iterable of str
+            Tokens to add to the vocabulary initially
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._ids = {}  # type: Dict[str, int]
+        self._tokens = []  # type: List[str]
+        if tokens is not None:
+            for token in tokens:
+                self.add(token)
+
+    def __len__(self) -> int:
+        """Return the number of tokens in the vocabulary.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._tokens)
+
+    def __contains__(self, token: str) -> bool:
+        """Return whether a token is in the vocabulary.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return token in self._ids
+
+    def add(self, token: str) -> int:
+        """Add a token to the vocabulary and return its ID.
+
+        Parameters
+        ----------
+        token : str
+            The token to add
+
+        Returns
+        -------
+        int
+            The ID of the token
+
+        Raises
+        ------
+        ValueError
+            The vocabulary is full
+
+        Examples
+        --------
+        >>> vocab = Vocabulary()
+        >>> vocab.add('ab')
+        0
+        >>> vocab.add('bc')
+        1
+        >>> vocab.add('ab')
+        0
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            return self._ids[token]
+        except KeyError:
+            token_id = len(self._tokens)
+            if token_id > 0x7FFFFFFF:
+                raise ValueError(
+                    'The vocabulary is full; token IDs must fit in int32.'
+                )
+            self._ids[token] = token_id
+            self._tokens.append(token)
+            return token_id
+
+    def get_id(self, token: str) -> int:
+        """Return the ID of a token.
+
+        Parameters
+        ----------
+        token : str
+            A token in the vocabulary
+
+        Returns
+        -------
+        int
+            The ID of the token
+
+        Raises
+        ------
+        KeyError
+            The token is not in the vocabulary
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._ids[token]
+
+    def get_token(self, token_id: int) -> str:
+        """Return the token with an ID.
+
+        Parameters
+        ----------
+        token_id : int
+            A token ID
+
+        Returns
+        -------
+        str
+            The token
+
+        Raises
+        ------
+        IndexError
+            The ID is not in the vocabulary
+
+        .. versionadded:: 0.6.0
+
+        """
+        if token_id < 0:
+            raise IndexError('Token IDs are non-negative.')
+        return self._tokens[token_id]
+
+    def encode(self, tokens: Mapping[str, float]) -> TokenArrays:
+        """Return the token arrays of a Counter of tokens.
+
+        Tokens not in the vocabulary are added to it.
+
+        Parameters
+        ----------
+        tokens : Counter
+            A Counter (or other mapping) of tokens, such as one returned by a
+            tokenizer's get_counter method
+
+        Returns
+        -------
+        TokenArrays
+            The sorted token IDs (as int32) & the count of each token (as
+            int64, or as float64 if any count is not an int)
+
+        Examples
+        --------
+        >>> vocab = Vocabulary()
+        >>> vocab.encode(Counter({'ab': 2, 'bc': 1}))
+        TokenArrays(ids=array([0, 1], dtype=int32), counts=array([2, 1]))
+        >>> vocab.encode(Counter({'cd': 1, 'ab': 1}))
+        TokenArrays(ids=array([0, 2], dtype=int32), counts=array([1, 1]))
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        add = self.add
+        ids = np.fromiter(
+            (add(token) for token in tokens),
+            dtype=np.int32,
+            count=len(tokens),
+        )
+        values = list(tokens.values())
+        if all(type(val) is int for val in values):
+            counts = np.array(values, dtype=np.int64)
+        else:
+            counts = np.array(values, dtype=np.float_)
+        order = np.argsort(ids, kind='stable')
+        return TokenArrays(ids[order], counts[order])
+
+    def decode(self, arrays: TokenArrays) -> TCounter[str]:
+        """Return the Counter of tokens of token arrays.
+
+        Parameters
+        ----------
+        arrays : TokenArrays
+            The token arrays (or a pair of token ID & count arrays)
+
+        Returns
+        -------
+        Counter
+            The tokens & their counts
+
+        Examples
+        --------
+        >>> vocab = Vocabulary()
+        >>> vocab.decode(vocab.encode(Counter({'bc': 2, 'ab': 1})))
+        Counter({'bc': 2, 'ab': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ids, counts = arrays
+        tokens = self._tokens
+        return Counter(
+            {
+                tokens[token_id]: count
+                for token_id, count in zip(ids.tolist(), counts.tolist())
+            }
+        )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -62,6 +62,54 @@ class DistanceTestCases(unittest.TestCase):
             self.dice.dist_abs('Niall', 'Nigel'),
         )
 
+    def test_sim_many(self):
+        """Test abydos.distance._Distance.sim_many."""
+        targets = ['Nigel', 'Neil', '']
+        self.assertEqual(
+            list(self.dice.sim_many('Niall', targets)),
+            [self.dice.sim('Niall', tar) for tar in targets],
+        )
+        self.assertEqual(len(self.dice.sim_many('Niall', [])), 0)
+
+    def test_dist_many(self):
+        """Test abydos.distance._Distance.dist_many."""
+        targets = ['Nigel', 'Neil', '']
+        self.assertEqual(
+            list(self.dice.dist_many('Niall', iter(targets))),
+            [self.dice.dist('Niall', tar) for tar in targets],
+        )
+
+    def test_dist_abs_many(self):
+        """Test abydos.distance._Distance.dist_abs_many."""
+        targets = ['Nigel', 'Neil', '']
+        self.assertEqual(
+            list(self.dice.dist_abs_many('Niall', targets)),
+            [self.dice.dist_abs('Niall', tar) for tar in targets],
+        )
+
+    def test_sim_cross(self):
+        """Test abydos.distance._Distance.sim_cross."""
+        srcs = ['Niall', 'Nigel']
+        targets = ['Nigel', 'Neil', '']
+        sims = self.lev.sim_cross(iter(srcs), iter(targets))
+        self.assertEqual(sims.shape, (2, 3))
+        for i, src in enumerate(srcs):
+            self.assertEqual(
+                list(sims[i]), [self.lev.sim(src, tar) for tar in targets]
+            )
+        self.assertEqual(self.lev.sim_cross([], targets).shape, (0, 3))
+
+    def test_dist_cross(self):
+        """Test abydos.distance._Distance.dist_cross."""
+        srcs = ['Niall', 'Nigel']
+        targets = ['Nigel', 'Neil', '']
+        dists = self.lev.dist_cross(srcs, targets)
+        for i, src in enumerate(srcs):
+            self.assertEqual(
+                list(dists[i]), [self.lev.dist(src, tar) for tar in targets]
+            )
+        self.assertEqual(self.lev.dist_cross(srcs, []).shape, (2, 0))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,23 +19,51 @@
 This module contains unit tests for abydos.distance._TokenDistance
 """
 
+import pickle  # noqa: S403
 import unittest
 from collections import Counter
+from inspect import getmembers, isclass
+from itertools import permutations
+from math import isnan
 
+import numpy as np
+
+import abydos.distance
 from abydos.distance import (
     AverageLinkage,
+    Cosine,
     DamerauLevenshtein,
+    Dice,
+    FellegiSunter,
     Jaccard,
     JaroWinkler,
+    Levenshtein,
+    Overlap,
     SokalMichener,
+    TFIDF,
+    Tversky,
+)
+from abydos.distance._csr_matrix import _CSRMatrix
+from abydos.distance._linear_assignment import (
+    _linear_assignment,
+    _sparse_linear_assignment,
 )
+from abydos.distance._token_distance import _TokenDistance
 from abydos.stats import ConfusionTable
 from abydos.tokenizer import (
     CharacterTokenizer,
     QSkipgrams,
+    QGrams,
+    TokenCache,
+    Vocabulary,
     WhitespaceTokenizer,
 )
 
+try:
+    import scipy
+except ImportError:  # pragma: no cover
+    scipy = None
+
 
 class TokenDistanceTestCases(unittest.TestCase):
     """Test _TokenDistance functions.
@@ -433,6 +461,611 @@ class TokenDistanceTestCases(unittest.TestCase):
             Counter({'#': 0.5, 'e#': -1, 'e': -0.5}),
         )
 
+    def test_token_distance_many(self):
+        """Test abydos.distance._TokenDistance.*_many."""
+        targets = ['', 'synonym', 'antonym', 'anonymous', 'synonymy']
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            self.cmp_j_fuzzy,
+            SokalMichener(),
+            AverageLinkage(),
+        ):
+            for src in ('', 'synonym'):
+                self.assertEqual(
+                    list(cmp.sim_many(src, targets)),
+                    [cmp.sim(src, tar) for tar in targets],
+                )
+                self.assertEqual(
+                    list(cmp.dist_many(src, targets)),
+                    [cmp.dist(src, tar) for tar in targets],
+                )
+                self.assertEqual(
+                    list(cmp.dist_abs_many(src, targets)),
+                    [cmp.dist_abs(src, tar) for tar in targets],
+                )
+                self.assertIsNone(cmp._src_memo)  # noqa: SF01
+
+    def test_token_distance_pickle(self):
+        """Test abydos.distance._TokenDistance.__getstate__."""
+        for cmp in (self.cmp_j_crisp, self.cmp_j_soft, self.cmp_j_fuzzy):
+            sim = cmp.sim('synonym', 'antonym')
+            clone = pickle.loads(pickle.dumps(cmp))  # noqa: S301
+            self.assertEqual(clone._src_tokens, Counter())  # noqa: SF01
+            self.assertEqual(clone._tar_tokens, Counter())  # noqa: SF01
+            self.assertEqual(clone.sim('synonym', 'antonym'), sim)
+            self.assertEqual(cmp._src_tokens['sy'], 1)  # noqa: SF01
+
+            method = pickle.loads(pickle.dumps(cmp.sim))  # noqa: S301
+            self.assertEqual(method('synonym', 'antonym'), sim)
+
+    def test_token_distance_cards(self):
+        """Test abydos.distance._TokenDistance cardinality computation."""
+        pairs = [
+            (Counter(), Counter()),
+            (Counter({'ab': 2, 'bc': 1}), Counter()),
+            (Counter(), Counter({'ab': 2, 'bc': 1})),
+            (
+                Counter({'ab': 2, 'bc': 1.5, 'cd': 0.25, 'de': -1, 'ef': 0}),
+                Counter({'ab': 1, 'bc': 2.75, 'de': 2, 'fg': 0.5, 'gh': -2}),
+            ),
+            (
+                Counter({'abc': 3, 'abd': 1, 'bcd': 2}),
+                Counter({'abd': 2, 'bce': 1, 'bcd': 2, 'xyz': 1}),
+            ),
+        ]
+        for intersection_type in ('crisp', 'fuzzy', 'linkage'):
+            cmp = Jaccard(intersection_type=intersection_type)
+            for src, tar in pairs:
+                if intersection_type == 'linkage' and not (src and tar):
+                    # group linkage requires tokens on each side
+                    continue
+                cmp._tokenize(src, tar)  # noqa: SF01
+                intersection = cmp._intersection()  # noqa: SF01
+                src_only = src - intersection
+                tar_only = tar - intersection
+                union = (src + tar) - intersection
+                if intersection_type != 'crisp':
+                    extra = intersection - (src & tar)
+                    src_only -= extra
+                    tar_only -= extra
+                    union -= extra
+                for card, tokens in (
+                    (cmp._intersection_card(), intersection),  # noqa: SF01
+                    (cmp._src_only_card(), src_only),  # noqa: SF01
+                    (cmp._tar_only_card(), tar_only),  # noqa: SF01
+                    (cmp._union_card(), union),  # noqa: SF01
+                    (
+                        cmp._symmetric_difference_card(),  # noqa: SF01
+                        src_only + tar_only,
+                    ),
+                    (cmp._total_card(), src + tar),  # noqa: SF01
+                ):
+                    self.assertEqual(
+                        repr(card),
+                        repr(sum(abs(val) for val in tokens.values())),
+                    )
+
+        # Cached cardinalities are reset by the next tokenization
+        cmp = Jaccard()
+        cmp._tokenize('nelson', 'neilsen')  # noqa: SF01
+        self.assertEqual(cmp._intersection_card(), 4)  # noqa: SF01
+        cmp._tokenize('nelson', 'nelson')  # noqa: SF01
+        self.assertEqual(cmp._intersection_card(), 7)  # noqa: SF01
+        self.assertEqual(cmp._src_only_card(), 0)  # noqa: SF01
+
+    def test_token_distance_token_cache(self):
+        """Test abydos.distance._TokenDistance with a token cache."""
+        cache = TokenCache(maxsize=16)
+        cmp = Jaccard(token_cache=cache)
+        ref = Jaccard()
+        pairs = [
+            ('nelson', 'neilsen'),
+            ('nelson', 'nelsen'),
+            ('niall', 'neil'),
+            ('nelson', 'neilsen'),
+        ]
+        for src, tar in pairs:
+            self.assertEqual(cmp.sim(src, tar), ref.sim(src, tar))
+        self.assertEqual(cache.cache_info(), (3, 5, 16, 5))
+        self.assertEqual(
+            list(cmp.sim_many('nelson', ['neilsen', 'niall'])),
+            list(ref.sim_many('nelson', ['neilsen', 'niall'])),
+        )
+
+        # Measures with tokenizers of another configuration share the cache,
+        # but not its entries
+        cmp3 = Jaccard(qval=3, token_cache=cache)
+        self.assertEqual(
+            cmp3.sim('nelson', 'neilsen'),
+            Jaccard(qval=3).sim('nelson', 'neilsen'),
+        )
+        self.assertEqual(cache.misses, 7)
+
+        # The cached tokens are not changed by changes to those returned
+        cmp._tokenize('nelson', 'neilsen')  # noqa: SF01
+        cmp._src_tokens['$n'] += 10  # noqa: SF01
+        self.assertEqual(
+            cmp.sim('nelson', 'neilsen'), ref.sim('nelson', 'neilsen')
+        )
+
+        # The cache is pickled with the measure
+        cmp = pickle.loads(pickle.dumps(cmp))  # noqa: S301
+        hits = cmp.params['token_cache'].hits
+        self.assertEqual(
+            cmp.sim('nelson', 'neilsen'), ref.sim('nelson', 'neilsen')
+        )
+        self.assertEqual(cmp.params['token_cache'].hits, hits + 2)
+
+    def test_token_distance_vocabulary(self):
+        """Test abydos.distance._TokenDistance with token arrays."""
+        vocab = Vocabulary()
+        tok = QGrams()
+        strings = ['', 'nelson', 'neilsen', 'nelsen', 'niall', 'neil']
+        arrays = [tok.tokenize(s).get_arrays(vocab) for s in strings]
+        for kwargs in (
+            {},
+            {'alphabet': 30},
+            {'alphabet': Counter({'$n': 1, 'ne': 2, 'xx': 1})},
+            {'normalizer': 'proportional'},
+            {'intersection_type': 'fuzzy'},
+            {'intersection_type': 'soft'},
+        ):
+            ref = Jaccard(**kwargs)
+            cmp = Jaccard(vocabulary=vocab, **kwargs)
+            conf = SokalMichener(**kwargs)
+            conf_cmp = SokalMichener(vocabulary=vocab, **kwargs)
+            for i, src in enumerate(strings):
+                for j, tar in enumerate(strings):
+                    self.assertAlmostEqual(
+                        cmp.sim(arrays[i], arrays[j]), ref.sim(src, tar)
+                    )
+                    if src != tar:
+                        self.assertAlmostEqual(
+                            cmp.sim(src, arrays[j]), ref.sim(src, tar)
+                        )
+                    self.assertAlmostEqual(
+                        conf_cmp.sim(arrays[i], arrays[j]), conf.sim(src, tar),
+                    )
+
+        # Tokens of token arrays are decoded as needed
+        cmp = Jaccard(vocabulary=vocab)
+        cmp._tokenize(arrays[1], arrays[2])  # noqa: SF01
+        self.assertEqual(cmp._intersection_card(), 4)  # noqa: SF01
+        self.assertEqual(
+            cmp._get_tokens(),  # noqa: SF01
+            (
+                tok.tokenize('nelson').get_counter(),
+                tok.tokenize('neilsen').get_counter(),
+            ),
+        )
+        self.assertEqual(
+            cmp._intersection(),  # noqa: SF01
+            Counter({'$n': 1, 'ne': 1, 'ls': 1, 'n#': 1}),
+        )
+
+        cmp = pickle.loads(pickle.dumps(cmp))  # noqa: S301
+        self.assertIsNone(cmp._src_arrays)  # noqa: SF01
+        self.assertEqual(
+            cmp.sim(arrays[1], arrays[2]), Jaccard().sim('nelson', 'neilsen')
+        )
+
+        with self.assertRaises(ValueError):
+            Jaccard().sim(arrays[1], arrays[2])
+
+    def test_token_distance_vocabulary_measures(self):
+        """Test every token measure with token arrays."""
+        vocab = Vocabulary()
+        pairs = (
+            ('cat', 'hate'),
+            ('nelson', 'neilsen'),
+            ('', 'abc'),
+            ('aluminum', 'Catalan'),
+            ('abc', 'abc'),
+        )
+        measures = [
+            cls
+            for name, cls in getmembers(abydos.distance, isclass)
+            if issubclass(cls, _TokenDistance) and not name.startswith('_')
+        ]
+        self.assertGreater(len(measures), 100)
+        for cls in measures:
+            if cls._compares_strings:  # noqa: SF01
+                with self.assertRaises(ValueError):
+                    cls(vocabulary=vocab)
+                continue
+            ref = cls()
+            cmp = cls(vocabulary=vocab)
+            tokenizer = ref.params['tokenizer']
+            for src, tar in pairs:
+                src_arrays = tokenizer.tokenize(src).get_arrays(vocab)
+                tar_arrays = tokenizer.tokenize(tar).get_arrays(vocab)
+                try:
+                    expected = ref.sim(src, tar)
+                except NotImplementedError:
+                    with self.assertRaises(NotImplementedError):
+                        cmp.sim(src_arrays, tar_arrays)
+                    continue
+                result = cmp.sim(src_arrays, tar_arrays)
+                if isnan(expected):
+                    self.assertTrue(isnan(result), cls.__name__)
+                else:
+                    self.assertAlmostEqual(result, expected, msg=cls.__name__)
+
+        # Measures reading the strings compared reject a vocabulary
+        self.assertFalse(Jaccard._compares_strings)  # noqa: SF01
+        for cls in (AverageLinkage, FellegiSunter, TFIDF):
+            with self.assertRaises(ValueError):
+                cls(vocabulary=vocab)
+
+    def test_token_distance_soft_intersection(self):
+        """Test abydos.distance._TokenDistance soft intersection pairing."""
+        src = 'the quick brown fox jumps over the lazy dog'
+        tar = 'a quick browne fax jumped over lazy dogs'
+        cmp = Jaccard(
+            intersection_type='soft', tokenizer=WhitespaceTokenizer()
+        )
+        self.assertEqual(cmp.sim(src, tar), 0.5634920634920635)
+        self.assertEqual(cmp.sim(tar, src), 0.5634920634920635)
+        self.assertEqual(
+            Dice(
+                intersection_type='soft', tokenizer=WhitespaceTokenizer()
+            ).sim(src, tar),
+            0.7208121827411168,
+        )
+
+        # The aligned tokens of the pairs taken are cached
+        self.assertEqual(
+            cmp._soft_alignments[('fox', 'fax')],  # noqa: SF01
+            ('o', 1 / 3, 'a', 1 / 3, 'f-x', 2 / 3),
+        )
+        self.assertEqual(len(cmp._soft_alignments), 8)  # noqa: SF01
+        cmp._soft_alignments_size = 8  # noqa: SF01
+        self.assertEqual(cmp.sim(src, 'quick brown fix'), 0.2857142857142857)
+        self.assertEqual(len(cmp._soft_alignments), 1)  # noqa: SF01
+        cmp = pickle.loads(pickle.dumps(cmp))  # noqa: S301
+        self.assertEqual(cmp._soft_alignments, {})  # noqa: SF01
+
+        # Ties are broken by the sorted order of the tokens
+        cmp = Jaccard(
+            intersection_type='soft', tokenizer=WhitespaceTokenizer()
+        )
+        self.assertEqual(cmp.sim('ab', 'ac ad'), cmp.sim('ab', 'ad ac'))
+        cmp.sim('ab', 'ad ac')
+        self.assertEqual(
+            list(cmp._soft_alignments), [('ab', 'ac')]  # noqa: SF01
+        )
+
+    def test_token_distance_fuzzy_intersection(self):
+        """Test abydos.distance._TokenDistance fuzzy intersection bounds."""
+        src = 'the quick brown fox jumps over the lazy dog'
+        tar = 'a quick browne fax jumped over lazy dogs'
+        docs = [src, tar, 'quick brown fix', 'ab ba abc cab', 'abcd bacd']
+        for threshold in (0.0, 0.3, 0.5, 0.75, 0.8, 1.0):
+            for metric, equivalent in (
+                (Levenshtein(), Levenshtein(normalizer=lambda x: max(x))),
+                (
+                    Levenshtein(mode='osa'),
+                    Levenshtein(mode='osa', normalizer=lambda x: max(x)),
+                ),
+                (
+                    DamerauLevenshtein(),
+                    DamerauLevenshtein(normalizer=lambda x: max(x)),
+                ),
+            ):
+                cmp = Jaccard(
+                    intersection_type='fuzzy',
+                    tokenizer=WhitespaceTokenizer(),
+                    metric=metric,
+                    threshold=threshold,
+                )
+                self.assertTrue(cmp._fuzzy_bounded())  # noqa: SF01
+                # An equivalent metric, to which the bounds are not applied
+                unbounded = Jaccard(
+                    intersection_type='fuzzy',
+                    tokenizer=WhitespaceTokenizer(),
+                    metric=equivalent,
+                    threshold=threshold,
+                )
+                self.assertFalse(unbounded._fuzzy_bounded())  # noqa: SF01
+                for doc1 in docs:
+                    for doc2 in docs:
+                        self.assertEqual(
+                            cmp.sim(doc1, doc2), unbounded.sim(doc1, doc2)
+                        )
+
+        # Pairs beyond the bounds are not compared, and so not cached
+        cmp = Jaccard(
+            intersection_type='fuzzy', tokenizer=WhitespaceTokenizer()
+        )
+        self.assertEqual(cmp.sim(src, tar), 0.2911392405063291)
+        self.assertEqual(
+            cmp._fuzzy_sims,  # noqa: SF01
+            {('brown', 'browne'): 0.8333333333333334},
+        )
+        self.assertFalse(
+            Jaccard(
+                intersection_type='fuzzy',
+                metric=Levenshtein(mode='osa', cost=(1, 1, 1, 0.5)),
+            )._fuzzy_bounded()  # noqa: SF01
+        )
+        self.assertFalse(
+            Jaccard(
+                intersection_type='fuzzy',
+                metric=Levenshtein(cost=(1, 1, 2, 1)),
+            )._fuzzy_bounded()  # noqa: SF01
+        )
+        self.assertFalse(
+            Jaccard(
+                intersection_type='fuzzy', metric=JaroWinkler()
+            )._fuzzy_bounded()  # noqa: SF01
+        )
+
+        # Cached similarities are reused, and the cache is bounded
+        cmp._fuzzy_sims[('brown', 'browne')] = 1.0  # noqa: SF01
+        self.assertEqual(cmp.sim(src, tar), 0.3076923076923077)
+        cmp._fuzzy_sims_size = 1  # noqa: SF01
+        cmp.sim('jumped', 'jumper')
+        self.assertEqual(
+            cmp._fuzzy_sims,  # noqa: SF01
+            {('jumped', 'jumper'): 0.8333333333333334},
+        )
+        cmp = pickle.loads(pickle.dumps(cmp))  # noqa: S301
+        self.assertEqual(cmp._fuzzy_sims, {})  # noqa: SF01
+
+    def test_token_distance_linkage_assignment(self):
+        """Test abydos.distance._TokenDistance linkage assignment methods."""
+        src = 'the quick brown fox jumps over the lazy dog'
+        tar = 'a quick browne fax jumped over lazy dogs'
+        for kwargs in (
+            {},
+            {'threshold': 0.5, 'metric': Levenshtein()},
+            {'tokenizer': QSkipgrams(qval=2)},
+        ):
+            kwargs.setdefault('tokenizer', WhitespaceTokenizer())
+            munkres = Jaccard(intersection_type='linkage', **kwargs)
+            jv = Jaccard(
+                intersection_type='linkage', assignment='jv', **kwargs
+            )
+            sparse = Jaccard(
+                intersection_type='linkage', assignment='sparse', **kwargs
+            )
+            for doc1, doc2 in ((src, tar), (tar, src), ('fox', src)):
+                self.assertAlmostEqual(
+                    jv.sim(doc1, doc2), munkres.sim(doc1, doc2)
+                )
+                self.assertAlmostEqual(
+                    sparse.sim(doc1, doc2), munkres.sim(doc1, doc2)
+                )
+
+        # The sparse method maximizes the weight of the pairs that meet the
+        # threshold
+        jv = Jaccard(
+            intersection_type='linkage',
+            tokenizer=WhitespaceTokenizer(),
+            metric=Levenshtein(),
+            threshold=0.6,
+            assignment='jv',
+        )
+        sparse = Jaccard(
+            intersection_type='linkage',
+            tokenizer=WhitespaceTokenizer(),
+            metric=Levenshtein(),
+            threshold=0.6,
+            assignment='sparse',
+        )
+        self.assertEqual(jv.sim('cabc bba', 'ccb babcc'), 0.0)
+        self.assertEqual(
+            sparse.sim('cabc bba', 'ccb babcc'), 0.17647058823529413
+        )
+
+        # Empty token sets
+        self.assertEqual(jv.sim('abc', 'abc'), 1.0)
+        jv._tokenize('abc', 'abc')  # noqa: SF01
+        self.assertEqual(jv._intersection(), Counter({'abc': 1}))  # noqa: SF01
+
+        # Unknown assignment methods are rejected
+        for assignment in ('hungarian', 'JV', None):
+            with self.assertRaises(ValueError):
+                Jaccard(intersection_type='linkage', assignment=assignment)
+
+    def test_linear_assignment(self):
+        """Test abydos.distance._linear_assignment."""
+        rng = np.random.RandomState(0)
+        for _ in range(100):
+            n_rows, n_cols = (int(size) for size in rng.randint(1, 6, 2))
+            cost = rng.randint(0, 4, (n_rows, n_cols)).astype(float)
+            pairs = _linear_assignment(cost)
+            self.assertEqual(len(pairs), min(n_rows, n_cols))
+            self.assertEqual(len({row for row, _ in pairs}), len(pairs))
+            self.assertEqual(len({col for _, col in pairs}), len(pairs))
+            if n_rows > n_cols:
+                best = min(
+                    sum(cost[row, col] for col, row in enumerate(perm))
+                    for perm in permutations(range(n_rows), n_cols)
+                )
+            else:
+                best = min(
+                    sum(cost[row, col] for row, col in enumerate(perm))
+                    for perm in permutations(range(n_cols), n_rows)
+                )
+            self.assertAlmostEqual(
+                sum(cost[row, col] for row, col in pairs), best
+            )
+        self.assertEqual(_linear_assignment(np.zeros((0, 3))), [])
+
+        weights = np.array([[0.9, 0.1, 0.0], [0.1, 0.0, 0.0], [0.0, 0.0, 0.7]])
+        self.assertEqual(
+            _sparse_linear_assignment(weights, weights >= 0.5),
+            [(0, 0), (2, 2)],
+        )
+        self.assertEqual(
+            _sparse_linear_assignment(weights, weights >= 0.05),
+            [(0, 0), (2, 2)],
+        )
+        self.assertEqual(_sparse_linear_assignment(weights, weights > 1.0), [])
+
+    def test_token_distance_sim_cross(self):
+        """Test abydos.distance._TokenDistance.sim_cross & dist_cross."""
+        srcs = ['Niall', 'Neil', 'Nigel', 'aaaa', '', 'abc', 'abc ']
+        targets = ['Neal', 'Niall', 'aa', 'aaa', '', 'cba', ' ']
+        for cmp in (
+            Jaccard(),
+            Dice(),
+            Tversky(alpha=0.3, beta=0.9),
+            Tversky(alpha=0.2, beta=2.0, bias=0.5),
+            Cosine(),
+            Overlap(),
+            Cosine(tokenizer=WhitespaceTokenizer()),
+            Jaccard(tokenizer=QGrams(qval=2, scaler='log')),
+            Jaccard(intersection_type='soft'),
+            Jaccard(normalizer='proportional'),
+            SokalMichener(),
+        ):
+            self.assertEqual(
+                cmp.sim_cross(srcs, targets).tolist(),
+                [[cmp.sim(src, tar) for tar in targets] for src in srcs],
+            )
+            self.assertEqual(
+                cmp.dist_cross(iter(srcs), iter(targets)).tolist(),
+                [[cmp.dist(src, tar) for tar in targets] for src in srcs],
+            )
+
+        self.assertTrue(Jaccard()._has_sim_formula())  # noqa: SF01
+        self.assertFalse(SokalMichener()._has_sim_formula())  # noqa: SF01
+        self.assertFalse(
+            Jaccard(intersection_type='fuzzy')._has_sim_formula()  # noqa: SF01
+        )
+        with self.assertRaises(NotImplementedError):
+            SokalMichener()._sim_formula(  # noqa: SF01
+                np.zeros((1, 1)), np.zeros((1, 1)), np.zeros((1, 1))
+            )
+        with self.assertRaises(ValueError):
+            Tversky(alpha=-1.0).sim_cross(['cat'], ['hat'])
+        self.assertEqual(Jaccard().sim_cross([], targets).shape, (0, 7))
+        self.assertEqual(Jaccard().sim_cross(srcs, []).shape, (7, 0))
+
+        # Counters & token arrays
+        vocab = Vocabulary()
+        cmp = Jaccard(vocabulary=vocab)
+        qgrams = QGrams(start_stop='$#', skip=0, scaler=None)
+        counters = [qgrams.tokenize(src).get_counter() for src in srcs]
+        arrays = [vocab.encode(counter) for counter in counters]
+        self.assertEqual(
+            cmp.sim_cross(counters, targets).tolist(),
+            [[cmp.sim(src, tar) for tar in targets] for src in counters],
+        )
+        self.assertEqual(
+            cmp.sim_cross(arrays, targets).tolist(),
+            [[cmp.sim(src, tar) for tar in targets] for src in arrays],
+        )
+        self.assertEqual(
+            cmp.sim_cross(arrays, arrays).tolist(),
+            [[cmp.sim(src, tar) for tar in arrays] for src in arrays],
+        )
+        with self.assertRaises(ValueError):
+            Jaccard().sim_cross(arrays, targets)
+
+        # Negative counts are compared pairwise
+        negative = [Counter({'ab': 2, 'bc': -1}), Counter({'ab': 1})]
+        self.assertEqual(
+            Jaccard().sim_cross(negative, negative).tolist(),
+            [
+                [Jaccard().sim(src, tar) for tar in negative]
+                for src in negative
+            ],
+        )
+
+    def test_csr_matrix(self):
+        """Test abydos.distance._CSRMatrix."""
+        vocab = Vocabulary()
+        qgrams = QGrams()
+        rng = np.random.RandomState(0)
+        words = [
+            ''.join(rng.choice(list('abcd'), rng.randint(0, 8)))
+            for _ in range(40)
+        ]
+        arrays = [
+            vocab.encode(qgrams.tokenize(w).get_counter()) for w in words
+        ]
+        matrix = _CSRMatrix.from_token_arrays(arrays, len(vocab))
+        dense = matrix.toarray()
+        self.assertEqual(dense.shape, (40, len(vocab)))
+        self.assertEqual(
+            matrix.transpose().toarray().tolist(), dense.T.tolist()
+        )
+        self.assertEqual(
+            matrix.row_sums().tolist(), dense.sum(axis=1).tolist()
+        )
+
+        expected = np.minimum(dense[:, np.newaxis, :], dense[np.newaxis, :, :])
+        expected = expected.sum(axis=2)
+        self.assertEqual(
+            matrix.min_product(matrix).tolist(), expected.tolist()
+        )
+        # Expanded in blocks of rows
+        matrix._block_cells = 7  # noqa: SF01
+        self.assertEqual(
+            matrix.min_product(matrix).tolist(), expected.tolist()
+        )
+
+        empty = _CSRMatrix.from_token_arrays([], len(vocab))
+        self.assertEqual(empty.min_product(matrix).shape, (0, 40))
+        self.assertEqual(matrix.min_product(empty).shape, (40, 0))
+
+    @unittest.skipUnless(scipy, 'SciPy is not installed')
+    def test_csr_matrix_scipy(self):
+        """Test abydos.distance._CSRMatrix's products by SciPy."""
+        rng = np.random.RandomState(0)
+        vocab = Vocabulary('t{}'.format(i) for i in range(30))
+        arrays = []
+        for _ in range(50):
+            counts = rng.randint(0, 9, 30) * (rng.rand(30) < 0.3)
+            arrays.append(
+                vocab.encode(
+                    {
+                        't{}'.format(i): int(count)
+                        for i, count in enumerate(counts)
+                        if count
+                    }
+                )
+            )
+        src = _CSRMatrix.from_token_arrays(arrays[:20], len(vocab))
+        tar = _CSRMatrix.from_token_arrays(arrays[20:], len(vocab))
+        self.assertEqual(
+            max(src._max_count(), tar._max_count()), 8  # noqa: SF01
+        )
+
+        expected = src._scipy_min_product(tar)  # noqa: SF01
+        src._scipy_max_count = 0  # noqa: SF01
+        numpy_product = src.min_product(tar)
+        self.assertEqual(expected.tolist(), numpy_product.tolist())
+        del src._scipy_max_count  # noqa: SF01
+        self.assertEqual(src.min_product(tar).tolist(), expected.tolist())
+
+        dense_src, dense_tar = src.toarray(), tar.toarray()
+        self.assertEqual(
+            expected.tolist(),
+            np.minimum(dense_src[:, np.newaxis, :], dense_tar[np.newaxis])
+            .sum(axis=2)
+            .tolist(),
+        )
+
+        # Counts above _scipy_max_count are left to NumPy
+        src.data[0] = 9
+        self.assertEqual(
+            src.min_product(tar)[0].tolist(),
+            np.minimum(src.toarray()[0], dense_tar).sum(axis=1).tolist(),
+        )
+
+        # The batch path of token measures agrees with the scalar method
+        words = ['nelson', 'neilsen', 'nelsen', 'niall', 'neil', 'aaaa']
+        cmp = Jaccard()
+        self.assertEqual(
+            cmp.sim_cross(words, words).tolist(),
+            [[cmp.sim(src, tar) for tar in words] for src in words],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
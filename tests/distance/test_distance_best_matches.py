@@ -0,0 +1,248 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_best_matches.
+
+This module contains unit tests for abydos.distance.best_matches
+"""
+
+import unittest
+
+from abydos.distance import (
+    Cosine,
+    DamerauLevenshtein,
+    Dice,
+    Gotoh,
+    Hamming,
+    Indel,
+    Jaccard,
+    JaroWinkler,
+    Levenshtein,
+    NeedlemanWunsch,
+    Overlap,
+    SmithWaterman,
+    Tversky,
+    best_matches,
+)
+from abydos.distance._best_matches import _upper_bounds
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
+
+
+class BestMatchesTestCases(unittest.TestCase):
+    """Test best_matches functions.
+
+    abydos.distance.best_matches
+    """
+
+    choices = [
+        'Niall',
+        'Neil',
+        'Nigel',
+        'Neal',
+        'Nils',
+        'Neill',
+        'Nelson',
+        'Neilsen',
+        'Nielsen',
+        'Nial',
+        'Niel',
+        'Noel',
+        'Nell',
+        'Nolan',
+        'Lionel',
+        'Anil',
+        'Ian',
+        '',
+        'Smith',
+        'Smyth',
+        'Schmidt',
+        'Neil',
+    ]
+    queries = ['Neill', 'Nilsen', 'Smit', 'Nile', 'Xyz', '']
+    measures = (
+        Levenshtein(),
+        Levenshtein(mode='osa', cost=(1, 2, 1, 1)),
+        Levenshtein(normalizer=sum),
+        Levenshtein(normalizer=lambda terms: max(terms) + 1),
+        Levenshtein(taper=True),
+        DamerauLevenshtein(),
+        Indel(),
+        Hamming(),
+        JaroWinkler(),
+        JaroWinkler(mode='jaro'),
+        JaroWinkler(long_strings=True, scaling_factor=0.25),
+        JaroWinkler(qval=2),
+        Jaccard(),
+        Cosine(),
+        Overlap(),
+        Dice(tokenizer=QGrams(qval=3, start_stop='')),
+        Tversky(alpha=0.3, beta=0.8, bias=0.5),
+        Jaccard(tokenizer=QGrams(qval=[1, 2], skip=[0, 1])),
+        Jaccard(intersection_type='soft'),
+        Cosine(tokenizer=WhitespaceTokenizer()),
+    )
+
+    def test_best_matches(self):
+        """Test abydos.distance.best_matches."""
+        cmp = Levenshtein()
+        self.assertEqual(
+            best_matches('Neill', self.choices, cmp, 3),
+            [('Neill', 1.0), ('Neil', 0.8), ('Nell', 0.8)],
+        )
+        self.assertEqual(
+            best_matches('Nilsen', self.choices, cmp, 4),
+            [
+                ('Neilsen', 0.8571428571428572),
+                ('Nielsen', 0.8571428571428572),
+                ('Nils', 0.6666666666666667),
+                ('Nelson', 0.6666666666666667),
+            ],
+        )
+        self.assertEqual(
+            best_matches('Smit', self.choices, cmp, 2, 0.5),
+            [('Smith', 0.8), ('Smyth', 0.6)],
+        )
+        self.assertEqual(
+            best_matches('Nile', self.choices, cmp, 5, 0.6),
+            [('Nils', 0.75), ('Niall', 0.6), ('Nigel', 0.6), ('Neill', 0.6)],
+        )
+        self.assertEqual(best_matches('Xyz', self.choices, cmp, 3, 0.5), [])
+
+        cmp = DamerauLevenshtein()
+        self.assertEqual(
+            best_matches('Nile', self.choices, cmp, 3),
+            [('Nils', 0.75), ('Niel', 0.75), ('Niall', 0.6)],
+        )
+
+        cmp = JaroWinkler()
+        self.assertEqual(
+            best_matches('Neill', self.choices, cmp, 3),
+            [('Neill', 1.0), ('Neil', 0.96), ('Neil', 0.96)],
+        )
+        self.assertEqual(
+            best_matches('Nilsen', self.choices, cmp, 4),
+            [
+                ('Neilsen', 0.9571428571428572),
+                ('Nils', 0.9333333333333333),
+                ('Nielsen', 0.9174603174603175),
+                ('Niel', 0.8444444444444443),
+            ],
+        )
+        self.assertEqual(
+            best_matches('Xyz', self.choices, cmp, 3, 0.5),
+            [('Smyth', 0.5111111111111111)],
+        )
+
+        cmp = Jaccard()
+        self.assertEqual(
+            best_matches('Nilsen', self.choices, cmp, 4),
+            [
+                ('Neilsen', 0.6666666666666666),
+                ('Nielsen', 0.6666666666666666),
+                ('Nils', 0.5),
+                ('Nelson', 0.2727272727272727),
+            ],
+        )
+        self.assertEqual(
+            best_matches('Smit', self.choices, cmp, 2, 0.5),
+            [('Smith', 0.5714285714285714)],
+        )
+
+        cmp = Cosine()
+        self.assertEqual(
+            best_matches('Nile', self.choices, cmp, 5, 0.6), [('Nils', 0.6)]
+        )
+
+        cmp = Dice(tokenizer=QGrams(qval=3, start_stop=''))
+        self.assertEqual(
+            best_matches('Nilsen', self.choices, cmp, 4),
+            [
+                ('Nils', 0.6666666666666666),
+                ('Neilsen', 0.6666666666666666),
+                ('Nielsen', 0.4444444444444444),
+                ('Niall', 0.0),
+            ],
+        )
+
+        # Choices may be any iterable
+        self.assertEqual(
+            best_matches('Neil', iter(self.choices), Levenshtein(), 2),
+            [('Neil', 1.0), ('Neil', 1.0)],
+        )
+        self.assertEqual(best_matches('abab', [], Levenshtein(), 2), [])
+        self.assertEqual(best_matches('abab', ['ab'], Levenshtein(), 0), [])
+        self.assertEqual(
+            best_matches('abab', ['ab', 'abc'], Levenshtein(), 5),
+            [('ab', 0.5), ('abc', 0.5)],
+        )
+
+        # The same as comparing the query to each choice
+        for cmp in (
+            Levenshtein(mode='osa', cost=(1, 2, 1, 1)),
+            JaroWinkler(long_strings=True, scaling_factor=0.25),
+            Tversky(alpha=0.3, beta=0.8, bias=0.5),
+        ):
+            for query in self.queries:
+                for k, min_sim in ((1, None), (5, 0.5)):
+                    scored = sorted(
+                        (-cmp.sim(query, choice), index)
+                        for index, choice in enumerate(self.choices)
+                        if min_sim is None or cmp.sim(query, choice) >= min_sim
+                    )
+                    self.assertEqual(
+                        best_matches(query, self.choices, cmp, k, min_sim),
+                        [(self.choices[index], -sim) for sim, index in scored][
+                            :k
+                        ],
+                    )
+
+    def test_best_matches_alignment(self):
+        """Test abydos.distance.best_matches with alignment measures."""
+        # These measures have a static sim_matrix method, which the batch
+        # methods must not be confused with
+        choices = ['ACGA', 'TTTT', 'ACGT', 'AGT']
+        for measure in (NeedlemanWunsch(), Gotoh(), SmithWaterman()):
+            self.assertEqual(
+                best_matches('ACGT', choices, measure, 3),
+                [('ACGT', 1.0), ('ACGA', 0.75), ('AGT', 0.5773502691896258)],
+            )
+
+    def test_best_matches_upper_bounds(self):
+        """Test abydos.distance._best_matches._upper_bounds."""
+        for measure in self.measures:
+            for query in self.queries:
+                bounds = _upper_bounds(query, self.choices, measure)
+                if bounds is None:
+                    continue
+                for bound, choice in zip(bounds, self.choices):
+                    self.assertGreaterEqual(
+                        bound + 1e-12, measure.sim(query, choice)
+                    )
+
+        # Measures without cheap bounds
+        for measure in (
+            Indel(),
+            Hamming(),
+            Levenshtein(taper=True),
+            JaroWinkler(qval=2),
+            Jaccard(intersection_type='soft'),
+            Cosine(tokenizer=WhitespaceTokenizer()),
+        ):
+            self.assertIsNone(_upper_bounds('abc', ['abd'], measure))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_cached_distance.
+
+This module contains unit tests for abydos.distance.CachedDistance
+"""
+
+import os
+import shelve
+import tempfile
+import unittest
+
+from abydos.distance import (
+    CachedDistance,
+    Cosine,
+    DamerauLevenshtein,
+    Dice,
+    DiceAsymmetricI,
+    Hamming,
+    Indel,
+    Jaccard,
+    JaroWinkler,
+    Levenshtein,
+    Overlap,
+    PreparedString,
+    Tversky,
+    YujianBo,
+)
+
+
+class _CountingLevenshtein(Levenshtein):
+    """Levenshtein, counting its comparisons."""
+
+    def __init__(self, **kwargs):
+        super(_CountingLevenshtein, self).__init__(**kwargs)
+        self.calls = 0
+
+    def dist_abs(self, src, tar):
+        self.calls += 1
+        return super(_CountingLevenshtein, self).dist_abs(src, tar)
+
+
+class CachedDistanceTestCases(unittest.TestCase):
+    """Test CachedDistance functions.
+
+    abydos.distance.CachedDistance
+    """
+
+    strings = ['Niall', 'Neil', 'Nigel', 'Neal', 'Nils', ' Neill ', '', 'N']
+
+    def test_cached_distance_results(self):
+        """Test abydos.distance.CachedDistance results."""
+        for measure, symmetric in (
+            (Levenshtein(), True),
+            (JaroWinkler(), True),
+            (Jaccard(), True),
+            (Tversky(alpha=1, beta=0), False),
+            (Levenshtein(cost=(1, 2, 1, 1)), False),
+        ):
+            cmp = CachedDistance(measure, maxsize=5, symmetric=symmetric)
+            for _ in range(2):
+                for src in self.strings:
+                    for tar in self.strings:
+                        self.assertEqual(
+                            cmp.sim(src, tar), measure.sim(src, tar)
+                        )
+                        self.assertEqual(
+                            cmp.dist(src, tar), measure.dist(src, tar)
+                        )
+                        self.assertEqual(
+                            cmp.dist_abs(src, tar), measure.dist_abs(src, tar)
+                        )
+            self.assertEqual(
+                list(cmp.sim_many('Niall', self.strings)),
+                list(measure.sim_many('Niall', self.strings)),
+            )
+            self.assertLessEqual(len(cmp), 5)
+
+    def test_cached_distance_symmetric(self):
+        """Test abydos.distance.CachedDistance symmetry."""
+        for measure in (
+            Levenshtein(),
+            Levenshtein(mode='osa', cost=(2, 2, 1, 1), normalizer=sum),
+            Indel(),
+            DamerauLevenshtein(),
+            Hamming(),
+            Jaccard(),
+            Dice(),
+            Cosine(),
+            Overlap(),
+        ):
+            self.assertTrue(CachedDistance(measure).symmetric)
+        for measure in (
+            Levenshtein(cost=(1, 2, 1, 1)),
+            Levenshtein(taper=True),
+            Levenshtein(normalizer=lambda terms: terms[0]),
+            DamerauLevenshtein(cost=(2, 1, 1, 1)),
+            Jaccard(intersection_type='soft'),
+            Tversky(),
+            DiceAsymmetricI(),
+            JaroWinkler(),
+            YujianBo(),
+        ):
+            self.assertFalse(CachedDistance(measure).symmetric)
+        self.assertTrue(
+            CachedDistance(JaroWinkler(), symmetric=True).symmetric
+        )
+        self.assertFalse(CachedDistance(Jaccard(), symmetric=False).symmetric)
+
+        # Asymmetric measures are cached by the order of the strings
+        for cmp, method, src, tar in (
+            (CachedDistance(DiceAsymmetricI()), 'sim', 'cats', 'cat'),
+            (
+                CachedDistance(Levenshtein(cost=(1, 2, 1, 1))),
+                'dist_abs',
+                'abc',
+                'ab',
+            ),
+        ):
+            expected = getattr(cmp.measure, method)(src, tar)
+            self.assertNotEqual(
+                getattr(cmp.measure, method)(tar, src), expected
+            )
+            getattr(cmp, method)(tar, src)
+            self.assertEqual(getattr(cmp, method)(src, tar), expected)
+
+    def test_cached_distance_lru(self):
+        """Test abydos.distance.CachedDistance eviction & stats."""
+        measure = _CountingLevenshtein()
+        cmp = CachedDistance(measure, maxsize=2, symmetric=True)
+        cmp.dist_abs('a', 'b')
+        cmp.dist_abs('b', 'a')
+        self.assertEqual(measure.calls, 1)
+        cmp.dist_abs('c', 'd')
+        cmp.dist_abs('a', 'b')
+        cmp.dist_abs('e', 'f')
+        # ('c', 'd') was the least recently used, and so was evicted
+        cmp.dist_abs('c', 'd')
+        self.assertEqual(measure.calls, 4)
+        self.assertEqual(
+            tuple(cmp.cache_info()), (2, 0, 4, 2, 2),
+        )
+
+        # The methods are cached separately
+        cmp.sim('a', 'b')
+        self.assertEqual(measure.calls, 5)
+
+        cmp.maxsize = 1
+        self.assertEqual(len(cmp), 1)
+        cmp.clear()
+        self.assertEqual(tuple(cmp.cache_info()), (0, 0, 0, 1, 0))
+
+        cmp = CachedDistance(_CountingLevenshtein(), symmetric=False)
+        cmp.dist_abs('a', 'b')
+        cmp.dist_abs('b', 'a')
+        self.assertEqual(cmp.measure.calls, 2)
+        # A subclass that redefines dist_abs is not known to be symmetric
+        cmp = CachedDistance(_CountingLevenshtein())
+        cmp.dist_abs('a', 'b')
+        cmp.dist_abs('b', 'a')
+        self.assertEqual(cmp.measure.calls, 2)
+
+        for maxsize in (0, -1, 1.5):
+            with self.assertRaises(ValueError):
+                CachedDistance(Levenshtein(), maxsize=maxsize)
+
+    def test_cached_distance_prepared_string(self):
+        """Test abydos.distance.CachedDistance with PreparedStrings."""
+        cmp = CachedDistance(Levenshtein())
+        self.assertEqual(
+            cmp.dist_abs(PreparedString('Niall'), PreparedString('Neil')), 3
+        )
+        self.assertEqual(cmp.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(cmp.hits, 1)
+
+    def test_cached_distance_store(self):
+        """Test abydos.distance.CachedDistance with a backing store."""
+        store = {}
+        measure = _CountingLevenshtein()
+        cmp = CachedDistance(measure, store=store, symmetric=True)
+        self.assertEqual(cmp.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(len(store), 1)
+        cmp.clear()
+        self.assertEqual(cmp.dist_abs('Neil', 'Niall'), 3)
+        self.assertEqual(measure.calls, 1)
+        self.assertEqual(tuple(cmp.cache_info())[:3], (0, 1, 0))
+
+        # A shelf persists results across instances
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'cache')
+            with shelve.open(filename) as shelf:
+                cmp = CachedDistance(Levenshtein(), store=shelf)
+                self.assertEqual(cmp.sim('Niall', 'Neil'), 0.4)
+                self.assertEqual(cmp.misses, 1)
+            with shelve.open(filename) as shelf:
+                measure = _CountingLevenshtein()
+                cmp = CachedDistance(measure, store=shelf, symmetric=True)
+                self.assertEqual(cmp.sim('Neil', 'Niall'), 0.4)
+                self.assertEqual(cmp.store_hits, 1)
+                self.assertEqual(measure.calls, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
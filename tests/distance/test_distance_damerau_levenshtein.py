@@ -52,6 +52,44 @@ class DamerauLevenshteinTestCases(unittest.TestCase):
         self.assertEqual(self.cmp55105.dist_abs('cab', 'cba'), 5)
         self.assertRaises(ValueError, self.cmp1010105.dist_abs, 'ab', 'ba')
 
+    def test_damerau_levenshtein_dist_abs_bounded(self):
+        """Test abydos.distance.DamerauLevenshtein.dist_abs_bounded."""
+        self.assertEqual(self.cmp.dist_abs_bounded('', '', 0), 0)
+        self.assertEqual(self.cmp.dist_abs_bounded('CA', 'CA', 0), 0)
+        self.assertEqual(self.cmp.dist_abs_bounded('CA', 'ABC', 2), 2)
+        self.assertEqual(self.cmp.dist_abs_bounded('CA', 'ABC', 1), 2)
+        self.assertEqual(self.cmp571010.dist_abs_bounded('', 'b', 5), 5)
+        self.assertEqual(self.cmp571010.dist_abs_bounded('b', '', 5), 6)
+        self.assertEqual(self.cmp571010.dist_abs_bounded('ab', 'a', 7), 7)
+        self.assertEqual(self.cmp571010.dist_abs_bounded('ab', 'a', 6), 7)
+        self.assertEqual(self.cmp55105.dist_abs_bounded('cab', 'cba', 5), 5)
+        self.assertEqual(
+            self.cmp.dist_abs_bounded('abcdefghij' * 8, 'jihgfedcba' * 8, 3),
+            4,
+        )
+        self.assertRaises(
+            ValueError, self.cmp1010105.dist_abs_bounded, 'ab', 'ba', 5
+        )
+
+        pairs = (
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('aaaabcbcddaaacca', 'aa'),
+            ('xabxcdxxefxgx', '1ab2cd34ef5g6'),
+            ('levenshtein', 'frankenstein'),
+            ('abcdefghij', 'bacdefhgij' * 3),
+        )
+        for cmp in (self.cmp, self.cmp571010, self.cmp55105):
+            for src, tar in pairs:
+                dist = cmp.dist_abs(src, tar)
+                self.assertEqual(cmp.dist_abs_bounded(src, tar, dist), dist)
+                self.assertEqual(
+                    cmp.dist_abs_bounded(src, tar, dist + 1), dist
+                )
+                self.assertEqual(
+                    cmp.dist_abs_bounded(src, tar, dist - 1), dist
+                )
+
     def test_damerau_dist(self):
         """Test abydos.distance.DamerauLevenshtein.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
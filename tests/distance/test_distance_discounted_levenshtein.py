@@ -117,6 +117,34 @@ class DiscountedLevenshteinTestCases(unittest.TestCase):
             self.cmp.dist_abs('ATCAACGAGT', 'AACGATTAG'), 3.480037325627888
         )
 
+    def test_discounted_levenshtein_dist_abs_bounded(self):
+        """Test abydos.distance.DiscountedLevenshtein.dist_abs_bounded."""
+        self.assertEqual(self.cmp.dist_abs_bounded('', '', 0), 0.0)
+        self.assertEqual(self.cmp.dist_abs_bounded('abc', 'abc', 0), 0.0)
+        self.assertEqual(
+            self.cmp.dist_abs_bounded('abc', '', 3), 2.845793595028118
+        )
+        self.assertEqual(self.cmp.dist_abs_bounded('abc', '', 2), 3)
+        self.assertEqual(self.cmp.dist_abs_bounded('abcd', 'efgh', 3), 4)
+
+        pairs = (
+            ('Nigel', 'Niall'),
+            ('Colin', 'Coiln'),
+            ('ATCAACGAGT', 'AACGATTAG'),
+            ('abcdefghij', 'bacdefhgij' * 3),
+        )
+        for cmp in (
+            self.cmp,
+            self.cmp_coda,
+            DiscountedLevenshtein(mode='osa', discount_func='exp'),
+        ):
+            for src, tar in pairs:
+                dist = cmp.dist_abs(src, tar)
+                self.assertEqual(cmp.dist_abs_bounded(src, tar, dist), dist)
+                self.assertEqual(
+                    cmp.dist_abs_bounded(src, tar, dist - 0.25), dist + 0.75
+                )
+
     def test_discounted_levenshtein_dist(self):
         """Test abydos.distance.DiscountedLevenshtein.dist."""
         # Base cases
@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.distance.Gotoh
 """
 
+import random
 import unittest
 
 from abydos.distance import Gotoh, NeedlemanWunsch
@@ -106,6 +107,9 @@ class GotohTestCases(unittest.TestCase):
     def test_gotoh_sim(self):
         """Test abydos.distance.Gotoh.sim."""
         self.assertEqual(Gotoh().sim('', ''), 1.0)
+        self.assertEqual(Gotoh().sim('', 'abc'), 0.0)
+        self.assertEqual(Gotoh().sim('abc', ''), 0.0)
+        self.assertEqual(Gotoh().dist('abc', ''), 1.0)
 
         # https://en.wikipedia.org/wiki/Needleman–Wunsch_algorithm
         self.assertEqual(Gotoh(1, 1, _sim_nw).sim('GATTACA', 'GCATGCU'), 0)
@@ -122,6 +126,51 @@ class GotohTestCases(unittest.TestCase):
             NeedlemanWunsch(5, _sim_wikipedia).sim('AGACTAGTTAC', 'CGAGACGT'),
         )
 
+    def test_gotoh_alignment(self):
+        """Test abydos.distance.Gotoh.alignment."""
+        self.assertEqual(Gotoh().alignment('', ''), (0.0, '', ''))
+        score, src_aligned, tar_aligned = Gotoh().alignment('abc', '')
+        self.assertAlmostEqual(score, -1.8)
+        self.assertEqual((src_aligned, tar_aligned), ('abc', '---'))
+
+        rand = random.Random(1982)
+        for cmp in (
+            Gotoh(),
+            Gotoh(5, 2, _sim_wikipedia),
+            Gotoh(1, 1, _sim_nw),
+        ):
+            for src_len, tar_len in ((1, 9), (12, 1), (70, 55), (250, 310)):
+                src = ''.join(rand.choice('ACGT') for _ in range(src_len))
+                tar = ''.join(rand.choice('ACGT') for _ in range(tar_len))
+                for linear_space in (True, False):
+                    score, src_aligned, tar_aligned = cmp.alignment(
+                        src, tar, linear_space
+                    )
+                    self.assertAlmostEqual(score, cmp.sim_score(src, tar))
+                    self.assertEqual(src_aligned.replace('-', ''), src)
+                    self.assertEqual(tar_aligned.replace('-', ''), tar)
+                    self.assertEqual(len(src_aligned), len(tar_aligned))
+
+    def test_gotoh_sim_score_long(self):
+        """Test abydos.distance.Gotoh.sim_score on long strings."""
+
+        def _sim_asym(src: str, tar: str) -> float:
+            if src == tar:
+                return 2.0
+            return -1.0 if src < tar else -2.0
+
+        src = 'ACGTTGCAACGTAGCTAGCTAGGATCCA'
+        tar = 'TTGCATCGATCGGATCAGCTAGCTAGCTAGCATGACGATCG'
+        cmp = Gotoh(3, 0.5, _sim_asym)
+        self.assertEqual(cmp.sim_score(src, tar), 21.5)
+        self.assertEqual(cmp.sim_score(tar, src), 19.5)
+        self.assertEqual(Gotoh().sim_score(src * 20, src * 20), 560.0)
+
+        # Runs of gaps alone score their open & extension costs, unrounded
+        cmp = Gotoh(0.3, 0.1)
+        self.assertEqual(cmp.sim_score('', 'TAGCGTATGAACAAA'), -0.3 - 0.1 * 14)
+        self.assertEqual(cmp.sim_score('TAGCGTATGAACAAA', ''), -0.3 - 0.1 * 14)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -105,6 +105,31 @@ class HammingTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.sim('1011101', '1001001'), 5 / 7)
         self.assertAlmostEqual(self.cmp.sim('2173896', '2233796'), 4 / 7)
 
+    def test_hamming_many(self):
+        """Test abydos.distance.Hamming.*_many."""
+        targets = ['', 'cat', 'hat', 'cats', 'tac', 'c\u00e0t', 'ca']
+        for src in ('', 'cat', 'c\u00e0ts'):
+            self.assertEqual(
+                list(self.cmp.dist_abs_many(src, targets)),
+                [self.cmp.dist_abs(src, tar) for tar in targets],
+            )
+            self.assertEqual(
+                list(self.cmp.dist_many(src, targets)),
+                [self.cmp.dist(src, tar) for tar in targets],
+            )
+            self.assertEqual(
+                list(self.cmp.sim_many(src, targets)),
+                [self.cmp.sim(src, tar) for tar in targets],
+            )
+
+        self.assertEqual(
+            list(self.cmp_no_diff.dist_abs_many('cat', ['hat', 'tac'])),
+            [1, 2],
+        )
+        self.assertRaises(
+            ValueError, self.cmp_no_diff.dist_abs_many, 'cat', ['hat', 'ca']
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -133,6 +133,32 @@ class JaroWinklerTestCases(unittest.TestCase):
 
         self.assertAlmostEqual(self.jaro_winkler.dist('ABCD', 'EFGH'), 1.0)
 
+    def test_jaro_winkler_many(self):
+        """Test abydos.distance.JaroWinkler.sim_many & .dist_many."""
+        targets = ['', 'dixon', 'dicksonx', 'dwayne', 'duane', ' dixon ']
+        for cmp in (
+            self.jaro,
+            self.jaro_winkler,
+            JaroWinkler(qval=2),
+            JaroWinkler(long_strings=True),
+        ):
+            for src in ('', 'dixon', 'dwayne'):
+                self.assertEqual(
+                    list(cmp.sim_many(src, targets)),
+                    [cmp.sim(src, tar) for tar in targets],
+                )
+                self.assertEqual(
+                    list(cmp.dist_many(src, targets)),
+                    [cmp.dist(src, tar) for tar in targets],
+                )
+
+        self.assertRaises(
+            ValueError,
+            JaroWinkler(boost_threshold=2).sim_many,
+            'abc',
+            ['abc'],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -69,6 +69,33 @@ class LCSseqTestCases(unittest.TestCase):
         self.assertEqual(self.cmp.lcsseq('cc', 'bbbbcccccc'), 'cc')
         self.assertEqual(self.cmp.lcsseq('ccc', 'bcbb'), 'c')
 
+    def test_lcsseq_len(self):
+        """Test abydos.distance.LCSseq.lcsseq_len."""
+        self.assertEqual(self.cmp.lcsseq_len('', ''), 0)
+        self.assertEqual(self.cmp.lcsseq_len('A', ''), 0)
+        self.assertEqual(self.cmp.lcsseq_len('', 'ABCD'), 0)
+        self.assertEqual(self.cmp.lcsseq_len('ABCD', 'ABCD'), 4)
+        self.assertEqual(self.cmp.lcsseq_len('AB', 'CD'), 0)
+        self.assertEqual(self.cmp.lcsseq_len('DIXON', 'DICKSONX'), 4)
+        self.assertEqual(self.cmp.lcsseq_len('XMJYAUZ', 'MZJAWXU'), 4)
+        self.assertEqual(self.cmp.lcsseq_len('hello world', 'world war 2'), 5)
+        self.assertEqual(self.cmp.lcsseq_len('cc', 'bbbbcccccc'), 2)
+        self.assertEqual(self.cmp.lcsseq_len('bbbbcccccc', 'cc'), 2)
+
+        # Strings longer than a machine word
+        for src, tar in (
+            ('ACGT' * 40, 'TGCA' * 35),
+            ('the quick brown fox ' * 8, 'jumps over the lazy dog ' * 6),
+            ('ab' * 100, 'ba' * 100),
+        ):
+            self.assertEqual(
+                self.cmp.lcsseq_len(src, tar), len(self.cmp.lcsseq(src, tar))
+            )
+            self.assertEqual(
+                self.cmp.lcsseq_len(tar, src), len(self.cmp.lcsseq(src, tar))
+            )
+        self.assertEqual(self.cmp.lcsseq_len('ab' * 100, 'ba' * 100), 199)
+
     def test_lcsseq_sim(self):
         """Test abydos.distance.LCSseq.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
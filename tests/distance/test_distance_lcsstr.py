@@ -85,6 +85,21 @@ ACTGCCTGGGAAAAGATCGGCAGCCACGGTGGCGAGTATGGCGCCGAGGCCGT',
             'TGGCGAGTATGG',
         )
 
+    def test_lcsstr_ties_and_long(self):
+        """Test abydos.distance.LCSstr.lcsstr tie-breaking & long strings."""
+        # The substring ending first in src is returned
+        self.assertEqual(self.cmp.lcsstr('abxcd', 'cdyab'), 'ab')
+        self.assertEqual(self.cmp.lcsstr('cdxab', 'abycd'), 'cd')
+        self.assertEqual(self.cmp.lcsstr('aaaa', 'aa'), 'aa')
+
+        src = '221B Baker Street, Marylebone, London NW1 6XE, United Kingdom'
+        tar = 'Flat B, 221 Baker Street, London, NW1 6XE'
+        self.assertEqual(self.cmp.lcsstr(src, tar), ' Baker Street, ')
+        self.assertEqual(self.cmp.lcsstr(tar, src), ' Baker Street, ')
+        self.assertEqual(
+            self.cmp.lcsstr('x' + src * 10, tar + src * 10 + 'y'), src * 10
+        )
+
     def test_lcsstr_sim(self):
         """Test abydos.distance.LCSstr.sim."""
         self.assertEqual(self.cmp.sim('', ''), 1)
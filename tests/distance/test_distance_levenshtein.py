@@ -19,9 +19,15 @@
 This module contains unit tests for abydos.distance.Levenshtein
 """
 
+import random
 import unittest
 
-from abydos.distance import Levenshtein
+from abydos.distance import (
+    BlockLevenshtein,
+    Levenshtein,
+    PhoneticEditDistance,
+    YujianBo,
+)
 
 
 class LevenshteinTestCases(unittest.TestCase):
@@ -167,6 +173,102 @@ class LevenshteinTestCases(unittest.TestCase):
             7.499999999999999,
         )
 
+    def test_levenshtein_dist_abs_bitparallel(self):
+        """Test abydos.distance.Levenshtein.dist_abs (bit-parallel)."""
+        pairs = (
+            ('', ''),
+            ('', 'abc'),
+            ('abc', ''),
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('CA', 'ABC'),
+            ('Niall', 'Naill'),
+            ('xabxcdxxefxgx', '1ab2cd34ef5g6'),
+            ('abcdefghij' * 9, 'bacdefhgij' * 8 + 'abcde'),
+            ('ab' * 70, 'ba' * 65),
+        )
+        for mode in ('lev', 'osa'):
+            cmp = Levenshtein(mode=mode)
+            for src, tar in pairs:
+                d_mat = cmp._alignment_matrix(  # noqa: SF01
+                    src, tar, backtrace=False
+                )
+                self.assertEqual(
+                    cmp.dist_abs(src, tar), int(d_mat[len(src), len(tar)])
+                )
+                self.assertEqual(
+                    cmp.dist_abs(src, tar), cmp.dist_abs(tar, src)
+                )
+
+        self.assertEqual(self.cmp.dist_abs('ab' * 70, 'ba' * 70), 2)
+        self.assertEqual(
+            Levenshtein(mode='osa').dist_abs('ab' * 70, 'ba' * 70), 2
+        )
+        self.assertEqual(self.cmp.dist_abs('ab' * 35, 'ba' * 35 + 'c'), 2)
+        self.assertEqual(
+            Levenshtein(mode='osa').dist_abs('abc' * 30, 'bac' * 30), 30
+        )
+
+    def test_levenshtein_dist_abs_bounded(self):
+        """Test abydos.distance.Levenshtein.dist_abs_bounded."""
+        self.assertEqual(self.cmp.dist_abs_bounded('', '', 0), 0)
+        self.assertEqual(self.cmp.dist_abs_bounded('abc', 'abc', 0), 0)
+        self.assertEqual(self.cmp.dist_abs_bounded('', 'abc', 3), 3)
+        self.assertEqual(self.cmp.dist_abs_bounded('', 'abc', 2), 3)
+        self.assertEqual(self.cmp.dist_abs_bounded('abc', '', 1), 2)
+        self.assertEqual(self.cmp.dist_abs_bounded('a', 'abcdef', 2), 3)
+        self.assertEqual(
+            self.cmp.dist_abs_bounded('xabxcdxxefxgx', 'abcdefg', 6), 6
+        )
+        self.assertEqual(
+            self.cmp.dist_abs_bounded('xabxcdxxefxgx', 'abcdefg', 5), 6
+        )
+        self.assertEqual(
+            self.cmp.dist_abs_bounded('abcdefghij' * 8, 'jihgfedcba' * 8, 3),
+            4,
+        )
+        self.assertEqual(self.cmp.dist_abs_bounded('ATCG', 'TAGC', 2.5), 3.5)
+
+        pairs = (
+            ('abc', 'ac'),
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('cab', 'cba'),
+            ('xabxcdxxefxgx', '1ab2cd34ef5g6'),
+            ('levenshtein', 'frankenstein'),
+            ('distance', 'difference'),
+            ('abcdefghij', 'bacdefhgij' * 3),
+        )
+        for mode in ('lev', 'osa'):
+            for cost in ((1, 1, 1, 1), (5, 7, 10, 3), (1, 1, 0.5, 0.75)):
+                for taper in (False, True):
+                    cmp = Levenshtein(mode=mode, cost=cost, taper=taper)
+                    for src, tar in pairs:
+                        dist = cmp.dist_abs(src, tar)
+                        self.assertEqual(
+                            cmp.dist_abs_bounded(src, tar, dist), dist
+                        )
+                        self.assertEqual(
+                            cmp.dist_abs_bounded(src, tar, dist + 1), dist
+                        )
+                        self.assertEqual(
+                            cmp.dist_abs_bounded(src, tar, dist - 0.25),
+                            dist + 0.75,
+                        )
+
+        # Subclasses that redefine dist_abs are bounded by their own distance
+        for cmp, src, tar in (
+            (PhoneticEditDistance(), 'Niall', 'Neil'),
+            (BlockLevenshtein(), 'abcdef', 'defabc'),
+            (YujianBo(), 'Niall', 'Neil'),
+        ):
+            dist = cmp.dist_abs(src, tar)
+            self.assertEqual(cmp.dist_abs_bounded(src, tar, 10), dist)
+            self.assertEqual(cmp.dist_abs_bounded(src, tar, dist), dist)
+            self.assertEqual(
+                cmp.dist_abs_bounded(src, tar, dist / 2), dist / 2 + 1
+            )
+
     def test_levenshtein_dist(self):
         """Test abydos.distance.Levenshtein.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
@@ -229,6 +331,80 @@ class LevenshteinTestCases(unittest.TestCase):
             (1.0, 'Niall', 'Naill'),
         )
 
+    def test_levenshtein_many(self):
+        """Test abydos.distance.Levenshtein.*_many."""
+        targets = ['', 'Niall', 'Neil', 'Nigel', 'Naill', 'Niall' * 20]
+        for cmp in (
+            self.cmp,
+            self.cmp_taper,
+            Levenshtein(mode='osa'),
+            Levenshtein(cost=(1, 1, 2, 2)),
+            Levenshtein(normalizer=sum),
+            YujianBo(),
+        ):
+            for src in ('', 'Niall', 'Niall' * 15):
+                self.assertEqual(
+                    list(cmp.dist_abs_many(src, targets)),
+                    [cmp.dist_abs(src, tar) for tar in targets],
+                )
+                self.assertEqual(
+                    list(cmp.dist_many(src, targets)),
+                    [cmp.dist(src, tar) for tar in targets],
+                )
+                self.assertEqual(
+                    list(cmp.sim_many(src, targets)),
+                    [cmp.sim(src, tar) for tar in targets],
+                )
+
+    def test_levenshtein_alignment_linear_space(self):
+        """Test abydos.distance.Levenshtein.alignment in linear space."""
+        rand = random.Random(1975)
+        for cmp in (self.cmp, Levenshtein(cost=(1, 2, 3, 1))):
+            for src_len, tar_len in (
+                (0, 0),
+                (0, 7),
+                (9, 0),
+                (60, 75),
+                (300, 240),
+            ):
+                src = ''.join(rand.choice('ACGT') for _ in range(src_len))
+                tar = ''.join(rand.choice('ACGT') for _ in range(tar_len))
+                dist, src_aligned, tar_aligned = cmp.alignment(
+                    src, tar, linear_space=True
+                )
+                self.assertEqual(dist, cmp.dist_abs(src, tar))
+                self.assertEqual(src_aligned.replace('-', ''), src)
+                self.assertEqual(tar_aligned.replace('-', ''), tar)
+                self.assertEqual(len(src_aligned), len(tar_aligned))
+                self.assertEqual(
+                    dist, cmp.alignment(src, tar, linear_space=False)[0]
+                )
+
+        # Short strings default to the full matrices
+        self.assertEqual(
+            self.cmp.alignment('Niall', 'Neil'),
+            self.cmp.alignment('Niall', 'Neil', linear_space=False),
+        )
+        self.assertEqual(
+            Levenshtein(mode='osa').alignment('ATCG', 'TAGC'),
+            (2.0, 'ATCG', 'TAGC'),
+        )
+
+        self.assertRaises(
+            ValueError,
+            Levenshtein(mode='osa').alignment,
+            'ATCG',
+            'TAGC',
+            linear_space=True,
+        )
+        self.assertRaises(
+            ValueError,
+            self.cmp_taper.alignment,
+            'ATCG',
+            'TAGC',
+            linear_space=True,
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
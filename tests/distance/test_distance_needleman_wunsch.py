@@ -19,9 +19,10 @@
 This module contains unit tests for abydos.distance.NeedlemanWunsch
 """
 
+import random
 import unittest
 
-from abydos.distance import NeedlemanWunsch
+from abydos.distance import Gotoh, NeedlemanWunsch, SmithWaterman
 
 from .. import NIALL
 
@@ -142,6 +143,11 @@ class NeedlemanWunschTestCases(unittest.TestCase):
         self.assertEqual(nw5.sim_score('AGACTAGTTAC', 'TGACGSTGC'), -7)
         self.assertEqual(nw5.sim_score('AGACTAGTTAC', 'CGAGACGT'), -15)
 
+        # Runs of gaps alone score their length times the gap cost, unrounded
+        nw_tenth = NeedlemanWunsch(gap_cost=0.1)
+        self.assertEqual(nw_tenth.sim_score('', 'TAGCGTATGAACAAA'), -1.5)
+        self.assertEqual(nw_tenth.sim_score('TAGCGTATGAACAAA', ''), -1.5)
+
     def test_needleman_wunsch_dist_abs_nialls(self):
         """Test abydos.distance.NeedlemanWunsch.dist_abs (Nialls set)."""
         # checked against http://ds9a.nl/nwunsch/ (mismatch=1, gap=2, skew=2)
@@ -153,6 +159,9 @@ class NeedlemanWunschTestCases(unittest.TestCase):
     def test_needleman_wunsch_sim(self):
         """Test abydos.distance.NeedlemanWunsch.sim."""
         self.assertEqual(NeedlemanWunsch().sim('', ''), 1.0)
+        self.assertEqual(NeedlemanWunsch().sim('', 'abc'), 0.0)
+        self.assertEqual(NeedlemanWunsch().sim('abc', ''), 0.0)
+        self.assertEqual(NeedlemanWunsch().dist('', 'abc'), 1.0)
 
         # https://en.wikipedia.org/wiki/Needleman–Wunsch_algorithm
         self.assertEqual(
@@ -169,6 +178,70 @@ class NeedlemanWunschTestCases(unittest.TestCase):
         self.assertEqual(nw5.sim('AGACTAGTTAC', 'TGACGSTGC'), 0)
         self.assertEqual(nw5.sim('AGACTAGTTAC', 'CGAGACGT'), 0)
 
+    def test_needleman_wunsch_sim_cross(self):
+        """Test abydos.distance.NeedlemanWunsch.sim_cross & dist_cross."""
+        # The batch methods do not shadow the static sim_matrix method
+        self.assertEqual(NeedlemanWunsch.sim_matrix('A', 'A'), 1)
+        for cmp in (NeedlemanWunsch(), Gotoh(), SmithWaterman()):
+            self.assertEqual(cmp.sim_matrix('A', 'T'), 0)
+            self.assertEqual(
+                cmp.sim_cross(['ACGT'], ['ACGA', 'TTTT']).tolist(),
+                [[cmp.sim('ACGT', 'ACGA'), cmp.sim('ACGT', 'TTTT')]],
+            )
+            self.assertEqual(
+                cmp.dist_cross(['ACGT'], ['ACGA', 'TTTT']).tolist(),
+                [[cmp.dist('ACGT', 'ACGA'), cmp.dist('ACGT', 'TTTT')]],
+            )
+
+    def test_needleman_wunsch_alignment(self):
+        """Test abydos.distance.NeedlemanWunsch.alignment."""
+        self.assertEqual(NeedlemanWunsch().alignment('', ''), (0.0, '', ''))
+        self.assertEqual(
+            NeedlemanWunsch().alignment('', 'ab'), (-2.0, '--', 'ab')
+        )
+
+        rand = random.Random(1970)
+        for cmp in (
+            NeedlemanWunsch(),
+            NeedlemanWunsch(1, _sim_nw),
+            NeedlemanWunsch(5, _sim_wikipedia),
+        ):
+            for src_len, tar_len in ((1, 9), (12, 1), (70, 55), (250, 310)):
+                src = ''.join(rand.choice('ACGT') for _ in range(src_len))
+                tar = ''.join(rand.choice('ACGT') for _ in range(tar_len))
+                for linear_space in (True, False):
+                    score, src_aligned, tar_aligned = cmp.alignment(
+                        src, tar, linear_space
+                    )
+                    self.assertAlmostEqual(score, cmp.sim_score(src, tar))
+                    self.assertEqual(src_aligned.replace('-', ''), src)
+                    self.assertEqual(tar_aligned.replace('-', ''), tar)
+                    self.assertEqual(len(src_aligned), len(tar_aligned))
+
+        nw2 = NeedlemanWunsch(2, _sim_nw)
+        for name in NIALL:
+            self.assertEqual(
+                nw2.alignment(NIALL[0], name)[0],
+                nw2.sim_score(NIALL[0], name),
+            )
+
+    def test_needleman_wunsch_sim_score_long(self):
+        """Test abydos.distance.NeedlemanWunsch.sim_score on long strings."""
+
+        def _sim_asym(src: str, tar: str) -> float:
+            if src == tar:
+                return 2.0
+            return -1.0 if src < tar else -2.0
+
+        src = 'ACGTTGCAACGTAGCTAGCTAGGATCCA'
+        tar = 'TTGCATCGATCGGATCAGCTAGCTAGCTAGCATGACGATCG'
+        cmp = NeedlemanWunsch(1, _sim_asym)
+        self.assertEqual(cmp.sim_score(src, tar), 28.0)
+        self.assertEqual(cmp.sim_score(tar, src), 28.0)
+        self.assertEqual(
+            NeedlemanWunsch().sim_score(src * 20, src * 20), 560.0
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
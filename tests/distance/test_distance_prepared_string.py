@@ -0,0 +1,181 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_prepared_string.
+
+This module contains unit tests for abydos.distance.PreparedString
+"""
+
+import pickle
+import unittest
+
+from abydos.distance import (
+    Bag,
+    Cosine,
+    DamerauLevenshtein,
+    Dice,
+    Editex,
+    Jaccard,
+    JaroWinkler,
+    Levenshtein,
+    MongeElkan,
+    PhoneticDistance,
+    PreparedString,
+    Typo,
+)
+from abydos.phonetic import Soundex
+from abydos.tokenizer import QGrams, TokenCache, WhitespaceTokenizer
+
+
+class PreparedStringTestCases(unittest.TestCase):
+    """Test PreparedString functions.
+
+    abydos.distance.PreparedString
+    """
+
+    strings = ['Niall', 'Neil', 'Nigel', 'Neal', 'Nils', ' Neill ', '', 'N']
+    measures = (
+        Levenshtein(),
+        Levenshtein(mode='osa', cost=(1, 2, 1, 1)),
+        Levenshtein(taper=True),
+        DamerauLevenshtein(),
+        JaroWinkler(),
+        JaroWinkler(qval=2),
+        Jaccard(),
+        Cosine(tokenizer=WhitespaceTokenizer()),
+        Dice(tokenizer=QGrams(qval=3)),
+        Jaccard(token_cache=TokenCache()),
+        Jaccard(intersection_type='soft'),
+        MongeElkan(),
+        PhoneticDistance(Soundex()),
+        PhoneticDistance(Soundex(), metric=Levenshtein()),
+        Editex(),
+        Typo(),
+        Bag(),
+    )
+
+    def test_prepared_string_is_str(self):
+        """Test abydos.distance.PreparedString as a str."""
+        prep = PreparedString('Niall')
+        self.assertIsInstance(prep, str)
+        self.assertEqual(prep, 'Niall')
+        self.assertEqual(hash(prep), hash('Niall'))
+        self.assertEqual({prep: 1}['Niall'], 1)
+        self.assertIs(type(prep[1:]), str)
+        self.assertIs(type(prep + 's'), str)
+
+    def test_prepared_string_derived(self):
+        """Test abydos.distance.PreparedString.derived & clear."""
+        prep = PreparedString('Niall')
+        calls = []
+
+        def _derive(string):
+            calls.append(string)
+            return string.upper()
+
+        self.assertEqual(prep.derived('upper', _derive), 'NIALL')
+        self.assertEqual(prep.derived('upper', _derive), 'NIALL')
+        self.assertEqual(calls, ['Niall'])
+        self.assertIs(type(calls[0]), str)
+
+        prep.clear()
+        self.assertEqual(prep.derived('upper', _derive), 'NIALL')
+        self.assertEqual(len(calls), 2)
+
+        # Representations are not shared between prepared strings
+        self.assertEqual(
+            PreparedString('Niall').derived('upper', str.lower), 'niall'
+        )
+
+    def test_prepared_string_pickle(self):
+        """Test abydos.distance.PreparedString pickling."""
+        prep = PreparedString('Niall')
+        prep.derived('upper', str.upper)
+        loaded = pickle.loads(pickle.dumps(prep))
+        self.assertIsInstance(loaded, PreparedString)
+        self.assertEqual(loaded, 'Niall')
+        self.assertEqual(loaded.derived('upper', str.lower), 'niall')
+
+    def test_prepared_string_measures(self):
+        """Test measures comparing PreparedStrings."""
+        for measure in self.measures:
+            prepared = [PreparedString(string) for string in self.strings]
+            # Twice, so that the second round uses the cached representations
+            for _ in range(2):
+                for src, src_prep in zip(self.strings, prepared):
+                    for tar, tar_prep in zip(self.strings, prepared):
+                        expected = measure.sim(src, tar)
+                        self.assertEqual(
+                            measure.sim(src_prep, tar_prep), expected
+                        )
+                        self.assertEqual(measure.sim(src_prep, tar), expected)
+                        self.assertEqual(
+                            measure.dist(src, tar_prep), measure.dist(src, tar)
+                        )
+            self.assertEqual(
+                list(measure.sim_many(prepared[0], prepared)),
+                list(measure.sim_many(self.strings[0], self.strings)),
+            )
+
+    def test_prepared_string_caching(self):
+        """Test the representations cached by measures."""
+        prep = PreparedString('Niall')
+        Levenshtein().dist_abs(prep, 'Neil')
+        self.assertEqual(
+            prep.derived('char_masks', dict),
+            {'N': 1, 'i': 2, 'a': 4, 'l': 24},
+        )
+
+        prep = PreparedString(' Niall')
+        JaroWinkler().sim(prep, 'Neil')
+        JaroWinkler(qval=2).sim(prep, 'Neil')
+        self.assertEqual(
+            prep.derived(('jaro_qgrams', 1), list), ['N', 'i', 'a', 'l', 'l']
+        )
+        self.assertEqual(
+            prep.derived(('jaro_qgrams', 2), list),
+            ['$N', 'Ni', 'ia', 'al', 'll', 'l#'],
+        )
+
+        # Tokens are cached by the configuration of the tokenizer, so
+        # measures with like tokenizers share them
+        prep = PreparedString('Niall')
+        self.assertEqual(Jaccard().sim(prep, 'Neil'), 0.2222222222222222)
+        self.assertEqual(Dice().sim(prep, 'Neil'), 0.36363636363636365)
+        self.assertEqual(
+            Jaccard(tokenizer=QGrams(qval=3)).sim(prep, 'Neil'),
+            0.18181818181818182,
+        )
+        self.assertEqual(
+            sorted(key[0] for key in prep._derived),  # noqa: SF01
+            ['tokens', 'tokens'],
+        )
+
+        # The tokens returned may be modified without affecting the cache
+        cmp = Jaccard()
+        cmp._get_counter(prep)['$N'] += 5  # noqa: SF01
+        self.assertEqual(cmp._get_counter(prep)['$N'], 1)  # noqa: SF01
+
+        prep = PreparedString('Niall')
+        cmp = PhoneticDistance(Soundex(), metric=Levenshtein())
+        cmp.dist_abs(prep, 'Neil')
+        (code,) = prep._derived.values()  # noqa: SF01
+        self.assertIsInstance(code, PreparedString)
+        self.assertEqual(code, 'N400')
+
+
+if __name__ == '__main__':
+    unittest.main()
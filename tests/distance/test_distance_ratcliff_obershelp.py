@@ -92,6 +92,22 @@ class RatcliffObershelpTestCases(unittest.TestCase):
                     SequenceMatcher(None, word1, word2).ratio(),
                 )
 
+    def test_ratcliff_obershelp_sim_long(self):
+        """Test abydos.distance.RatcliffObershelp.sim on long strings."""
+        src = (
+            'Stainless steel 18/10 saucepan with lid, 20 cm, 3.1 L, '
+            'induction compatible, dishwasher safe, 5 year guarantee'
+        )
+        tar = (
+            'Saucepan & glass lid 20cm (3.1 litre), 18/10 stainless '
+            'steel, suitable for induction hobs, dishwasher-safe'
+        )
+        for word1, word2 in ((src, tar), (tar, src), (src * 4, tar * 3)):
+            self.assertAlmostEqual(
+                self.cmp.sim(word1, word2),
+                SequenceMatcher(None, word1, word2, autojunk=False).ratio(),
+            )
+
     def test_ratcliff_obershelp_dist(self):
         """Test abydos.distance.RatcliffObershelp.dist."""
         # https://github.com/rockymadden/stringmetric/blob/master/core/src/test/scala/com/rockymadden/stringmetric/similarity/RatcliffObershelpMetricSpec.scala
@@ -0,0 +1,106 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_similarity_join.
+
+This module contains unit tests for abydos.distance.similarity_join
+"""
+
+import random
+import types
+import unittest
+
+from abydos.distance import (
+    Cosine,
+    Dice,
+    Jaccard,
+    Levenshtein,
+    Overlap,
+    Tversky,
+    similarity_join,
+)
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
+
+
+class SimilarityJoinTestCases(unittest.TestCase):
+    """Test similarity_join functions.
+
+    abydos.distance.similarity_join
+    """
+
+    def setUp(self):
+        """Set up the records to join."""
+        rng = random.Random(0)
+        self.records = [
+            ''.join(rng.choice('abcd ') for _ in range(rng.randint(0, 9)))
+            for _ in range(100)
+        ] + ['', '', 'abab', 'abab', ' ', ' ', '  ']
+
+    def _brute_force(self, measure, threshold):
+        pairs = []
+        for i, src in enumerate(self.records):
+            for j in range(i + 1, len(self.records)):
+                sim = measure.sim(src, self.records[j])
+                if sim >= threshold:
+                    pairs.append((i, j, sim))
+        return pairs
+
+    def test_similarity_join(self):
+        """Test abydos.distance.similarity_join."""
+        for measure in (
+            Jaccard(),
+            Dice(),
+            Cosine(),
+            Overlap(),
+            Tversky(alpha=2.0, beta=2.0),
+            Jaccard(qval=1),
+            Cosine(tokenizer=WhitespaceTokenizer()),
+            Dice(tokenizer=QGrams(qval=3, scaler='set')),
+        ):
+            for threshold in (0.2, 0.5, 0.8, 1.0):
+                self.assertEqual(
+                    sorted(similarity_join(self.records, measure, threshold)),
+                    self._brute_force(measure, threshold),
+                )
+
+        # Results are yielded lazily
+        self.assertIsInstance(
+            similarity_join(self.records, Jaccard(), 0.5), types.GeneratorType,
+        )
+        self.assertEqual(list(similarity_join([], Jaccard(), 0.5)), [])
+        self.assertEqual(
+            list(similarity_join(['cat', 'cat', 'cat'], Jaccard(), 1.0)),
+            [(0, 1, 1.0), (0, 2, 1.0), (1, 2, 1.0)],
+        )
+
+    def test_similarity_join_errors(self):
+        """Test abydos.distance.similarity_join errors."""
+        for measure, threshold in (
+            (Jaccard(), 0.0),
+            (Jaccard(), 1.5),
+            (Jaccard(intersection_type='soft'), 0.5),
+            (Jaccard(normalizer='proportional'), 0.5),
+            (Tversky(alpha=0.5, beta=1.0), 0.5),
+            (Tversky(bias=0.5), 0.5),
+            (Levenshtein(), 0.5),
+            (Jaccard(tokenizer=QGrams(scaler='length')), 0.5),
+        ):
+            with self.assertRaises(ValueError):
+                list(similarity_join(['cat', 'hat'], measure, threshold))
+
+
+if __name__ == '__main__':
+    unittest.main()
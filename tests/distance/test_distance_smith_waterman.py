@@ -63,6 +63,9 @@ class SmithWatermanTestCases(unittest.TestCase):
     def test_smith_waterman_sim(self):
         """Test abydos.distance.SmithWaterman.sim."""
         self.assertEqual(SmithWaterman().sim('', ''), 1.0)
+        self.assertEqual(SmithWaterman().sim('', 'abc'), 0.0)
+        self.assertEqual(SmithWaterman().sim('abc', ''), 0.0)
+        self.assertEqual(SmithWaterman().dist('', 'abc'), 1.0)
 
         # https://en.wikipedia.org/wiki/Needleman–Wunsch_algorithm
         self.assertEqual(
@@ -80,6 +83,27 @@ class SmithWatermanTestCases(unittest.TestCase):
         )
         self.assertEqual(sw5.sim('AGACTAGTTAC', 'CGAGACGT'), 0)
 
+    def test_smith_waterman_alignment(self):
+        """Test abydos.distance.SmithWaterman.alignment."""
+        self.assertRaises(
+            NotImplementedError, SmithWaterman().alignment, 'cat', 'hat'
+        )
+
+    def test_smith_waterman_sim_score_long(self):
+        """Test abydos.distance.SmithWaterman.sim_score on long strings."""
+
+        def _sim_asym(src: str, tar: str) -> float:
+            if src == tar:
+                return 2.0
+            return -1.0 if src < tar else -2.0
+
+        src = 'ACGTTGCAACGTAGCTAGCTAGGATCCA'
+        tar = 'TTGCATCGATCGGATCAGCTAGCTAGCTAGCATGACGATCG'
+        cmp = SmithWaterman(1, _sim_asym)
+        self.assertEqual(cmp.sim_score(src, tar), 31.0)
+        self.assertEqual(cmp.sim_score(tar, src), 31.0)
+        self.assertEqual(SmithWaterman().sim_score(src * 20, src * 20), 560.0)
+
 
 if __name__ == '__main__':
     unittest.main()
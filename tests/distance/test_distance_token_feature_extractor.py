@@ -0,0 +1,149 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_token_feature_extractor.
+
+This module contains unit tests for abydos.distance.TokenFeatureExtractor
+"""
+
+import unittest
+
+import numpy as np
+
+from abydos.distance import (
+    BaulieuXIV,
+    Cosine,
+    Dice,
+    Jaccard,
+    KulczynskiII,
+    Levenshtein,
+    Overlap,
+    SokalMichener,
+    TokenFeatureExtractor,
+    Tversky,
+    YuleQ,
+)
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
+
+
+class TokenFeatureExtractorTestCases(unittest.TestCase):
+    """Test TokenFeatureExtractor functions.
+
+    abydos.distance.TokenFeatureExtractor
+    """
+
+    pairs = [
+        ('', ''),
+        ('abc', ''),
+        ('', 'abc'),
+        ('cat', 'hat'),
+        ('Niall', 'Neil'),
+        ('aluminum', 'Catalan'),
+        ('ATCG', 'TAGC'),
+        ('same', 'same'),
+        ('the quick brown fox', 'the quick brown dog'),
+    ]
+
+    def _measures(self):
+        return [
+            Jaccard(),
+            Dice(),
+            KulczynskiII(),
+            Cosine(),
+            Tversky(alpha=0.2, beta=0.8),
+            Overlap(),
+            SokalMichener(),
+            YuleQ(),
+            BaulieuXIV(),
+            Jaccard(normalizer='proportional'),
+            Jaccard(qval=3),
+            Dice(tokenizer=WhitespaceTokenizer()),
+            Jaccard(intersection_type='soft'),
+            Dice(intersection_type='soft'),
+            Jaccard(intersection_type='fuzzy'),
+            Dice(intersection_type='linkage'),
+            Levenshtein(),
+        ]
+
+    def test_token_feature_extractor_features(self):
+        """Test abydos.distance.TokenFeatureExtractor.features."""
+        for method in ('sim', 'dist'):
+            reference = self._measures()
+            fe = TokenFeatureExtractor(self._measures(), method)
+            for src, tar in self.pairs:
+                row = fe.features(src, tar)
+                self.assertEqual(row.shape, (len(reference),))
+                for value, measure in zip(row, reference):
+                    self.assertAlmostEqual(
+                        value, getattr(measure, method)(src, tar)
+                    )
+
+        fe = TokenFeatureExtractor([Jaccard(), Tversky()], 'dist_abs')
+        self.assertEqual(
+            list(fe.features('cat', 'hat')),
+            [
+                Jaccard().dist_abs('cat', 'hat'),
+                Tversky().dist_abs('cat', 'hat'),
+            ],
+        )
+
+    def test_token_feature_extractor_transform(self):
+        """Test abydos.distance.TokenFeatureExtractor.transform."""
+        fe = TokenFeatureExtractor(self._measures())
+        features = fe.transform(self.pairs)
+        self.assertEqual(features.shape, (len(self.pairs), 17))
+        for row, (src, tar) in zip(features, self.pairs):
+            self.assertTrue(
+                np.array_equal(row, fe.features(src, tar), equal_nan=True)
+            )
+        self.assertEqual(fe.transform([]).shape, (0, 17))
+        self.assertEqual(fe.transform(iter(self.pairs)).shape, (9, 17))
+
+    def test_token_feature_extractor_groups(self):
+        """Test abydos.distance.TokenFeatureExtractor grouping."""
+        fe = TokenFeatureExtractor(self._measures())
+        self.assertEqual(
+            [members for _, members in fe._groups],  # noqa: SF01
+            [[0, 1, 2, 3, 4, 5, 6, 7, 8, 9], [10], [11], [12, 13], [14], [15]],
+        )
+        self.assertEqual(fe._ungrouped, [16])  # noqa: SF01
+
+        # Equal tokenizer configurations are grouped
+        fe = TokenFeatureExtractor(
+            [
+                Jaccard(tokenizer=QGrams(qval=(2, 3))),
+                Dice(tokenizer=QGrams(qval=[2, 3])),
+                Dice(tokenizer=QGrams(qval=(2, 3), scaler='set')),
+            ]
+        )
+        self.assertEqual(
+            [members for _, members in fe._groups],  # noqa: SF01
+            [[0, 1], [2]],
+        )
+
+        self.assertEqual(
+            TokenFeatureExtractor(self._measures()).feature_names[-3:],
+            ['Jaccard', 'Dice', 'Levenshtein'],
+        )
+
+        self.assertRaises(ValueError, TokenFeatureExtractor, [])
+        self.assertRaises(
+            ValueError, TokenFeatureExtractor, [Jaccard()], 'sim_score'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
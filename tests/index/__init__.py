@@ -0,0 +1,72 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.
+
+This module contains unit tests for abydos.index
+"""
+
+import unittest
+
+# A dictionary of names to index, and queries to search for in it
+NAMES = (
+    'Niall',
+    'Neil',
+    'Nigel',
+    'Neal',
+    'Nils',
+    'Neill',
+    'Nial',
+    'Niel',
+    'Noel',
+    'Nell',
+    'Nelson',
+    'Neilsen',
+    'Nelsen',
+    'Nielsen',
+    'Nilsson',
+    'Nolan',
+    'Lionel',
+    'Anil',
+    'Ian',
+    '',
+    'Smith',
+    'Smyth',
+    'Schmidt',
+    'Schmitt',
+)
+QUERIES = ('Neill', 'Nilsen', 'Smit', 'Ni', 'Nile', 'Xyzzy', '')
+
+
+def _linear_search(strings, metric, query, max_distance=None, k=None):
+    """Return the strings near a query, by comparing it to each of them.
+
+    This is the result expected of an index's search (with max_distance) or
+    nearest (with k) method.
+    """
+    found = sorted(
+        (metric.dist_abs(query, string), string_id)
+        for string_id, string in enumerate(strings)
+    )
+    if max_distance is not None:
+        found = [item for item in found if item[0] <= max_distance]
+    if k is not None:
+        found = found[:k]
+    return [(strings[string_id], dist) for dist, string_id in found]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_bk_tree.
+
+This module contains unit tests for abydos.index.BKTree
+"""
+
+import os
+import pickle  # noqa: S403
+import tempfile
+import unittest
+
+from abydos.distance import (
+    DamerauLevenshtein,
+    Hamming,
+    Indel,
+    Jaccard,
+    Levenshtein,
+)
+from abydos.index import BKTree
+
+from . import NAMES, QUERIES, _linear_search
+
+
+class BKTreeTestCases(unittest.TestCase):
+    """Test BKTree functions.
+
+    abydos.index.BKTree
+    """
+
+    tree = BKTree(NAMES)
+
+    def test_bk_tree_search(self):
+        """Test abydos.index.BKTree.search."""
+        self.assertEqual(
+            self.tree.search('Neill', 1),
+            [('Neill', 0), ('Neil', 1), ('Nell', 1)],
+        )
+        self.assertEqual(
+            self.tree.search('Nilsen', 2),
+            [
+                ('Neilsen', 1),
+                ('Nelsen', 1),
+                ('Nielsen', 1),
+                ('Nils', 2),
+                ('Nelson', 2),
+                ('Nilsson', 2),
+            ],
+        )
+        self.assertEqual(self.tree.search('Smit', 1.5), [('Smith', 1)])
+        self.assertEqual(self.tree.search('Ni', 1), [])
+        self.assertEqual(self.tree.search('', 0), [('', 0)])
+        self.assertEqual(self.tree.search('Neill', -1), [])
+        self.assertEqual(BKTree().search('Neill', 2), [])
+
+        tree = BKTree(NAMES, metric=DamerauLevenshtein())
+        self.assertEqual(tree.search('Nile', 1), [('Nils', 1), ('Niel', 1)])
+        tree = BKTree(NAMES, metric=Indel())
+        self.assertEqual(
+            tree.search('Nilsen', 2),
+            [('Neilsen', 1), ('Nielsen', 1), ('Nils', 2), ('Nelsen', 2)],
+        )
+        tree = BKTree(NAMES, metric=Hamming())
+        self.assertEqual(tree.search('Smyt', 2), [('Smyth', 1), ('Smith', 2)])
+
+        # The same as comparing the query to each string
+        for metric in (Levenshtein(), Levenshtein(cost=(2, 2, 3, 1))):
+            tree = BKTree(NAMES, metric=metric)
+            for query in QUERIES:
+                for max_distance in (0, 1, 2.5):
+                    self.assertEqual(
+                        tree.search(query, max_distance),
+                        _linear_search(NAMES, metric, query, max_distance),
+                    )
+
+    def test_bk_tree_nearest(self):
+        """Test abydos.index.BKTree.nearest."""
+        self.assertEqual(
+            self.tree.nearest('Neill', 3),
+            [('Neill', 0), ('Neil', 1), ('Nell', 1)],
+        )
+        self.assertEqual(
+            self.tree.nearest('Nilsen', 3),
+            [('Neilsen', 1), ('Nelsen', 1), ('Nielsen', 1)],
+        )
+        self.assertEqual(
+            self.tree.nearest('Smit', 2), [('Smith', 1), ('Smyth', 2)]
+        )
+        self.assertEqual(self.tree.nearest('Neill', 0), [])
+        self.assertEqual(BKTree().nearest('Neill'), [])
+        self.assertEqual(
+            BKTree(['Niall', 'Neil', 'Nigel']).nearest('Neill', 5),
+            [('Neil', 1), ('Niall', 2), ('Nigel', 3)],
+        )
+
+        tree = BKTree(NAMES, metric=Indel())
+        self.assertEqual(tree.nearest('Smit', 2), [('Smith', 1), ('Smyth', 3)])
+        tree = BKTree(NAMES, metric=Hamming())
+        self.assertEqual(tree.nearest('Neil'), [('Neil', 0)])
+
+    def test_bk_tree_add(self):
+        """Test abydos.index.BKTree.add & update."""
+        tree = BKTree()
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.add('Niall'), 0)
+        self.assertEqual(tree.search('Neil', 2), [])
+        tree.update(['Neil', 'Niall', 'Nigel'])
+        self.assertEqual(len(tree), 3)
+        self.assertIn('Nigel', tree)
+        self.assertNotIn('Neal', tree)
+        self.assertEqual(tree.add('Niall'), 0)
+        self.assertEqual(tree.search('Neil', 2), [('Neil', 0)])
+
+        # Extended after searching; strings keep the order they were added in
+        tree = BKTree(NAMES[::2])
+        self.assertEqual(tree.search('Nilsen', 1), [('Nelsen', 1)])
+        tree.update(NAMES[1::2])
+        self.assertEqual(
+            tree.search('Nilsen', 1),
+            [('Nelsen', 1), ('Neilsen', 1), ('Nielsen', 1)],
+        )
+
+    def test_bk_tree_save_load(self):
+        """Test abydos.index.BKTree.save & load."""
+        tree = BKTree(NAMES, metric=DamerauLevenshtein())
+        handle, filename = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            tree.save(filename)
+            loaded = BKTree.load(filename)
+            self.assertEqual(len(loaded), len(tree))
+            self.assertEqual(
+                loaded.search('Nile', 1), [('Nils', 1), ('Niel', 1)]
+            )
+            # The loaded tree can be extended
+            loaded.add('Nile')
+            self.assertEqual(loaded.nearest('Nile'), [('Nile', 0)])
+
+            with open(filename, mode='wb') as pkl:
+                pickle.dump(['not', 'a', 'tree'], pkl)
+            with self.assertRaises(TypeError):
+                BKTree.load(filename)
+        finally:
+            os.remove(filename)
+
+    def test_bk_tree_errors(self):
+        """Test abydos.index.BKTree errors."""
+
+        class _Reversed(Levenshtein):
+            def dist_abs(self, src, tar):
+                return super(_Reversed, self).dist_abs(src[::-1], tar)
+
+        for metric in (
+            Jaccard(),
+            Levenshtein(mode='osa'),
+            Levenshtein(taper=True),
+            Levenshtein(cost=(1, 2, 1, 1)),
+            Levenshtein(cost=(1, 1, 0, 1)),
+            DamerauLevenshtein(cost=(1, 1, 1, 0.5)),
+            DamerauLevenshtein(cost=(2, 1, 1, 2)),
+            _Reversed(),
+            # Real-valued metrics are left to VPTree
+            Levenshtein(cost=(1, 1, 1.5, 1)),
+        ):
+            with self.assertRaises(ValueError):
+                BKTree(metric=metric)
+        # The transposition cost is unused by Levenshtein distance
+        BKTree(metric=Levenshtein(cost=(1, 1, 1, 0.5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
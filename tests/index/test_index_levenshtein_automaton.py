@@ -0,0 +1,87 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_levenshtein_automaton.
+
+This module contains unit tests for abydos.index.LevenshteinAutomaton
+"""
+
+import random
+import unittest
+
+from abydos.distance import Levenshtein
+from abydos.index import LevenshteinAutomaton
+
+
+class LevenshteinAutomatonTestCases(unittest.TestCase):
+    """Test LevenshteinAutomaton functions.
+
+    abydos.index.LevenshteinAutomaton
+    """
+
+    def setUp(self):
+        """Set up the strings to read."""
+        rng = random.Random(0)
+        self.strings = [
+            ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 7)))
+            for _ in range(200)
+        ]
+
+    def test_levenshtein_automaton(self):
+        """Test abydos.index.LevenshteinAutomaton."""
+        for metric in (
+            Levenshtein(),
+            Levenshtein(mode='osa'),
+            Levenshtein(cost=(2, 1, 1.5, 1)),
+            Levenshtein(mode='osa', cost=(1, 2, 2, 0.5)),
+        ):
+            for query in self.strings[:10] + ['abab', 'ba']:
+                for max_distance in (0, 1, 2.5):
+                    automaton = LevenshteinAutomaton(
+                        query, max_distance, metric
+                    )
+                    for string in self.strings:
+                        state = automaton.start()
+                        self.assertEqual(
+                            automaton.distance(state),
+                            metric.dist_abs(query, ''),
+                        )
+                        for pos, char in enumerate(string):
+                            state = automaton.step(state, char)
+                            prefix = string[: pos + 1]
+                            dist = metric.dist_abs(query, prefix)
+                            self.assertEqual(automaton.distance(state), dist)
+                            self.assertEqual(
+                                automaton.is_match(state), dist <= max_distance
+                            )
+                            # No string beginning with a prefix that cannot
+                            # match is within max_distance
+                            if not automaton.can_match(state):
+                                self.assertGreater(
+                                    metric.dist_abs(query, string),
+                                    max_distance,
+                                )
+
+    def test_levenshtein_automaton_errors(self):
+        """Test abydos.index.LevenshteinAutomaton errors."""
+        with self.assertRaises(ValueError):
+            LevenshteinAutomaton('abc', 1, Levenshtein(mode='dam'))
+        with self.assertRaises(ValueError):
+            LevenshteinAutomaton('abc', 1, Levenshtein(cost=(-1, 1, 1, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
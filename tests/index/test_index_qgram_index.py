@@ -0,0 +1,175 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_qgram_index.
+
+This module contains unit tests for abydos.index.QGramIndex
+"""
+
+import os
+import pickle  # noqa: S403
+import tempfile
+import unittest
+
+from abydos.distance import (
+    BlockLevenshtein,
+    DamerauLevenshtein,
+    DiscountedLevenshtein,
+    Indel,
+    Jaccard,
+    Levenshtein,
+    PhoneticEditDistance,
+    YujianBo,
+)
+from abydos.index import QGramIndex
+
+from . import NAMES, QUERIES, _linear_search
+
+
+class QGramIndexTestCases(unittest.TestCase):
+    """Test QGramIndex functions.
+
+    abydos.index.QGramIndex
+    """
+
+    index = QGramIndex(NAMES)
+
+    def test_qgram_index_search(self):
+        """Test abydos.index.QGramIndex.search."""
+        self.assertEqual(
+            self.index.search('Neill', 1),
+            [('Neill', 0), ('Neil', 1), ('Nell', 1)],
+        )
+        self.assertEqual(
+            self.index.search('Nilsen', 2),
+            [
+                ('Neilsen', 1),
+                ('Nelsen', 1),
+                ('Nielsen', 1),
+                ('Nils', 2),
+                ('Nelson', 2),
+                ('Nilsson', 2),
+            ],
+        )
+        self.assertEqual(self.index.search('Smit', 1.5), [('Smith', 1)])
+        self.assertEqual(self.index.search('Nile', 1), [('Nils', 1)])
+        self.assertEqual(self.index.search('Ni', 1), [])
+        # Strings too short to share q-grams are found by their lengths
+        self.assertEqual(self.index.search('Ia', 1), [('Ian', 1)])
+        self.assertEqual(self.index.search('', 3), [('', 0), ('Ian', 3)])
+        self.assertEqual(self.index.search('Neill', -1), [])
+        self.assertEqual(QGramIndex().search('Neill', 2), [])
+
+        index = QGramIndex(NAMES, metric=Levenshtein(mode='osa'))
+        self.assertEqual(index.search('Nlis', 1), [('Nils', 1)])
+        self.assertEqual(index.search('Nile', 1), [('Nils', 1), ('Niel', 1)])
+        index = QGramIndex(NAMES, qval=3, metric=DamerauLevenshtein())
+        self.assertEqual(
+            index.search('Nielsne', 2),
+            [('Nielsen', 1), ('Neilsen', 2), ('Nelsen', 2)],
+        )
+        index = QGramIndex(NAMES, qval=1)
+        self.assertEqual(
+            index.search('Nelsno', 2), [('Nelson', 2), ('Nelsen', 2)]
+        )
+        index = QGramIndex(NAMES, metric=Levenshtein(cost=(1, 2, 1.5, 1)))
+        self.assertEqual(
+            index.search('Nilsen', 2),
+            [('Neilsen', 1), ('Nielsen', 1), ('Nelsen', 1.5)],
+        )
+
+        # The same as comparing the query to each string
+        for metric in (Levenshtein(), DamerauLevenshtein()):
+            for qval in (1, 3):
+                index = QGramIndex(NAMES, qval=qval, metric=metric)
+                for query in QUERIES:
+                    for max_distance in (0, 1, 2.5):
+                        self.assertEqual(
+                            index.search(query, max_distance),
+                            _linear_search(NAMES, metric, query, max_distance),
+                        )
+
+    def test_qgram_index_add(self):
+        """Test abydos.index.QGramIndex.add & update."""
+        index = QGramIndex()
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.add('Niall'), 0)
+        self.assertEqual(index.search('Neil', 2), [])
+        index.update(['Neil', 'Niall', 'Nigel'])
+        self.assertEqual(len(index), 3)
+        self.assertIn('Nigel', index)
+        self.assertNotIn('Neal', index)
+        self.assertEqual(index.add('Niall'), 0)
+        self.assertEqual(index.search('Neil', 2), [('Neil', 0)])
+
+        # Extended after searching
+        index = QGramIndex(NAMES[::2])
+        self.assertEqual(index.search('Nilsen', 1), [('Nelsen', 1)])
+        index.update(NAMES[1::2])
+        self.assertEqual(
+            index.search('Nilsen', 1),
+            [('Nelsen', 1), ('Neilsen', 1), ('Nielsen', 1)],
+        )
+
+    def test_qgram_index_save_load(self):
+        """Test abydos.index.QGramIndex.save & load."""
+        index = QGramIndex(NAMES, qval=3, metric=Levenshtein(mode='osa'))
+        handle, filename = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            index.save(filename)
+            loaded = QGramIndex.load(filename)
+            self.assertEqual(len(loaded), len(index))
+            self.assertEqual(
+                loaded.search('Nile', 1), [('Nils', 1), ('Niel', 1)]
+            )
+            # The loaded index can be extended
+            loaded.add('Nile')
+            self.assertEqual(loaded.search('Nile', 0), [('Nile', 0)])
+
+            with open(filename, mode='wb') as pkl:
+                pickle.dump(['not', 'an', 'index'], pkl)
+            with self.assertRaises(TypeError):
+                QGramIndex.load(filename)
+        finally:
+            os.remove(filename)
+
+    def test_qgram_index_errors(self):
+        """Test abydos.index.QGramIndex errors."""
+        with self.assertRaises(ValueError):
+            QGramIndex(qval=0)
+        with self.assertRaises(ValueError):
+            QGramIndex(metric=Jaccard())
+        with self.assertRaises(ValueError):
+            QGramIndex(metric=Levenshtein(cost=(1, 1, 0.5, 1)))
+        with self.assertRaises(ValueError):
+            QGramIndex(metric=DamerauLevenshtein(cost=(1, 1, 1, 0.5)))
+        # Subclasses that redefine dist_abs do not count edits
+        for metric in (
+            BlockLevenshtein(),
+            YujianBo(),
+            DiscountedLevenshtein(),
+            PhoneticEditDistance(),
+        ):
+            with self.assertRaises(ValueError):
+                QGramIndex(metric=metric)
+        # The transposition cost is unused by Levenshtein distance
+        QGramIndex(metric=Levenshtein(cost=(1, 1, 1, 0.5)))
+        QGramIndex(metric=Indel())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_trie.
+
+This module contains unit tests for abydos.index.Trie
+"""
+
+import os
+import pickle  # noqa: S403
+import tempfile
+import types
+import unittest
+
+from abydos.distance import Hamming, Indel, Levenshtein
+from abydos.index import LevenshteinAutomaton, Trie
+
+from . import NAMES, QUERIES, _linear_search
+
+
+class TrieTestCases(unittest.TestCase):
+    """Test Trie functions.
+
+    abydos.index.Trie
+    """
+
+    trie = Trie(NAMES)
+
+    def test_trie_search(self):
+        """Test abydos.index.Trie.search."""
+        self.assertEqual(
+            self.trie.search('Neill', 1),
+            [('Neill', 0), ('Neil', 1), ('Nell', 1)],
+        )
+        self.assertEqual(
+            self.trie.search('Nilsen', 2),
+            [
+                ('Neilsen', 1),
+                ('Nelsen', 1),
+                ('Nielsen', 1),
+                ('Nils', 2),
+                ('Nelson', 2),
+                ('Nilsson', 2),
+            ],
+        )
+        self.assertEqual(self.trie.search('Smit', 1.5), [('Smith', 1)])
+        self.assertEqual(self.trie.search('Nlis', 1), [])
+        self.assertEqual(self.trie.search('Xyzzy', 2), [])
+        self.assertEqual(self.trie.search('', 0), [('', 0)])
+        self.assertEqual(self.trie.search('Neill', -1), [])
+        self.assertEqual(Trie().search('Neill', 2), [])
+        self.assertEqual(Trie(['']).search('ab', 2), [('', 2)])
+
+        trie = Trie(NAMES, metric=Levenshtein(mode='osa'))
+        self.assertEqual(trie.search('Nlis', 1), [('Nils', 1)])
+        self.assertEqual(trie.search('Nile', 1), [('Nils', 1), ('Niel', 1)])
+        trie = Trie(NAMES, metric=Indel())
+        self.assertEqual(
+            trie.search('Neill', 2),
+            [('Neill', 0), ('Neil', 1), ('Nell', 1), ('Niall', 2)],
+        )
+        trie = Trie(NAMES, metric=Levenshtein(cost=(1, 2, 1.5, 1)))
+        self.assertEqual(
+            trie.search('Nilsen', 2),
+            [('Neilsen', 1), ('Nielsen', 1), ('Nelsen', 1.5)],
+        )
+
+        # The same as comparing the query to each string
+        for metric in (
+            Levenshtein(mode='osa', cost=(2, 1, 1.5, 0.5)),
+            Levenshtein(cost=(1, 1, 0, 1)),
+        ):
+            trie = Trie(NAMES, metric=metric)
+            for query in QUERIES:
+                for max_distance in (0, 1, 2.5):
+                    self.assertEqual(
+                        trie.search(query, max_distance),
+                        _linear_search(NAMES, metric, query, max_distance),
+                    )
+
+    def test_trie_walk(self):
+        """Test abydos.index.Trie.walk."""
+        automaton = LevenshteinAutomaton('Nilsen', 1)
+        self.assertIsInstance(self.trie.walk(automaton), types.GeneratorType)
+        self.assertEqual(
+            sorted(self.trie.walk(automaton)),
+            [('Neilsen', 1), ('Nelsen', 1), ('Nielsen', 1)],
+        )
+
+    def test_trie_add(self):
+        """Test abydos.index.Trie.add & update."""
+        trie = Trie()
+        self.assertEqual(len(trie), 0)
+        self.assertEqual(trie.add('Niall'), 0)
+        self.assertEqual(trie.search('Neil', 2), [])
+        trie.update(['Neil', 'Niall', 'Nigel', 'Nig'])
+        self.assertEqual(len(trie), 4)
+        self.assertIn('Nigel', trie)
+        self.assertIn('Nig', trie)
+        self.assertNotIn('Ni', trie)
+        self.assertNotIn('Neal', trie)
+        self.assertEqual(trie.add('Niall'), 0)
+        self.assertEqual(trie.search('Neil', 1), [('Neil', 0)])
+        self.assertEqual(trie.search('Ni', 1), [('Nig', 1)])
+
+    def test_trie_save_load(self):
+        """Test abydos.index.Trie.save & load."""
+        trie = Trie(NAMES, metric=Levenshtein(mode='osa'))
+        handle, filename = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            trie.save(filename)
+            loaded = Trie.load(filename)
+            self.assertEqual(len(loaded), len(trie))
+            self.assertEqual(loaded.search('Nlis', 1), [('Nils', 1)])
+            # The loaded trie can be extended
+            loaded.add('Nile')
+            self.assertEqual(loaded.search('Nile', 0), [('Nile', 0)])
+
+            with open(filename, mode='wb') as pkl:
+                pickle.dump(['not', 'a', 'trie'], pkl)
+            with self.assertRaises(TypeError):
+                Trie.load(filename)
+        finally:
+            os.remove(filename)
+
+    def test_trie_errors(self):
+        """Test abydos.index.Trie errors."""
+        for metric in (
+            Hamming(),
+            Levenshtein(mode='dam'),
+            Levenshtein(taper=True),
+            Levenshtein(cost=(1, 1, -1, 1)),
+        ):
+            with self.assertRaises(ValueError):
+                Trie(metric=metric)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_vp_tree.
+
+This module contains unit tests for abydos.index.VPTree
+"""
+
+import os
+import pickle  # noqa: S403
+import tempfile
+import unittest
+
+from abydos.distance import DamerauLevenshtein, Jaccard, Levenshtein
+from abydos.index import VPTree
+
+from . import NAMES, QUERIES, _linear_search
+
+
+class VPTreeTestCases(unittest.TestCase):
+    """Test VPTree functions.
+
+    abydos.index.VPTree
+    """
+
+    cmp = Levenshtein(cost=(1, 1, 1.5, 1))
+    tree = VPTree(NAMES, metric=cmp)
+
+    def test_vp_tree_search(self):
+        """Test abydos.index.VPTree.search."""
+        self.assertEqual(
+            self.tree.search('Neill', 1),
+            [('Neill', 0), ('Neil', 1), ('Nell', 1)],
+        )
+        self.assertEqual(
+            self.tree.search('Nilsen', 2),
+            [('Neilsen', 1), ('Nielsen', 1), ('Nelsen', 1.5), ('Nils', 2)],
+        )
+        self.assertEqual(self.tree.search('Nile', 1.5), [('Nils', 1.5)])
+        self.assertEqual(self.tree.search('Smit', 2), [('Smith', 1)])
+        self.assertEqual(self.tree.search('Xyzzy', 2), [])
+        self.assertEqual(self.tree.search('Neill', -1), [])
+        self.assertEqual(VPTree().search('Neill', 2), [])
+
+        tree = VPTree(NAMES, metric=DamerauLevenshtein(cost=(2, 2, 1.5, 2.5)))
+        self.assertEqual(
+            tree.search('Nile', 2.5),
+            [('Nils', 1), ('Nial', 2), ('Niel', 2), ('Nell', 2)],
+        )
+        self.assertEqual(
+            tree.search('Neill', 2),
+            [('Neill', 0), ('Niall', 2), ('Neil', 2), ('Nell', 2)],
+        )
+
+        # The same as comparing the query to each string
+        for metric in (Levenshtein(), self.cmp):
+            tree = VPTree(NAMES, metric=metric)
+            for query in QUERIES:
+                for max_distance in (0, 1, 2.5):
+                    self.assertEqual(
+                        tree.search(query, max_distance),
+                        _linear_search(NAMES, metric, query, max_distance),
+                    )
+
+    def test_vp_tree_nearest(self):
+        """Test abydos.index.VPTree.nearest."""
+        self.assertEqual(
+            self.tree.nearest('Smit', 3),
+            [('Smith', 1), ('Smyth', 2.5), ('Schmidt', 3)],
+        )
+        self.assertEqual(
+            self.tree.nearest('Nilsen', 3),
+            [('Neilsen', 1), ('Nielsen', 1), ('Nelsen', 1.5)],
+        )
+        self.assertEqual(
+            self.tree.nearest('Neill', 2), [('Neill', 0), ('Neil', 1)]
+        )
+        self.assertEqual(self.tree.nearest('Neill', 0), [])
+        self.assertEqual(VPTree().nearest('Neill'), [])
+        self.assertEqual(
+            VPTree(['Niall', 'Neil', 'Nigel']).nearest('Neill', 5),
+            [('Neil', 1), ('Niall', 2), ('Nigel', 3)],
+        )
+
+    def test_vp_tree_add(self):
+        """Test abydos.index.VPTree.add & update."""
+        tree = VPTree()
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.add('Niall'), 0)
+        self.assertEqual(tree.search('Neil', 2), [])
+        tree.update(['Neil', 'Niall', 'Nigel'])
+        self.assertEqual(len(tree), 3)
+        self.assertIn('Nigel', tree)
+        self.assertNotIn('Neal', tree)
+        self.assertEqual(tree.add('Niall'), 0)
+        self.assertEqual(tree.search('Neil', 2), [('Neil', 0)])
+
+        # Strings added after a search are placed at the next one
+        tree = VPTree(NAMES[::2], metric=self.cmp)
+        self.assertEqual(tree.search('Nilsen', 1.5), [('Nelsen', 1.5)])
+        tree.update(NAMES[1::2])
+        self.assertEqual(
+            tree.search('Nilsen', 1.5),
+            [('Neilsen', 1), ('Nielsen', 1), ('Nelsen', 1.5)],
+        )
+
+    def test_vp_tree_save_load(self):
+        """Test abydos.index.VPTree.save & load."""
+        handle, filename = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            self.tree.save(filename)
+            loaded = VPTree.load(filename)
+            self.assertEqual(len(loaded), len(self.tree))
+            self.assertEqual(loaded.search('Nile', 1.5), [('Nils', 1.5)])
+            # The loaded tree can be extended
+            loaded.add('Nile')
+            self.assertEqual(loaded.nearest('Nile'), [('Nile', 0)])
+
+            with open(filename, mode='wb') as pkl:
+                pickle.dump(['not', 'a', 'tree'], pkl)
+            with self.assertRaises(TypeError):
+                VPTree.load(filename)
+        finally:
+            os.remove(filename)
+
+    def test_vp_tree_errors(self):
+        """Test abydos.index.VPTree errors."""
+        for metric in (
+            Jaccard(),
+            Levenshtein(mode='osa'),
+            Levenshtein(cost=(1, 0.5, 1, 1)),
+            DamerauLevenshtein(cost=(1, 1, 1, 0.5)),
+        ):
+            with self.assertRaises(ValueError):
+                VPTree(metric=metric)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,14 +19,23 @@
 This module contains unit tests for abydos.stats pairwise functions
 """
 
+import os
+import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 
-from abydos.distance import Jaccard, JaroWinkler
+import numpy as np
+
+from abydos.distance import Jaccard, JaroWinkler, Levenshtein, Tversky
 from abydos.stats import (
     amean,
+    cross_matrix,
     gmean,
+    heronian_mean,
     hmean,
     mean_pairwise_similarity,
+    median,
+    pairwise_matrix,
     pairwise_similarity_statistics,
 )
 
@@ -121,6 +130,65 @@ class MPSTestCases(unittest.TestCase):
             mean_pairwise_similarity(' '.join(NIALL_1WORD), mean_func=amean),
         )
 
+        # Test parallel execution
+        metric = Levenshtein(cost=(1, 1, 2, 1)).sim
+        for symmetric in (False, True):
+            serial = mean_pairwise_similarity(
+                NIALL, metric, amean, symmetric=symmetric
+            )
+            self.assertEqual(
+                mean_pairwise_similarity(
+                    NIALL, metric, amean, symmetric=symmetric, n_jobs=2
+                ),
+                serial,
+            )
+            with ProcessPoolExecutor(2) as executor:
+                self.assertEqual(
+                    mean_pairwise_similarity(
+                        NIALL,
+                        metric,
+                        amean,
+                        symmetric=symmetric,
+                        executor=executor,
+                    ),
+                    serial,
+                )
+        self.assertEqual(
+            mean_pairwise_similarity(NIALL, Jaccard().sim, gmean, n_jobs=-1),
+            mean_pairwise_similarity(NIALL, Jaccard().sim, gmean),
+        )
+        self.assertRaises(
+            ValueError, mean_pairwise_similarity, NIALL, n_jobs=0
+        )
+
+        # Test streaming
+        for mean_func in (amean, gmean, hmean):
+            for symmetric in (False, True):
+                self.assertAlmostEqual(
+                    mean_pairwise_similarity(
+                        NIALL,
+                        mean_func=mean_func,
+                        symmetric=symmetric,
+                        streaming=True,
+                    ),
+                    mean_pairwise_similarity(
+                        NIALL, mean_func=mean_func, symmetric=symmetric
+                    ),
+                )
+        self.assertAlmostEqual(
+            mean_pairwise_similarity(
+                NIALL, metric, amean, streaming=True, n_jobs=2
+            ),
+            mean_pairwise_similarity(NIALL, metric, amean),
+        )
+        self.assertRaises(
+            ValueError,
+            mean_pairwise_similarity,
+            NIALL,
+            mean_func=lambda nums: 0.0,
+            streaming=True,
+        )
+
         self.assertRaises(ValueError, mean_pairwise_similarity, ['a b c'])
         self.assertRaises(ValueError, mean_pairwise_similarity, 'abc')
         self.assertRaises(ValueError, mean_pairwise_similarity, 0)
@@ -233,6 +301,64 @@ class PSSTestCases(unittest.TestCase):
         self.assertAlmostEqual(pw_mean, 0.30718771249150056)
         self.assertAlmostEqual(pw_std, 0.25253182790044676)
 
+        # Test parallel execution
+        metric = Jaccard(qval=3).sim
+        serial = pairwise_similarity_statistics(
+            NIALL, NIALL_1WORD, metric, symmetric=True
+        )
+        self.assertEqual(
+            pairwise_similarity_statistics(
+                NIALL, NIALL_1WORD, metric, symmetric=True, n_jobs=3
+            ),
+            serial,
+        )
+        with ProcessPoolExecutor(2) as executor:
+            self.assertEqual(
+                pairwise_similarity_statistics(
+                    NIALL,
+                    NIALL_1WORD,
+                    metric,
+                    symmetric=True,
+                    n_jobs=2,
+                    executor=executor,
+                ),
+                serial,
+            )
+
+        # Test streaming
+        for mean_func in (amean, gmean, heronian_mean):
+            for args in (
+                (NIALL, NIALL),
+                (NIALL, ('Kneal',)),
+                ('The quick brown fox', 'jumped over the lazy dog.'),
+            ):
+                for streamed, listed in zip(
+                    pairwise_similarity_statistics(
+                        *args,
+                        mean_func=mean_func,
+                        symmetric=True,
+                        streaming=True,
+                    ),
+                    pairwise_similarity_statistics(
+                        *args, mean_func=mean_func, symmetric=True
+                    ),
+                ):
+                    self.assertAlmostEqual(streamed, listed)
+        for streamed, listed in zip(
+            pairwise_similarity_statistics(
+                NIALL, NIALL_1WORD, metric, streaming=True, n_jobs=2
+            ),
+            serial,
+        ):
+            self.assertAlmostEqual(streamed, listed)
+        self.assertRaises(
+            ValueError,
+            pairwise_similarity_statistics,
+            NIALL,
+            [],
+            streaming=True,
+        )
+
         # Test exceptions
         self.assertRaises(
             ValueError,
@@ -241,6 +367,17 @@ class PSSTestCases(unittest.TestCase):
             NIALL,
             mean_func='mean',
         )
+        self.assertRaises(
+            ValueError, pairwise_similarity_statistics, NIALL, NIALL, n_jobs=0
+        )
+        self.assertRaises(
+            ValueError,
+            pairwise_similarity_statistics,
+            NIALL,
+            NIALL,
+            mean_func=median,
+            streaming=True,
+        )
         self.assertRaises(
             ValueError,
             pairwise_similarity_statistics,
@@ -252,5 +389,133 @@ class PSSTestCases(unittest.TestCase):
         self.assertRaises(ValueError, pairwise_similarity_statistics, NIALL, 5)
 
 
+class PairwiseMatrixTestCases(unittest.TestCase):
+    """Test pairwise matrix functions.
+
+    abydos.stats.pairwise_matrix & abydos.stats.cross_matrix
+    """
+
+    def test_pairwise_matrix(self):
+        """Test abydos.stats.pairwise_matrix."""
+        sim = JaroWinkler().sim
+        expected = np.array([[sim(a, b) for b in NIALL] for a in NIALL])
+
+        np.testing.assert_array_equal(pairwise_matrix(NIALL, sim), expected)
+        np.testing.assert_array_equal(
+            pairwise_matrix(NIALL, lambda a, b: sim(a, b)), expected
+        )
+        np.testing.assert_array_equal(
+            pairwise_matrix(NIALL, sim, chunk_size=3), expected
+        )
+
+        condensed = pairwise_matrix(NIALL, sim, condensed=True)
+        self.assertEqual(
+            condensed.shape, (len(NIALL) * (len(NIALL) - 1) // 2,)
+        )
+        np.testing.assert_array_equal(
+            condensed, expected[np.triu_indices(len(NIALL), 1)]
+        )
+        for chunk_size in (1, 4, 100):
+            np.testing.assert_array_equal(
+                pairwise_matrix(
+                    NIALL, sim, condensed=True, chunk_size=chunk_size
+                ),
+                condensed,
+            )
+
+        # Asymmetric metric
+        tversky = Tversky(alpha=1.0, beta=0.0).sim
+        np.testing.assert_array_equal(
+            pairwise_matrix(NIALL, tversky, symmetric=False),
+            np.array([[tversky(a, b) for b in NIALL] for a in NIALL]),
+        )
+        np.testing.assert_array_equal(
+            pairwise_matrix(NIALL, tversky, symmetric=False, chunk_size=5),
+            np.array([[tversky(a, b) for b in NIALL] for a in NIALL]),
+        )
+
+        # Default metric & splittable strings
+        np.testing.assert_array_equal(
+            pairwise_matrix(' '.join(NIALL_1WORD)),
+            pairwise_matrix(NIALL_1WORD),
+        )
+        self.assertEqual(pairwise_matrix([]).shape, (0, 0))
+        self.assertEqual(pairwise_matrix(['a'], condensed=True).shape, (0,))
+
+        # Caller-supplied & memory-mapped buffers
+        buffer = np.empty((len(NIALL), len(NIALL)))
+        self.assertIs(pairwise_matrix(NIALL, sim, out=buffer), buffer)
+        np.testing.assert_array_equal(buffer, expected)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'condensed.npy')
+            mapped = pairwise_matrix(
+                NIALL, sim, condensed=True, out=path, chunk_size=2
+            )
+            self.assertIsInstance(mapped, np.memmap)
+            del mapped
+            np.testing.assert_array_equal(np.load(path), condensed)
+
+        # Test exceptions
+        self.assertRaises(ValueError, pairwise_matrix, 5)
+        self.assertRaises(ValueError, pairwise_matrix, NIALL, 'Levenshtein')
+        self.assertRaises(
+            ValueError,
+            pairwise_matrix,
+            NIALL,
+            tversky,
+            symmetric=False,
+            condensed=True,
+        )
+        self.assertRaises(ValueError, pairwise_matrix, NIALL, chunk_size=0)
+        self.assertRaises(
+            ValueError, pairwise_matrix, NIALL, out=np.empty((2, 2))
+        )
+
+    def test_cross_matrix(self):
+        """Test abydos.stats.cross_matrix."""
+        dist = Jaccard().dist
+        expected = np.array([[dist(a, b) for b in NIALL_1WORD] for a in NIALL])
+
+        np.testing.assert_array_equal(
+            cross_matrix(NIALL, NIALL_1WORD, dist), expected
+        )
+        np.testing.assert_array_equal(
+            cross_matrix(NIALL, NIALL_1WORD, dist, chunk_size=4), expected
+        )
+        np.testing.assert_array_equal(
+            cross_matrix(NIALL, NIALL_1WORD, lambda a, b: dist(a, b)),
+            expected,
+        )
+        np.testing.assert_array_equal(
+            cross_matrix('The quick brown fox', 'jumped over the lazy dog.'),
+            cross_matrix(
+                ['The', 'quick', 'brown', 'fox'],
+                ['jumped', 'over', 'the', 'lazy', 'dog.'],
+            ),
+        )
+        self.assertEqual(cross_matrix(NIALL, []).shape, (len(NIALL), 0))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'cross.npy')
+            mapped = cross_matrix(
+                NIALL, NIALL_1WORD, dist, out=path, chunk_size=3
+            )
+            self.assertIsInstance(mapped, np.memmap)
+            del mapped
+            np.testing.assert_array_equal(np.load(path), expected)
+
+        # Test exceptions
+        self.assertRaises(ValueError, cross_matrix, 5, NIALL)
+        self.assertRaises(ValueError, cross_matrix, NIALL, 5)
+        self.assertRaises(ValueError, cross_matrix, NIALL, NIALL, 'Jaccard')
+        self.assertRaises(
+            ValueError, cross_matrix, NIALL, NIALL, chunk_size=-1
+        )
+        self.assertRaises(
+            ValueError, cross_matrix, NIALL, NIALL, out=np.empty(3)
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,153 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.stats.test_stats_streaming_statistics.
+
+This module contains unit tests for abydos.stats.StreamingStatistics
+"""
+
+import unittest
+from math import isnan
+
+from abydos.stats import (
+    StreamingStatistics,
+    aghmean,
+    agmean,
+    amean,
+    cmean,
+    ghmean,
+    gmean,
+    heronian_mean,
+    hmean,
+    hoelder_mean,
+    lehmer_mean,
+    median,
+    midrange,
+    qmean,
+    std,
+    var,
+)
+
+
+class StreamingStatisticsTestCases(unittest.TestCase):
+    """Test abydos.stats.StreamingStatistics."""
+
+    _series = (
+        [1, 2, 3, 4, 5],
+        [1, 1, 3, 5, 5],
+        [0.5, 0.8, 0.1, 0.2, 0.25],
+        [0.5, 0.25],
+        [1, 1],
+        [7],
+        [0, 5, 1000],
+        [0.3, 0.0, 0.7, 0.2, 0.9, 0.9],
+    )
+
+    def test_streaming_statistics_means(self):
+        """Test abydos.stats.StreamingStatistics means."""
+        for nums in self._series:
+            stats = StreamingStatistics(nums, powers=(2, 3, 0.5))
+            self.assertEqual(stats.count(), len(nums))
+            self.assertEqual(stats.min(), min(nums))
+            self.assertEqual(stats.max(), max(nums))
+            for mean_func in (
+                amean,
+                gmean,
+                hmean,
+                qmean,
+                cmean,
+                heronian_mean,
+                agmean,
+                ghmean,
+                aghmean,
+                midrange,
+            ):
+                self.assertAlmostEqual(
+                    stats.mean(mean_func), mean_func(nums), places=10
+                )
+            for exp in (0, 0.5, 2, 3):
+                self.assertAlmostEqual(
+                    stats.hoelder_mean(exp), hoelder_mean(nums, exp)
+                )
+            for exp in (2, 3):
+                self.assertAlmostEqual(
+                    stats.lehmer_mean(exp), lehmer_mean(nums, exp)
+                )
+            self.assertAlmostEqual(stats.var(), var(nums))
+            if len(nums) > 1:
+                self.assertAlmostEqual(stats.var(ddof=1), var(nums, ddof=1))
+            self.assertAlmostEqual(stats.std(), std(nums))
+            self.assertAlmostEqual(stats.std(stats.hmean()), std(nums, hmean))
+
+        self.assertTrue(isnan(StreamingStatistics([0, 0, 5]).hmean()))
+        self.assertEqual(StreamingStatistics([0, 0]).hmean(), 0)
+        self.assertAlmostEqual(
+            StreamingStatistics([-1, 2, -4]).gmean(), gmean([-1, 2, -4])
+        )
+        self.assertAlmostEqual(StreamingStatistics([-8]).gmean(), gmean([-8]))
+        # A product that underflows does not zero the geometric mean.
+        self.assertAlmostEqual(
+            StreamingStatistics([1e-10] * 1000).gmean(), 1e-10
+        )
+
+        # Test exceptions
+        stats = StreamingStatistics()
+        for method in (
+            stats.min,
+            stats.max,
+            stats.amean,
+            stats.gmean,
+            stats.hmean,
+            stats.qmean,
+            stats.var,
+        ):
+            self.assertRaises(ValueError, method)
+        stats = StreamingStatistics([1, 2, 3], powers=())
+        self.assertRaises(ValueError, stats.qmean)
+        self.assertRaises(ValueError, stats.cmean)
+        self.assertRaises(ValueError, stats.hoelder_mean, 4)
+        self.assertRaises(ValueError, stats.mean, median)
+        self.assertEqual(stats.hoelder_mean(1), 2.0)
+        self.assertEqual(stats.lehmer_mean(1), 2.0)
+
+    def test_streaming_statistics_merge(self):
+        """Test abydos.stats.StreamingStatistics.merge."""
+        nums = [0.3, 0.0, 0.7, 0.2, 0.9, 0.9, 0.15, 0.5]
+        whole = StreamingStatistics(nums)
+        for split in range(len(nums) + 1):
+            merged = StreamingStatistics(nums[:split])
+            merged.merge(StreamingStatistics(nums[split:]))
+            self.assertEqual(merged.count(), whole.count())
+            self.assertEqual(merged.min(), whole.min())
+            self.assertEqual(merged.max(), whole.max())
+            self.assertAlmostEqual(merged.amean(), whole.amean())
+            self.assertAlmostEqual(merged.var(), whole.var())
+            self.assertEqual(merged.gmean(), 0.0)
+            self.assertEqual(merged.hmean(), 0)
+            self.assertAlmostEqual(merged.qmean(), whole.qmean())
+            self.assertAlmostEqual(
+                merged.heronian_mean(), whole.heronian_mean()
+            )
+
+        self.assertRaises(
+            ValueError,
+            StreamingStatistics().merge,
+            StreamingStatistics(powers=(3,)),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
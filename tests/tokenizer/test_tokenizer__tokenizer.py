@@ -180,6 +180,22 @@ class TokenizerTestCases(unittest.TestCase):
         nelson_entropy = QSkipgrams(scaler='entropy').tokenize('NELSON')
         self.assertAlmostEqual(nelson_entropy.count(), 4.6644977792)
 
+    def test__tokenizer_config_key(self):
+        """Test abydos.tokenizer._Tokenizer._config_key."""
+        qgrams = QGrams()
+        key = qgrams._config_key()  # noqa: SF01
+        self.assertEqual(hash(key), hash(QGrams()._config_key()))  # noqa: SF01
+        qgrams.tokenize('NELSON')
+        self.assertEqual(qgrams._config_key(), key)  # noqa: SF01
+        self.assertEqual(
+            QGrams(qval=(2,), skip=[0])._config_key(), key  # noqa: SF01
+        )
+        self.assertNotEqual(QGrams(qval=3)._config_key(), key)  # noqa: SF01
+        self.assertNotEqual(
+            QGrams(scaler='set')._config_key(), key  # noqa: SF01
+        )
+        self.assertNotEqual(_Tokenizer()._config_key(), key)  # noqa: SF01
+
 
 if __name__ == '__main__':
     unittest.main()
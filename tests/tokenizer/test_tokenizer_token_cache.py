@@ -0,0 +1,132 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.tokenizer.test_tokenizer_token_cache.
+
+This module contains unit tests for abydos.tokenizer.TokenCache
+"""
+
+import gc
+import pickle  # noqa: S403
+import unittest
+
+from abydos.tokenizer import (
+    CharacterTokenizer,
+    QGrams,
+    TokenCache,
+    WhitespaceTokenizer,
+)
+
+
+class TokenCacheTestCases(unittest.TestCase):
+    """Test abydos.tokenizer.TokenCache."""
+
+    def test_token_cache(self):
+        """Test abydos.tokenizer.TokenCache."""
+        cache = TokenCache(maxsize=3)
+        tok = QGrams()
+        for string in ('', 'nelson', 'neilsen'):
+            self.assertEqual(
+                cache.get_counter(tok, string),
+                QGrams().tokenize(string).get_counter(),
+            )
+        self.assertEqual(cache.cache_info(), (0, 3, 3, 3))
+        self.assertEqual(len(cache), 3)
+
+        # Hits, with tokenizers of the same configuration
+        self.assertEqual(
+            cache.get_counter(QGrams(qval=2), 'nelson'),
+            QGrams().tokenize('nelson').get_counter(),
+        )
+        self.assertEqual(cache.hits, 1)
+
+        # Misses, with tokenizers of different configurations
+        for other in (
+            QGrams(qval=3),
+            QGrams(start_stop=''),
+            QGrams(scaler='set'),
+            CharacterTokenizer(),
+            WhitespaceTokenizer(),
+        ):
+            self.assertEqual(
+                cache.get_counter(other, 'nelson nelson'),
+                other.tokenize('nelson nelson').get_counter(),
+            )
+        self.assertEqual(cache.cache_info(), (1, 8, 3, 3))
+
+        # The returned Counters are copies
+        counter = cache.get_counter(tok, 'nelson')
+        counter['$n'] += 10
+        self.assertEqual(
+            cache.get_counter(tok, 'nelson'),
+            QGrams().tokenize('nelson').get_counter(),
+        )
+
+    def test_token_cache_lru(self):
+        """Test abydos.tokenizer.TokenCache least-recently-used eviction."""
+        cache = TokenCache(maxsize=2)
+        tok = WhitespaceTokenizer()
+        cache.get_counter(tok, 'a b')
+        cache.get_counter(tok, 'c d')
+        cache.get_counter(tok, 'a b')
+        cache.get_counter(tok, 'e f')  # evicts 'c d'
+        self.assertEqual(cache.cache_info(), (1, 3, 2, 2))
+        cache.get_counter(tok, 'a b')
+        self.assertEqual(cache.hits, 2)
+        cache.get_counter(tok, 'c d')
+        self.assertEqual(cache.misses, 4)
+
+        # Reducing maxsize evicts the least recently used entries
+        cache.maxsize = 1
+        self.assertEqual(cache.maxsize, 1)
+        self.assertEqual(len(cache), 1)
+        cache.get_counter(tok, 'c d')
+        self.assertEqual(cache.hits, 3)
+
+        cache.clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 1, 0))
+
+        for maxsize in (0, -1, 1.5, None):
+            with self.assertRaises(ValueError):
+                TokenCache(maxsize=maxsize)
+            with self.assertRaises(ValueError):
+                cache.maxsize = maxsize
+
+    def test_token_cache_tokenizers(self):
+        """Test abydos.tokenizer.TokenCache's keys of tokenizers."""
+        cache = TokenCache(maxsize=10)
+        # Tokenizers created for each use share entries, and are not
+        # retained by the cache
+        for _ in range(100):
+            cache.get_counter(QGrams(), 'nelson')
+        gc.collect()
+        self.assertEqual(cache.cache_info(), (99, 1, 10, 1))
+        self.assertLessEqual(len(cache._config_keys), 1)  # noqa: SF01
+
+        # The cache can be pickled, with the tokenizers' keys dropped
+        tok = QGrams()
+        cache.get_counter(tok, 'neilsen')
+        clone = pickle.loads(pickle.dumps(cache))  # noqa: S301
+        self.assertEqual(len(clone._config_keys), 0)  # noqa: SF01
+        self.assertEqual(
+            clone.get_counter(tok, 'neilsen'),
+            tok.tokenize('neilsen').get_counter(),
+        )
+        self.assertEqual(clone.cache_info(), (100, 2, 10, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
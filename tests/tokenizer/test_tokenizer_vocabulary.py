@@ -0,0 +1,105 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.tokenizer.test_tokenizer_vocabulary.
+
+This module contains unit tests for abydos.tokenizer.Vocabulary
+"""
+
+import pickle  # noqa: S403
+import unittest
+from collections import Counter
+from math import log1p
+
+import numpy as np
+
+from abydos.tokenizer import (
+    QGrams,
+    TokenArrays,
+    Vocabulary,
+    WhitespaceTokenizer,
+)
+
+
+class VocabularyTestCases(unittest.TestCase):
+    """Test abydos.tokenizer.Vocabulary."""
+
+    def test_vocabulary(self):
+        """Test abydos.tokenizer.Vocabulary."""
+        vocab = Vocabulary(['ab', 'bc'])
+        self.assertEqual(len(vocab), 2)
+        self.assertIn('ab', vocab)
+        self.assertNotIn('cd', vocab)
+        self.assertEqual(vocab.add('cd'), 2)
+        self.assertEqual(vocab.add('ab'), 0)
+        self.assertEqual(len(vocab), 3)
+        self.assertEqual(vocab.get_id('bc'), 1)
+        self.assertEqual(vocab.get_token(2), 'cd')
+        with self.assertRaises(KeyError):
+            vocab.get_id('de')
+        with self.assertRaises(IndexError):
+            vocab.get_token(3)
+        with self.assertRaises(IndexError):
+            vocab.get_token(-1)
+
+        vocab = pickle.loads(pickle.dumps(vocab))  # noqa: S301
+        self.assertEqual(vocab.get_id('cd'), 2)
+
+    def test_vocabulary_encode(self):
+        """Test abydos.tokenizer.Vocabulary.encode & decode."""
+        vocab = Vocabulary()
+        for tok in (QGrams(), QGrams(scaler=log1p), WhitespaceTokenizer()):
+            for string in ('', 'nelson', 'the quick brown fox jumps over'):
+                counter = tok.tokenize(string).get_counter()
+                arrays = tok.tokenize(string).get_arrays(vocab)
+                self.assertIsInstance(arrays, TokenArrays)
+                self.assertEqual(arrays.ids.dtype, np.int32)
+                self.assertTrue(np.all(np.diff(arrays.ids) > 0))
+                self.assertEqual(vocab.decode(arrays), counter)
+                self.assertEqual(
+                    [type(val) for val in vocab.decode(arrays).values()],
+                    [type(val) for val in counter.values()],
+                )
+
+        arrays = vocab.encode(Counter({'$n': 2, 'zz': 1.5}))
+        self.assertEqual(arrays.counts.dtype, np.float_)
+        self.assertEqual(list(arrays.ids), [0, len(vocab) - 1])
+        self.assertEqual(vocab.decode(arrays), Counter({'$n': 2, 'zz': 1.5}))
+
+    def test_token_arrays(self):
+        """Test abydos.tokenizer.TokenArrays."""
+        vocab = Vocabulary()
+        tok = QGrams()
+        nelson = tok.tokenize('nelson').get_arrays(vocab)
+        neilsen = tok.tokenize('neilsen').get_arrays(vocab)
+        empty = tok.tokenize('').get_arrays(vocab)
+
+        self.assertEqual(nelson, tok.tokenize('nelson').get_arrays(vocab))
+        self.assertNotEqual(nelson, neilsen)
+        self.assertNotEqual(nelson, 'nelson')
+        self.assertEqual(
+            hash(nelson), hash(tok.tokenize('nelson').get_arrays(vocab))
+        )
+        self.assertTrue(nelson)
+        self.assertFalse(empty)
+
+        ids, counts = nelson
+        self.assertIs(ids, nelson.ids)
+        self.assertIs(counts, nelson.counts)
+
+
+if __name__ == '__main__':
+    unittest.main()